@@ -4,13 +4,15 @@
 """Claude Code CLI inferencer for executing Claude Code CLI commands."""
 
 import asyncio
+import concurrent.futures
 import json
 import logging
 import os
 import subprocess
-from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, TextIO
+from typing import Any, AsyncIterator, Callable, ClassVar, Dict, Iterator, List, Optional, TextIO
 
 from attr import attrib, attrs
+from agent_foundation.common.inferencers.loop_runner import get_default_loop_runner
 from agent_foundation.common.inferencers.streaming_inferencer_base import (
     EmptyLineMode,
 )
@@ -87,6 +89,9 @@ class ClaudeCodeCliInferencer(TerminalSessionInferencerBase):
     max_budget_usd: Optional[float] = attrib(default=None)
     extra_cli_args: Optional[List[str]] = attrib(default=None)
 
+    # construct_command() honors use_stdin, so process_pool is supported
+    supports_stdin_prompt: ClassVar[bool] = True
+
     # Known Node.js Claude Code CLI paths to try as fallback
     _NODE_CLAUDE_PATHS: List[str] = [
         "node /opt/homebrew/lib/node_modules/@anthropic-ai/claude-code/cli.js",
@@ -418,6 +423,9 @@ class ClaudeCodeCliInferencer(TerminalSessionInferencerBase):
         The final ``result`` event is captured into ``_last_stream_result`` so
         that ``ainfer()`` can extract session_id, cost, and usage metadata.
 
+        With ``process_pool`` set, the events are read from a pooled process
+        fed the prompt over stdin (see ``_ainfer_streaming_pooled``).
+
         Args:
             prompt: The prompt string.
             **kwargs: Additional arguments.
@@ -425,14 +433,30 @@ class ClaudeCodeCliInferencer(TerminalSessionInferencerBase):
         Yields:
             Text chunks as they arrive from Claude.
         """
-        import json as _json
-
         kwargs["output_format"] = "stream-json"
         kwargs["verbose"] = True
         kwargs["include_partial_messages"] = True
 
         self._last_stream_result = None  # reset before each call
 
+        if self.process_pool is not None:
+            # Pooled processes take the prompt over stdin, the same way the
+            # base class runs them; only the stream-json decoding differs.
+            pooled_lines = self._ainfer_streaming_pooled(prompt, **kwargs)
+            chunks: List[str] = []
+            try:
+                async for line in pooled_lines:
+                    text = self._handle_stream_json_line(line)
+                    if text:
+                        chunks.append(text)
+                        yield text
+            finally:
+                await pooled_lines.aclose()
+                # The pooled reader keeps the raw event lines; ``_ainfer()``
+                # parses ``_last_streaming_output``, so expose the text instead.
+                self._last_streaming_output = "".join(chunks)
+            return
+
         command = self.construct_command({"prompt": prompt}, **kwargs)
         full_command = self._build_full_command(command)
 
@@ -445,34 +469,52 @@ class ClaudeCodeCliInferencer(TerminalSessionInferencerBase):
 
         try:
             async for line_bytes in process.stdout:
-                line = line_bytes.decode("utf-8", errors="replace").strip()
-                if not line:
-                    continue
-                try:
-                    event = _json.loads(line)
-                except _json.JSONDecodeError:
-                    continue
-
-                event_type = event.get("type")
-
-                # Real-time streaming: text deltas are inside
-                # stream_event → event → content_block_delta → delta.text
-                if event_type == "stream_event":
-                    inner = event.get("event", {})
-                    if inner.get("type") == "content_block_delta":
-                        delta = inner.get("delta", {})
-                        if delta.get("type") == "text_delta" and delta.get("text"):
-                            yield delta["text"]
-
-                # Capture result event for session_id / cost / usage metadata
-                elif event_type == "result":
-                    self._last_stream_result = event
+                text = self._handle_stream_json_line(
+                    line_bytes.decode("utf-8", errors="replace")
+                )
+                if text:
+                    yield text
 
         finally:
             stderr_bytes = await process.stderr.read() if process.stderr else b""
             self._last_streaming_stderr = stderr_bytes.decode("utf-8", errors="replace")
             await process.wait()
 
+    def _handle_stream_json_line(self, line: str) -> Optional[str]:
+        """Decode one ``stream-json`` event line.
+
+        Captures the final ``result`` event into ``_last_stream_result``.
+
+        Args:
+            line: One line of ``--output-format stream-json`` output.
+
+        Returns:
+            The text delta carried by the event, or None.
+        """
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            event = json.loads(line)
+        except json.JSONDecodeError:
+            return None
+
+        event_type = event.get("type")
+
+        # Real-time streaming: text deltas are inside
+        # stream_event → event → content_block_delta → delta.text
+        if event_type == "stream_event":
+            inner = event.get("event", {})
+            if inner.get("type") == "content_block_delta":
+                delta = inner.get("delta", {})
+                if delta.get("type") == "text_delta" and delta.get("text"):
+                    return delta["text"]
+
+        # Capture result event for session_id / cost / usage metadata
+        elif event_type == "result":
+            self._last_stream_result = event
+        return None
+
     def _resolve_subprocess_timeout(
         self, override: Optional[float] = None
     ) -> float:
@@ -504,6 +546,9 @@ class ClaudeCodeCliInferencer(TerminalSessionInferencerBase):
         hangs. Timeout defaults to ``max(idle_timeout_seconds, 1800)``;
         callers can override via ``subprocess_timeout_seconds`` kwarg.
 
+        With ``process_pool`` set, the call runs on a pooled process instead
+        (see ``_ainfer_json_pooled``), under the same timeout.
+
         Args:
             inference_input: Input for inference.
             inference_config: Optional configuration (unused).
@@ -523,6 +568,21 @@ class ClaudeCodeCliInferencer(TerminalSessionInferencerBase):
         else:
             prompt = str(inference_input)
 
+        if self.process_pool is not None:
+            try:
+                # Pooled processes are bound to the loop that spawned them; the
+                # shared background loop keeps them usable across sync calls.
+                return get_default_loop_runner().run(
+                    self._ainfer_json_pooled(prompt, **kwargs), timeout=timeout
+                )
+            except concurrent.futures.TimeoutError:
+                logger.error(
+                    "[%s] Pooled subprocess timed out after %ss.",
+                    self.__class__.__name__,
+                    timeout,
+                )
+                raise subprocess.TimeoutExpired(self.claude_command, timeout)
+
         command = self.construct_command(inference_input, **kwargs)
         full_command = self._build_full_command(command)
 
@@ -546,6 +606,29 @@ class ClaudeCodeCliInferencer(TerminalSessionInferencerBase):
         result_dict = self.parse_output(result.stdout, result.stderr, result.returncode)
         return TerminalInferencerResponse.from_dict(result_dict)
 
+    async def _ainfer_json_pooled(self, prompt: str, **kwargs: Any) -> Any:
+        """Run one ``--output-format json`` call on a pooled process.
+
+        Args:
+            prompt: The prompt string, written to the process's stdin.
+            **kwargs: Additional arguments passed to ``construct_command()``.
+
+        Returns:
+            TerminalInferencerResponse wrapping ``parse_output()`` result.
+        """
+        pooled_lines = self._ainfer_streaming_pooled(prompt, **kwargs)
+        try:
+            async for _ in pooled_lines:
+                pass
+        finally:
+            await pooled_lines.aclose()
+        result_dict = self.parse_output(
+            self._last_streaming_output,
+            self._last_streaming_stderr,
+            self._last_streaming_return_code,
+        )
+        return TerminalInferencerResponse.from_dict(result_dict)
+
     # === Override: ainfer() — Session-Aware ===
 
     async def ainfer(
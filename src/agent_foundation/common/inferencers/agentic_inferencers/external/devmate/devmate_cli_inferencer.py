@@ -1,5 +1,6 @@
 """DevMate CLI inferencer for executing DevMate CLI commands."""
 
+import asyncio
 import json
 import os
 import tempfile
@@ -620,8 +621,13 @@ class DevmateCliInferencer(TerminalSessionInferencerBase):
             content_started = False
             pending_empty_lines = []
 
-            # Open cache file if configured
-            cache_file = self._open_cache_file(prompt) if self.cache_folder else None
+            # Open cache file if configured (off the loop: mkdir, open and
+            # the manifest insert all block)
+            cache_file = (
+                await asyncio.to_thread(self._open_cache_file, prompt)
+                if self.cache_folder
+                else None
+            )
             success = False
             error = None
 
@@ -653,7 +659,7 @@ class DevmateCliInferencer(TerminalSessionInferencerBase):
                 error = e
                 raise
             finally:
-                self._finalize_cache(cache_file, success, error)
+                await self._afinalize_cache(cache_file, success, error)
 
         finally:
             self.dump_output = original_dump_output
@@ -9,7 +9,7 @@ TerminalSessionInferencerBase implementation.
 import logging
 import os
 import subprocess
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional
 
 from attr import attrib, attrs
 from agent_foundation.common.inferencers.terminal_inferencers.terminal_session_inferencer_base import (
@@ -81,6 +81,9 @@ class KiroCliInferencer(TerminalSessionInferencerBase):
     idle_timeout_seconds: int = attrib(default=1800)
     large_input_mode: LargeInputMode = attrib(default=LargeInputMode.STDIN)
 
+    # construct_command() honors use_stdin, so process_pool is supported
+    supports_stdin_prompt: ClassVar[bool] = True
+
     def __attrs_post_init__(self) -> None:
         """Initialize defaults after attrs init."""
         from agent_foundation.common.inferencers.agentic_inferencers.external.kiro.common import (
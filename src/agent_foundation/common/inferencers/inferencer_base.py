@@ -4,7 +4,21 @@ import os
 from abc import ABC, abstractmethod
 from contextvars import ContextVar
 from functools import partial
-from typing import Any, AsyncIterator, Callable, Iterable, Iterator, List, Optional, Sequence, Type, Union
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
 
 from attr import attrib, attrs
 from rich_python_utils.common_objects.debuggable import Debuggable
@@ -12,6 +26,15 @@ from rich_python_utils.common_objects.workflow.common.resumable import Resumable
 from rich_python_utils.common_utils import dict_, iter__, resolve_environ
 from rich_python_utils.common_utils.function_helper import FallbackMode, execute_with_retry
 
+from agent_foundation.common.inferencers.rate_limiter import RateLimiter
+from agent_foundation.common.inferencers.request_coalescing import RequestCoalescer
+from agent_foundation.common.inferencers.response_cache import (
+    CACHE_MISS,
+    ResponseCacheBase,
+    ResponseCacheStats,
+    build_response_cache_key,
+)
+
 # Retry prompt mode constants
 RETRY_PROMPT_MODES = ("original", "simple_retry", "retry_with_original")
 
@@ -68,6 +91,14 @@ class InferencerBase(Debuggable, Resumable, ABC):
         input_preprocessor (Callable): Optional input preprocessor.
         response_post_processor (Callable): Optional response post-processor.
         post_response_merger (str, Callable): Optional response merger for iterator inputs.
+        response_cache (ResponseCacheBase): Optional content-addressed response cache. When set,
+            ``_infer_single``/``_ainfer_single`` serve identical requests from the cache before
+            entering the retry/fallback loop. Pass ``use_response_cache=False`` per call to bypass.
+        request_coalescer (RequestCoalescer): Optional single-flight coalescer. When set, concurrent
+            identical requests share one execution of the retry/fallback loop.
+        rate_limiter (RateLimiter): Optional request/token rate and adaptive concurrency controller.
+            Gates every upstream attempt (including retries and self-recovery) and backs off on
+            throttling errors. Share one instance across inferencers hitting the same backend.
     """
 
     model_id: str = attrib(default="")
@@ -128,6 +159,24 @@ class InferencerBase(Debuggable, Resumable, ABC):
     template_root_space: Optional[str] = attrib(default=None)
     template_extra_feed: dict = attrib(factory=dict)
 
+    # === Response cache (opt-in) ===
+    # Keyed by rendered prompt + class + _response_cache_config() + inference
+    # args. May be shared across instances; stats are tracked per instance.
+    response_cache: Optional[ResponseCacheBase] = attrib(default=None)
+    _response_cache_stats: ResponseCacheStats = attrib(
+        init=False, factory=ResponseCacheStats, repr=False
+    )
+
+    # === Request coalescing (opt-in) ===
+    # Concurrent identical requests (same fingerprint as the response cache)
+    # share one upstream call. May be shared across instances.
+    request_coalescer: Optional[RequestCoalescer] = attrib(default=None)
+
+    # === Rate limiting (opt-in) ===
+    # Token buckets + AIMD concurrency applied per attempt inside the retry
+    # loop, so throttling errors seen by retries shrink the shared limit.
+    rate_limiter: Optional[RateLimiter] = attrib(default=None)
+
     def __attrs_post_init__(self):
         if isinstance(self.post_response_merger, str):
             if self.post_response_merger == "default":
@@ -310,6 +359,105 @@ class InferencerBase(Debuggable, Resumable, ABC):
         """
         return self._try_resume_from_cache(inference_input, inference_config, **kwargs)
 
+    # -- Response cache -----------------------------------------------------
+
+    @property
+    def response_cache_stats(self) -> ResponseCacheStats:
+        """Hit/miss/write counters for this inferencer's response cache lookups."""
+        return self._response_cache_stats
+
+    def _response_cache_config(self) -> dict:
+        """Inferencer configuration that affects responses and therefore the cache key.
+
+        Base implementation returns ``model_id`` only.  Subclasses with
+        response-affecting attributes that are not forwarded through
+        ``default_inference_args`` (e.g. a system prompt or endpoint) should
+        extend the returned dict.
+        """
+        return {"model_id": self.model_id}
+
+    def _request_fingerprint(
+        self, inference_input: Any, inference_config: Any, inference_args: dict
+    ) -> Optional[str]:
+        """Content-addressed request key shared by the response cache and request coalescing.
+
+        Returns ``None`` when the request cannot be fingerprinted (unserializable args).
+        """
+        try:
+            return build_response_cache_key(
+                namespace=f"{type(self).__module__}.{type(self).__qualname__}",
+                prompt=inference_input,
+                config=self._response_cache_config(),
+                inference_config=inference_config,
+                inference_args=inference_args,
+            )
+        except (TypeError, ValueError) as e:
+            self.log_debug(f"Unfingerprintable request: {e}", "RequestFingerprint")
+            return None
+
+    def _response_cache_get(self, cache_key: Optional[str]) -> Any:
+        """Look up ``cache_key``; returns ``CACHE_MISS`` on miss or error."""
+        if cache_key is None:
+            return CACHE_MISS
+        try:
+            cached = self.response_cache.get(cache_key)
+        except Exception as e:
+            self._response_cache_stats.record("errors")
+            _logger.warning(f"{type(self).__name__}: response cache read failed: {e}")
+            return CACHE_MISS
+        if cached is CACHE_MISS:
+            self._response_cache_stats.record("misses")
+        else:
+            self._response_cache_stats.record("hits")
+            self.log_debug(cache_key, "ResponseCacheHit")
+        return cached
+
+    def _response_cache_set(self, cache_key: Optional[str], response: Any) -> None:
+        """Store a successful raw ``_infer`` response under ``cache_key``.
+
+        ``None`` and the configured ``default_return_or_raise`` value (returned
+        when all retries fail) are never cached. Callers skip this for
+        responses returned by a ``fallback_inferencer``.
+        """
+        if cache_key is None or response is None:
+            return
+        if (
+            self.default_return_or_raise is not None
+            and response is self.default_return_or_raise
+        ):
+            return
+        try:
+            self.response_cache.set(cache_key, response)
+            self._response_cache_stats.record("writes")
+        except Exception as e:
+            self._response_cache_stats.record("errors")
+            _logger.warning(f"{type(self).__name__}: response cache write failed: {e}")
+
+    # -- Rate limiting ------------------------------------------------------
+
+    def _rate_limited(self, func: Callable) -> Callable:
+        """Gate each call of a sync attempt function through ``rate_limiter`` (if set)."""
+        if self.rate_limiter is None:
+            return func
+        return self.rate_limiter.wrap(func)
+
+    def _arate_limited(self, func: Callable) -> Callable:
+        """Gate each call of an async attempt function through ``rate_limiter`` (if set)."""
+        if self.rate_limiter is None:
+            return func
+        return self.rate_limiter.awrap(func)
+
+    def _default_max_concurrency(self) -> int:
+        """Default worker/semaphore size for the parallel entry points.
+
+        With a ``rate_limiter`` the pool is sized to its ``max_concurrency``;
+        the limiter's adaptive limit then governs how many attempts actually
+        run.  Otherwise 32.
+        """
+        if self.rate_limiter is not None:
+            return self.rate_limiter.max_concurrency
+        return 32
+
     # -- Inference pipeline -------------------------------------------------
 
     def _infer_single(
@@ -381,6 +529,8 @@ class InferencerBase(Debuggable, Resumable, ABC):
         fallback_mode = inference_args.pop("fallback_mode", self.fallback_mode)
         on_fallback_callback = inference_args.pop("on_fallback_callback", None)
         retry_prompt_mode = inference_args.pop("retry_prompt_mode", "original")
+        use_response_cache = inference_args.pop("use_response_cache", True)
+        coalesce_request = inference_args.pop("coalesce_request", True)
 
         # Per-attempt timeout is async-only — reject in sync path
         if attempt_timeout and attempt_timeout > 0:
@@ -396,6 +546,26 @@ class InferencerBase(Debuggable, Resumable, ABC):
                 f"Must be one of {RETRY_PROMPT_MODES}"
             )
 
+        # Response cache: serve identical requests before the retry/fallback loop
+        use_response_cache = use_response_cache and self.response_cache is not None
+        coalesce_request = coalesce_request and self.request_coalescer is not None
+        fingerprint = (
+            self._request_fingerprint(inference_input, inference_config, inference_args)
+            if use_response_cache or coalesce_request
+            else None
+        )
+        cache_key = fingerprint if use_response_cache else None
+        coalesce_key = fingerprint if coalesce_request else None
+        cached_response = self._response_cache_get(cache_key)
+        if cached_response is not CACHE_MISS:
+            # Run the same post-processing tail as the normal path
+            cached_response = self._finalize_output(cached_response)
+            if self.state_graphs:
+                self.update_state_graphs(cached_response)
+            if self.response_post_processor is not None:
+                cached_response = self.response_post_processor(cached_response)
+            return cached_response
+
         # Mutable args list — prompt can be swapped by the retry callback
         retry_args = [inference_input]
 
@@ -429,7 +599,12 @@ class InferencerBase(Debuggable, Resumable, ABC):
         effective_total_timeout = total_timeout or None
 
         # -- Build _fallback_state and fallback chain --
-        _fallback_state = {"last_exception": None, "partial_output": None, "cache_path": None}
+        _fallback_state = {
+            "last_exception": None,
+            "partial_output": None,
+            "cache_path": None,
+            "external_fallback": False,
+        }
 
         # Recovery wrapper — reads from closure-captured _fallback_state
         def _recovery_wrapper(inp, **kw):
@@ -449,17 +624,21 @@ class InferencerBase(Debuggable, Resumable, ABC):
                 if isinstance(self.fallback_inferencer, list)
                 else [self.fallback_inferencer]
             )
-            external_wrappers = [
-                lambda inp, inf=inf, **kw: inf.infer(inp, inference_config, **kw)
-                for inf in fb_list
-            ]
+
+            def _external_wrapper(inp, inf, **kw):
+                _fallback_state["external_fallback"] = True
+                return inf.infer(inp, inference_config, **kw)
+
+            external_wrappers = [partial(_external_wrapper, inf=inf) for inf in fb_list]
 
         # Build fallback chain and mode for the retry helper
         if fallback_mode == FallbackMode.NEVER:
             effective_fallback_func = None
             effective_fallback_mode = FallbackMode.NEVER
         else:
-            effective_fallback_func = [_recovery_wrapper] + external_wrappers
+            effective_fallback_func = [
+                self._rate_limited(_recovery_wrapper)
+            ] + external_wrappers
             effective_fallback_mode = fallback_mode
 
         # Transition callback — populates _fallback_state and resets retry_args[0]
@@ -481,11 +660,12 @@ class InferencerBase(Debuggable, Resumable, ABC):
             if _user_on_fallback is not None:
                 _user_on_fallback(from_func, to_func, exception, total_attempts)
 
-        # Set ContextVar for this call (per-thread safe for sync path)
-        token = _current_fallback_state.set(_fallback_state)
-        try:
-            inference_response = execute_with_retry(
-                func=partial(self._infer, inference_config=inference_config),
+        # Retry loop + cache write; shared by coalesced followers when enabled
+        def _execute():
+            response = execute_with_retry(
+                func=self._rate_limited(
+                    partial(self._infer, inference_config=inference_config)
+                ),
                 max_retry=self.max_retry,
                 min_retry_wait=self.min_retry_wait,
                 max_retry_wait=self.max_retry_wait,
@@ -498,6 +678,20 @@ class InferencerBase(Debuggable, Resumable, ABC):
                 fallback_mode=effective_fallback_mode,
                 on_fallback_callback=_on_transition if effective_fallback_func else None,
             )
+            # A fallback inferencer's answer must not be served for this
+            # inferencer's key once the primary recovers.
+            if not _fallback_state["external_fallback"]:
+                self._response_cache_set(cache_key, response)
+            return response
+
+        # Set ContextVar for this call (per-thread safe for sync path)
+        token = _current_fallback_state.set(_fallback_state)
+        try:
+            if coalesce_key is not None:
+                # Single-flight: concurrent identical requests share one execution
+                inference_response = self.request_coalescer.run(coalesce_key, _execute)
+            else:
+                inference_response = _execute()
         except TimeoutError:
             self.log_info(
                 f"Total timeout after {total_timeout}s",
@@ -708,7 +902,8 @@ class InferencerBase(Debuggable, Resumable, ABC):
                 Generators are supported (materialized internally).
             inference_config: Optional configuration passed to each _infer_single call.
             num_workers: Number of pool workers. None = auto:
-                threading (default): min(len(inputs), 32) for I/O-bound work.
+                threading (default): min(len(inputs), 32) for I/O-bound work
+                (``rate_limiter.max_concurrency`` instead of 32 when set).
                 multiprocessing: get_suggested_num_workers() respecting CPU count.
                 Always capped at len(inputs).
             use_threading: True (default) uses ThreadPool — no pickling required.
@@ -739,7 +934,7 @@ class InferencerBase(Debuggable, Resumable, ABC):
 
         if num_workers is None:
             if use_threading:
-                num_workers = min(num_inputs, 32)
+                num_workers = min(num_inputs, self._default_max_concurrency())
             else:
                 from rich_python_utils.mp_utils.common import get_suggested_num_workers
 
@@ -928,6 +1123,8 @@ class InferencerBase(Debuggable, Resumable, ABC):
         fallback_mode = inference_args.pop("fallback_mode", self.fallback_mode)
         on_fallback_callback = inference_args.pop("on_fallback_callback", None)
         retry_prompt_mode = inference_args.pop("retry_prompt_mode", "original")
+        use_response_cache = inference_args.pop("use_response_cache", True)
+        coalesce_request = inference_args.pop("coalesce_request", True)
 
         # Validate retry_prompt_mode
         if retry_prompt_mode not in RETRY_PROMPT_MODES:
@@ -936,6 +1133,26 @@ class InferencerBase(Debuggable, Resumable, ABC):
                 f"Must be one of {RETRY_PROMPT_MODES}"
             )
 
+        # Response cache: serve identical requests before the retry/fallback loop
+        use_response_cache = use_response_cache and self.response_cache is not None
+        coalesce_request = coalesce_request and self.request_coalescer is not None
+        fingerprint = (
+            self._request_fingerprint(inference_input, inference_config, inference_args)
+            if use_response_cache or coalesce_request
+            else None
+        )
+        cache_key = fingerprint if use_response_cache else None
+        coalesce_key = fingerprint if coalesce_request else None
+        cached_response = self._response_cache_get(cache_key)
+        if cached_response is not CACHE_MISS:
+            # Run the same post-processing tail as the normal path
+            cached_response = self._finalize_output(cached_response)
+            if self.state_graphs:
+                self.update_state_graphs(cached_response)
+            if self.response_post_processor is not None:
+                cached_response = self.response_post_processor(cached_response)
+            return cached_response
+
         # Mutable args list — prompt can be swapped by the retry callback
         retry_args = [inference_input]
 
@@ -970,7 +1187,12 @@ class InferencerBase(Debuggable, Resumable, ABC):
         effective_attempt_timeout = attempt_timeout or None
 
         # -- Build _fallback_state and fallback chain --
-        _fallback_state = {"last_exception": None, "partial_output": None, "cache_path": None}
+        _fallback_state = {
+            "last_exception": None,
+            "partial_output": None,
+            "cache_path": None,
+            "external_fallback": False,
+        }
 
         # Recovery wrapper — reads from closure-captured _fallback_state
         async def _recovery_wrapper(inp, **kw):
@@ -990,17 +1212,21 @@ class InferencerBase(Debuggable, Resumable, ABC):
                 if isinstance(self.fallback_inferencer, list)
                 else [self.fallback_inferencer]
             )
-            external_wrappers = [
-                lambda inp, inf=inf, **kw: inf.ainfer(inp, inference_config, **kw)
-                for inf in fb_list
-            ]
+
+            async def _external_wrapper(inp, inf, **kw):
+                _fallback_state["external_fallback"] = True
+                return await inf.ainfer(inp, inference_config, **kw)
+
+            external_wrappers = [partial(_external_wrapper, inf=inf) for inf in fb_list]
 
         # Build fallback chain and mode for the retry helper
         if fallback_mode == FallbackMode.NEVER:
             effective_fallback_func = None
             effective_fallback_mode = FallbackMode.NEVER
         else:
-            effective_fallback_func = [_recovery_wrapper] + external_wrappers
+            effective_fallback_func = [
+                self._arate_limited(_recovery_wrapper)
+            ] + external_wrappers
             effective_fallback_mode = fallback_mode
 
         # Transition callback — populates _fallback_state and resets retry_args[0]
@@ -1024,11 +1250,12 @@ class InferencerBase(Debuggable, Resumable, ABC):
                 if asyncio.iscoroutine(result):
                     await result
 
-        # Set ContextVar for this call (per-task safe under aparallel_infer)
-        token = _current_fallback_state.set(_fallback_state)
-        try:
-            inference_response = await async_execute_with_retry(
-                func=lambda inp: self._ainfer(inp, inference_config, **inference_args),
+        # Retry loop + cache write; shared by coalesced followers when enabled
+        async def _aexecute():
+            response = await async_execute_with_retry(
+                func=self._arate_limited(
+                    lambda inp: self._ainfer(inp, inference_config, **inference_args)
+                ),
                 max_retry=self.max_retry,
                 min_retry_wait=self.min_retry_wait,
                 max_retry_wait=self.max_retry_wait,
@@ -1041,6 +1268,22 @@ class InferencerBase(Debuggable, Resumable, ABC):
                 fallback_mode=effective_fallback_mode,
                 on_fallback_callback=_on_transition if effective_fallback_func else None,
             )
+            # A fallback inferencer's answer must not be served for this
+            # inferencer's key once the primary recovers.
+            if not _fallback_state["external_fallback"]:
+                self._response_cache_set(cache_key, response)
+            return response
+
+        # Set ContextVar for this call (per-task safe under aparallel_infer)
+        token = _current_fallback_state.set(_fallback_state)
+        try:
+            if coalesce_key is not None:
+                # Single-flight: concurrent identical requests share one execution
+                inference_response = await self.request_coalescer.arun(
+                    coalesce_key, _aexecute
+                )
+            else:
+                inference_response = await _aexecute()
         except TimeoutError:
             self.log_info(
                 f"Total timeout after {total_timeout}s",
@@ -1176,7 +1419,8 @@ class InferencerBase(Debuggable, Resumable, ABC):
                 Generators are supported (materialized internally).
             inference_config: Optional configuration passed to each _ainfer_single call.
             max_concurrency: Maximum number of concurrent tasks. None defaults to
-                min(len(inputs), 32) to prevent unbounded concurrency.
+                min(len(inputs), 32) to prevent unbounded concurrency
+                (``rate_limiter.max_concurrency`` instead of 32 when set).
             debug: True runs sequentially via await loop (parity with sync
                 parallel_infer debug mode).
             **_inference_args: Additional keyword arguments merged with
@@ -1189,6 +1433,8 @@ class InferencerBase(Debuggable, Resumable, ABC):
         Note:
             post_response_merger is NOT auto-applied — same rationale as
             parallel_infer. Users can apply their own merging on the returned list.
+            For large batches, use aiter_parallel_infer() to consume results as
+            they complete without materializing inputs or results.
         """
         inference_inputs = list(inference_inputs)
         if not inference_inputs:
@@ -1210,7 +1456,7 @@ class InferencerBase(Debuggable, Resumable, ABC):
             return results
 
         if max_concurrency is None:
-            max_concurrency = min(num_inputs, 32)
+            max_concurrency = min(num_inputs, self._default_max_concurrency())
 
         self.log_debug(
             f"{num_inputs} inputs, max_concurrency={max_concurrency}",
@@ -1229,6 +1475,120 @@ class InferencerBase(Debuggable, Resumable, ABC):
         results = await asyncio.gather(*tasks)
         return list(results)
 
+    async def aiter_parallel_infer(
+        self,
+        inference_inputs: Union[Iterable[Any], AsyncIterable[Any]],
+        inference_config: Any = None,
+        max_concurrency: int = None,
+        preserve_order: bool = False,
+        max_reorder_buffer: int = None,
+        return_exceptions: bool = False,
+        **_inference_args,
+    ) -> AsyncIterator[Tuple[int, Any]]:
+        """Streaming variant of aparallel_infer() yielding ``(index, result)`` as items complete.
+
+        Inputs are pulled lazily — at most ``max_concurrency`` items are in
+        flight at any time — so sync or async input streams of any length are
+        processed with bounded memory.  Results are yielded as soon as they
+        are available instead of after the slowest item.
+
+        Args:
+            inference_inputs: Iterable or async iterable of inputs. Consumed lazily.
+            inference_config: Optional configuration passed to each _ainfer_single call.
+            max_concurrency: Maximum number of in-flight items. None defaults to 32
+                (``rate_limiter.max_concurrency`` when set).
+            preserve_order: False (default) yields in completion order. True holds
+                completed results in a reorder buffer and yields in input order.
+            max_reorder_buffer: With ``preserve_order``, maximum number of completed
+                results held while waiting for an earlier item. When full, no new
+                inputs are started until the head-of-line item completes.
+                None defaults to ``max_concurrency``.
+            return_exceptions: False (default) re-raises the first failure and
+                cancels in-flight items. True yields the exception object as the
+                result for the failing index.
+            **_inference_args: Additional keyword arguments merged with
+                default_inference_args and passed to _ainfer_single().
+
+        Yields:
+            ``(index, result)`` tuples, where ``index`` is the position of the
+            input in ``inference_inputs``.
+
+        Note:
+            Closing the generator early (e.g. ``break`` in ``async for``)
+            cancels all in-flight items.
+        """
+        if max_concurrency is None:
+            max_concurrency = self._default_max_concurrency()
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        if max_reorder_buffer is None:
+            max_reorder_buffer = max_concurrency
+        if max_reorder_buffer < 1:
+            raise ValueError(f"max_reorder_buffer must be >= 1, got {max_reorder_buffer}")
+
+        if isinstance(inference_inputs, AsyncIterable):
+            async_source = inference_inputs.__aiter__()
+            sync_source = None
+        else:
+            async_source = None
+            sync_source = iter(inference_inputs)
+
+        pending: Dict[asyncio.Task, int] = {}
+        reorder_buffer: Dict[int, Any] = {}
+        next_input_index = 0
+        next_yield_index = 0
+        exhausted = False
+
+        try:
+            while True:
+                # Refill the window from the (lazy) input stream
+                while (
+                    not exhausted
+                    and len(pending) < max_concurrency
+                    and (not preserve_order or len(reorder_buffer) < max_reorder_buffer)
+                ):
+                    try:
+                        if async_source is not None:
+                            inp = await async_source.__anext__()
+                        else:
+                            inp = next(sync_source)
+                    except (StopIteration, StopAsyncIteration):
+                        exhausted = True
+                        break
+                    task = asyncio.ensure_future(
+                        self._ainfer_single(inp, inference_config, **_inference_args)
+                    )
+                    pending[task] = next_input_index
+                    next_input_index += 1
+
+                if not pending:
+                    break
+
+                done, _ = await asyncio.wait(
+                    pending.keys(), return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=pending.get):
+                    index = pending.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        if not return_exceptions:
+                            raise
+                        result = e
+
+                    if not preserve_order:
+                        yield index, result
+                        continue
+                    reorder_buffer[index] = result
+                    while next_yield_index in reorder_buffer:
+                        yield next_yield_index, reorder_buffer.pop(next_yield_index)
+                        next_yield_index += 1
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
     # region Async Lifecycle Methods
 
     async def aconnect(self, **kwargs):
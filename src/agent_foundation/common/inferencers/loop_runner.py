@@ -0,0 +1,231 @@
+"""Long-lived background event loop for sync-to-async bridging.
+
+Synchronous entry points (Flask handlers, CLIs) that call async inferencer
+code typically do so with ``asyncio.run`` on a fresh thread.  That creates and
+tears down a full event loop per call, which is measurable overhead on hot
+paths and — worse — invalidates any loop-bound client state (subprocess
+transports, HTTP sessions, SDK clients opened via ``aconnect``), forcing a
+reconnect on every call.
+
+``BackgroundLoopRunner`` owns a single event loop running forever on a daemon
+thread.  Sync callers submit coroutines (``run``/``submit``) or async
+generators (``iterate``) to it and block on the result.  Because the loop
+outlives each call, connections opened on it survive across calls.
+
+Context variables of the calling thread are propagated into submitted work:
+``asyncio.run_coroutine_threadsafe`` schedules through ``call_soon_threadsafe``
+which captures ``contextvars.copy_context()`` of the caller.
+
+Usage:
+    runner = get_default_loop_runner()
+    result = runner.run(client.ainfer("hi"))
+    for chunk in runner.iterate(lambda: client.ainfer_streaming("hi")):
+        print(chunk)
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import logging
+import queue
+import threading
+from typing import Any, AsyncIterator, Callable, Coroutine, Iterator, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_ITEM, _ERROR, _DONE = 0, 1, 2
+
+
+class BackgroundLoopRunner:
+    """Runs an asyncio event loop forever on a dedicated daemon thread.
+
+    The loop and thread are created lazily on first use and recreated if they
+    have been stopped.  ``stop()`` is registered with ``atexit`` for the shared
+    default runner.
+    """
+
+    def __init__(self, name: str = "background-loop-runner"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The running background loop (started on demand)."""
+        return self._ensure_started()
+
+    @property
+    def is_running(self) -> bool:
+        return (
+            self._thread is not None
+            and self._thread.is_alive()
+            and self._loop is not None
+            and not self._loop.is_closed()
+        )
+
+    def in_runner_thread(self) -> bool:
+        """True when called from the runner's own loop thread.
+
+        Blocking on the runner from its own thread would deadlock; callers use
+        this to fall back to a different bridging strategy.
+        """
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        if self.is_running:
+            return self._loop
+        with self._lock:
+            if self.is_running:
+                return self._loop
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+
+            def _run() -> None:
+                asyncio.set_event_loop(loop)
+                loop.call_soon(started.set)
+                try:
+                    loop.run_forever()
+                finally:
+                    try:
+                        _cancel_pending(loop)
+                        loop.run_until_complete(loop.shutdown_asyncgens())
+                    finally:
+                        loop.close()
+
+            thread = threading.Thread(target=_run, name=self.name, daemon=True)
+            thread.start()
+            started.wait()
+            self._loop, self._thread = loop, thread
+            return loop
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "concurrent.futures.Future[T]":
+        """Schedule ``coro`` on the background loop and return a thread-safe future."""
+        if self.in_runner_thread():
+            coro.close()
+            raise RuntimeError(
+                "BackgroundLoopRunner.submit() called from the runner's own thread; "
+                "await the coroutine directly instead"
+            )
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_started())
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Run ``coro`` on the background loop and block until it completes.
+
+        On ``timeout`` (or ``KeyboardInterrupt`` in the caller) the coroutine is
+        cancelled on the loop before the exception propagates.
+        """
+        future = self.submit(coro)
+        try:
+            return future.result(timeout=timeout)
+        except BaseException:
+            future.cancel()
+            raise
+
+    def iterate(
+        self,
+        agen_factory: Callable[[], AsyncIterator[T]],
+        max_buffer: int = 0,
+    ) -> Iterator[T]:
+        """Drive an async iterator on the background loop and yield its items.
+
+        Args:
+            agen_factory: Zero-arg callable returning the async iterator.  It
+                is invoked on the loop thread so loop-bound resources are
+                created there.
+            max_buffer: Maximum items queued ahead of the consumer
+                (0 = unbounded).  A bounded buffer applies backpressure to
+                the producer without blocking the loop.
+
+        Closing the returned generator early (``break``, ``close()``, garbage
+        collection) cancels the producer on the loop.
+        """
+        items: "queue.Queue[tuple]" = queue.Queue()
+        # Created on the loop thread inside ``_pump`` so it binds to that loop.
+        credits: list = []
+
+        async def _pump() -> None:
+            if max_buffer > 0:
+                credits.append(asyncio.Semaphore(max_buffer))
+            agen = agen_factory()
+            try:
+                async for item in agen:
+                    if credits:
+                        await credits[0].acquire()
+                    items.put((_ITEM, item))
+            except BaseException as e:  # includes CancelledError
+                items.put((_ERROR, e))
+                if isinstance(e, asyncio.CancelledError):
+                    raise
+            else:
+                items.put((_DONE, None))
+            finally:
+                aclose = getattr(agen, "aclose", None)
+                if aclose is not None:
+                    try:
+                        await aclose()
+                    except Exception:
+                        logger.debug("aclose() failed in iterate()", exc_info=True)
+
+        future = self.submit(_pump())
+        loop = self._loop
+        finished = False
+        try:
+            while True:
+                kind, value = items.get()
+                if kind == _ITEM:
+                    if credits:
+                        loop.call_soon_threadsafe(credits[0].release)
+                    yield value
+                elif kind == _ERROR:
+                    finished = True
+                    if isinstance(value, asyncio.CancelledError):
+                        return
+                    raise value
+                else:
+                    finished = True
+                    return
+        finally:
+            if not finished:
+                future.cancel()
+                try:
+                    future.result(timeout=5.0)
+                except BaseException:
+                    pass
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the loop (cancelling pending tasks) and join the thread."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or thread is None:
+            return
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(loop.stop)
+        if thread is not threading.current_thread():
+            thread.join(timeout)
+
+
+def _cancel_pending(loop: asyncio.AbstractEventLoop) -> None:
+    pending = [t for t in asyncio.all_tasks(loop) if not t.done()]
+    if not pending:
+        return
+    for task in pending:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+
+_default_runner: Optional[BackgroundLoopRunner] = None
+_default_runner_lock = threading.Lock()
+
+
+def get_default_loop_runner() -> BackgroundLoopRunner:
+    """Return the process-wide shared ``BackgroundLoopRunner``."""
+    global _default_runner
+    with _default_runner_lock:
+        if _default_runner is None:
+            _default_runner = BackgroundLoopRunner(name="inferencer-loop-runner")
+            atexit.register(_default_runner.stop)
+        return _default_runner
@@ -0,0 +1,355 @@
+"""Token-bucket rate limiting and AIMD adaptive concurrency for inferencers.
+
+``RateLimiter`` combines three controls that gate every upstream attempt
+made by ``InferencerBase._infer_single`` / ``_ainfer_single`` (including
+retries and self-recovery attempts):
+
+    - a requests/second token bucket,
+    - a tokens/minute token bucket (prompt size estimated by ``token_estimator``),
+    - an AIMD concurrency limit: additive increase on success, multiplicative
+      decrease plus a short global cooldown when an attempt fails with a
+      throttling error (HTTP 429, "rate limit", "overloaded", ...).
+
+All primitives are thread-safe and usable from sync threads and asyncio
+tasks at the same time, so one limiter can be shared by every inferencer
+instance that hits the same backend (see ``get_shared_rate_limiter``).
+
+Usage:
+    >>> limiter = get_shared_rate_limiter("bedrock/claude", requests_per_second=5)
+    >>> inferencer = MyInferencer(rate_limiter=limiter)  # doctest: +SKIP
+"""
+
+import asyncio
+import functools
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from attr import attrib, attrs
+
+_THROTTLING_MARKERS = (
+    "429",
+    "rate limit",
+    "rate_limit",
+    "ratelimit",
+    "too many requests",
+    "throttl",
+    "overloaded",
+    "quota exceeded",
+)
+
+
+def is_throttling_error(exception: BaseException) -> bool:
+    """Heuristically classify ``exception`` as backend throttling.
+
+    Checks common ``status_code``/``status`` attributes for 429 and the
+    exception type name and message for well-known throttling markers.
+    """
+    for attr_name in ("status_code", "status", "http_status"):
+        if getattr(exception, attr_name, None) == 429:
+            return True
+    text = f"{type(exception).__name__} {exception}".lower()
+    return any(marker in text for marker in _THROTTLING_MARKERS)
+
+
+def estimate_tokens(prompt: Any) -> int:
+    """Rough prompt token estimate (~4 characters per token)."""
+    if prompt is None:
+        return 0
+    return len(str(prompt)) // 4 + 1
+
+
+@attrs
+class TokenBucket:
+    """Thread-safe token bucket with reservation semantics.
+
+    ``reserve(n)`` always succeeds immediately and returns how long the
+    caller must wait before proceeding; the bucket may go into debt, which
+    keeps requests larger than ``capacity`` admissible and preserves FIFO
+    fairness between waiters.
+
+    Attributes:
+        rate: Tokens refilled per second.
+        capacity: Maximum burst size. None defaults to ``rate`` (one second of burst).
+    """
+
+    rate: float = attrib()
+    capacity: Optional[float] = attrib(default=None)
+    _tokens: float = attrib(init=False, default=0.0)
+    _last_refill: float = attrib(init=False, factory=time.monotonic)
+    _lock: threading.Lock = attrib(init=False, factory=threading.Lock, repr=False)
+
+    def __attrs_post_init__(self):
+        if self.rate <= 0:
+            raise ValueError(f"TokenBucket rate must be > 0, got {self.rate}")
+        if self.capacity is None:
+            self.capacity = max(self.rate, 1.0)
+        self._tokens = self.capacity
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take ``tokens`` from the bucket; returns seconds to wait before using them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._last_refill) * self.rate
+            )
+            self._last_refill = now
+            self._tokens -= tokens
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+
+@attrs
+class AdaptiveConcurrencyLimiter:
+    """AIMD concurrency limit shared by threads and asyncio tasks.
+
+    Attributes:
+        max_limit: Upper bound for the concurrency limit.
+        min_limit: Lower bound for the concurrency limit.
+        initial_limit: Starting limit. None defaults to ``max_limit``.
+        increase_step: Limit increase per full window of successful attempts
+            (i.e. ``+increase_step / limit`` per success).
+        decrease_factor: Multiplier applied to the limit on throttling.
+        adaptive: False keeps the limit fixed at ``initial_limit``.
+    """
+
+    max_limit: int = attrib(default=32)
+    min_limit: int = attrib(default=1)
+    initial_limit: Optional[int] = attrib(default=None)
+    increase_step: float = attrib(default=1.0)
+    decrease_factor: float = attrib(default=0.5)
+    adaptive: bool = attrib(default=True)
+    _limit: float = attrib(init=False, default=0.0)
+    _in_flight: int = attrib(init=False, default=0)
+    _cond: threading.Condition = attrib(init=False, factory=threading.Condition, repr=False)
+    _async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = attrib(
+        init=False, factory=list, repr=False
+    )
+
+    def __attrs_post_init__(self):
+        if not 1 <= self.min_limit <= self.max_limit:
+            raise ValueError(
+                f"Require 1 <= min_limit <= max_limit, got {self.min_limit}, {self.max_limit}"
+            )
+        initial = self.max_limit if self.initial_limit is None else self.initial_limit
+        self._limit = float(min(max(initial, self.min_limit), self.max_limit))
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def acquire(self) -> None:
+        with self._cond:
+            while self._in_flight >= int(self._limit):
+                self._cond.wait()
+            self._in_flight += 1
+
+    async def aacquire(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._cond:
+                if self._in_flight < int(self._limit):
+                    self._in_flight += 1
+                    return
+                waiter = (loop, loop.create_future())
+                self._async_waiters.append(waiter)
+            try:
+                await waiter[1]
+            finally:
+                with self._cond:
+                    if waiter in self._async_waiters:
+                        self._async_waiters.remove(waiter)
+
+    def release(self, throttled: bool = False, succeeded: bool = True) -> None:
+        """Release a slot and feed the outcome of the attempt into the AIMD controller."""
+        with self._cond:
+            self._in_flight -= 1
+            if self.adaptive:
+                if throttled:
+                    self._limit = max(self.min_limit, self._limit * self.decrease_factor)
+                elif succeeded:
+                    self._limit = min(
+                        self.max_limit, self._limit + self.increase_step / self._limit
+                    )
+            self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        self._cond.notify_all()
+        waiters, self._async_waiters = self._async_waiters, []
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(_resolve_future, future)
+            except RuntimeError:
+                # Waiter's event loop is already closed
+                pass
+
+
+def _resolve_future(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+@attrs
+class RateLimitStats:
+    """Counters exposed by ``RateLimiter.stats``."""
+
+    attempts: int = attrib(default=0)
+    throttled: int = attrib(default=0)
+    wait_seconds: float = attrib(default=0.0)
+
+
+@attrs
+class RateLimiter:
+    """Request-rate, token-rate and adaptive concurrency controller for one backend.
+
+    Attributes:
+        requests_per_second: Request rate limit. 0 = disabled.
+        tokens_per_minute: Estimated prompt-token rate limit. 0 = disabled.
+        max_concurrency: Upper bound for concurrent attempts (also used as the
+            default pool/semaphore size by ``parallel_infer``/``aparallel_infer``).
+        min_concurrency: Lower bound the AIMD controller can back off to.
+        initial_concurrency: Starting concurrency. None defaults to ``max_concurrency``.
+        adaptive: False disables AIMD adjustment (fixed ``initial_concurrency``).
+        decrease_factor: AIMD multiplicative decrease on throttling.
+        throttle_cooldown_seconds: After a throttling error, new attempts from
+            every sharer wait this long before starting. 0 = disabled.
+        token_estimator: Maps a prompt to an estimated token count.
+        throttling_classifier: Decides whether an exception is throttling.
+    """
+
+    requests_per_second: float = attrib(default=0)
+    tokens_per_minute: float = attrib(default=0)
+    max_concurrency: int = attrib(default=32)
+    min_concurrency: int = attrib(default=1)
+    initial_concurrency: Optional[int] = attrib(default=None)
+    adaptive: bool = attrib(default=True)
+    decrease_factor: float = attrib(default=0.5)
+    throttle_cooldown_seconds: float = attrib(default=1.0)
+    token_estimator: Callable[[Any], int] = attrib(default=estimate_tokens)
+    throttling_classifier: Callable[[BaseException], bool] = attrib(
+        default=is_throttling_error
+    )
+    stats: RateLimitStats = attrib(init=False, factory=RateLimitStats)
+    _request_bucket: Optional[TokenBucket] = attrib(init=False, default=None, repr=False)
+    _token_bucket: Optional[TokenBucket] = attrib(init=False, default=None, repr=False)
+    _concurrency: AdaptiveConcurrencyLimiter = attrib(init=False, default=None, repr=False)
+    _cooldown_until: float = attrib(init=False, default=0.0, repr=False)
+    _stats_lock: threading.Lock = attrib(init=False, factory=threading.Lock, repr=False)
+
+    def __attrs_post_init__(self):
+        if self.requests_per_second:
+            self._request_bucket = TokenBucket(rate=self.requests_per_second)
+        if self.tokens_per_minute:
+            self._token_bucket = TokenBucket(
+                rate=self.tokens_per_minute / 60.0, capacity=self.tokens_per_minute
+            )
+        self._concurrency = AdaptiveConcurrencyLimiter(
+            max_limit=self.max_concurrency,
+            min_limit=self.min_concurrency,
+            initial_limit=self.initial_concurrency,
+            decrease_factor=self.decrease_factor,
+            adaptive=self.adaptive,
+        )
+
+    @property
+    def concurrency_limit(self) -> int:
+        """Current (adaptive) concurrency limit."""
+        return self._concurrency.limit
+
+    @property
+    def in_flight(self) -> int:
+        return self._concurrency.in_flight
+
+    def _reserve(self, prompt: Any) -> float:
+        wait = max(self._cooldown_until - time.monotonic(), 0.0)
+        if self._request_bucket is not None:
+            wait = max(wait, self._request_bucket.reserve(1))
+        if self._token_bucket is not None:
+            wait = max(wait, self._token_bucket.reserve(self.token_estimator(prompt)))
+        with self._stats_lock:
+            self.stats.attempts += 1
+            self.stats.wait_seconds += wait
+        return wait
+
+    def _on_done(self, exception: Optional[BaseException]) -> None:
+        throttled = exception is not None and self.throttling_classifier(exception)
+        if throttled:
+            with self._stats_lock:
+                self.stats.throttled += 1
+            if self.throttle_cooldown_seconds:
+                self._cooldown_until = max(
+                    self._cooldown_until,
+                    time.monotonic() + self.throttle_cooldown_seconds,
+                )
+        self._concurrency.release(throttled=throttled, succeeded=exception is None)
+
+    @contextmanager
+    def limit(self, prompt: Any = None):
+        """Sync context manager gating one upstream attempt."""
+        wait = self._reserve(prompt)
+        if wait > 0:
+            time.sleep(wait)
+        self._concurrency.acquire()
+        try:
+            yield
+        except BaseException as e:
+            self._on_done(e)
+            raise
+        else:
+            self._on_done(None)
+
+    @asynccontextmanager
+    async def alimit(self, prompt: Any = None):
+        """Async context manager gating one upstream attempt."""
+        wait = self._reserve(prompt)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        await self._concurrency.aacquire()
+        try:
+            yield
+        except BaseException as e:
+            self._on_done(e)
+            raise
+        else:
+            self._on_done(None)
+
+    def wrap(self, func: Callable) -> Callable:
+        """Wrap a sync ``func(prompt, ...)`` so each call is rate limited."""
+
+        @functools.wraps(func)
+        def _limited(*args, **kwargs):
+            with self.limit(args[0] if args else None):
+                return func(*args, **kwargs)
+
+        return _limited
+
+    def awrap(self, func: Callable) -> Callable:
+        """Wrap an async ``func(prompt, ...)`` so each call is rate limited."""
+
+        @functools.wraps(func)
+        async def _limited(*args, **kwargs):
+            async with self.alimit(args[0] if args else None):
+                return await func(*args, **kwargs)
+
+        return _limited
+
+
+_shared_rate_limiters: Dict[str, RateLimiter] = {}
+_shared_rate_limiters_lock = threading.Lock()
+
+
+def get_shared_rate_limiter(backend_key: str, **kwargs) -> RateLimiter:
+    """Get or create the process-wide ``RateLimiter`` for ``backend_key``.
+
+    ``kwargs`` are only used when the limiter is first created; later calls
+    with the same key return the existing instance unchanged.
+    """
+    with _shared_rate_limiters_lock:
+        limiter = _shared_rate_limiters.get(backend_key)
+        if limiter is None:
+            limiter = _shared_rate_limiters[backend_key] = RateLimiter(**kwargs)
+        return limiter
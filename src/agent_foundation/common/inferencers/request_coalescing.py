@@ -0,0 +1,120 @@
+"""Single-flight coalescing of identical in-flight inference requests.
+
+When ``aparallel_infer``/``parallel_infer`` or concurrent agent branches send
+the same request at the same time, only the first caller (the *leader*)
+executes the retry/fallback loop; concurrent identical callers (*followers*)
+wait for and share the leader's raw response or exception.  Each caller
+still runs its own post-processing tail.
+
+Requests are identified by the same fingerprint as the response cache
+(rendered prompt + inferencer class + config + inference args), so a
+coalescer can be shared by several inferencer instances.
+
+Sync callers coalesce with other sync callers (threads); async callers
+coalesce with other async callers on the same event loop.
+
+Usage:
+    >>> coalescer = RequestCoalescer()
+    >>> inferencer = MyInferencer(request_coalescer=coalescer)  # doctest: +SKIP
+    >>> await inferencer.aparallel_infer(["q"] * 10)  # one upstream call  # doctest: +SKIP
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from attr import attrib, attrs
+
+
+@attrs(slots=True)
+class _SyncFlight:
+    """State of one in-flight sync request."""
+
+    done: threading.Event = attrib(factory=threading.Event)
+    result: Any = attrib(default=None)
+    exception: BaseException = attrib(default=None)
+
+
+@attrs
+class RequestCoalescer:
+    """Shares one execution among concurrent identical requests.
+
+    Attributes:
+        leaders: Number of requests that executed upstream.
+        followers: Number of requests that were served by another caller's flight.
+    """
+
+    leaders: int = attrib(default=0, init=False)
+    followers: int = attrib(default=0, init=False)
+    _lock: threading.Lock = attrib(init=False, factory=threading.Lock, repr=False)
+    _sync_flights: Dict[str, _SyncFlight] = attrib(init=False, factory=dict, repr=False)
+    _async_flights: Dict[Tuple[int, str], asyncio.Future] = attrib(
+        init=False, factory=dict, repr=False
+    )
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests currently executing."""
+        return len(self._sync_flights) + len(self._async_flights)
+
+    def run(self, key: str, func: Callable[[], Any]) -> Any:
+        """Run ``func`` once for all concurrent sync callers sharing ``key``.
+
+        Followers block until the leader finishes and then return its result
+        or re-raise its exception.
+        """
+        with self._lock:
+            flight = self._sync_flights.get(key)
+            is_leader = flight is None
+            if is_leader:
+                flight = self._sync_flights[key] = _SyncFlight()
+                self.leaders += 1
+            else:
+                self.followers += 1
+
+        if not is_leader:
+            flight.done.wait()
+            if flight.exception is not None:
+                raise flight.exception
+            return flight.result
+
+        try:
+            flight.result = func()
+            return flight.result
+        except BaseException as e:
+            flight.exception = e
+            raise
+        finally:
+            with self._lock:
+                self._sync_flights.pop(key, None)
+            flight.done.set()
+
+    async def arun(self, key: str, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``coro_factory()`` once for all concurrent async callers sharing ``key``.
+
+        The flight runs as its own task (inheriting the leader's context), and
+        every caller awaits it through ``asyncio.shield`` so that cancelling
+        one caller — including the leader — does not cancel the others.
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop), key)
+        with self._lock:
+            task = self._async_flights.get(flight_key)
+            if task is None:
+                task = loop.create_task(coro_factory())
+                self._async_flights[flight_key] = task
+                task.add_done_callback(
+                    lambda t, k=flight_key: self._on_async_flight_done(k, t)
+                )
+                self.leaders += 1
+            else:
+                self.followers += 1
+        return await asyncio.shield(task)
+
+    def _on_async_flight_done(self, flight_key: Tuple[int, str], task: asyncio.Future) -> None:
+        with self._lock:
+            if self._async_flights.get(flight_key) is task:
+                del self._async_flights[flight_key]
+        # Mark the exception as retrieved in case every waiter was cancelled.
+        if not task.cancelled():
+            task.exception()
@@ -0,0 +1,343 @@
+"""Content-addressed response cache for InferencerBase.
+
+Caches final ``_infer``/``_ainfer`` responses keyed by the rendered prompt,
+the inferencer class, its cache-relevant configuration and the effective
+inference args.  ``InferencerBase._infer_single`` / ``_ainfer_single``
+consult the cache BEFORE entering the retry/fallback loop, so a hit never
+touches the backend (or any fallback inferencer).
+
+Backends:
+    - ``InMemoryLRUResponseCache`` — bounded LRU dict, process-local.
+    - ``SqliteResponseCache`` — persistent on-disk cache, shareable across
+      processes and reruns.
+
+A single cache instance can be shared by multiple inferencers; entries are
+namespaced by inferencer class through the key.  Hit/miss counters live on
+each inferencer (``InferencerBase.response_cache_stats``) so that shared
+caches still report per-inferencer statistics.
+
+Usage:
+    >>> cache = InMemoryLRUResponseCache(max_entries=1000)
+    >>> inferencer = MyInferencer(model_id="m", response_cache=cache)  # doctest: +SKIP
+    >>> inferencer("hello")  # miss, calls the backend  # doctest: +SKIP
+    >>> inferencer("hello")  # hit, served from cache  # doctest: +SKIP
+"""
+
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Mapping, Optional
+
+from attr import attrib, attrs
+
+logger = logging.getLogger(__name__)
+
+# Sentinel returned by ``ResponseCacheBase.get`` on a miss (None is a valid
+# cached value for callers that choose to store it).
+CACHE_MISS = object()
+
+
+def _stable_json_default(obj: Any) -> Any:
+    """JSON fallback for non-native values in cache key material.
+
+    Module-level functions and classes are keyed by qualified name. Other
+    callables (lambdas, closures, bound methods, partials) have no stable
+    identity, so they raise ``TypeError`` and the request bypasses the cache.
+    """
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj, key=repr)
+    if inspect.isroutine(obj) or isinstance(obj, (type, functools.partial)):
+        qualname = getattr(obj, "__qualname__", "")
+        owner = getattr(obj, "__self__", None)
+        if qualname and "<" not in qualname and (owner is None or inspect.ismodule(owner)):
+            return f"{obj.__module__}.{qualname}"
+        raise TypeError(f"Cannot fingerprint callable {obj!r}")
+    if hasattr(obj, "__attrs_attrs__"):
+        from attr import asdict
+
+        return asdict(obj)
+    if hasattr(obj, "__dict__"):
+        return {"__type__": type(obj).__qualname__, **vars(obj)}
+    return repr(obj)
+
+
+def build_response_cache_key(
+    namespace: str,
+    prompt: Any,
+    config: Optional[Mapping[str, Any]] = None,
+    inference_config: Any = None,
+    inference_args: Optional[Mapping[str, Any]] = None,
+) -> str:
+    """Build a deterministic sha256 cache key.
+
+    Args:
+        namespace: Identifies the producer of the response, typically the
+            fully-qualified inferencer class name.
+        prompt: The rendered prompt (after preprocessing and templating).
+        config: Inferencer configuration that affects the response
+            (model id, sampling parameters, ...).
+        inference_config: The per-call ``inference_config``.
+        inference_args: The effective inference args forwarded to ``_infer``.
+
+    Returns:
+        A hex digest that is stable across processes.
+
+    Raises:
+        TypeError/ValueError: If the key material cannot be serialized.
+    """
+    material = {
+        "namespace": namespace,
+        "prompt": prompt,
+        "config": dict(config or {}),
+        "inference_config": inference_config,
+        "inference_args": dict(inference_args or {}),
+    }
+    payload = json.dumps(
+        material, sort_keys=True, default=_stable_json_default, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@attrs
+class ResponseCacheStats:
+    """Thread-safe hit/miss/write counters for one inferencer."""
+
+    hits: int = attrib(default=0)
+    misses: int = attrib(default=0)
+    writes: int = attrib(default=0)
+    errors: int = attrib(default=0)
+    _lock: threading.Lock = attrib(factory=threading.Lock, repr=False, eq=False)
+
+    def record(self, field: str) -> None:
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.lookups
+        return self.hits / lookups if lookups else 0.0
+
+    def reset(self) -> None:
+        with self._lock:
+            self.hits = self.misses = self.writes = self.errors = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "errors": self.errors,
+            "hit_rate": self.hit_rate,
+        }
+
+
+@attrs
+class ResponseCacheBase(ABC):
+    """Abstract response cache backend.
+
+    Attributes:
+        ttl_seconds: Entry time-to-live in seconds. 0 = entries never expire.
+    """
+
+    ttl_seconds: float = attrib(default=0)
+
+    @abstractmethod
+    def get(self, key: str) -> Any:
+        """Return the cached value for ``key`` or ``CACHE_MISS``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Store ``value`` under ``key``."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def _is_expired(self, created_at: float) -> bool:
+        return bool(self.ttl_seconds) and (time.time() - created_at) > self.ttl_seconds
+
+
+@attrs
+class InMemoryLRUResponseCache(ResponseCacheBase):
+    """Bounded in-process LRU response cache.
+
+    Attributes:
+        max_entries: Maximum number of cached responses. 0 = unbounded.
+    """
+
+    max_entries: int = attrib(default=1024)
+    _entries: "OrderedDict[str, tuple]" = attrib(
+        init=False, factory=OrderedDict, repr=False
+    )
+    _lock: threading.Lock = attrib(init=False, factory=threading.Lock, repr=False)
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return CACHE_MISS
+            created_at, value = entry
+            if self._is_expired(created_at):
+                del self._entries[key]
+                return CACHE_MISS
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.time(), value)
+            self._entries.move_to_end(key)
+            if self.max_entries:
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@attrs
+class SqliteResponseCache(ResponseCacheBase):
+    """Persistent response cache backed by a SQLite database file.
+
+    Values are pickled, so any picklable response type is supported.  The
+    database is opened per thread (SQLite connections are not shareable
+    across threads) and runs in WAL mode so concurrent readers do not block
+    the writer.
+
+    Attributes:
+        path: Database file path. Parent directories are created on demand.
+        max_entries: Maximum number of rows kept; the least recently
+            accessed rows are evicted on write. 0 = unbounded.
+    """
+
+    path: str = attrib(default=None)
+    max_entries: int = attrib(default=0)
+    _local: threading.local = attrib(init=False, factory=threading.local, repr=False)
+
+    def __attrs_post_init__(self):
+        if not self.path:
+            raise ValueError("SqliteResponseCache requires a database path")
+        parent = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(parent, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " value BLOB NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_responses_accessed_at"
+                " ON responses (accessed_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Any:
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return CACHE_MISS
+        blob, created_at = row
+        if self._is_expired(created_at):
+            self.delete(key)
+            return CACHE_MISS
+        with conn:
+            conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        return pickle.loads(blob)
+
+    def set(self, key: str, value: Any) -> None:
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, sqlite3.Binary(blob), now, now),
+            )
+            if self.max_entries:
+                conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    " SELECT key FROM responses ORDER BY accessed_at DESC"
+                    " LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+
+    def delete(self, key: str) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute("DELETE FROM responses")
+
+    def purge_expired(self) -> int:
+        """Delete expired rows. Returns the number of rows removed."""
+        if not self.ttl_seconds:
+            return 0
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                "DELETE FROM responses WHERE created_at < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+        return cursor.rowcount
+
+    def close(self) -> None:
+        """Close this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
@@ -0,0 +1,429 @@
+"""Persistent manifest of StreamingInferencerBase cache files.
+
+``StreamingInferencerBase`` writes one file per streamed call to
+``cache_folder/{ClassName}/{id}_{timestamp}/stream_{uid}_{hash8}.txt``.
+Without an index, resume lookups glob and stat every matching file on every
+call.  ``StreamCacheIndex`` keeps a SQLite manifest at
+``cache_folder/.stream_cache_index.sqlite`` mapping
+``(class_name, prompt_hash)`` to cache files with their completion status
+and size, so the latest file is found with one indexed query.
+
+The manifest is maintained by ``_open_cache_file`` (status ``open``) and
+``_finalize_cache`` (``completed``/``failed`` + size).  A stream that was
+never finalized (process crash) stays ``open`` and is treated as partial,
+exactly like the unmarked file on disk.
+
+The first lookup for a class on a folder that has no manifest yet rebuilds
+it from disk once; ``rebuild()`` (or the ``rebuild`` CLI command) re-syncs
+after files were added or removed externally.
+
+CLI:
+    python -m agent_foundation.common.inferencers.stream_cache_index rebuild CACHE_FOLDER
+    python -m agent_foundation.common.inferencers.stream_cache_index evict CACHE_FOLDER \\
+        --max-age-days 30 --max-total-mb 2048
+    python -m agent_foundation.common.inferencers.stream_cache_index stats CACHE_FOLDER
+"""
+
+import argparse
+import glob
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional
+
+from attr import attrib, attrs
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".stream_cache_index.sqlite"
+
+STATUS_OPEN = "open"
+STATUS_COMPLETED = "completed"
+STATUS_FAILED = "failed"
+
+COMPLETED_MARKER = "--- STREAM COMPLETED SUCCESSFULLY ---"
+FAILED_MARKER = "--- STREAM FAILED:"
+
+# Bytes read from the end of a cache file to detect its status marker on rebuild.
+_MARKER_TAIL_BYTES = 4096
+
+
+@attrs(slots=True)
+class StreamCacheEntry:
+    """One manifest row."""
+
+    path: str = attrib()
+    class_name: str = attrib()
+    prompt_hash: str = attrib()
+    status: str = attrib()
+    size: int = attrib(default=0)
+    updated_at: float = attrib(default=0.0)
+
+
+def _parse_prompt_hash(path: str) -> Optional[str]:
+    """Extract ``hash8`` from ``stream_{uid}_{hash8}.txt``."""
+    name = os.path.basename(path)
+    if not (name.startswith("stream_") and name.endswith(".txt")):
+        return None
+    stem = name[: -len(".txt")]
+    return stem.rsplit("_", 1)[-1] or None
+
+
+def _detect_status(path: str) -> str:
+    """Read the tail of a cache file and classify it by its final marker."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(f.tell() - _MARKER_TAIL_BYTES, 0))
+            tail = f.read().decode("utf-8", errors="ignore")
+    except OSError:
+        return STATUS_OPEN
+    if COMPLETED_MARKER in tail:
+        return STATUS_COMPLETED
+    if FAILED_MARKER in tail:
+        return STATUS_FAILED
+    return STATUS_OPEN
+
+
+@attrs
+class StreamCacheIndex:
+    """SQLite manifest for one streaming cache folder.
+
+    Use ``StreamCacheIndex.for_folder()`` to share one instance per folder
+    within a process.  Connections are per thread; the database runs in WAL
+    mode so several processes can share a cache folder.
+
+    Attributes:
+        cache_folder: The streaming cache root (``StreamingInferencerBase.cache_folder``).
+    """
+
+    cache_folder: str = attrib()
+    _local: threading.local = attrib(init=False, factory=threading.local, repr=False)
+    _built_classes: set = attrib(init=False, factory=set, repr=False)
+    _build_lock: threading.Lock = attrib(init=False, factory=threading.Lock, repr=False)
+
+    def __attrs_post_init__(self):
+        os.makedirs(self.cache_folder, exist_ok=True)
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS streams ("
+                " path TEXT PRIMARY KEY,"
+                " class_name TEXT NOT NULL,"
+                " prompt_hash TEXT NOT NULL,"
+                " status TEXT NOT NULL,"
+                " size INTEGER NOT NULL DEFAULT 0,"
+                " created_at REAL NOT NULL,"
+                " updated_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_streams_lookup"
+                " ON streams (class_name, prompt_hash, updated_at)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_streams_updated_at ON streams (updated_at)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS built_classes ("
+                " class_name TEXT PRIMARY KEY, built_at REAL NOT NULL)"
+            )
+
+    @property
+    def index_path(self) -> str:
+        return os.path.join(self.cache_folder, INDEX_FILENAME)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.index_path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # region shared instances
+
+    _instances: Dict[str, "StreamCacheIndex"] = {}
+    _instances_lock = threading.Lock()
+
+    @classmethod
+    def for_folder(cls, cache_folder: str) -> "StreamCacheIndex":
+        """Return the process-wide index instance for ``cache_folder``."""
+        key = os.path.abspath(cache_folder)
+        with cls._instances_lock:
+            index = cls._instances.get(key)
+            if index is None:
+                index = cls._instances[key] = cls(cache_folder=key)
+            return index
+
+    # endregion
+
+    # region maintenance hooks (called by StreamingInferencerBase)
+
+    def record_open(self, path: str, class_name: str, prompt_hash: str) -> None:
+        now = time.time()
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO streams"
+                " (path, class_name, prompt_hash, status, size, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, 0, ?, ?)",
+                (os.path.abspath(path), class_name, prompt_hash, STATUS_OPEN, now, now),
+            )
+
+    def record_finalized(self, path: str, completed: bool, size: Optional[int] = None) -> None:
+        path = os.path.abspath(path)
+        if size is None:
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                size = 0
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "UPDATE streams SET status = ?, size = ?, updated_at = ? WHERE path = ?",
+                (STATUS_COMPLETED if completed else STATUS_FAILED, size, time.time(), path),
+            )
+
+    # endregion
+
+    # region lookups
+
+    def latest(self, class_name: str, prompt_hash: str) -> Optional[StreamCacheEntry]:
+        """Return the most recently updated existing cache file for a prompt hash.
+
+        Rows whose file has disappeared are dropped lazily.
+        """
+        self._ensure_built(class_name)
+        conn = self._connect()
+        while True:
+            row = conn.execute(
+                "SELECT path, class_name, prompt_hash, status, size, updated_at"
+                " FROM streams WHERE class_name = ? AND prompt_hash = ?"
+                " ORDER BY updated_at DESC LIMIT 1",
+                (class_name, prompt_hash),
+            ).fetchone()
+            if row is None:
+                return None
+            entry = StreamCacheEntry(*row)
+            if os.path.exists(entry.path):
+                return entry
+            with conn:
+                conn.execute("DELETE FROM streams WHERE path = ?", (entry.path,))
+
+    def entries(self, class_name: Optional[str] = None) -> List[StreamCacheEntry]:
+        sql = "SELECT path, class_name, prompt_hash, status, size, updated_at FROM streams"
+        params: tuple = ()
+        if class_name is not None:
+            sql += " WHERE class_name = ?"
+            params = (class_name,)
+        return [StreamCacheEntry(*row) for row in self._connect().execute(sql, params)]
+
+    def stats(self) -> dict:
+        rows = self._connect().execute(
+            "SELECT status, COUNT(*), COALESCE(SUM(size), 0) FROM streams GROUP BY status"
+        ).fetchall()
+        return {status: {"count": count, "bytes": size} for status, count, size in rows}
+
+    # endregion
+
+    # region rebuild / eviction
+
+    def _ensure_built(self, class_name: str) -> None:
+        if class_name in self._built_classes:
+            return
+        with self._build_lock:
+            if class_name in self._built_classes:
+                return
+            row = self._connect().execute(
+                "SELECT 1 FROM built_classes WHERE class_name = ?", (class_name,)
+            ).fetchone()
+            if row is None:
+                self.rebuild(class_name)
+            self._built_classes.add(class_name)
+
+    def rebuild(self, class_name: Optional[str] = None) -> int:
+        """Re-sync the manifest with the files on disk.
+
+        Args:
+            class_name: Only rebuild this inferencer class directory. None
+                rebuilds every class directory under ``cache_folder``.
+
+        Returns:
+            Number of cache files indexed.
+        """
+        if class_name is None:
+            class_names = [
+                name
+                for name in os.listdir(self.cache_folder)
+                if os.path.isdir(os.path.join(self.cache_folder, name))
+            ]
+        else:
+            class_names = [class_name]
+
+        conn = self._connect()
+        indexed = 0
+        for name in class_names:
+            pattern = os.path.join(self.cache_folder, name, "*", "stream_*_*.txt")
+            rows = []
+            for path in glob.glob(pattern):
+                prompt_hash = _parse_prompt_hash(path)
+                if prompt_hash is None:
+                    continue
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                rows.append(
+                    (
+                        os.path.abspath(path),
+                        name,
+                        prompt_hash,
+                        _detect_status(path),
+                        stat.st_size,
+                        stat.st_mtime,
+                        stat.st_mtime,
+                    )
+                )
+            with conn:
+                conn.execute("DELETE FROM streams WHERE class_name = ?", (name,))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO streams"
+                    " (path, class_name, prompt_hash, status, size, created_at, updated_at)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO built_classes (class_name, built_at) VALUES (?, ?)",
+                    (name, time.time()),
+                )
+            self._built_classes.add(name)
+            indexed += len(rows)
+        logger.info("Indexed %d stream cache files under %s", indexed, self.cache_folder)
+        return indexed
+
+    def evict(
+        self,
+        max_age_seconds: Optional[float] = None,
+        max_total_bytes: Optional[int] = None,
+        include_open: bool = False,
+    ) -> int:
+        """Delete old stream cache files and their manifest rows.
+
+        Args:
+            max_age_seconds: Remove entries not updated within this many seconds.
+            max_total_bytes: After the age pass, remove the oldest entries until
+                the indexed total size is at most this many bytes.
+            include_open: Also evict ``open`` (in-progress or crashed) streams.
+                False (default) never touches them so live streams are safe.
+
+        Returns:
+            Number of files removed.
+        """
+        conn = self._connect()
+        status_filter = "" if include_open else f" AND status != '{STATUS_OPEN}'"
+        victims: List[str] = []
+        if max_age_seconds is not None:
+            cutoff = time.time() - max_age_seconds
+            victims.extend(
+                row[0]
+                for row in conn.execute(
+                    "SELECT path FROM streams WHERE updated_at < ?" + status_filter,
+                    (cutoff,),
+                )
+            )
+        if max_total_bytes is not None:
+            excluded = set(victims)
+            total = 0
+            rows = conn.execute(
+                "SELECT path, size FROM streams WHERE 1 = 1"
+                + status_filter
+                + " ORDER BY updated_at DESC"
+            ).fetchall()
+            for path, size in rows:
+                if path in excluded:
+                    continue
+                total += size
+                if total > max_total_bytes:
+                    victims.append(path)
+
+        for path in victims:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning("Could not evict %s: %s", path, e)
+                continue
+            session_dir = os.path.dirname(path)
+            try:
+                os.rmdir(session_dir)  # only succeeds when empty
+            except OSError:
+                pass
+        with conn:
+            conn.executemany("DELETE FROM streams WHERE path = ?", [(p,) for p in victims])
+        return len(victims)
+
+    # endregion
+
+    def close(self) -> None:
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Maintain the StreamingInferencerBase cache manifest."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = sub.add_parser("rebuild", help="Rebuild the manifest from files on disk.")
+    rebuild.add_argument("cache_folder")
+    rebuild.add_argument("--class-name", default=None, help="Only rebuild this class.")
+
+    evict = sub.add_parser("evict", help="Delete old stream cache files.")
+    evict.add_argument("cache_folder")
+    evict.add_argument("--max-age-days", type=float, default=None)
+    evict.add_argument("--max-total-mb", type=float, default=None)
+    evict.add_argument(
+        "--include-open",
+        action="store_true",
+        help="Also evict streams that were never finalized.",
+    )
+
+    stats = sub.add_parser("stats", help="Print manifest statistics.")
+    stats.add_argument("cache_folder")
+    return parser
+
+
+def main() -> None:
+    """CLI entry-point."""
+    args = _build_parser().parse_args()
+    index = StreamCacheIndex(cache_folder=os.path.abspath(args.cache_folder))
+    if args.command == "rebuild":
+        count = index.rebuild(args.class_name)
+        print(f"Indexed {count} stream cache files")
+    elif args.command == "evict":
+        removed = index.evict(
+            max_age_seconds=(
+                args.max_age_days * 86400 if args.max_age_days is not None else None
+            ),
+            max_total_bytes=(
+                int(args.max_total_mb * 1024 * 1024)
+                if args.max_total_mb is not None
+                else None
+            ),
+            include_open=args.include_open,
+        )
+        print(f"Evicted {removed} stream cache files")
+    else:
+        for status, info in sorted(index.stats().items()):
+            print(f"{status:10s} {info['count']:8d} files {info['bytes']:14d} bytes")
+
+
+if __name__ == "__main__":
+    main()
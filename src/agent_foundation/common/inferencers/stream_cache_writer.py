@@ -0,0 +1,225 @@
+"""Buffered, off-event-loop writer for streaming inference cache files.
+
+``StreamingInferencerBase`` appends every streamed chunk to a cache file so
+that a crashed or failed stream can be resumed.  Writing and flushing each
+chunk directly from the async streaming loop stalls the event loop on slow
+disks and costs two syscalls per chunk.
+
+``BufferedCacheWriter`` is a drop-in replacement for the cache file handle:
+
+    - ``write()`` only appends to an in-memory buffer (no I/O on the caller's
+      thread).
+    - The buffer is handed to a shared background writer thread when it
+      reaches ``flush_bytes`` or when ``flush_interval_seconds`` have passed
+      since the last flush — also while the stream is idle.  This bounds the
+      data that can be lost on a hard crash (the *durability window*).
+    - ``close()`` (called by ``_finalize_cache`` right after the completion /
+      failure marker is written) drains the buffer, flushes (optionally
+      fsyncs) and closes the file, and blocks until that is done, so readers
+      such as ``_load_cached_or_resume`` and the recovery path always see the
+      full stream plus its marker.  The close waits behind every write
+      already queued on the shared thread, including other streams'; async
+      callers use ``aclose()``, which awaits the same completion without
+      blocking the event loop.
+
+All file I/O for every writer happens on one daemon thread, in submission
+order, so chunk order within a file is preserved.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+import os
+import queue
+import threading
+import time
+from typing import Any, Callable, List, Optional, Set
+
+from attr import attrib, attrs
+
+logger = logging.getLogger(__name__)
+
+
+class _CacheWriterService:
+    """Process-wide background thread executing cache file I/O in FIFO order."""
+
+    _instance: Optional["_CacheWriterService"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, tick_seconds: float = 0.1):
+        self._queue: "queue.Queue[Callable[[], None]]" = queue.Queue()
+        self._writers: Set["BufferedCacheWriter"] = set()
+        self._writers_lock = threading.Lock()
+        self._tick_seconds = tick_seconds
+        self._thread = threading.Thread(
+            target=self._run, name="stream-cache-writer", daemon=True
+        )
+        self._thread.start()
+
+    @classmethod
+    def get(cls) -> "_CacheWriterService":
+        with cls._instance_lock:
+            if cls._instance is None or not cls._instance._thread.is_alive():
+                cls._instance = cls()
+            return cls._instance
+
+    def submit(self, op: Callable[[], None]) -> None:
+        self._queue.put(op)
+
+    def register(self, writer: "BufferedCacheWriter") -> None:
+        with self._writers_lock:
+            self._writers.add(writer)
+
+    def unregister(self, writer: "BufferedCacheWriter") -> None:
+        with self._writers_lock:
+            self._writers.discard(writer)
+
+    def _run(self) -> None:
+        while True:
+            try:
+                op = self._queue.get(timeout=self._tick_seconds)
+            except queue.Empty:
+                op = None
+            if op is not None:
+                try:
+                    op()
+                except Exception:
+                    logger.exception("Stream cache write failed")
+            # Time-based flushes for idle streams are scheduled (not executed)
+            # here so they stay ordered behind already-queued writes.
+            with self._writers_lock:
+                writers = list(self._writers)
+            for writer in writers:
+                writer._schedule_flush_if_stale()
+
+
+@attrs(eq=False)
+class BufferedCacheWriter:
+    """File-like cache writer with size/time-batched background flushing.
+
+    Attributes:
+        file: The underlying text file handle (opened for writing).
+        flush_bytes: Hand the buffer to the writer thread once it holds at
+            least this many characters.
+        flush_interval_seconds: Maximum age of buffered data before it is
+            flushed, i.e. the durability window on a hard crash.
+        fsync_on_close: fsync the file when closing (after the final marker).
+            Off by default: the cache only needs to survive process crashes,
+            which a flush already covers.
+    """
+
+    file: Any = attrib()
+    flush_bytes: int = attrib(default=64 * 1024)
+    flush_interval_seconds: float = attrib(default=1.0)
+    fsync_on_close: bool = attrib(default=False)
+    _buffer: List[str] = attrib(init=False, factory=list, repr=False)
+    _buffered: int = attrib(init=False, default=0, repr=False)
+    _first_buffered_at: Optional[float] = attrib(init=False, default=None, repr=False)
+    _lock: threading.Lock = attrib(init=False, factory=threading.Lock, repr=False)
+    _closed: bool = attrib(init=False, default=False, repr=False)
+    _service: _CacheWriterService = attrib(init=False, default=None, repr=False)
+
+    def __attrs_post_init__(self):
+        self._service = _CacheWriterService.get()
+        self._service.register(self)
+
+    @property
+    def name(self) -> str:
+        return self.file.name
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def write(self, chunk: str) -> int:
+        """Buffer ``chunk``; schedules a background flush when the buffer is due."""
+        with self._lock:
+            if self._closed:
+                raise ValueError("write to closed BufferedCacheWriter")
+            if not self._buffer:
+                self._first_buffered_at = time.monotonic()
+            self._buffer.append(chunk)
+            self._buffered += len(chunk)
+            if self._buffered >= self.flush_bytes:
+                self._schedule_flush_locked()
+        return len(chunk)
+
+    def flush(self, wait: bool = False) -> None:
+        """Schedule a flush of buffered data; with ``wait``, block until it is on disk."""
+        done = threading.Event() if wait else None
+        with self._lock:
+            if self._closed:
+                return
+            self._schedule_flush_locked(done)
+        if done is not None:
+            done.wait()
+
+    def close(self) -> None:
+        """Drain, flush, (fsync) and close the file. Blocks until complete."""
+        self._begin_close().result()
+
+    async def aclose(self) -> None:
+        """Async ``close()``: awaits completion without blocking the event loop."""
+        await asyncio.wrap_future(self._begin_close())
+
+    def _begin_close(self) -> "concurrent.futures.Future[None]":
+        """Schedule the final drain and close; the future resolves once it is done."""
+        done: "concurrent.futures.Future[None]" = concurrent.futures.Future()
+        with self._lock:
+            if self._closed:
+                done.set_result(None)
+                return done
+            self._closed = True
+            data = self._take_buffer_locked()
+            self._service.submit(lambda: self._close_file(data, done))
+        self._service.unregister(self)
+        return done
+
+    def _take_buffer_locked(self) -> str:
+        data = "".join(self._buffer)
+        self._buffer = []
+        self._buffered = 0
+        self._first_buffered_at = None
+        return data
+
+    def _schedule_flush_locked(self, done: Optional[threading.Event] = None) -> None:
+        data = self._take_buffer_locked()
+        if not data and done is None:
+            return
+        self._service.submit(lambda: self._write_out(data, done))
+
+    def _schedule_flush_if_stale(self) -> None:
+        with self._lock:
+            if (
+                not self._closed
+                and self._first_buffered_at is not None
+                and time.monotonic() - self._first_buffered_at
+                >= self.flush_interval_seconds
+            ):
+                self._schedule_flush_locked()
+
+    def _write_out(self, data: str, done: Optional[threading.Event] = None) -> None:
+        try:
+            if data:
+                self.file.write(data)
+                self.file.flush()
+        finally:
+            if done is not None:
+                done.set()
+
+    def _close_file(self, data: str, done: "concurrent.futures.Future[None]") -> None:
+        # Once running, a cancelled awaiter can no longer cancel ``done``.
+        done.set_running_or_notify_cancel()
+        try:
+            if data:
+                self.file.write(data)
+            self.file.flush()
+            if self.fsync_on_close:
+                try:
+                    os.fsync(self.file.fileno())
+                except (OSError, ValueError):
+                    pass
+            self.file.close()
+        finally:
+            if not done.cancelled():
+                done.set_result(None)
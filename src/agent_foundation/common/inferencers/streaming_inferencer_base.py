@@ -31,6 +31,7 @@ import hashlib
 import logging
 import os
 import queue
+import sqlite3
 import threading
 import uuid
 from abc import abstractmethod
@@ -44,10 +45,13 @@ from agent_foundation.common.inferencers.inferencer_base import (
     InferencerBase,
     _current_fallback_state,
 )
+from agent_foundation.common.inferencers.loop_runner import get_default_loop_runner
 from agent_foundation.common.inferencers.prompt_templates import (
     DEFAULT_RECOVERY_DIR,
     render_recovery_prompt,
 )
+from agent_foundation.common.inferencers.stream_cache_index import StreamCacheIndex
+from agent_foundation.common.inferencers.stream_cache_writer import BufferedCacheWriter
 
 logger: logging.Logger = logging.getLogger(__name__)
 
@@ -106,7 +110,7 @@ class StreamingInferencerBase(InferencerBase):
 
     Provides:
     - ``ainfer_streaming()`` — async streaming with per-chunk idle timeout + cache
-    - ``infer_streaming()`` — sync bridge via thread + queue
+    - ``infer_streaming()`` — sync bridge via a shared background event loop
     - ``_ainfer()`` — accumulates from ``ainfer_streaming()``
     - Session management: ``new_session``, ``anew_session``, ``resume_session``, ``aresume_session``
     - Cache persistence: optional ``cache_folder`` for writing intermediate output
@@ -146,10 +150,31 @@ class StreamingInferencerBase(InferencerBase):
             when non-empty content follows.
         auto_resume: If True, automatically resume previous session on subsequent
             infer calls. Default: True.
+        use_cache_index: If True (default), cache files are tracked in a
+            ``StreamCacheIndex`` manifest under ``cache_folder`` so resume
+            lookups are a single indexed query instead of a glob + stat of
+            every cached stream. False restores the glob-based lookup.
+        cache_flush_interval_seconds: Durability window for cache writes.
+            Chunks are buffered and written by a background thread at least
+            this often (and on stream completion/failure), keeping file I/O off
+            the event loop. A hard crash loses at most this much output.
+            0 disables buffering (write + flush per chunk). Default: 1.0.
+        cache_flush_bytes: Also flush once this many characters are buffered.
+            Default: 65536.
+        use_background_loop: If True, ``infer_streaming()`` runs on a
+            process-wide long-lived event loop instead of creating a thread
+            and event loop per call. Every sync stream in the process then
+            shares that loop, so any blocking call a subclass makes inside
+            ``_ainfer_streaming()`` stalls all of them. False (default) keeps
+            the per-call thread.
     """
 
     # Streaming configuration
     cache_folder: Optional[str] = attrib(default=None)
+    use_cache_index: bool = attrib(default=True)
+    cache_flush_interval_seconds: float = attrib(default=1.0)
+    cache_flush_bytes: int = attrib(default=64 * 1024)
+    use_background_loop: bool = attrib(default=False)
     idle_timeout_seconds: int = attrib(default=600)
     tool_use_idle_timeout_seconds: int = attrib(default=0)
     empty_line_mode: EmptyLineMode = attrib(default=EmptyLineMode.PASS_THROUGH)
@@ -221,11 +246,24 @@ class StreamingInferencerBase(InferencerBase):
                 return os.path.join(self.cache_folder, f"{result_id}.pkl")
             raise
 
+    def _get_cache_index(self) -> Optional[StreamCacheIndex]:
+        """Shared manifest for ``cache_folder``, or ``None`` when disabled/unavailable."""
+        if not self.cache_folder or not self.use_cache_index:
+            return None
+        try:
+            return StreamCacheIndex.for_folder(self.cache_folder)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Stream cache index unavailable (%s); using glob lookups", e)
+            return None
+
     def _find_latest_cache(self, prompt: str) -> Optional[str]:
         """Find the most recent cache file for a given prompt.
 
-        Globs ``cache_folder/{ClassName}/*/stream_*_{prompt_hash}.txt``
-        and returns the path with the latest modification time.
+        With ``use_cache_index`` (default), queries the ``StreamCacheIndex``
+        manifest by ``(ClassName, prompt_hash)``.  Otherwise (or if the
+        manifest is unavailable), globs
+        ``cache_folder/{ClassName}/*/stream_*_{prompt_hash}.txt`` and returns
+        the path with the latest modification time.
         Returns ``None`` if no cache file exists.
 
         Note: ``self.id`` contains a random UUID and changes across process
@@ -235,6 +273,13 @@ class StreamingInferencerBase(InferencerBase):
         if not self.cache_folder:
             return None
         prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:8]
+        index = self._get_cache_index()
+        if index is not None:
+            try:
+                entry = index.latest(self.__class__.__name__, prompt_hash)
+                return entry.path if entry is not None else None
+            except sqlite3.Error as e:
+                logger.warning("Stream cache index lookup failed (%s); using glob", e)
         pattern = os.path.join(
             self.cache_folder,
             self.__class__.__name__,
@@ -471,7 +516,8 @@ class StreamingInferencerBase(InferencerBase):
         # Open cache file if configured
         cache_file = None
         if self.cache_folder:
-            cache_file = self._open_cache_file(prompt)
+            # Directory creation, the open and the manifest insert all block.
+            cache_file = await asyncio.to_thread(self._open_cache_file, prompt)
             # Publish cache path to _fallback_state (if set by _ainfer_single)
             fs = _current_fallback_state.get(None)
             if fs is not None:
@@ -605,7 +651,7 @@ class StreamingInferencerBase(InferencerBase):
             error = e
             raise
         finally:
-            self._finalize_cache(cache_file, success, error)
+            await self._afinalize_cache(cache_file, success, error)
 
     async def _ainfer(
         self, inference_input: Any, inference_config: Any = None, **kwargs: Any
@@ -634,10 +680,14 @@ class StreamingInferencerBase(InferencerBase):
     def infer_streaming(
         self, inference_input: Any, inference_config: Any = None, **kwargs: Any
     ) -> Iterator[str]:
-        """Sync streaming inference via thread + queue bridge.
+        """Sync streaming inference bridged onto a background event loop.
 
-        Runs ``ainfer_streaming()`` in a background thread and yields chunks
-        as they arrive.
+        With ``use_background_loop``, ``ainfer_streaming()`` runs on
+        the shared long-lived loop from ``get_default_loop_runner()`` so no
+        thread or event loop is created per call and loop-bound client state
+        (e.g. connections opened via ``aconnect``) survives across calls.
+        Otherwise (the default) — or when already running on that loop's
+        thread — a dedicated thread runs ``asyncio.run`` for this call only.
 
         Args:
             inference_input: Input for inference.
@@ -647,6 +697,23 @@ class StreamingInferencerBase(InferencerBase):
         Yields:
             Text chunks as they arrive from the backend.
         """
+        if self.use_background_loop:
+            runner = get_default_loop_runner()
+            if not runner.in_runner_thread():
+                yield from runner.iterate(
+                    lambda: self.ainfer_streaming(
+                        inference_input, inference_config, **kwargs
+                    )
+                )
+                return
+        yield from self._infer_streaming_in_thread(
+            inference_input, inference_config, **kwargs
+        )
+
+    def _infer_streaming_in_thread(
+        self, inference_input: Any, inference_config: Any = None, **kwargs: Any
+    ) -> Iterator[str]:
+        """Per-call thread + ``asyncio.run`` + queue bridge for ``infer_streaming``."""
         chunk_queue: queue.Queue[str | None] = queue.Queue()
         error_container: list[Exception] = []
 
@@ -932,7 +999,9 @@ class StreamingInferencerBase(InferencerBase):
             prompt: The prompt string (hashed for filename).
 
         Returns:
-            An open file handle (caller must close via ``_finalize_cache``).
+            An open file handle, or a ``BufferedCacheWriter`` wrapping it when
+            ``cache_flush_interval_seconds > 0`` (caller must close via
+            ``_finalize_cache``).
         """
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:8]
@@ -945,22 +1014,84 @@ class StreamingInferencerBase(InferencerBase):
         unique_id = uuid.uuid4().hex[:8]
         cache_path = os.path.join(session_dir, f"stream_{unique_id}_{prompt_hash}.txt")
         self.log_debug(f"Cache file: {cache_path}", "CacheOpen")
-        return open(cache_path, "w", encoding="utf-8")
+        cache_file = open(cache_path, "w", encoding="utf-8")
+        if self.cache_flush_interval_seconds > 0:
+            cache_file = BufferedCacheWriter(
+                cache_file,
+                flush_bytes=self.cache_flush_bytes,
+                flush_interval_seconds=self.cache_flush_interval_seconds,
+            )
+        index = self._get_cache_index()
+        if index is not None:
+            try:
+                index.record_open(cache_path, self.__class__.__name__, prompt_hash)
+            except sqlite3.Error as e:
+                logger.warning("Stream cache index update failed: %s", e)
+        return cache_file
 
     def _append_to_cache(self, cache_file: Any, chunk: str) -> None:
-        """Append a chunk to the cache file, flush immediately."""
+        """Append a chunk to the cache file.
+
+        With a ``BufferedCacheWriter`` this only buffers in memory; the
+        writer thread flushes within the durability window.  A plain file
+        handle is flushed immediately.
+
+        The manifest is not touched per chunk: an ``open`` entry already
+        resolves to this file, and its size is recorded on finalize.
+        """
         if cache_file:
             cache_file.write(chunk)
-            cache_file.flush()
+            if not isinstance(cache_file, BufferedCacheWriter):
+                cache_file.flush()
 
     def _finalize_cache(
         self, cache_file: Any, success: bool, error: Exception | None = None
     ) -> None:
-        """Write final status marker and close the cache file."""
+        """Write final status marker, close the cache file and update the manifest.
+
+        Closing a ``BufferedCacheWriter`` blocks until all buffered chunks and
+        the marker are flushed, so resume/recovery readers see the full stream.
+        Async callers use ``_afinalize_cache`` instead.
+        """
         if cache_file:
-            if success:
-                cache_file.write("\n--- STREAM COMPLETED SUCCESSFULLY ---\n")
-            else:
-                msg = str(error) if error else "unknown"
-                cache_file.write(f"\n--- STREAM FAILED: {msg} ---\n")
+            self._write_cache_marker(cache_file, success, error)
             cache_file.close()
+            self._record_cache_finalized(cache_file, success)
+
+    async def _afinalize_cache(
+        self, cache_file: Any, success: bool, error: Exception | None = None
+    ) -> None:
+        """Async ``_finalize_cache``: the close and manifest update run off the loop.
+
+        A ``BufferedCacheWriter`` close is awaited (it waits behind other
+        streams' queued writes on the shared writer thread); a plain file
+        close and the SQLite manifest update run via ``asyncio.to_thread``.
+        """
+        if cache_file:
+            self._write_cache_marker(cache_file, success, error)
+            if isinstance(cache_file, BufferedCacheWriter):
+                await cache_file.aclose()
+            else:
+                await asyncio.to_thread(cache_file.close)
+            if self.use_cache_index:
+                await asyncio.to_thread(
+                    self._record_cache_finalized, cache_file, success
+                )
+
+    @staticmethod
+    def _write_cache_marker(
+        cache_file: Any, success: bool, error: Exception | None
+    ) -> None:
+        if success:
+            cache_file.write("\n--- STREAM COMPLETED SUCCESSFULLY ---\n")
+        else:
+            msg = str(error) if error else "unknown"
+            cache_file.write(f"\n--- STREAM FAILED: {msg} ---\n")
+
+    def _record_cache_finalized(self, cache_file: Any, success: bool) -> None:
+        index = self._get_cache_index()
+        if index is not None:
+            try:
+                index.record_finalized(cache_file.name, completed=success)
+            except sqlite3.Error as e:
+                logger.warning("Stream cache index update failed: %s", e)
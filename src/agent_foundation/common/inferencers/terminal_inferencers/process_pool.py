@@ -0,0 +1,490 @@
+"""Warm subprocess pool for terminal-based inferencers.
+
+Terminal inferencers (Claude Code CLI, Devmate, Kiro, RovoDev, ...) start a
+fresh CLI process for every request, paying interpreter/CLI startup on the
+hot path.  ``TerminalProcessPool`` removes that cost in two ways:
+
+    - **Pre-spawning** (one-shot CLIs): when the command line does not depend
+      on the prompt (the prompt is written to stdin), a replacement process
+      for the same command is spawned in the background as soon as one is
+      checked out, so the next request finds a warm process waiting on stdin.
+    - **Reuse** (multi-turn CLIs): when the CLI serves several turns over one
+      stdin/stdout session, the process is returned to the pool after each
+      turn and handed to the next request for the same command.
+
+Idle processes are health-checked before being handed out (still running,
+within ``idle_ttl_seconds``, below ``max_uses_per_process`` and, optionally,
+a caller-provided async probe); unhealthy ones are terminated and replaced.
+Since pre-spawning is keyed by command, a command that is never requested
+again would otherwise keep its warm process until ``aclose``: a periodic
+reaper terminates idle processes past ``idle_ttl_seconds`` and the total
+number of idle processes across all keys is capped (``max_idle_total``,
+oldest evicted first).
+
+Processes are bound to the event loop that spawned them.  Sync callers should
+go through the shared background loop (``get_default_loop_runner``) so the
+pool survives across calls; if the pool is used from a different loop, its
+idle processes are discarded.
+
+``wait_for_process_exit`` replaces fixed-interval ``waitpid`` polling with
+event-driven exit detection: on Linux a pidfd becomes readable the moment the
+process exits; elsewhere it falls back to polling with exponential backoff.
+"""
+
+import asyncio
+import logging
+import os
+import signal
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional
+
+from attr import attrib, attrs
+
+logger = logging.getLogger(__name__)
+
+SpawnFactory = Callable[[], Awaitable[asyncio.subprocess.Process]]
+HealthCheck = Callable[[asyncio.subprocess.Process], Awaitable[bool]]
+
+
+_RUNNING = -1
+
+
+def _peek_exit(pid: int) -> Optional[int]:
+    """Non-blocking, non-reaping exit check.
+
+    Returns the exit code if ``pid`` has exited, ``_RUNNING`` if it is still
+    running, or ``None`` if it is not (or no longer) our child.  The zombie
+    is left for asyncio's child watcher to reap so ``Process.returncode`` is
+    still populated normally.
+    """
+    if hasattr(os, "waitid"):
+        try:
+            info = os.waitid(os.P_PID, pid, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+        except ChildProcessError:
+            return None
+        if info is None or info.si_pid == 0:
+            return _RUNNING
+        if info.si_code == os.CLD_EXITED:
+            return info.si_status
+        return -info.si_status
+    try:
+        wpid, status = os.waitpid(pid, os.WNOHANG)
+    except ChildProcessError:
+        return None
+    if wpid == 0:
+        return _RUNNING
+    return os.waitstatus_to_exitcode(status)
+
+
+async def wait_for_process_exit(
+    pid: int, max_poll_interval: float = 0.5
+) -> Optional[int]:
+    """Wait for process ``pid`` to exit, independently of its pipes.
+
+    Uses a pidfd (Linux 5.3+) registered with the event loop so the wait
+    completes as soon as the process exits.  Without pidfd support the
+    process is polled (non-blocking), starting at 5ms and backing off to
+    ``max_poll_interval``.  The process is never reaped here.
+
+    Args:
+        pid: The process ID to monitor.
+        max_poll_interval: Upper bound for the fallback poll interval.
+
+    Returns:
+        Exit code, or ``None`` if the process is not a child of this process
+        (e.g. already reaped).
+    """
+    code = _peek_exit(pid)
+    if code != _RUNNING:
+        return code
+
+    pidfd = None
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(pid)
+        except OSError:
+            pidfd = None
+
+    if pidfd is not None:
+        loop = asyncio.get_running_loop()
+        exited = loop.create_future()
+
+        def _on_exit() -> None:
+            if not exited.done():
+                exited.set_result(None)
+
+        try:
+            loop.add_reader(pidfd, _on_exit)
+        except (NotImplementedError, OSError, ValueError):
+            os.close(pidfd)
+            pidfd = None
+        else:
+            try:
+                await exited
+            finally:
+                loop.remove_reader(pidfd)
+                os.close(pidfd)
+            code = _peek_exit(pid)
+            return None if code == _RUNNING else code
+
+    interval = 0.005
+    while True:
+        await asyncio.sleep(interval)
+        code = _peek_exit(pid)
+        if code != _RUNNING:
+            return code
+        interval = min(interval * 2, max_poll_interval)
+
+
+@attrs(eq=False)
+class PooledProcess:
+    """A subprocess checked out of (or owned by) a ``TerminalProcessPool``.
+
+    Attributes:
+        process: The asyncio subprocess (spawned with stdin/stdout pipes).
+        key: Pool key the process was spawned for.
+        created_at: ``time.monotonic()`` at spawn.
+        last_used_at: ``time.monotonic()`` when last released to the pool.
+        uses: Number of times the process has been checked out.
+        warm: True if the process was spawned ahead of the request.
+    """
+
+    process: asyncio.subprocess.Process = attrib()
+    key: Hashable = attrib()
+    created_at: float = attrib(factory=time.monotonic)
+    last_used_at: float = attrib(factory=time.monotonic)
+    uses: int = attrib(default=0)
+    warm: bool = attrib(default=False)
+    _stderr_chunks: List[bytes] = attrib(factory=list, repr=False)
+    _stderr_task: Optional[asyncio.Task] = attrib(default=None, repr=False)
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+    @property
+    def is_alive(self) -> bool:
+        return self.process.returncode is None and _peek_exit(self.pid) == _RUNNING
+
+    def start_stderr_drain(self) -> None:
+        """Continuously drain stderr so long-lived processes never block on it."""
+        if self.process.stderr is None or self._stderr_task is not None:
+            return
+
+        async def _drain() -> None:
+            while True:
+                chunk = await self.process.stderr.read(65536)
+                if not chunk:
+                    return
+                self._stderr_chunks.append(chunk)
+
+        self._stderr_task = asyncio.get_running_loop().create_task(_drain())
+
+    async def wait_stderr(self, timeout: float) -> None:
+        """Wait (bounded) for stderr EOF, e.g. after a one-shot process exited."""
+        if self._stderr_task is None or self._stderr_task.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(self._stderr_task), timeout)
+        except asyncio.TimeoutError:
+            pass
+
+    def take_stderr(self) -> str:
+        """Return and clear the stderr collected since the last call."""
+        data, self._stderr_chunks = b"".join(self._stderr_chunks), []
+        return data.decode("utf-8", errors="replace")
+
+    def terminate(self) -> None:
+        if self._stderr_task is not None and not self._stderr_task.done():
+            self._stderr_task.cancel()
+        if self.process.returncode is None:
+            try:
+                self.process.kill()
+            except ProcessLookupError:
+                pass
+        for stream in (self.process.stdin, self.process.stdout, self.process.stderr):
+            transport = getattr(stream, "_transport", None) if stream else None
+            if transport is not None and not transport.is_closing():
+                transport.close()
+
+
+@attrs
+class TerminalProcessPoolStats:
+    """Pool counters.
+
+    Attributes:
+        spawned: Processes started (warm and cold).
+        warm_hits: Checkouts served by a pre-spawned or reused process.
+        cold_starts: Checkouts that had to spawn on the request path.
+        reused: Checkouts served by a process that already handled a turn.
+        discarded: Idle processes dropped by the health check, the idle
+            reaper or the pool limits.
+    """
+
+    spawned: int = attrib(default=0)
+    warm_hits: int = attrib(default=0)
+    cold_starts: int = attrib(default=0)
+    reused: int = attrib(default=0)
+    discarded: int = attrib(default=0)
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "spawned": self.spawned,
+            "warm_hits": self.warm_hits,
+            "cold_starts": self.cold_starts,
+            "reused": self.reused,
+            "discarded": self.discarded,
+        }
+
+
+@attrs
+class TerminalProcessPool:
+    """Keyed pool of pre-spawned / reusable CLI subprocesses.
+
+    Attributes:
+        max_idle_per_key: Maximum idle processes kept per key.
+        max_idle_total: Maximum idle processes kept across all keys; the
+            least recently used ones are terminated first. 0 = unlimited.
+        idle_ttl_seconds: Idle processes older than this are discarded.
+            0 disables the age check.
+        reap_interval_seconds: How often idle processes past
+            ``idle_ttl_seconds`` (or already exited) are terminated in the
+            background, whether or not their key is requested again.
+            0 disables the reaper.
+        max_uses_per_process: Retire a reusable process after this many
+            turns (0 = unlimited).
+        prewarm: Spawn a replacement in the background whenever a process is
+            checked out, so the next request for the same key starts warm.
+        health_check: Optional async probe ``(process) -> bool`` run on an
+            idle process before it is handed out.
+    """
+
+    max_idle_per_key: int = attrib(default=1)
+    max_idle_total: int = attrib(default=8)
+    idle_ttl_seconds: float = attrib(default=300.0)
+    reap_interval_seconds: float = attrib(default=30.0)
+    max_uses_per_process: int = attrib(default=0)
+    prewarm: bool = attrib(default=True)
+    health_check: Optional[HealthCheck] = attrib(default=None)
+    stats: TerminalProcessPoolStats = attrib(init=False, factory=TerminalProcessPoolStats)
+    _idle: Dict[Hashable, List[PooledProcess]] = attrib(init=False, factory=dict, repr=False)
+    _pending: Dict[Hashable, List[asyncio.Task]] = attrib(init=False, factory=dict, repr=False)
+    _loop: Optional[asyncio.AbstractEventLoop] = attrib(init=False, default=None, repr=False)
+    _reaper: Optional[asyncio.Task] = attrib(init=False, default=None, repr=False)
+
+    def idle_count(self, key: Optional[Hashable] = None) -> int:
+        if key is not None:
+            return len(self._idle.get(key, ()))
+        return sum(len(v) for v in self._idle.values())
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+        if self._loop is not None:
+            # Processes and tasks from another loop cannot be awaited here.
+            for procs in self._idle.values():
+                for pooled in procs:
+                    try:
+                        os.kill(pooled.pid, signal.SIGKILL)
+                    except (ProcessLookupError, PermissionError):
+                        pass
+                    self.stats.discarded += 1
+            self._idle.clear()
+            self._pending.clear()
+            self._reaper = None
+        self._loop = loop
+        if self.reap_interval_seconds > 0:
+            self._reaper = loop.create_task(self._reap_periodically())
+
+    async def _reap_periodically(self) -> None:
+        while True:
+            await asyncio.sleep(self.reap_interval_seconds)
+            self.reap_idle()
+
+    def reap_idle(self) -> int:
+        """Terminate idle processes that exited or outlived ``idle_ttl_seconds``.
+
+        Returns:
+            The number of processes terminated.
+        """
+        now = time.monotonic()
+        reaped = 0
+        for key in list(self._idle):
+            keep = []
+            for pooled in self._idle[key]:
+                expired = (
+                    self.idle_ttl_seconds
+                    and now - pooled.last_used_at > self.idle_ttl_seconds
+                )
+                if expired or not pooled.is_alive:
+                    pooled.terminate()
+                    reaped += 1
+                else:
+                    keep.append(pooled)
+            if keep:
+                self._idle[key] = keep
+            else:
+                del self._idle[key]
+        for key in list(self._pending):
+            if all(task.done() for task in self._pending[key]):
+                del self._pending[key]
+        self.stats.discarded += reaped
+        return reaped
+
+    def _add_idle(self, pooled: PooledProcess) -> None:
+        """Park ``pooled`` as idle, evicting the least recently used beyond ``max_idle_total``."""
+        self._idle.setdefault(pooled.key, []).append(pooled)
+        if not self.max_idle_total:
+            return
+        while self.idle_count() > self.max_idle_total:
+            key, oldest = min(
+                ((k, p) for k, procs in self._idle.items() for p in procs),
+                key=lambda item: item[1].last_used_at,
+            )
+            self._idle[key].remove(oldest)
+            if not self._idle[key]:
+                del self._idle[key]
+            oldest.terminate()
+            self.stats.discarded += 1
+
+    async def _spawn(self, key: Hashable, spawn: SpawnFactory, warm: bool) -> PooledProcess:
+        process = await spawn()
+        self.stats.spawned += 1
+        pooled = PooledProcess(process=process, key=key, warm=warm)
+        pooled.start_stderr_drain()
+        return pooled
+
+    async def _is_healthy(self, pooled: PooledProcess) -> bool:
+        if not pooled.is_alive:
+            return False
+        now = time.monotonic()
+        if self.idle_ttl_seconds and now - pooled.last_used_at > self.idle_ttl_seconds:
+            return False
+        if self.max_uses_per_process and pooled.uses >= self.max_uses_per_process:
+            return False
+        if self.health_check is not None:
+            try:
+                return bool(await self.health_check(pooled.process))
+            except Exception:
+                logger.debug("Health check failed for pid %s", pooled.pid, exc_info=True)
+                return False
+        return True
+
+    def _schedule_prewarm(self, key: Hashable, spawn: SpawnFactory) -> None:
+        pending = [t for t in self._pending.get(key, ()) if not t.done()]
+        if len(self._idle.get(key, ())) + len(pending) >= self.max_idle_per_key:
+            self._pending[key] = pending
+            return
+
+        async def _prewarm() -> None:
+            try:
+                pooled = await self._spawn(key, spawn, warm=True)
+            except Exception:
+                logger.debug("Pre-spawn failed for %r", key, exc_info=True)
+                return
+            self._add_idle(pooled)
+
+        pending.append(asyncio.get_running_loop().create_task(_prewarm()))
+        self._pending[key] = pending
+
+    async def acquire(
+        self, key: Hashable, spawn: SpawnFactory, prewarm: Optional[bool] = None
+    ) -> PooledProcess:
+        """Check out a healthy process for ``key``, spawning one if needed.
+
+        Args:
+            key: Identifies interchangeable processes (e.g. command + cwd).
+            spawn: Async factory starting a new process for ``key`` with
+                stdin/stdout/stderr pipes.
+            prewarm: Override the pool's ``prewarm`` for this checkout. Pass
+                False when a process spawned now would not be interchangeable
+                with one spawned after this checkout finishes (e.g. a command
+                resuming a session the checked-out process is still writing).
+        """
+        self._bind_loop()
+        pooled: Optional[PooledProcess] = None
+        idle = self._idle.get(key, [])
+        if not idle:
+            # A pre-spawn already in flight is still cheaper than a cold start.
+            pending = [t for t in self._pending.get(key, ()) if not t.done()]
+            if pending:
+                await asyncio.wait(pending)
+                idle = self._idle.get(key, [])
+        while idle:
+            candidate = idle.pop()
+            if await self._is_healthy(candidate):
+                pooled = candidate
+                break
+            candidate.terminate()
+            self.stats.discarded += 1
+
+        if pooled is None:
+            pooled = await self._spawn(key, spawn, warm=False)
+            self.stats.cold_starts += 1
+        else:
+            self.stats.warm_hits += 1
+            if pooled.uses:
+                self.stats.reused += 1
+        pooled.uses += 1
+
+        if self.prewarm if prewarm is None else prewarm:
+            self._schedule_prewarm(key, spawn)
+        return pooled
+
+    def release(self, pooled: PooledProcess, reusable: bool = False) -> None:
+        """Return ``pooled`` to the pool (``reusable``) or terminate it."""
+        keep = (
+            reusable
+            and pooled.is_alive
+            and len(self._idle.get(pooled.key, ())) < self.max_idle_per_key
+            and not (
+                self.max_uses_per_process and pooled.uses >= self.max_uses_per_process
+            )
+        )
+        if keep:
+            pooled.last_used_at = time.monotonic()
+            self._add_idle(pooled)
+        else:
+            pooled.terminate()
+
+    async def aclose(self) -> None:
+        """Stop the reaper, cancel pending pre-spawns and terminate all idle processes."""
+        if self._reaper is not None:
+            self._reaper.cancel()
+            if self._reaper.get_loop() is asyncio.get_running_loop():
+                await asyncio.gather(self._reaper, return_exceptions=True)
+            self._reaper = None
+        for tasks in self._pending.values():
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        self._pending.clear()
+        for procs in self._idle.values():
+            for pooled in procs:
+                pooled.terminate()
+                try:
+                    await asyncio.wait_for(pooled.process.wait(), timeout=1.0)
+                except (asyncio.TimeoutError, ProcessLookupError):
+                    pass
+        self._idle.clear()
+        # The next acquire rebinds and restarts the reaper.
+        self._loop = None
+
+
+_shared_pools: Dict[str, TerminalProcessPool] = {}
+_shared_pools_lock = threading.Lock()
+
+
+def get_shared_process_pool(name: str = "default", **kwargs: Any) -> TerminalProcessPool:
+    """Return the process-wide pool registered under ``name``.
+
+    ``kwargs`` configure the pool on first creation and are ignored afterwards.
+    """
+    with _shared_pools_lock:
+        pool = _shared_pools.get(name)
+        if pool is None:
+            pool = _shared_pools[name] = TerminalProcessPool(**kwargs)
+        return pool
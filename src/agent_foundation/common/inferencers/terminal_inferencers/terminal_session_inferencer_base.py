@@ -11,12 +11,18 @@ import logging
 import os
 import subprocess
 from abc import abstractmethod
-from typing import Any, AsyncIterator, Dict, Iterator, List, Optional
+from typing import Any, AsyncIterator, ClassVar, Dict, Iterator, List, Optional
 
 from attr import attrib, attrs
+from agent_foundation.common.inferencers.loop_runner import get_default_loop_runner
 from agent_foundation.common.inferencers.streaming_inferencer_base import (
     StreamingInferencerBase,
 )
+from agent_foundation.common.inferencers.terminal_inferencers.process_pool import (
+    PooledProcess,
+    TerminalProcessPool,
+    wait_for_process_exit,
+)
 from agent_foundation.common.inferencers.terminal_inferencers.terminal_inferencer_response import (
     TerminalInferencerResponse,
 )
@@ -62,6 +68,19 @@ class TerminalSessionInferencerBase(StreamingInferencerBase):
         pre_exec_scripts: Shell commands to run before the main command.
         session_arg_name: CLI argument name for session ID.
         resume_arg_name: CLI argument name for resume flag.
+        process_pool: Optional ``TerminalProcessPool``. When set, the prompt
+            is written to the CLI's stdin (``construct_command`` is called
+            with ``use_stdin=True``) and processes come from the pool, so
+            requests whose command line is identical start on a pre-spawned
+            process. Only enable for CLIs whose ``construct_command`` honors
+            ``use_stdin`` (``supports_stdin_prompt``); other classes reject
+            a pool, since pre-spawning would run the previous prompt.
+        multi_turn_stdin: The CLI serves multiple turns over one process:
+            each prompt is written to stdin as one message and the response
+            ends with a ``turn_end_marker`` line. Processes are then returned
+            to ``process_pool`` and reused across requests.
+        turn_end_marker: Line (without newline) that terminates a response in
+            ``multi_turn_stdin`` mode.
     """
 
     # Terminal-specific attributes
@@ -78,14 +97,32 @@ class TerminalSessionInferencerBase(StreamingInferencerBase):
     # main process is detected as exited.
     subprocess_exit_drain_timeout: float = attrib(default=5.0)
 
-    # Polling interval (seconds) for checking if the subprocess has exited.
+    # Upper bound (seconds) of the exit poll interval, used only where
+    # event-driven (pidfd) exit detection is unavailable.
     _subprocess_exit_poll_interval: float = attrib(default=0.5, repr=False)
 
+    # Warm process pool / multi-turn session reuse
+    process_pool: Optional[TerminalProcessPool] = attrib(default=None)
+    # Class flag: ``construct_command(use_stdin=True)`` leaves the prompt out
+    # of the command line and the CLI reads it from stdin. Required for
+    # ``process_pool``; set by subclasses whose CLI supports it.
+    supports_stdin_prompt: ClassVar[bool] = False
+    multi_turn_stdin: bool = attrib(default=False)
+    turn_end_marker: Optional[str] = attrib(default=None)
+
     # Internal state for streaming result
     _last_streaming_output: str = attrib(default="", init=False, repr=False)
     _last_streaming_stderr: str = attrib(default="", init=False, repr=False)
     _last_streaming_return_code: int = attrib(default=0, init=False, repr=False)
 
+    def __attrs_post_init__(self) -> None:
+        super().__attrs_post_init__()
+        if self.process_pool is not None and not self.supports_stdin_prompt:
+            raise ValueError(
+                f"{type(self).__name__} does not support process_pool: its CLI "
+                "takes the prompt from the command line, not stdin"
+            )
+
     # === Abstract Methods ===
 
     @abstractmethod
@@ -133,12 +170,14 @@ class TerminalSessionInferencerBase(StreamingInferencerBase):
     # === Helpers: subprocess pipe-hang prevention ===
 
     async def _poll_process_exit(self, pid: int) -> Optional[int]:
-        """Poll for subprocess exit without relying on pipe closure.
+        """Wait for subprocess exit without relying on pipe closure.
 
         ``asyncio.subprocess.Process.wait()`` waits for pipe transports to
         close, which never happens when child processes (e.g., MCP servers)
-        inherit the pipes.  This helper uses ``os.waitpid(WNOHANG)`` to
-        detect the *actual* process exit.
+        inherit the pipes.  This helper detects the *actual* process exit via
+        ``wait_for_process_exit`` — event-driven through a pidfd where the
+        platform supports it, otherwise polled with backoff up to
+        ``_subprocess_exit_poll_interval``.
 
         Args:
             pid: The process ID to monitor.
@@ -146,14 +185,9 @@ class TerminalSessionInferencerBase(StreamingInferencerBase):
         Returns:
             Exit code, or ``None`` if the process was already reaped.
         """
-        while True:
-            try:
-                wpid, status = os.waitpid(pid, os.WNOHANG)
-                if wpid != 0:
-                    return os.waitstatus_to_exitcode(status)
-            except ChildProcessError:
-                return None  # already reaped by asyncio
-            await asyncio.sleep(self._subprocess_exit_poll_interval)
+        return await wait_for_process_exit(
+            pid, max_poll_interval=self._subprocess_exit_poll_interval
+        )
 
     @staticmethod
     def _force_close_pipes(
@@ -316,6 +350,113 @@ class TerminalSessionInferencerBase(StreamingInferencerBase):
             self._last_streaming_output = "".join(collected_stdout)
             self._last_streaming_return_code = process.returncode
 
+    async def _ainfer_streaming_pooled(
+        self, prompt: str, **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """Yield stdout lines from a pooled process fed the prompt via stdin.
+
+        One-shot CLIs: the prompt is written, stdin is closed and output is
+        read until exit; the pool pre-spawns the next process meanwhile.
+        ``multi_turn_stdin`` CLIs: output is read until ``turn_end_marker``
+        and the still-running process is returned to the pool. A turn that
+        does not finish cleanly (process exit, error, early close by the
+        consumer) retires the process instead.
+
+        Args:
+            prompt: The prompt string, or a dict with a ``"prompt"`` key.
+            **kwargs: Additional arguments passed to ``construct_command()``.
+
+        Yields:
+            Lines from subprocess stdout.
+        """
+        if self.multi_turn_stdin and not self.turn_end_marker:
+            raise ValueError("multi_turn_stdin requires turn_end_marker")
+
+        prompt = self._extract_prompt(prompt)
+        kwargs["use_stdin"] = True
+        command = self.construct_command({"prompt": prompt}, **kwargs)
+        full_command = self._build_full_command(command)
+
+        async def _spawn() -> asyncio.subprocess.Process:
+            return await asyncio.create_subprocess_shell(
+                full_command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=self.working_dir,
+            )
+
+        # A ``--resume <id>`` process spawned (or kept) while a turn of that
+        # session is running would start without the turn's context, so
+        # session-bound commands are neither pre-spawned nor reused.
+        session_bound = bool(kwargs.get("resume") and kwargs.get("session_id"))
+        pooled = await self.process_pool.acquire(
+            (full_command, self.working_dir), _spawn, prewarm=not session_bound
+        )
+        process = pooled.process
+        collected_stdout: list[str] = []
+        turn_completed = False
+        try:
+            payload = prompt
+            if self.multi_turn_stdin and not payload.endswith("\n"):
+                payload += "\n"
+            process.stdin.write(payload.encode("utf-8"))
+            await process.stdin.drain()
+
+            if self.multi_turn_stdin:
+                lines = self._read_stdout_with_exit_detection(process)
+                try:
+                    async for line in lines:
+                        if line.rstrip("\r\n") == self.turn_end_marker:
+                            turn_completed = True
+                            break
+                        collected_stdout.append(line)
+                        yield line
+                finally:
+                    await lines.aclose()
+            else:
+                process.stdin.close()
+                async for line in self._read_stdout_with_exit_detection(process):
+                    collected_stdout.append(line)
+                    yield line
+        finally:
+            await self._release_pooled_process(
+                pooled, turn_completed, reusable=not session_bound
+            )
+            self._last_streaming_output = "".join(collected_stdout)
+
+    async def _release_pooled_process(
+        self, pooled: PooledProcess, turn_completed: bool, reusable: bool = True
+    ) -> None:
+        """Record stderr/return code for the turn and hand ``pooled`` back.
+
+        A completed multi-turn process is returned for reuse unless
+        ``reusable`` is False, in which case it is retired.
+        """
+        process = pooled.process
+        if turn_completed:
+            self._last_streaming_stderr = pooled.take_stderr()
+            self._last_streaming_return_code = 0
+            self.process_pool.release(pooled, reusable=reusable)
+            if not reusable:
+                # The turn succeeded; the session process is just not kept.
+                await self._safe_process_cleanup(process)
+            return
+        if self.multi_turn_stdin:
+            # An unfinished turn leaves the session in an unknown state; kill
+            # it rather than waiting for a session process to exit by itself.
+            if process.returncode is None:
+                try:
+                    process.kill()
+                except ProcessLookupError:
+                    pass
+        else:
+            await pooled.wait_stderr(self.subprocess_exit_drain_timeout)
+        self._last_streaming_stderr = pooled.take_stderr()
+        await self._safe_process_cleanup(process)
+        self.process_pool.release(pooled, reusable=False)
+        self._last_streaming_return_code = process.returncode
+
     # === Concrete: _build_full_command ===
 
     def _build_full_command(self, command: str) -> str:
@@ -368,7 +509,7 @@ class TerminalSessionInferencerBase(StreamingInferencerBase):
     def _infer(
         self, inference_input: Any, inference_config: Any = None, **kwargs: Any
     ) -> Any:
-        """Sync execution via subprocess.run().
+        """Sync execution via subprocess.run() (or the process pool, if set).
 
         Args:
             inference_input: Input data for inference.
@@ -378,6 +519,13 @@ class TerminalSessionInferencerBase(StreamingInferencerBase):
         Returns:
             TerminalInferencerResponse wrapping ``parse_output()`` result.
         """
+        if self.process_pool is not None:
+            # Pooled processes are bound to the loop that spawned them; the
+            # shared background loop keeps them usable across sync calls.
+            return get_default_loop_runner().run(
+                self._ainfer(inference_input, inference_config, **kwargs)
+            )
+
         command = self.construct_command(inference_input, **kwargs)
         full_command = self._build_full_command(command)
 
@@ -443,6 +591,9 @@ class TerminalSessionInferencerBase(StreamingInferencerBase):
         Uses ``_read_stdout_with_exit_detection()`` to prevent hangs when
         child processes inherit stdout/stderr pipes.
 
+        With ``process_pool`` set, the prompt is sent over stdin to a pooled
+        process instead (see ``_ainfer_streaming_pooled``).
+
         Args:
             inference_input: Input data for inference.
             **kwargs: Additional arguments passed to ``construct_command()``.
@@ -450,6 +601,16 @@ class TerminalSessionInferencerBase(StreamingInferencerBase):
         Yields:
             Lines from subprocess stdout.
         """
+        if self.process_pool is not None:
+            pooled_lines = self._ainfer_streaming_pooled(inference_input, **kwargs)
+            try:
+                async for line in pooled_lines:
+                    yield line
+            finally:
+                # Release the process now, not when the generator is collected.
+                await pooled_lines.aclose()
+            return
+
         command = self.construct_command(inference_input, **kwargs)
         full_command = self._build_full_command(command)
 
@@ -52,7 +52,8 @@ Result Types:
     ScoredPiece, MergeJobResult, OperationResult
 
 Store ABCs:
-    MetadataStore, KnowledgePieceStore, EntityGraphStore
+    MetadataStore, KnowledgePieceStore, EntityGraphStore, PieceFilter,
+    ContentHashIndex
 
 Adapter-Based Stores:
     KeyValueMetadataStore, RetrievalKnowledgePieceStore,
@@ -68,9 +69,9 @@ Provider:
     InfoType, BudgetAwareKnowledgeProvider
 
 Retrieval:
-    HybridSearchConfig, HybridRetriever,
+    HybridSearchConfig, HybridSearchResult, HybridRetriever,
     MMRConfig, apply_mmr_reranking,
-    TemporalDecayConfig, apply_temporal_decay,
+    TemporalDecayConfig, apply_temporal_decay, compute_decay_multipliers,
     SubQuery, AgenticRetrievalResult,
     create_domain_decomposer, create_llm_decomposer,
     RetrievalPipeline, QueryExpander, PostProcessor,
@@ -163,6 +164,8 @@ from agent_foundation.knowledge.retrieval.models.results import (
 # ── Store ABCs ───────────────────────────────────────────────────────────
 from agent_foundation.knowledge.retrieval.stores.metadata.base import MetadataStore
 from agent_foundation.knowledge.retrieval.stores.pieces.base import KnowledgePieceStore
+from agent_foundation.knowledge.retrieval.stores.pieces.filters import PieceFilter
+from agent_foundation.knowledge.retrieval.stores.pieces.content_hash_index import ContentHashIndex
 from agent_foundation.knowledge.retrieval.stores.graph.base import EntityGraphStore
 
 # ── Adapter-Based Store Implementations ──────────────────────────────────
@@ -199,6 +202,7 @@ from agent_foundation.knowledge.retrieval.knowledge_provider import (
 # ── Hybrid Search ────────────────────────────────────────────────────────
 from agent_foundation.knowledge.retrieval.hybrid_search import (
     HybridSearchConfig,
+    HybridSearchResult,
     HybridRetriever,
 )
 
@@ -212,6 +216,7 @@ from agent_foundation.knowledge.retrieval.mmr_reranking import (
 from agent_foundation.knowledge.retrieval.temporal_decay import (
     TemporalDecayConfig,
     apply_temporal_decay,
+    compute_decay_multipliers,
 )
 
 # ── Query Decomposition & Agentic Models ─────────────────────────────────
@@ -369,6 +374,8 @@ __all__ = [
     # Store ABCs
     "MetadataStore",
     "KnowledgePieceStore",
+    "PieceFilter",
+    "ContentHashIndex",
     "EntityGraphStore",
     # Adapter-based stores
     "KeyValueMetadataStore",
@@ -384,6 +391,7 @@ __all__ = [
     "BudgetAwareKnowledgeProvider",
     # Hybrid Search
     "HybridSearchConfig",
+    "HybridSearchResult",
     "HybridRetriever",
     # MMR Re-ranking
     "MMRConfig",
@@ -391,6 +399,7 @@ __all__ = [
     # Temporal Decay
     "TemporalDecayConfig",
     "apply_temporal_decay",
+    "compute_decay_multipliers",
     # Query Decomposition & Agentic Models
     "SubQuery",
     "AgenticRetrievalResult",
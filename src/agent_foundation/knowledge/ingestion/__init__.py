@@ -33,6 +33,7 @@ from .knowledge_deleter import DeleteConfig, ConfirmationRequiredError, Knowledg
 from .document_ingester import (
     DocumentIngester,
     IngestionResult,
+    IngestionStats,
     IngesterConfig,
     ingest_markdown_files,
     ingest_directory,
@@ -84,6 +85,7 @@ __all__ = [
     # Document Ingester
     "DocumentIngester",
     "IngestionResult",
+    "IngestionStats",
     "IngesterConfig",
     "ingest_markdown_files",
     "ingest_directory",
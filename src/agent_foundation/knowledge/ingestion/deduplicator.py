@@ -5,21 +5,38 @@ Implements a three-tier deduplication strategy:
 1. Tier 1: Content hash (exact match) - O(1) lookup with index
 2. Tier 2: Embedding similarity - threshold-based
 3. Tier 3: LLM Judge - semantic analysis for borderline cases
+
+``deduplicate_many`` runs the same tiers over a batch of new pieces: the
+candidates are embedded with one batch call, the store is searched with the
+precomputed vectors, and pieces are also compared with the earlier pieces of
+the same batch (exact hash and cosine similarity), since those are not in
+the store yet. The in-batch similarities use numpy when it is installed.
 """
 
 import json
 import logging
 from dataclasses import dataclass
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
 from agent_foundation.knowledge.prompt_templates import render_prompt
+from agent_foundation.knowledge.retrieval.embedding_cache import EmbeddingCache
 from agent_foundation.knowledge.retrieval.models.enums import DedupAction
 from agent_foundation.knowledge.retrieval.models.knowledge_piece import KnowledgePiece
 from agent_foundation.knowledge.retrieval.models.results import DedupResult
 from agent_foundation.knowledge.retrieval.stores.pieces.base import KnowledgePieceStore
+from agent_foundation.knowledge.retrieval.utils import cosine_similarity
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised via monkeypatch in tests
+    np = None
 
 logger = logging.getLogger(__name__)
 
+# Batch actions after which a piece is stored as new, so later pieces of the
+# same batch are compared against it.
+_STORED_ACTIONS = (DedupAction.ADD, DedupAction.UPDATE)
+
 
 @dataclass
 class DedupConfig:
@@ -32,8 +49,77 @@ class DedupConfig:
     enable_tier3: bool = True
 
 
+class _BatchSimilarity:
+    """Cosine similarities between the candidates of one dedup batch.
+
+    With numpy, candidate vectors are normalized once into a unit matrix and
+    each lookup is one matrix-vector product against the earlier rows.
+    Without numpy (or with ragged vectors) falls back to pure Python.
+    """
+
+    def __init__(self, pieces: Sequence[KnowledgePiece]):
+        self._pieces = list(pieces)
+        codes: Dict[Optional[str], int] = {}
+        self._entity_codes = [
+            codes.setdefault(p.entity_id, len(codes)) for p in self._pieces
+        ]
+        self._stored = [False] * len(self._pieces)
+        self._unit = None
+        if np is not None and self._pieces:
+            try:
+                matrix = np.asarray([p.embedding for p in self._pieces], dtype=float)
+            except (TypeError, ValueError):
+                matrix = None
+            if matrix is not None and matrix.ndim == 2:
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                self._unit = np.divide(
+                    matrix, norms, out=np.zeros_like(matrix), where=norms > 0
+                )
+                self._entity_array = np.asarray(self._entity_codes)
+                self._stored_mask = np.zeros(len(self._pieces), dtype=bool)
+
+    def mark_stored(self, k: int) -> None:
+        """Make candidate ``k`` a match target for later candidates."""
+        self._stored[k] = True
+        if self._unit is not None:
+            self._stored_mask[k] = True
+
+    def best_match(self, k: int) -> Optional[Tuple[KnowledgePiece, float]]:
+        """Most similar stored candidate before ``k`` with the same entity_id."""
+        if self._unit is not None:
+            eligible = self._stored_mask[:k] & (
+                self._entity_array[:k] == self._entity_codes[k]
+            )
+            if not eligible.any():
+                return None
+            sims = np.where(eligible, self._unit[:k] @ self._unit[k], -np.inf)
+            best = int(np.argmax(sims))
+            return self._pieces[best], float(sims[best])
+
+        vector = self._pieces[k].embedding
+        scored = [
+            (p, cosine_similarity(p.embedding, vector))
+            for j, p in enumerate(self._pieces[:k])
+            if self._stored[j]
+            and self._entity_codes[j] == self._entity_codes[k]
+            and p.embedding is not None
+            and vector is not None
+            and len(p.embedding) == len(vector)
+        ]
+        return max(scored, key=lambda item: item[1]) if scored else None
+
+
 class ThreeTierDeduplicator:
-    """Three-tier deduplication for knowledge pieces."""
+    """Three-tier deduplication for knowledge pieces.
+
+    Pass the piece store's own embedding function (ideally an
+    ``EmbeddingCache``) as ``embedding_fn`` so the Tier 2 candidate vector
+    is reused for the store search and for the eventual ``add``.
+
+    ``batch_embedding_fn`` embeds a list of texts in one call for
+    ``deduplicate_many``; it defaults to ``embedding_fn.embed_many`` when
+    ``embedding_fn`` is an ``EmbeddingCache``.
+    """
 
     def __init__(
         self,
@@ -41,11 +127,15 @@ class ThreeTierDeduplicator:
         embedding_fn: Callable[[str], List[float]],
         llm_fn: Optional[Callable[[str], str]] = None,
         config: Optional[DedupConfig] = None,
+        batch_embedding_fn: Optional[Callable[[List[str]], List[List[float]]]] = None,
     ):
         self.piece_store = piece_store
         self.embedding_fn = embedding_fn
         self.llm_fn = llm_fn
         self.config = config or DedupConfig()
+        if batch_embedding_fn is None and isinstance(embedding_fn, EmbeddingCache):
+            batch_embedding_fn = embedding_fn.embed_many
+        self.batch_embedding_fn = batch_embedding_fn
 
     def deduplicate(self, piece: KnowledgePiece) -> DedupResult:
         """Run three-tier deduplication on a piece."""
@@ -58,27 +148,123 @@ class ThreeTierDeduplicator:
         # Tier 2: Embedding similarity
         if self.config.enable_tier2:
             result, top_match = self._tier2_embedding_check(piece)
-            if result.action == DedupAction.NO_OP:
-                return result
+            return self._resolve_tier2(piece, result, top_match)
+
+        return DedupResult(action=DedupAction.ADD, reason="No duplicates found")
 
-            # Borderline case: top_match present means score is between thresholds
-            if top_match is not None:
-                # Tier 3: LLM Judge (for borderline cases)
-                if self.config.enable_tier3:
-                    return self._tier3_llm_judge(
-                        piece, top_match, result.similarity_score
+    def deduplicate_many(
+        self, pieces: Sequence[KnowledgePiece]
+    ) -> List[DedupResult]:
+        """Run three-tier deduplication on a batch of new pieces.
+
+        Equivalent to ``deduplicate`` per piece, except that each piece is
+        also checked against the earlier pieces of the batch that would be
+        stored (ADD or UPDATE): an identical content hash, or a cosine
+        similarity above ``auto_dedup_threshold``, makes it a NO_OP without
+        a store round trip. Tier 1 checks the store with one
+        ``find_by_content_hashes`` call per entity. Tier 2 embeds all
+        candidates in one batch call and reuses the vectors for the store
+        searches when the store embeds queries with ``embedding_fn``.
+
+        Args:
+            pieces: The new pieces, in ingestion order.
+
+        Returns:
+            One DedupResult per piece, in input order.
+        """
+        results: List[Optional[DedupResult]] = [None] * len(pieces)
+        hash_duplicates: Dict[int, int] = {}
+
+        # Tier 1: Content hash, against the store and earlier batch pieces
+        if self.config.enable_tier1:
+            stored = self._find_stored_hashes(pieces)
+            first_by_hash: Dict[Tuple[Optional[str], str], int] = {}
+            for i, piece in enumerate(pieces):
+                existing = stored.get((piece.entity_id, piece.content_hash))
+                if existing is not None:
+                    results[i] = DedupResult(
+                        action=DedupAction.NO_OP,
+                        reason="Exact content hash match",
+                        existing_piece_id=existing.piece_id,
                     )
-                # Tier 3 disabled, default to ADD for borderline
-                return DedupResult(
-                    action=DedupAction.ADD,
-                    reason="Borderline similarity, Tier 3 disabled",
-                    similarity_score=result.similarity_score,
+                    continue
+                key = (piece.entity_id, piece.content_hash)
+                if key in first_by_hash:
+                    hash_duplicates[i] = first_by_hash[key]
+                else:
+                    first_by_hash[key] = i
+
+        remaining = [
+            i for i, result in enumerate(results)
+            if result is None and i not in hash_duplicates
+        ]
+
+        # Tier 2: Embedding similarity, with one batched embedding call
+        if self.config.enable_tier2:
+            candidates = [pieces[i] for i in remaining]
+            embedded = self._embed_pieces(candidates)
+            local = _BatchSimilarity(candidates)
+            for k, (i, fresh) in enumerate(zip(remaining, embedded)):
+                # Batch pieces are not stored yet, so they can only absorb a
+                # near-identical later piece, never be updated or merged into.
+                batch_match = local.best_match(k)
+                if batch_match is not None and (
+                    batch_match[1] > self.config.auto_dedup_threshold
+                ):
+                    similar = [batch_match]
+                else:
+                    similar = self._search_similar(pieces[i], fresh)
+                result, top_match = self._classify_similar(similar)
+                results[i] = self._resolve_tier2(pieces[i], result, top_match)
+                if results[i].action in _STORED_ACTIONS:
+                    local.mark_stored(k)
+        else:
+            for i in remaining:
+                results[i] = DedupResult(
+                    action=DedupAction.ADD, reason="No duplicates found"
                 )
 
-            # Low similarity, no match
+        # Repeats of an earlier batch piece point at that piece if it is
+        # stored, otherwise at whatever the earlier piece matched.
+        for i, first in hash_duplicates.items():
+            first_result = results[first]
+            results[i] = DedupResult(
+                action=DedupAction.NO_OP,
+                reason="Exact content hash match within batch",
+                existing_piece_id=(
+                    pieces[first].piece_id
+                    if first_result.action in _STORED_ACTIONS
+                    else first_result.existing_piece_id
+                ),
+            )
+        return results
+
+    def _resolve_tier2(
+        self,
+        piece: KnowledgePiece,
+        result: DedupResult,
+        top_match: Optional[KnowledgePiece],
+    ) -> DedupResult:
+        """Turn a Tier 2 outcome into the final decision, running Tier 3 if needed."""
+        if result.action == DedupAction.NO_OP:
             return result
 
-        return DedupResult(action=DedupAction.ADD, reason="No duplicates found")
+        # Borderline case: top_match present means score is between thresholds
+        if top_match is not None:
+            # Tier 3: LLM Judge (for borderline cases)
+            if self.config.enable_tier3:
+                return self._tier3_llm_judge(
+                    piece, top_match, result.similarity_score
+                )
+            # Tier 3 disabled, default to ADD for borderline
+            return DedupResult(
+                action=DedupAction.ADD,
+                reason="Borderline similarity, Tier 3 disabled",
+                similarity_score=result.similarity_score,
+            )
+
+        # Low similarity, no match
+        return result
 
     def _tier1_hash_check(self, piece: KnowledgePiece) -> DedupResult:
         """Tier 1: Check for exact hash match."""
@@ -98,20 +284,74 @@ class ThreeTierDeduplicator:
 
         return DedupResult(action=DedupAction.ADD, reason="No hash match")
 
+    def _find_stored_hashes(
+        self, pieces: Sequence[KnowledgePiece]
+    ) -> Dict[Tuple[Optional[str], str], KnowledgePiece]:
+        """Tier 1 for a batch: one ``find_by_content_hashes`` call per entity."""
+        hashes_by_entity: Dict[Optional[str], List[str]] = {}
+        for piece in pieces:
+            if piece.content_hash is None:
+                piece.content_hash = piece._compute_content_hash()
+            hashes_by_entity.setdefault(piece.entity_id, []).append(piece.content_hash)
+        stored: Dict[Tuple[Optional[str], str], KnowledgePiece] = {}
+        for entity_id, hashes in hashes_by_entity.items():
+            found = self.piece_store.find_by_content_hashes(hashes, entity_id)
+            for content_hash, existing in found.items():
+                stored[(entity_id, content_hash)] = existing
+        return stored
+
     def _tier2_embedding_check(
         self, piece: KnowledgePiece
     ) -> Tuple[DedupResult, Optional[KnowledgePiece]]:
         """Tier 2: Check embedding similarity."""
-        if piece.embedding is None:
-            text = piece.embedding_text or piece.content
-            piece.embedding = self.embedding_fn(text)
-
-        similar = self.piece_store.search(
+        embedded = piece.embedding is None
+        if embedded:
+            piece.embedding = self.embedding_fn(piece.embedding_text or piece.content)
+        return self._classify_similar(self._search_similar(piece, embedded))
+
+    def _embed_pieces(self, pieces: Sequence[KnowledgePiece]) -> List[bool]:
+        """Fill in missing embeddings, in one batch call when possible.
+
+        Returns, per piece, whether it was embedded here with ``embedding_fn``.
+        """
+        embedded = [piece.embedding is None for piece in pieces]
+        missing = [piece for piece, flag in zip(pieces, embedded) if flag]
+        if not missing:
+            return embedded
+        texts = [piece.embedding_text or piece.content for piece in missing]
+        if self.batch_embedding_fn is not None:
+            vectors = self.batch_embedding_fn(texts)
+        else:
+            vectors = [self.embedding_fn(text) for text in texts]
+        for piece, vector in zip(missing, vectors):
+            piece.embedding = vector.tolist() if hasattr(vector, "tolist") else vector
+        return embedded
+
+    def _search_similar(
+        self, piece: KnowledgePiece, embedded: bool
+    ) -> List[Tuple[KnowledgePiece, float]]:
+        """Search the store for pieces similar to a candidate.
+
+        ``embedded`` says whether ``piece.embedding`` was just computed with
+        ``embedding_fn``.
+        """
+        search_kwargs = {}
+        # Reuse the vector for the store's search when it embeds queries
+        # with the same function, instead of embedding the text twice.
+        if embedded and self.piece_store.query_embedding_function is self.embedding_fn:
+            search_kwargs["query_vector"] = piece.embedding
+
+        return self.piece_store.search(
             query=piece.embedding_text or piece.content,
             entity_id=piece.entity_id,
             top_k=5,
+            **search_kwargs,
         )
 
+    def _classify_similar(
+        self, similar: List[Tuple[KnowledgePiece, float]]
+    ) -> Tuple[DedupResult, Optional[KnowledgePiece]]:
+        """Apply the Tier 2 thresholds to the best similarity match."""
         if not similar:
             return (
                 DedupResult(action=DedupAction.ADD, reason="No similar pieces"),
@@ -13,16 +13,31 @@ and the new domain taxonomy-aware structuring prompts.
 Progress Callbacks:
     The ingester supports optional progress callbacks for real-time UI updates.
     Pass a ProgressCallback function to receive status messages during ingestion.
+
+Concurrency:
+    With ``IngesterConfig.max_concurrent_chunks > 1`` chunk extraction (the
+    LLM calls, with their per-chunk retries) runs on a bounded thread pool.
+    ``ingest_files`` submits the chunks of every file to the same pool, so
+    parallelism spans files as well as chunks. Results are still consumed in
+    document and chunk order, and merging, deduplication and loading stay on
+    the calling thread, so output is the same as a sequential run. With
+    ``load_batch_size`` set, merged results are loaded into the KnowledgeBase
+    every that many chunks instead of once per document. Counters for
+    progress and throughput are kept in ``IngestionResult.stats``.
 """
 
+import concurrent.futures
 import json
 import logging
 import os
 import tempfile
-from dataclasses import dataclass
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from agent_foundation.knowledge.ingestion.chunker import (
     ChunkerConfig,
@@ -70,6 +85,46 @@ def _noop_progress(message: str) -> None:
     pass
 
 
+@dataclass
+class IngestionStats:
+    """Progress and throughput counters for one document.
+
+    Counters are updated with ``add()``, which is safe to call from the
+    chunk worker threads.
+
+    Attributes:
+        chunks_total: Number of chunks the document was split into.
+        chunks_completed: Chunks whose extraction finished (success or failure).
+        chunks_failed: Chunks that failed after all retries.
+        llm_calls: LLM calls made, including retries.
+        batches_loaded: Number of ``_load_into_kb`` calls made.
+        elapsed_seconds: Wall-clock time from chunking to the final load.
+    """
+
+    chunks_total: int = 0
+    chunks_completed: int = 0
+    chunks_failed: int = 0
+    llm_calls: int = 0
+    batches_loaded: int = 0
+    elapsed_seconds: float = 0.0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def add(self, **counts: int) -> None:
+        """Increment the named counters."""
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    @property
+    def chunks_per_second(self) -> float:
+        """Completed chunks per second of elapsed time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.chunks_completed / self.elapsed_seconds
+
+
 @dataclass
 class IngestionResult:
     """Result of a document ingestion operation.
@@ -83,6 +138,7 @@ class IngestionResult:
         graph_edges_created: Number of graph edges created.
         errors: List of error messages from failed chunks.
         source_file: Source file path if applicable.
+        stats: Progress and throughput counters.
     """
 
     success: bool
@@ -93,10 +149,13 @@ class IngestionResult:
     graph_edges_created: int = 0
     errors: List[str] = None
     source_file: Optional[str] = None
+    stats: Optional[IngestionStats] = None
 
     def __post_init__(self):
         if self.errors is None:
             self.errors = []
+        if self.stats is None:
+            self.stats = IngestionStats()
 
 
 @dataclass
@@ -110,6 +169,11 @@ class IngesterConfig:
         merge_graphs: Whether to merge graphs across chunks (default True).
         dedupe_pieces: Whether to deduplicate pieces by content hash (default True).
         debug_session: Optional debug session for saving artifacts.
+        max_concurrent_chunks: Maximum chunks sent to the LLM at once, across
+            all documents of one ingestion call (default 1, sequential). The
+            inferencer must be thread-safe when this is above 1.
+        load_batch_size: If set, load merged results into the KnowledgeBase
+            every this many extracted chunks instead of once per document.
     """
 
     max_retries: int = 3
@@ -118,6 +182,30 @@ class IngesterConfig:
     merge_graphs: bool = True
     dedupe_pieces: bool = True
     debug_session: Optional[IngestionDebugSession] = None
+    max_concurrent_chunks: int = 1
+    load_batch_size: Optional[int] = None
+
+
+@dataclass
+class _MergeState:
+    """Identifiers already merged for a document, kept across load batches."""
+
+    piece_ids: Set[str] = field(default_factory=set)
+    node_ids: Set[str] = field(default_factory=set)
+    edges: Set[Tuple[str, str, str]] = field(default_factory=set)
+    loaded_node_ids: Set[str] = field(default_factory=set)
+    deferred_edges: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class _DocumentPlan:
+    """A chunked document and its (possibly in-flight) chunk extractions."""
+
+    doc_id: str
+    chunks: List[DocumentChunk]
+    result: IngestionResult
+    started_at: float
+    pending: List[Optional[concurrent.futures.Future]] = field(default_factory=list)
 
 
 class DocumentIngester:
@@ -222,20 +310,90 @@ class DocumentIngester:
         Returns:
             IngestionResult with counts and status.
         """
+        plan = self._plan_document(text, source_file)
+        if not plan.chunks:
+            return plan.result
+
+        with self._chunk_executor() as executor:
+            self._submit_chunks(plan, executor)
+            return self._finish_document(plan, kb, spaces)
+
+    def ingest_files(
+        self,
+        file_paths: List[str],
+        kb: KnowledgeBase,
+        spaces: Optional[List[str]] = None,
+    ) -> Dict[str, IngestionResult]:
+        """Ingest several files, extracting their chunks concurrently.
+
+        All chunks of all files share one pool of
+        ``config.max_concurrent_chunks`` workers. Files are merged and loaded
+        one at a time, in input order. A file that cannot be read or
+        ingested gets a failed IngestionResult instead of raising.
+
+        Args:
+            file_paths: Paths of the files to ingest.
+            kb: KnowledgeBase to populate.
+            spaces: Optional user-specified spaces override for every file.
+
+        Returns:
+            Dict mapping each path to its IngestionResult, in input order.
+        """
+        results: Dict[str, IngestionResult] = {}
+        plans: List[Tuple[str, _DocumentPlan]] = []
+
+        with self._chunk_executor() as executor:
+            for path in file_paths:
+                try:
+                    if not Path(path).exists():
+                        raise FileNotFoundError(f"File not found: {path}")
+                    text = Path(path).read_text(encoding="utf-8")
+                    plan = self._plan_document(text, path)
+                    self._submit_chunks(plan, executor)
+                    plans.append((path, plan))
+                except Exception as e:
+                    results[path] = IngestionResult(
+                        success=False, errors=[str(e)], source_file=path
+                    )
+                    logger.error("Failed to ingest %s: %s", path, e)
+
+            for path, plan in plans:
+                try:
+                    results[path] = (
+                        self._finish_document(plan, kb, spaces)
+                        if plan.chunks
+                        else plan.result
+                    )
+                except Exception as e:
+                    results[path] = IngestionResult(
+                        success=False, errors=[str(e)], source_file=path
+                    )
+                    logger.error("Failed to ingest %s: %s", path, e)
+
+        return {path: results[path] for path in file_paths}
+
+    def _plan_document(
+        self, text: str, source_file: Optional[str] = None
+    ) -> _DocumentPlan:
+        """Chunk a document and save its chunks to the debug session."""
         result = IngestionResult(success=True, source_file=source_file)
         doc_id = source_file or f"doc_{id(text) % 100000}"
+        plan = _DocumentPlan(
+            doc_id=doc_id, chunks=[], result=result, started_at=time.perf_counter()
+        )
 
         # Step 1: Chunk the document
         self._report("Analyzing document structure...")
-        chunks = self.chunker.chunk_document(text, source_file=source_file)
-        if not chunks:
+        plan.chunks = self.chunker.chunk_document(text, source_file=source_file)
+        if not plan.chunks:
             self._report("No content to process")
-            return result
+            return plan
 
-        self._report(f"Split into {len(chunks)} chunk(s)")
+        result.stats.chunks_total = len(plan.chunks)
+        self._report(f"Split into {len(plan.chunks)} chunk(s)")
 
         if self.debug_session:
-            for chunk in chunks:
+            for chunk in plan.chunks:
                 self.debug_session.save_chunk(
                     doc_id=doc_id,
                     chunk_idx=chunk.chunk_index,
@@ -246,16 +404,73 @@ class DocumentIngester:
                         "source_file": chunk.source_file,
                     },
                 )
+        return plan
 
-        # Step 2: Process each chunk through LLM
-        all_structured_data: List[Dict[str, Any]] = []
+    @contextmanager
+    def _chunk_executor(self) -> Iterator[Optional[concurrent.futures.Executor]]:
+        """Yield a bounded pool for chunk extraction, or None when sequential.
+
+        Chunks not yet started are cancelled if the ingestion call exits
+        early.
+        """
+        workers = self.config.max_concurrent_chunks
+        if workers <= 1:
+            yield None
+            return
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="kb-ingest"
+        )
+        try:
+            yield executor
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _submit_chunks(
+        self,
+        plan: _DocumentPlan,
+        executor: Optional[concurrent.futures.Executor],
+    ) -> None:
+        """Start extraction of every chunk of ``plan`` on ``executor``.
 
-        for chunk in chunks:
+        With no executor, chunks are extracted lazily by ``_finish_document``.
+        """
+        plan.pending = [
+            executor.submit(
+                self._process_chunk, chunk, plan.doc_id, plan.result.stats
+            )
+            if executor is not None
+            else None
+            for chunk in plan.chunks
+        ]
+
+    def _finish_document(
+        self,
+        plan: _DocumentPlan,
+        kb: KnowledgeBase,
+        spaces: Optional[List[str]] = None,
+    ) -> IngestionResult:
+        """Collect chunk results in order, then merge and load them."""
+        result = plan.result
+        stats = result.stats
+        batch_size = self.config.load_batch_size
+        merge_state = _MergeState()
+        batch: List[Dict[str, Any]] = []
+        extracted_any = False
+        totals = {"pieces": 0, "metadata": 0, "graph_nodes": 0, "graph_edges": 0}
+
+        # Step 2: Process each chunk through LLM
+        for chunk, future in zip(plan.chunks, plan.pending):
             try:
                 self._report(
                     f"Processing chunk {chunk.chunk_index + 1}/{chunk.total_chunks}..."
                 )
-                structured = self._process_chunk(chunk, doc_id=doc_id)
+                if future is not None:
+                    structured = future.result()
+                else:
+                    structured = self._process_chunk(
+                        chunk, doc_id=plan.doc_id, stats=stats
+                    )
+                stats.add(chunks_completed=1)
                 if structured:
                     pieces = structured.get("pieces", [])
                     if pieces:
@@ -263,29 +478,89 @@ class DocumentIngester:
                         self._report(
                             f"  → {len(pieces)} piece(s): {', '.join(sorted(domains))}"
                         )
-                    all_structured_data.append(structured)
+                    batch.append(structured)
+                    extracted_any = True
                     result.chunks_processed += 1
             except Exception as e:
+                stats.add(chunks_completed=1, chunks_failed=1)
                 error_msg = f"Chunk {chunk.chunk_index}: {e}"
                 self._report(f"  ✗ Failed: {e}")
                 result.errors.append(error_msg)
 
-        if not all_structured_data:
+            if batch_size and len(batch) >= batch_size:
+                self._load_batch(
+                    batch, plan, kb, spaces, merge_state, totals, final=False
+                )
+                batch = []
+
+        if not extracted_any:
             result.success = False
+            stats.elapsed_seconds = time.perf_counter() - plan.started_at
             self._report("No data extracted from any chunk")
             return result
 
-        # Step 3: Merge results from all chunks
+        if batch or merge_state.deferred_edges:
+            self._load_batch(batch, plan, kb, spaces, merge_state, totals, final=True)
+
+        result.pieces_created = totals["pieces"]
+        result.metadata_created = totals["metadata"]
+        result.graph_nodes_created = totals["graph_nodes"]
+        result.graph_edges_created = totals["graph_edges"]
+        stats.elapsed_seconds = time.perf_counter() - plan.started_at
+        if result.success:
+            self._report(
+                f"Done: {result.pieces_created} pieces, "
+                f"{result.graph_nodes_created} nodes "
+                f"({stats.chunks_per_second:.2f} chunks/s)"
+            )
+        return result
+
+    def _load_batch(
+        self,
+        batch: List[Dict[str, Any]],
+        plan: _DocumentPlan,
+        kb: KnowledgeBase,
+        spaces: Optional[List[str]],
+        merge_state: _MergeState,
+        totals: Dict[str, int],
+        final: bool,
+    ) -> None:
+        """Merge, enhance and load one batch of chunk results.
+
+        Edges whose endpoints have not been loaded yet are held back until a
+        later batch loads them (or the final batch), so graph stores never
+        see an edge before its nodes.
+        """
+        result = plan.result
+
+        # Step 3: Merge results from the batch's chunks
         self._report("Merging results...")
-        merged = self._merge_results(all_structured_data)
+        merged = self._merge_results(batch, state=merge_state)
+
+        if self.config.load_batch_size:
+            batch_nodes = {n.get("node_id", "") for n in merged["graph"]["nodes"]}
+            available = merge_state.loaded_node_ids | batch_nodes
+            edges = merge_state.deferred_edges + merged["graph"]["edges"]
+            merge_state.deferred_edges = []
+            ready = []
+            for edge in edges:
+                if final or (
+                    edge.get("source_id", "") in available
+                    and edge.get("target_id", "") in available
+                ):
+                    ready.append(edge)
+                else:
+                    merge_state.deferred_edges.append(edge)
+            merged["graph"]["edges"] = ready
+            merge_state.loaded_node_ids = available
 
         if self.debug_session:
-            self.debug_session.save_merged(doc_id=doc_id, data=merged)
+            self.debug_session.save_merged(doc_id=plan.doc_id, data=merged)
 
         # Step 4: Add source metadata to pieces
-        if source_file:
+        if result.source_file:
             for piece in merged.get("pieces", []):
-                piece["source"] = source_file
+                piece["source"] = result.source_file
 
         # Step 4.5: Apply enhancements (dedup, validation, merge, space classification)
         merged, enhancement_counts, pieces_to_deactivate = (
@@ -297,29 +572,28 @@ class DocumentIngester:
         if enhancement_counts.get("merged"):
             logger.info("Merged %d pieces", enhancement_counts["merged"])
 
-        # Step 5: Load into KnowledgeBase (atomic)
+        # Step 5: Load into KnowledgeBase (atomic per batch)
         try:
             self._report("Saving to knowledge base...")
             counts = self._load_into_kb(merged, kb, pieces_to_deactivate)
-            result.pieces_created = counts.get("pieces", 0)
-            result.metadata_created = counts.get("metadata", 0)
-            result.graph_nodes_created = counts.get("graph_nodes", 0)
-            result.graph_edges_created = counts.get("graph_edges", 0)
-            self._report(
-                f"Done: {result.pieces_created} pieces, "
-                f"{result.graph_nodes_created} nodes"
-            )
+            for key in totals:
+                totals[key] += counts.get(key, 0)
+            result.stats.add(batches_loaded=1)
         except Exception as e:
             result.success = False
             result.errors.append(f"Failed to load into KB: {e}")
             self._report(f"✗ Save failed: {e}")
 
-        return result
-
     def _process_chunk(
-        self, chunk: DocumentChunk, doc_id: str = ""
+        self,
+        chunk: DocumentChunk,
+        doc_id: str = "",
+        stats: Optional[IngestionStats] = None,
     ) -> Optional[Dict[str, Any]]:
-        """Process a single chunk through the LLM."""
+        """Process a single chunk through the LLM.
+
+        Safe to run on a worker thread; ``stats`` counts the LLM calls made.
+        """
         context = ""
         if chunk.header_context:
             context = f"Section context: {chunk.header_context}"
@@ -342,6 +616,8 @@ class DocumentIngester:
         last_error = None
         for attempt in range(self.config.max_retries):
             try:
+                if stats is not None:
+                    stats.add(llm_calls=1)
                 response = self._call_llm(prompt)
 
                 if self.debug_session:
@@ -422,17 +698,26 @@ class DocumentIngester:
 
         return data
 
-    def _merge_results(self, all_data: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Merge structured data from multiple chunks."""
+    def _merge_results(
+        self,
+        all_data: List[Dict[str, Any]],
+        state: Optional[_MergeState] = None,
+    ) -> Dict[str, Any]:
+        """Merge structured data from multiple chunks.
+
+        Pass the same ``state`` for successive batches of one document to
+        drop pieces, nodes and edges already merged in an earlier batch.
+        """
         merged: Dict[str, Any] = {
             "metadata": {},
             "pieces": [],
             "graph": {"nodes": [], "edges": []},
         }
 
-        seen_piece_ids: set = set()
-        seen_node_ids: set = set()
-        seen_edges: set = set()
+        state = state or _MergeState()
+        seen_piece_ids = state.piece_ids
+        seen_node_ids = state.node_ids
+        seen_edges = state.edges
 
         for data in all_data:
             merged["metadata"].update(data.get("metadata", {}))
@@ -484,6 +769,7 @@ class DocumentIngester:
         pieces_to_deactivate: List[str] = []
 
         enhanced_pieces = []
+        pieces: List[KnowledgePiece] = []
 
         for piece_dict in data.get("pieces", []):
             piece = KnowledgePiece.from_dict(piece_dict)
@@ -516,10 +802,17 @@ class DocumentIngester:
                     piece.space_suggestion_reasons = result.suggestion_reasons
                     piece.space_suggestion_status = "pending"
 
-            # Deduplication
-            if self._deduplicator:
-                dedup_result = self._deduplicator.deduplicate(piece)
+            pieces.append(piece)
 
+        # Deduplication, one batch for all pieces of this load
+        dedup_results = (
+            self._deduplicator.deduplicate_many(pieces)
+            if self._deduplicator and pieces
+            else [None] * len(pieces)
+        )
+
+        for piece, dedup_result in zip(pieces, dedup_results):
+            if dedup_result is not None:
                 if dedup_result.action == DedupAction.NO_OP:
                     counts["deduped"] += 1
                     continue
@@ -625,27 +918,21 @@ def ingest_markdown_files(
     inferencer: Callable[[str], Any],
     config: Optional[IngesterConfig] = None,
 ) -> Dict[str, IngestionResult]:
-    """Convenience function to ingest multiple markdown files."""
-    ingester = DocumentIngester(inferencer, config)
-    results: Dict[str, IngestionResult] = {}
+    """Convenience function to ingest multiple markdown files.
 
-    for path in file_paths:
-        try:
-            result = ingester.ingest_file(path, kb)
-            results[path] = result
-            logger.info(
-                "Ingested %s: %d pieces, %d errors",
-                path,
-                result.pieces_created,
-                len(result.errors),
-            )
-        except Exception as e:
-            results[path] = IngestionResult(
-                success=False,
-                errors=[str(e)],
-                source_file=path,
-            )
-            logger.error("Failed to ingest %s: %s", path, e)
+    Chunks of all files are extracted with up to
+    ``config.max_concurrent_chunks`` concurrent LLM calls.
+    """
+    ingester = DocumentIngester(inferencer, config)
+    results = ingester.ingest_files(file_paths, kb)
+
+    for path, result in results.items():
+        logger.info(
+            "Ingested %s: %d pieces, %d errors",
+            path,
+            result.pieces_created,
+            len(result.errors),
+        )
 
     return results
 
@@ -24,6 +24,7 @@ from agent_foundation.knowledge.retrieval.models.enums import DeleteMode
 from agent_foundation.knowledge.retrieval.models.knowledge_piece import KnowledgePiece
 from agent_foundation.knowledge.retrieval.models.results import OperationResult
 from agent_foundation.knowledge.retrieval.stores.pieces.base import KnowledgePieceStore
+from agent_foundation.knowledge.retrieval.stores.pieces.filters import PieceFilter
 
 logger = logging.getLogger(__name__)
 
@@ -59,9 +60,10 @@ class KnowledgeDeleter:
     NOTE: This implementation assumes that piece_store.get_by_id()
     returns pieces regardless of is_active status.
 
-    PERFORMANCE WARNING: restore_by_id() calls list_all() which
-    loads all pieces for the entity into memory. For large knowledge bases,
-    consider adding a find_by_supersedes() method to the store interface.
+    PERFORMANCE WARNING: restore_by_id() scans the entity's active pieces
+    with iter_all(). Memory stays bounded, but the scan is linear; for large
+    knowledge bases, consider adding a find_by_supersedes() method to the
+    store interface.
     """
 
     def __init__(
@@ -208,8 +210,8 @@ class KnowledgeDeleter:
     ) -> OperationResult:
         """Restore a soft-deleted piece.
 
-        PERFORMANCE WARNING: This calls list_all() which may be
-        slow for large knowledge bases.
+        PERFORMANCE WARNING: This scans the entity's active pieces with
+        iter_all(), which may be slow for large knowledge bases.
         """
         existing = self.piece_store.get_by_id(piece_id)
         if existing is None:
@@ -229,10 +231,12 @@ class KnowledgeDeleter:
             )
 
         # Check if any active piece supersedes this one
-        all_pieces = self.piece_store.list_all(entity_id=existing.entity_id)
+        active_pieces = self.piece_store.iter_all(
+            entity_id=existing.entity_id, piece_filter=PieceFilter(is_active=True)
+        )
         superseding = [
             p
-            for p in all_pieces
+            for p in active_pieces
             if p.is_active and getattr(p, "supersedes", None) == piece_id
         ]
         if superseding:
@@ -20,6 +20,7 @@ from agent_foundation.knowledge.retrieval.models.enums import (
 from agent_foundation.knowledge.retrieval.models.knowledge_piece import KnowledgePiece
 from agent_foundation.knowledge.retrieval.models.results import MergeJobResult
 from agent_foundation.knowledge.retrieval.stores.pieces.base import KnowledgePieceStore
+from agent_foundation.knowledge.retrieval.stores.pieces.filters import PieceFilter
 
 
 class PostIngestionMergeJob:
@@ -119,17 +120,16 @@ class PostIngestionMergeJob:
                 A piece matches if its ``spaces`` list has at least one element
                 in common with the filter list (OR semantics).
         """
-        all_pieces = self.piece_store.list_all(entity_id=None)
-
-        filter_spaces = set(spaces) if spaces else {space}
+        filter_spaces = list(spaces) if spaces else [space]
 
+        # Stream the scan so only deferred pieces are held in memory.
         deferred = []
-        for piece in all_pieces:
+        for piece in self.piece_store.iter_all(
+            entity_id=None, piece_filter=PieceFilter(spaces=filter_spaces)
+        ):
             if not getattr(piece, "merge_processed", True):
                 strategy = getattr(piece, "merge_strategy", None)
-                piece_spaces = getattr(piece, "spaces", [getattr(piece, "space", "main")])
-
-                if set(piece_spaces) & filter_spaces and strategy in (
+                if strategy in (
                     MergeStrategy.POST_INGESTION_AUTO.value,
                     MergeStrategy.POST_INGESTION_SUGGESTION.value,
                 ):
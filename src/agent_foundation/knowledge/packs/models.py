@@ -158,8 +158,19 @@ class PackInstallResult:
 
 @dataclass
 class PackManagerConfig:
-    """Configuration for KnowledgePackManager."""
+    """Configuration for KnowledgePackManager.
+
+    Attributes:
+        install_batch_size: Pieces written per ``add_many`` call during
+            install and update.
+        skip_existing_content: If True, install skips pack pieces whose
+            content already exists as an active piece in the store. Off by
+            default because the skipped content then belongs to another
+            pack (or none) and leaves with it on uninstall.
+    """
 
     default_domain: str = "agent_skills"
     default_info_type: str = "skills"
     preserve_history: bool = True
+    install_batch_size: int = 500
+    skip_existing_content: bool = False
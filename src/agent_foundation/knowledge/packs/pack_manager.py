@@ -2,14 +2,20 @@
 KnowledgePackManager — atomic install/uninstall/update for knowledge packs.
 
 Manages packs across three existing stores (MetadataStore, KnowledgePieceStore,
-EntityGraphStore) without requiring any ABC changes. Follows the atomicity
+EntityGraphStore) without any pack-specific ABC changes. Follows the atomicity
 pattern from KnowledgeUpdater: add new first, deactivate old after, best-effort
 rollback on failure.
+
+Install is a bulk pipeline: the whole pack is validated and de-duplicated
+before the first write, pieces and graph links are written in batches inside
+one piece-store ``bulk_session`` (so indexes are rebuilt once, at commit),
+and the pack metadata is saved last, marking the pack installed.
 """
 
 import logging
+import time
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from rich_python_utils.service_utils.graph_service.graph_node import (
     GraphEdge,
@@ -64,11 +70,19 @@ class KnowledgePackManager:
         """Atomically install a pack and its pieces.
 
         Steps:
-        1. Add all pieces to the piece store
-        2. Save pack metadata to the metadata store
-        3. Create pack graph node and CONTAINS edges to piece nodes
+        0. Validate and de-duplicate the whole pack (``_plan_install``);
+           an invalid pack fails before anything is written
+        1. Add pieces in batches of ``config.install_batch_size``
+        2. Create pack graph node and CONTAINS edges with batched writes
+        3. Save pack metadata, which marks the pack installed
+
+        Steps 1-3 run inside one piece-store ``bulk_session``, so indexes are
+        rebuilt once when it commits. On failure, everything written so far
+        (pieces, piece nodes created for the pack, the pack node, metadata)
+        is removed before the session closes.
 
-        On failure, rolls back pieces that were already added.
+        The result's ``details`` report ``pieces_skipped``, ``batches``,
+        ``elapsed_seconds`` and ``pieces_per_second``.
 
         Args:
             pack: The KnowledgePack to install.
@@ -84,61 +98,80 @@ class KnowledgePackManager:
                 error=f"Pack already installed: {pack.pack_id}",
             )
 
-        added_piece_ids = []
+        started = time.perf_counter()
         try:
-            # Step 1: Add all pieces
-            for piece in pieces:
-                if pack.spaces is not None:
-                    piece.spaces = list(pack.spaces)
-                    piece.space = piece.spaces[0]
-                self._piece_store.add(piece)
-                added_piece_ids.append(piece.piece_id)
-
-            # Record piece IDs on the pack
-            pack.piece_ids = added_piece_ids
-            pack.status = PackStatus.INSTALLED
-
-            # Step 2: Save pack metadata
-            metadata = self._pack_to_metadata(pack)
-            self._metadata_store.save_metadata(metadata)
-
-            # Step 3: Create graph structure
-            self._create_pack_graph(pack.pack_id, added_piece_ids)
-
-            logger.info(
-                "Installed pack %s with %d pieces", pack.pack_id, len(added_piece_ids)
+            to_add, skipped = self._plan_install(pack, pieces)
+        except ValueError as e:
+            return PackInstallResult(
+                success=False,
+                pack_id=pack.pack_id,
+                error=f"Invalid pack: {e}",
             )
+        except Exception as e:
+            # Planning queries the piece store; nothing has been written yet.
+            logger.error("Install planning failed for %s: %s", pack.pack_id, e)
             return PackInstallResult(
-                success=True,
+                success=False,
                 pack_id=pack.pack_id,
-                pieces_installed=len(added_piece_ids),
+                error=f"Install failed: {e}",
             )
 
-        except Exception as e:
-            logger.error("Install failed for %s: %s. Rolling back.", pack.pack_id, e)
-            # Rollback: remove pieces that were added
-            for pid in added_piece_ids:
+        added_piece_ids: List[str] = []
+        created_node_ids: List[str] = []
+        try:
+            with self._piece_store.bulk_session():
                 try:
-                    self._piece_store.remove(pid)
+                    # Step 1: Add pieces in batches
+                    batches = self._add_pieces_in_batches(to_add, added_piece_ids)
+
+                    # Record piece IDs on the pack
+                    pack.piece_ids = added_piece_ids
+                    pack.status = PackStatus.INSTALLED
+
+                    # Step 2: Create graph structure
+                    self._create_pack_graph(
+                        pack.pack_id, added_piece_ids, created_node_ids
+                    )
+
+                    # Step 3: Save pack metadata
+                    metadata = self._pack_to_metadata(pack)
+                    self._metadata_store.save_metadata(metadata)
                 except Exception:
-                    pass
-            # Rollback: remove metadata if it was saved
-            try:
-                self._metadata_store.delete_metadata(pack.pack_id)
-            except Exception:
-                pass
-            # Rollback: remove graph node (cascades edges)
-            try:
-                self._graph_store.remove_node(pack.pack_id)
-            except Exception:
-                pass
+                    self._rollback_install(
+                        pack.pack_id, added_piece_ids, created_node_ids
+                    )
+                    raise
 
+        except Exception as e:
+            logger.error("Install failed for %s: %s. Rolled back.", pack.pack_id, e)
             return PackInstallResult(
                 success=False,
                 pack_id=pack.pack_id,
                 error=f"Install failed: {e}",
             )
 
+        elapsed = time.perf_counter() - started
+        details = {
+            "pieces_skipped": skipped,
+            "batches": batches,
+            "elapsed_seconds": elapsed,
+            "pieces_per_second": len(added_piece_ids) / elapsed if elapsed > 0 else 0.0,
+        }
+        logger.info(
+            "Installed pack %s with %d pieces (%d skipped) in %.2fs (%.1f pieces/s)",
+            pack.pack_id,
+            len(added_piece_ids),
+            skipped,
+            elapsed,
+            details["pieces_per_second"],
+        )
+        return PackInstallResult(
+            success=True,
+            pack_id=pack.pack_id,
+            pieces_installed=len(added_piece_ids),
+            details=details,
+        )
+
     # ── Uninstall ────────────────────────────────────────────────────────
 
     def uninstall(
@@ -243,21 +276,20 @@ class KnowledgePackManager:
 
         added_piece_ids = []
         try:
-            # Step 1: Add all new pieces FIRST
-            for piece in new_pieces:
-                if pack.spaces is not None:
-                    piece.spaces = list(pack.spaces)
-                    piece.space = piece.spaces[0]
-                self._piece_store.add(piece)
-                added_piece_ids.append(piece.piece_id)
-
-            # Step 2: Deactivate old pieces AFTER
-            for pid in old_piece_ids:
-                old_piece = self._piece_store.get_by_id(pid)
-                if old_piece and old_piece.is_active:
-                    old_piece.is_active = False
-                    old_piece.updated_at = datetime.now(timezone.utc).isoformat()
-                    self._piece_store.update(old_piece)
+            with self._piece_store.bulk_session():
+                # Step 1: Add all new pieces FIRST (batched writes)
+                for piece in new_pieces:
+                    self._stamp_pack_spaces(pack, piece)
+                self._add_pieces_in_batches(new_pieces, added_piece_ids)
+
+                # Step 2: Deactivate old pieces AFTER
+                deactivated = []
+                for old_piece in self._piece_store.get_by_ids(old_piece_ids).values():
+                    if old_piece.is_active:
+                        old_piece.is_active = False
+                        old_piece.updated_at = datetime.now(timezone.utc).isoformat()
+                        deactivated.append(old_piece)
+                self._piece_store.update_many(deactivated)
 
             # Step 3: Update metadata
             pack.piece_ids = added_piece_ids
@@ -286,11 +318,7 @@ class KnowledgePackManager:
         except Exception as e:
             logger.error("Update failed for %s: %s. Rolling back.", pack.pack_id, e)
             # Rollback: remove new pieces
-            for pid in added_piece_ids:
-                try:
-                    self._piece_store.remove(pid)
-                except Exception:
-                    pass
+            self._remove_pieces_best_effort(added_piece_ids)
             return PackInstallResult(
                 success=False,
                 pack_id=pack.pack_id,
@@ -348,12 +376,7 @@ class KnowledgePackManager:
             List of KnowledgePiece objects in the pack.
         """
         piece_ids = self._get_piece_ids_from_graph(pack_id)
-        pieces = []
-        for pid in piece_ids:
-            piece = self._piece_store.get_by_id(pid)
-            if piece:
-                pieces.append(piece)
-        return pieces
+        return list(self._piece_store.get_by_ids(piece_ids).values())
 
     def is_installed(self, pack_id: str) -> bool:
         """Check if a pack is installed.
@@ -389,6 +412,127 @@ class KnowledgePackManager:
 
     # ── Internal helpers ─────────────────────────────────────────────────
 
+    def _plan_install(
+        self,
+        pack: KnowledgePack,
+        pieces: List[KnowledgePiece],
+    ) -> Tuple[List[KnowledgePiece], int]:
+        """Validate and de-duplicate a pack before any write.
+
+        Stamps the pack's spaces on the pieces. A piece repeating the
+        content of an earlier piece of the pack (same entity and content
+        hash) is dropped; with ``config.skip_existing_content``, so is a
+        piece whose content already exists as an active piece in the store
+        (one ``find_by_content_hashes`` call per entity).
+
+        Returns:
+            The pieces to add, and how many were skipped.
+
+        Raises:
+            ValueError: If piece IDs repeat within the pack or already
+                exist in the store.
+        """
+        seen_ids = set()
+        repeated_ids = set()
+        for piece in pieces:
+            if piece.piece_id in seen_ids:
+                repeated_ids.add(piece.piece_id)
+            seen_ids.add(piece.piece_id)
+        if repeated_ids:
+            raise ValueError(f"Duplicate piece_id(s) in pack: {sorted(repeated_ids)}")
+        existing_ids = self._piece_store.get_by_ids(seen_ids)
+        if existing_ids:
+            raise ValueError(f"Piece ID(s) already in store: {sorted(existing_ids)}")
+
+        unique: List[KnowledgePiece] = []
+        seen_content = set()
+        for piece in pieces:
+            self._stamp_pack_spaces(pack, piece)
+            key = (piece.entity_id, piece.content_hash)
+            if key not in seen_content:
+                seen_content.add(key)
+                unique.append(piece)
+
+        if self.config.skip_existing_content:
+            hashes_by_entity: Dict[Optional[str], List[str]] = {}
+            for piece in unique:
+                hashes_by_entity.setdefault(piece.entity_id, []).append(piece.content_hash)
+            stored = set()
+            for entity_id, hashes in hashes_by_entity.items():
+                found = self._piece_store.find_by_content_hashes(hashes, entity_id)
+                stored.update(
+                    (entity_id, content_hash)
+                    for content_hash, existing in found.items()
+                    if existing.is_active
+                )
+            unique = [
+                piece for piece in unique
+                if (piece.entity_id, piece.content_hash) not in stored
+            ]
+
+        return unique, len(pieces) - len(unique)
+
+    @staticmethod
+    def _stamp_pack_spaces(pack: KnowledgePack, piece: KnowledgePiece) -> None:
+        """Assign the pack's spaces (if any) to ``piece``."""
+        if pack.spaces is not None:
+            piece.spaces = list(pack.spaces)
+            piece.space = piece.spaces[0]
+
+    def _add_pieces_in_batches(
+        self,
+        pieces: List[KnowledgePiece],
+        added_piece_ids: List[str],
+    ) -> int:
+        """Add ``pieces`` with ``add_many`` in ``config.install_batch_size`` chunks.
+
+        Added IDs are appended to ``added_piece_ids`` as each batch lands, so
+        a caller rolling back after a failure sees the partial progress.
+
+        Returns:
+            The number of batches written.
+        """
+        size = max(1, self.config.install_batch_size)
+        batches = 0
+        for start in range(0, len(pieces), size):
+            added_piece_ids.extend(self._piece_store.add_many(pieces[start:start + size]))
+            batches += 1
+        return batches
+
+    def _rollback_install(
+        self,
+        pack_id: str,
+        piece_ids: List[str],
+        created_node_ids: List[str],
+    ) -> None:
+        """Best-effort undo of a partial install."""
+        self._remove_pieces_best_effort(piece_ids)
+        # Removing the pack node cascades its CONTAINS edges
+        for node_id in [pack_id, *created_node_ids]:
+            try:
+                self._graph_store.remove_node(node_id)
+            except Exception:
+                pass
+        try:
+            self._metadata_store.delete_metadata(pack_id)
+        except Exception:
+            pass
+
+    def _remove_pieces_best_effort(self, piece_ids: List[str]) -> None:
+        """Remove ``piece_ids`` in one batch, falling back to one at a time."""
+        if not piece_ids:
+            return
+        try:
+            self._piece_store.remove_many(piece_ids)
+            return
+        except Exception:
+            pass
+        for pid in piece_ids:
+            try:
+                self._piece_store.remove(pid)
+            except Exception:
+                pass
+
     def _pack_to_metadata(self, pack: KnowledgePack) -> EntityMetadata:
         """Convert a KnowledgePack to EntityMetadata for storage."""
         return EntityMetadata(
@@ -403,8 +547,19 @@ class KnowledgePackManager:
         """Reconstruct a KnowledgePack from stored EntityMetadata."""
         return KnowledgePack.from_dict(metadata.properties)
 
-    def _create_pack_graph(self, pack_id: str, piece_ids: List[str]) -> None:
-        """Create a pack graph node with CONTAINS edges to piece nodes."""
+    def _create_pack_graph(
+        self,
+        pack_id: str,
+        piece_ids: List[str],
+        created_node_ids: Optional[List[str]] = None,
+    ) -> None:
+        """Create a pack graph node with CONTAINS edges to piece nodes.
+
+        Existing piece nodes are looked up with one ``get_nodes`` call;
+        missing ones and the edges are written with ``add_nodes`` /
+        ``add_relations``. IDs of the piece nodes about to be created are
+        appended to ``created_node_ids`` before the write, for rollback.
+        """
         pack_node = GraphNode(
             node_id=pack_id,
             node_type=PACK_NODE_TYPE,
@@ -412,23 +567,24 @@ class KnowledgePackManager:
         )
         self._graph_store.add_node(pack_node)
 
-        for pid in piece_ids:
-            # Ensure piece node exists
-            piece_node = self._graph_store.get_node(pid)
-            if piece_node is None:
-                piece_node = GraphNode(
-                    node_id=pid,
-                    node_type="knowledge_piece",
-                    label=pid,
-                )
-                self._graph_store.add_node(piece_node)
-
-            edge = GraphEdge(
+        existing = self._graph_store.get_nodes(piece_ids)
+        new_nodes = [
+            GraphNode(node_id=pid, node_type="knowledge_piece", label=pid)
+            for pid in dict.fromkeys(piece_ids)
+            if pid not in existing
+        ]
+        if created_node_ids is not None:
+            created_node_ids.extend(node.node_id for node in new_nodes)
+        self._graph_store.add_nodes(new_nodes)
+
+        self._graph_store.add_relations(
+            GraphEdge(
                 source_id=pack_id,
                 target_id=pid,
                 edge_type=CONTAINS_RELATION,
             )
-            self._graph_store.add_relation(edge)
+            for pid in piece_ids
+        )
 
     def _get_piece_ids_from_graph(self, pack_id: str) -> List[str]:
         """Get piece IDs from CONTAINS edges in the graph."""
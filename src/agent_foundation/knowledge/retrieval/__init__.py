@@ -2,9 +2,9 @@
 
 Provides core retrieval components including the KnowledgeBase orchestrator,
 composable RetrievalPipeline with pluggable post-processors, data models,
-store ABCs and adapters, hybrid search, MMR re-ranking, temporal decay,
-budget-aware knowledge provider, formatter, data loader, utilities, and
-ingestion CLI.
+store ABCs and adapters, hybrid search, embedding cache, MMR re-ranking,
+temporal decay, budget-aware knowledge provider, formatter, data loader,
+utilities, and ingestion CLI.
 """
 
 # ── Data Models ──────────────────────────────────────────────────────────
@@ -35,6 +35,8 @@ from .models.results import (
 # ── Store ABCs ───────────────────────────────────────────────────────────
 from .stores.metadata.base import MetadataStore
 from .stores.pieces.base import KnowledgePieceStore
+from .stores.pieces.filters import PieceFilter
+from .stores.pieces.content_hash_index import ContentHashIndex
 from .stores.graph.base import EntityGraphStore
 
 # ── Adapter-Based Store Implementations ──────────────────────────────────
@@ -59,13 +61,20 @@ from .knowledge_consolidator import KnowledgeConsolidator
 from .knowledge_provider import BudgetAwareKnowledgeProvider
 
 # ── Hybrid Search ────────────────────────────────────────────────────────
-from .hybrid_search import HybridSearchConfig, HybridRetriever
+from .hybrid_search import HybridSearchConfig, HybridSearchResult, HybridRetriever
+
+# ── Embedding Cache ──────────────────────────────────────────────────────
+from .embedding_cache import EmbeddingCache, EmbeddingCacheStats
 
 # ── MMR Re-ranking ───────────────────────────────────────────────────────
 from .mmr_reranking import MMRConfig, apply_mmr_reranking
 
 # ── Temporal Decay ───────────────────────────────────────────────────────
-from .temporal_decay import TemporalDecayConfig, apply_temporal_decay
+from .temporal_decay import (
+    TemporalDecayConfig,
+    apply_temporal_decay,
+    compute_decay_multipliers,
+)
 
 # ── Query Decomposition & Agentic Models ─────────────────────────────────
 from .retrieval_pipeline import (
@@ -130,6 +139,8 @@ __all__ = [
     # Store ABCs
     "MetadataStore",
     "KnowledgePieceStore",
+    "PieceFilter",
+    "ContentHashIndex",
     "EntityGraphStore",
     # Adapter-based stores
     "KeyValueMetadataStore",
@@ -147,13 +158,18 @@ __all__ = [
     "KnowledgeConsolidator",
     # Hybrid Search
     "HybridSearchConfig",
+    "HybridSearchResult",
     "HybridRetriever",
+    # Embedding Cache
+    "EmbeddingCache",
+    "EmbeddingCacheStats",
     # MMR Re-ranking
     "MMRConfig",
     "apply_mmr_reranking",
     # Temporal Decay
     "TemporalDecayConfig",
     "apply_temporal_decay",
+    "compute_decay_multipliers",
     # Query Decomposition & Agentic Models
     "SubQuery",
     "AgenticRetrievalResult",
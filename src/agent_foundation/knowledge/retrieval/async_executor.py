@@ -0,0 +1,132 @@
+"""
+Shared executor for running blocking knowledge-store calls off the event loop.
+
+The store backends (LanceDB, retrieval/graph services, file stores) expose
+synchronous clients. The async store methods (``asearch``, ``aget_metadata``,
+``aget_neighbors``, ...) and ``KnowledgeBase.aretrieve`` default to running
+those calls on one process-wide thread pool via ``run_blocking`` so an
+asyncio agent can await retrieval without blocking its loop. Stores whose
+backend has a native async client override the ``a*`` methods instead.
+
+The same pool backs concurrent layer execution in
+``KnowledgeBase.retrieve`` (``concurrent_layers=True``). Work submitted to it
+must not block on other work submitted to it, or a saturated pool deadlocks;
+``in_retrieval_worker`` lets code that may run there (e.g. ``retrieve``
+called through ``KnowledgeBase.acall``) detect that and stay inline.
+
+The vector and keyword legs of a hybrid search therefore run on a second,
+leaf-only pool (``get_search_leg_executor``), and the sub-queries of a
+multi-query ``RetrievalPipeline`` on a third (``get_subquery_executor``),
+since each sub-query may itself fan out onto the other two.
+"""
+import asyncio
+import concurrent.futures
+import contextvars
+import functools
+import threading
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 16
+
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+_retrieval_thread_state = threading.local()
+
+
+def _mark_retrieval_thread() -> None:
+    _retrieval_thread_state.is_retrieval_worker = True
+
+
+def in_retrieval_worker() -> bool:
+    """Whether the current thread is a retrieval executor worker.
+
+    Code that fans out onto the retrieval executor (e.g. concurrent layer
+    execution) checks this and runs its work inline instead, so a task on
+    the pool never waits on the pool it occupies.
+    """
+    return getattr(_retrieval_thread_state, "is_retrieval_worker", False)
+
+
+def get_retrieval_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the process-wide thread pool for blocking store calls."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=DEFAULT_MAX_WORKERS,
+                thread_name_prefix="kb-retrieve",
+                initializer=_mark_retrieval_thread,
+            )
+        return _executor
+
+
+async def run_blocking(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run ``fn(*args, **kwargs)`` on the retrieval executor and await it.
+
+    Context variables of the calling task are propagated to the worker
+    thread, like ``asyncio.to_thread``.
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, fn, *args, **kwargs)
+    return await loop.run_in_executor(get_retrieval_executor(), call)
+
+
+_leg_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_leg_thread_state = threading.local()
+
+
+def _mark_leg_thread() -> None:
+    _leg_thread_state.is_leg_worker = True
+
+
+def in_search_leg_worker() -> bool:
+    """Whether the current thread is a search-leg executor worker.
+
+    Code that may itself run as a search leg (e.g. a store's ``search``
+    used as a ``HybridRetriever`` leg) checks this and runs its own
+    sub-queries inline instead of submitting them, so legs never wait on
+    the pool they occupy.
+    """
+    return getattr(_leg_thread_state, "is_leg_worker", False)
+
+
+def get_search_leg_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the process-wide thread pool for the legs of a hybrid search.
+
+    Kept separate from ``get_retrieval_executor`` because hybrid searches
+    themselves run on that pool (as the pieces layer) and wait for their
+    legs. Search legs must not submit further work to this pool; see
+    ``in_search_leg_worker``.
+    """
+    global _leg_executor
+    with _executor_lock:
+        if _leg_executor is None:
+            _leg_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=DEFAULT_MAX_WORKERS,
+                thread_name_prefix="kb-search-leg",
+                initializer=_mark_leg_thread,
+            )
+        return _leg_executor
+
+
+_subquery_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+
+def get_subquery_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the process-wide thread pool for pipeline sub-queries.
+
+    Sub-query tasks run KnowledgeBase layer calls, which may wait on the
+    search-leg pool, so they get a pool of their own rather than sharing
+    the retrieval or leg pools.
+    """
+    global _subquery_executor
+    with _executor_lock:
+        if _subquery_executor is None:
+            _subquery_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=DEFAULT_MAX_WORKERS,
+                thread_name_prefix="kb-subquery",
+            )
+        return _subquery_executor
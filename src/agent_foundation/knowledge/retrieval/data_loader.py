@@ -129,7 +129,9 @@ class KnowledgeDataLoader:
 
         Validates knowledge_type against KnowledgeType enum — skips and logs
         a warning if invalid. Delegates sensitive content validation to
-        kb.add_piece() which raises ValueError for sensitive content.
+        kb.add_piece() which raises ValueError for sensitive content. Pieces
+        are added inside a piece-store ``bulk_session`` so index maintenance
+        runs once for the whole section.
 
         Args:
             kb: The KnowledgeBase to add pieces to.
@@ -138,6 +140,12 @@ class KnowledgeDataLoader:
         Returns:
             Count of pieces successfully loaded.
         """
+        with kb.piece_store.bulk_session():
+            return KnowledgeDataLoader._add_pieces(kb, pieces_section)
+
+    @staticmethod
+    def _add_pieces(kb: KnowledgeBase, pieces_section: List[Any]) -> int:
+        """Validate and add each piece entry; returns the count added."""
         count = 0
         for i, entry in enumerate(pieces_section):
             piece_id = entry.get("piece_id", f"piece-{i}")
@@ -0,0 +1,264 @@
+"""
+Embedding cache for query and piece texts.
+
+Embedding the same text several times is common on the retrieval and
+ingestion paths: ``KnowledgeBase.retrieve_pieces`` in hybrid mode searches
+the entity scope and the global scope with the same query,
+``ThreeTierDeduplicator`` embeds a candidate and then searches the piece
+store with the same text, and the store embeds that text once more when the
+candidate is finally added.
+
+``EmbeddingCache`` wraps any embedding function (``str -> vector``) and is
+itself a drop-in embedding function:
+
+- **Memory tier** — a bounded LRU of the most recent vectors.
+- **Disk tier** (optional) — a SQLite file shared across processes and
+  restarts, keyed by ``sha256(model_name, text)`` so vectors from different
+  models never collide.
+
+Usage:
+    cache = EmbeddingCache(model.encode, model_name="all-MiniLM-L6-v2",
+                           persist_path="~/.cache/kb/embeddings.sqlite")
+    store = LanceDBKnowledgePieceStore(db_path, embedding_function=cache,
+                                       batch_embedding_function=cache.embed_many)
+    dedup = ThreeTierDeduplicator(store, embedding_fn=cache)
+"""
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from array import array
+from collections import OrderedDict
+from typing import Callable, List, Optional, Sequence
+
+from attr import attrib, attrs
+
+logger = logging.getLogger(__name__)
+
+
+def _to_list(vector) -> List[float]:
+    """Normalize numpy arrays and other sequences to a list of floats."""
+    if hasattr(vector, "tolist"):
+        return vector.tolist()
+    return list(vector)
+
+
+def _declared_model_name(embedding_fn: Callable) -> Optional[str]:
+    name = getattr(embedding_fn, "model_name", None)
+    return str(name) if name else None
+
+
+def _qualified_name(embedding_fn: Callable) -> str:
+    qualname = getattr(embedding_fn, "__qualname__", None) or type(embedding_fn).__qualname__
+    module = getattr(embedding_fn, "__module__", None) or ""
+    return f"{module}.{qualname}"
+
+
+@attrs(slots=True)
+class EmbeddingCacheStats:
+    """Counters for cache effectiveness."""
+
+    memory_hits: int = attrib(default=0)
+    disk_hits: int = attrib(default=0)
+    misses: int = attrib(default=0)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.memory_hits + self.disk_hits + self.misses
+        return (self.memory_hits + self.disk_hits) / total if total else 0.0
+
+
+@attrs
+class EmbeddingCache:
+    """LRU (+ optional SQLite) cache around an embedding function.
+
+    Instances are callable with the same signature as the wrapped function,
+    so they can be passed wherever an ``embedding_function`` /
+    ``embedding_fn`` is expected. Returned vectors are lists of floats and
+    are shared with the cache; callers must not mutate them.
+
+    Attributes:
+        embedding_fn: The wrapped ``str -> vector`` function.
+        model_name: Cache namespace; vectors are only reused for the same
+            model name. Defaults to ``embedding_fn.model_name``, else (memory
+            tier only) its qualified name. With ``persist_path`` it must be
+            given or declared by ``embedding_fn``: a qualified name such as
+            ``SentenceTransformer.encode`` is shared by every model, so
+            different models would read each other's vectors from disk.
+        max_entries: Size of the in-memory LRU. 0 disables the memory tier.
+        persist_path: Optional SQLite file for the persistent tier.
+        batch_embedding_fn: Optional ``List[str] -> List[vector]`` used by
+            ``embed_many`` for the texts that miss both tiers.
+    """
+
+    embedding_fn: Callable = attrib()
+    model_name: Optional[str] = attrib(default=None)
+    max_entries: int = attrib(default=1024)
+    persist_path: Optional[str] = attrib(default=None)
+    batch_embedding_fn: Optional[Callable] = attrib(default=None)
+    stats: EmbeddingCacheStats = attrib(init=False, factory=EmbeddingCacheStats)
+    _memory: OrderedDict = attrib(init=False, factory=OrderedDict, repr=False)
+    _lock: threading.Lock = attrib(init=False, factory=threading.Lock, repr=False)
+    _local: threading.local = attrib(init=False, factory=threading.local, repr=False)
+
+    def __attrs_post_init__(self):
+        if self.model_name is None:
+            self.model_name = _declared_model_name(self.embedding_fn)
+        if self.model_name is None:
+            if self.persist_path:
+                raise ValueError(
+                    "EmbeddingCache with persist_path requires model_name; "
+                    f"{_qualified_name(self.embedding_fn)!r} does not identify the model"
+                )
+            self.model_name = _qualified_name(self.embedding_fn)
+        if self.persist_path:
+            self.persist_path = os.path.expanduser(self.persist_path)
+            parent = os.path.dirname(self.persist_path)
+            if parent:
+                os.makedirs(parent, exist_ok=True)
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings ("
+                    " key TEXT PRIMARY KEY,"
+                    " model_name TEXT NOT NULL,"
+                    " vector BLOB NOT NULL)"
+                )
+
+    # ── Public API ───────────────────────────────────────────────────────
+
+    def __call__(self, text: str) -> List[float]:
+        return self.embed(text)
+
+    def embed(self, text: str) -> List[float]:
+        """Return the embedding of ``text``, computing it on a miss."""
+        key = self._key(text)
+        vector = self._lookup(key)
+        if vector is not None:
+            return vector
+        vector = _to_list(self.embedding_fn(text))
+        self._store({key: vector})
+        return vector
+
+    def embed_many(self, texts: Sequence[str]) -> List[List[float]]:
+        """Return embeddings for ``texts`` in order.
+
+        Cached texts are served from the cache; the remaining unique texts
+        are embedded with one ``batch_embedding_fn`` call (or one
+        ``embedding_fn`` call each when no batch function is configured).
+        """
+        keys = [self._key(text) for text in texts]
+        vectors = {}
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key in vectors or key in missing:
+                continue
+            vector = self._lookup(key)
+            if vector is None:
+                missing[key] = text
+            else:
+                vectors[key] = vector
+        if missing:
+            miss_texts = list(missing.values())
+            if self.batch_embedding_fn is not None:
+                computed = [_to_list(v) for v in self.batch_embedding_fn(miss_texts)]
+            else:
+                computed = [_to_list(self.embedding_fn(t)) for t in miss_texts]
+            new = dict(zip(missing, computed))
+            self._store(new)
+            vectors.update(new)
+        return [vectors[key] for key in keys]
+
+    def get(self, text: str) -> Optional[List[float]]:
+        """Return the cached embedding of ``text`` without computing it."""
+        return self._lookup(self._key(text))
+
+    def clear(self, include_disk: bool = False) -> None:
+        """Drop the memory tier (and the disk tier for this model if asked)."""
+        with self._lock:
+            self._memory.clear()
+        if include_disk and self.persist_path:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "DELETE FROM embeddings WHERE model_name = ?", (self.model_name,)
+                )
+
+    def close(self) -> None:
+        """Close this thread's SQLite connection, if any."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    # ── Internals ────────────────────────────────────────────────────────
+
+    def _key(self, text: str) -> str:
+        payload = f"{self.model_name}\0{text}".encode("utf-8")
+        return hashlib.sha256(payload).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.persist_path, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _lookup(self, key: str) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._memory.get(key)
+            if vector is not None:
+                self._memory.move_to_end(key)
+                self.stats.memory_hits += 1
+                return vector
+        if self.persist_path:
+            try:
+                row = self._connect().execute(
+                    "SELECT vector FROM embeddings WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as exc:
+                logger.warning("Embedding cache read failed: %s", exc)
+                row = None
+            if row is not None:
+                vector = array("d", row[0]).tolist()
+                self._remember(key, vector)
+                with self._lock:
+                    self.stats.disk_hits += 1
+                return vector
+        with self._lock:
+            self.stats.misses += 1
+        return None
+
+    def _remember(self, key: str, vector: List[float]) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._memory[key] = vector
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _store(self, vectors: dict) -> None:
+        for key, vector in vectors.items():
+            self._remember(key, vector)
+        if not self.persist_path or not vectors:
+            return
+        try:
+            conn = self._connect()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, model_name, vector)"
+                    " VALUES (?, ?, ?)",
+                    [
+                        (key, self.model_name, array("d", vector).tobytes())
+                        for key, vector in vectors.items()
+                    ],
+                )
+        except sqlite3.Error as exc:
+            logger.warning("Embedding cache write failed: %s", exc)
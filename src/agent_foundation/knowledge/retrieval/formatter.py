@@ -32,11 +32,18 @@ class RetrievalResult:
         pieces: Scored knowledge pieces as (KnowledgePiece, score) tuples.
         graph_context: Graph traversal results as list of dicts with keys:
             relation_type, target_node_id, target_label, piece (optional), depth.
+        layer_timings: Wall-clock seconds per retrieval layer (``metadata``,
+            ``pieces``, ``search_graph``, ``identity_graph``) plus ``total``.
+            Diagnostic only; excluded from equality.
+        layer_errors: Layers that failed or timed out during concurrent
+            retrieval, mapped to a short reason. Their results are empty.
     """
     metadata: Optional[EntityMetadata] = attrib(default=None)
     global_metadata: Optional[EntityMetadata] = attrib(default=None)
     pieces: List[Tuple[KnowledgePiece, float]] = attrib(factory=list)
     graph_context: List[Dict[str, Any]] = attrib(factory=list)
+    layer_timings: Dict[str, float] = attrib(factory=dict, eq=False)
+    layer_errors: Dict[str, str] = attrib(factory=dict, eq=False)
 
 
 @attrs
@@ -7,7 +7,9 @@ and ``_extract_search_graph_knowledge`` (L3a) into two phases:
 1. **Seed finding** — ``find_search_seeds()`` and ``find_identity_seeds()``
    discover starting nodes via semantic search or identity lookup.
 2. **Graph walk** — ``graph_walk()`` takes seed nodes and produces graph
-   context entries with depth-decayed scoring.
+   context entries with depth-decayed scoring. Neighbor and relation
+   lookups go through the store's batched read methods; linked pieces are
+   hydrated in one batch.
 3. **Merge** — ``merge_graph_contexts()`` deduplicates entries from both paths.
 
 Requirements: 1.1, 1.2, 1.3, 1.4, 2.1–2.4, 3.1–3.4
@@ -175,16 +177,27 @@ def graph_walk(
     spaces: Optional[List[str]] = None,
     ignore_already_retrieved: Union[bool, Tuple[str, ...], List[str]] = False,
 ) -> List[Dict[str, Any]]:
-    """Perform a unified BFS walk from seed nodes, producing graph context entries.
-
-    For each seed:
+    """Walk the graph from all seed nodes at once, producing graph context entries.
+
+    Store lookups are issued once for all seeds:
+    1. Neighbors of all (distinct) seeds come from one
+       ``graph_store.get_neighbors_many`` call. Stores without a batched
+       traversal answer it with one ``get_neighbors`` call per seed.
+    2. Outgoing relations of every seed with depth-1 neighbors come from one
+       ``graph_store.get_relations_many`` call, indexed by target node
+       (again one ``get_relations`` call per seed unless overridden).
+    3. All linked pieces are hydrated with ONE ``piece_store.get_by_ids`` call.
+
+    Then, for each seed:
     1. Emit a depth-0 entry with relation_type derived from seed.source
        ("SEARCH_HIT" for search, "IDENTITY" for identity).
-    2. Call ``graph_store.get_neighbors(seed.node.node_id, depth=traversal_depth)``.
-    3. Filter neighbors by spaces (OR semantics) if provided.
-    4. For each neighbor at depth D, compute score = ``seed.score × 1/(D+1)``.
-    5. For depth-1 neighbors, look up the edge relation and extract linked pieces.
-       ``get_relations(seed.node_id)`` is called ONCE per seed and cached.
+    2. Filter its neighbors by spaces (OR semantics) if provided.
+    3. For each neighbor at depth D, compute score = ``seed.score × 1/(D+1)``.
+    4. For depth-1 neighbors, emit one entry per edge from the seed (with
+       its linked piece); otherwise emit a "RELATED" entry.
+
+    If a batched call fails, the walk retries seed by seed so one failing
+    seed only loses its own neighbors (or relations).
 
     Args:
         graph_store: The graph store for neighbor traversal and edge lookup.
@@ -201,7 +214,27 @@ def graph_walk(
 
     Requirements: 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 4.8
     """
+    seed_ids = list(dict.fromkeys(seed.node.node_id for seed in seeds))
+    neighbors_by_seed = _fetch_neighbors(graph_store, seed_ids, traversal_depth)
+
+    # Filter neighbors by spaces
+    if spaces:
+        neighbors_by_seed = {
+            seed_id: [(n, d) for n, d in neighbors if _node_passes_space_filter(n, spaces)]
+            for seed_id, neighbors in neighbors_by_seed.items()
+        }
+
+    relations_by_seed = _fetch_relations_by_target(
+        graph_store,
+        [
+            seed_id for seed_id, neighbors in neighbors_by_seed.items()
+            if any(depth == 1 for _, depth in neighbors)
+        ],
+    )
+
     graph_context: List[Dict[str, Any]] = []
+    # (entry, piece_id) pairs hydrated with a single batched lookup at the end
+    pending_pieces: List[Tuple[Dict[str, Any], str]] = []
 
     for seed in seeds:
         # Depth-0 entry for the seed itself
@@ -216,86 +249,36 @@ def graph_walk(
         }
         graph_context.append(depth_0_entry)
 
-        # Walk neighbors from the seed node
-        try:
-            neighbors = graph_store.get_neighbors(
-                seed.node.node_id, depth=traversal_depth
-            )
-        except Exception:
-            logger.warning(
-                "graph_store.get_neighbors() failed for seed %s; skipping walk",
-                seed.node.node_id,
-                exc_info=True,
-            )
-            continue
-
-        # Filter neighbors by spaces
-        if spaces:
-            neighbors = [
-                (n, d)
-                for n, d in neighbors
-                if _node_passes_space_filter(n, spaces)
-            ]
-
-        # Cache relations for depth-1 lookups (called ONCE per seed)
-        relations_cache: Optional[list] = None
+        neighbors = neighbors_by_seed.get(seed.node.node_id)
+        if neighbors is None:
+            continue  # neighbor lookup failed for this seed
+        relations_by_target = relations_by_seed.get(seed.node.node_id, {})
 
         for neighbor, depth in neighbors:
             depth_factor = 1.0 / (depth + 1)
             combined_score = seed.score * depth_factor
 
-            # For depth-1 neighbors, look up ALL edges and emit one entry per edge
-            if depth == 1:
-                # Lazy-load relations cache once per seed
-                if relations_cache is None:
-                    try:
-                        relations_cache = graph_store.get_relations(
-                            seed.node.node_id, direction="outgoing"
-                        )
-                    except Exception:
-                        logger.warning(
-                            "graph_store.get_relations() failed for seed %s; "
-                            "using RELATED and no piece",
-                            seed.node.node_id,
-                            exc_info=True,
-                        )
-                        relations_cache = []
-
-                # Collect ALL matching edges for this neighbor
-                matching_rels = [
-                    rel for rel in relations_cache
-                    if rel.target_id == neighbor.node_id
-                ]
-
-                if matching_rels:
-                    for rel in matching_rels:
-                        rel_entry: Dict[str, Any] = {
-                            "relation_type": rel.edge_type,
-                            "target_node_id": neighbor.node_id,
-                            "target_label": neighbor.label,
-                            "piece": None,
-                            "depth": depth,
-                            "score": combined_score,
-                        }
-                        piece_id = rel.properties.get("piece_id")
-                        if piece_id and not _should_skip_piece(
-                            piece_id,
-                            already_retrieved_piece_ids,
-                            ignore_already_retrieved,
-                        ):
-                            try:
-                                piece = piece_store.get_by_id(piece_id)
-                            except Exception:
-                                logger.warning(
-                                    "piece_store.get_by_id(%s) failed; setting piece=None",
-                                    piece_id,
-                                    exc_info=True,
-                                )
-                                piece = None
-                            if piece:
-                                rel_entry["piece"] = piece
-                        graph_context.append(rel_entry)
-                    continue  # skip the default RELATED append below
+            # For depth-1 neighbors, emit one entry per edge from the seed
+            matching_rels = relations_by_target.get(neighbor.node_id) if depth == 1 else None
+            if matching_rels:
+                for rel in matching_rels:
+                    rel_entry: Dict[str, Any] = {
+                        "relation_type": rel.edge_type,
+                        "target_node_id": neighbor.node_id,
+                        "target_label": neighbor.label,
+                        "piece": None,
+                        "depth": depth,
+                        "score": combined_score,
+                    }
+                    piece_id = rel.properties.get("piece_id")
+                    if piece_id and not _should_skip_piece(
+                        piece_id,
+                        already_retrieved_piece_ids,
+                        ignore_already_retrieved,
+                    ):
+                        pending_pieces.append((rel_entry, piece_id))
+                    graph_context.append(rel_entry)
+                continue
 
             # Default entry: non-depth-1, or depth-1 with no matching relations
             neighbor_entry: Dict[str, Any] = {
@@ -308,6 +291,151 @@ def graph_walk(
             }
             graph_context.append(neighbor_entry)
 
+    if pending_pieces:
+        pieces = _fetch_pieces(piece_store, [pid for _, pid in pending_pieces])
+        for entry, piece_id in pending_pieces:
+            piece = pieces.get(piece_id)
+            if piece:
+                entry["piece"] = piece
+
+    return graph_context
+
+
+def _fetch_neighbors(
+    graph_store: "EntityGraphStore",
+    seed_ids: List[str],
+    traversal_depth: int,
+) -> Dict[str, List[Tuple[GraphNode, int]]]:
+    """Fetch neighbors of all seeds with one ``get_neighbors_many`` call.
+
+    Falls back to per-seed ``get_neighbors`` if the batch fails; seeds
+    whose lookup fails are absent from the result.
+    """
+    if not seed_ids:
+        return {}
+    try:
+        return graph_store.get_neighbors_many(seed_ids, depth=traversal_depth)
+    except Exception:
+        logger.warning(
+            "graph_store.get_neighbors_many() failed for %d seeds; retrying one by one",
+            len(seed_ids),
+            exc_info=True,
+        )
+    neighbors_by_seed: Dict[str, List[Tuple[GraphNode, int]]] = {}
+    for seed_id in seed_ids:
+        try:
+            neighbors_by_seed[seed_id] = graph_store.get_neighbors(
+                seed_id, depth=traversal_depth
+            )
+        except Exception:
+            logger.warning(
+                "graph_store.get_neighbors() failed for seed %s; skipping walk",
+                seed_id,
+                exc_info=True,
+            )
+    return neighbors_by_seed
+
+
+def _fetch_relations_by_target(
+    graph_store: "EntityGraphStore",
+    seed_ids: List[str],
+) -> Dict[str, Dict[str, List[Any]]]:
+    """Fetch outgoing relations of the seeds, indexed by seed then target node.
+
+    Falls back to per-seed ``get_relations`` if the batch fails; a seed
+    whose lookup fails gets no relations (its neighbors become "RELATED").
+    """
+    if not seed_ids:
+        return {}
+    try:
+        relations = graph_store.get_relations_many(seed_ids, direction="outgoing")
+    except Exception:
+        logger.warning(
+            "graph_store.get_relations_many() failed for %d seeds; retrying one by one",
+            len(seed_ids),
+            exc_info=True,
+        )
+        relations = {}
+        for seed_id in seed_ids:
+            try:
+                relations[seed_id] = graph_store.get_relations(seed_id, direction="outgoing")
+            except Exception:
+                logger.warning(
+                    "graph_store.get_relations() failed for seed %s; "
+                    "using RELATED and no piece",
+                    seed_id,
+                    exc_info=True,
+                )
+
+    indexed: Dict[str, Dict[str, List[Any]]] = {}
+    for seed_id, edges in relations.items():
+        by_target: Dict[str, List[Any]] = {}
+        for rel in edges:
+            by_target.setdefault(rel.target_id, []).append(rel)
+        indexed[seed_id] = by_target
+    return indexed
+
+
+def _fetch_pieces(
+    piece_store: "KnowledgePieceStore",
+    piece_ids: List[str],
+) -> Dict[str, Any]:
+    """Fetch edge-linked pieces in one ``get_by_ids`` round trip.
+
+    If the batched lookup fails, falls back to per-piece ``get_by_id`` so a
+    single bad piece only drops that piece (it is left as ``None``).
+    """
+    try:
+        return piece_store.get_by_ids(piece_ids)
+    except Exception:
+        logger.warning(
+            "piece_store.get_by_ids() failed for %d pieces; retrying one by one",
+            len(piece_ids),
+            exc_info=True,
+        )
+    pieces: Dict[str, Any] = {}
+    for piece_id in dict.fromkeys(piece_ids):
+        try:
+            piece = piece_store.get_by_id(piece_id)
+        except Exception:
+            logger.warning(
+                "piece_store.get_by_id(%s) failed; setting piece=None",
+                piece_id,
+                exc_info=True,
+            )
+            continue
+        if piece is not None:
+            pieces[piece_id] = piece
+    return pieces
+
+
+def drop_already_retrieved_pieces(
+    graph_context: List[Dict[str, Any]],
+    already_retrieved_piece_ids: Optional[Dict[str, str]],
+    ignore_already_retrieved: Union[bool, Tuple[str, ...], List[str]],
+) -> List[Dict[str, Any]]:
+    """Apply ``graph_walk``'s already-retrieved dedup after the walk.
+
+    Clears ``piece`` on entries whose piece would have been skipped had the
+    walk been given ``already_retrieved_piece_ids`` up front. Lets graph
+    walks run concurrently with Layer 2 and still produce the same entries.
+
+    Args:
+        graph_context: Entries from ``graph_walk`` (modified in place).
+        already_retrieved_piece_ids: Piece IDs already found by L2.
+        ignore_already_retrieved: Controls piece dedup behavior.
+
+    Returns:
+        The same ``graph_context`` list.
+    """
+    if not already_retrieved_piece_ids or not ignore_already_retrieved:
+        return graph_context
+    for entry in graph_context:
+        piece = entry.get("piece")
+        if piece is not None and _should_skip_piece(
+            piece.piece_id, already_retrieved_piece_ids, ignore_already_retrieved
+        ):
+            entry["piece"] = None
     return graph_context
 
 
@@ -3,17 +3,46 @@ Hybrid Search with Reciprocal Rank Fusion (RRF).
 
 Combines vector similarity search and keyword (BM25) search using
 RRF fusion for improved retrieval quality.
+
+The two legs are independent, so by default they run concurrently on the
+shared search-leg executor and a hybrid query costs roughly the slower leg
+instead of the sum of both. ``search_with_stats()`` reports per-leg latency
+and whether the fused ranking was returned before the slower leg finished:
+
+- **Early termination** (``early_termination=True``): once one leg is done,
+  the other can add at most ``weight / (rrf_k + 1)`` to any piece. If every
+  gap in the partial top-k (including the gap to the next candidate) is
+  larger than that bound, the top-k order is final and the slower leg is
+  not awaited. Scores then omit the skipped leg's contribution. The bound
+  is exact when nothing is known about the missing leg, but RRF gaps
+  within one leg's ranking are small (``w / ((rrf_k + r + 1)(rrf_k + r + 2))``
+  at rank ``r``), so the check only passes with very unequal leg weights:
+  the missing leg's weight must be below about
+  ``(rrf_k + 1) / ((rrf_k + top_k) * (rrf_k + top_k + 1))`` of the finished
+  leg's, i.e. roughly 1.2% for the default ``rrf_k=60`` and ``top_k=10``.
+  With the default 0.7 / 0.3 weights it never fires.
+- **Straggler timeout** (``straggler_timeout_seconds``): after the first leg
+  finishes, wait at most this long for the other before fusing without it.
 """
 
+import concurrent.futures
 import logging
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from typing import Callable, Dict, List, Optional, Tuple
 
+from agent_foundation.knowledge.retrieval.async_executor import (
+    get_search_leg_executor,
+    in_search_leg_worker,
+)
 from agent_foundation.knowledge.retrieval.models.knowledge_piece import KnowledgePiece
 from agent_foundation.knowledge.retrieval.models.results import ScoredPiece
 
 logger = logging.getLogger(__name__)
 
+LEG_VECTOR = "vector"
+LEG_KEYWORD = "keyword"
+
 
 @dataclass
 class HybridSearchConfig:
@@ -23,6 +52,30 @@ class HybridSearchConfig:
     keyword_weight: float = 0.3
     rrf_k: int = 60
     candidate_multiplier: int = 3
+    parallel_legs: bool = True
+    early_termination: bool = False
+    straggler_timeout_seconds: Optional[float] = None
+
+
+@dataclass
+class HybridSearchResult:
+    """Fused results of one hybrid search plus execution details.
+
+    Attributes:
+        pieces: The fused top-k, highest score first.
+        leg_latencies: Seconds spent in each finished leg, keyed by
+            ``LEG_VECTOR`` / ``LEG_KEYWORD``.
+        leg_errors: Error message per failed or abandoned leg.
+        skipped_leg: The leg that was not awaited (early termination or
+            straggler timeout), or None when both legs were fused.
+        total_seconds: Wall-clock time of the whole search.
+    """
+
+    pieces: List[ScoredPiece] = field(default_factory=list)
+    leg_latencies: Dict[str, float] = field(default_factory=dict)
+    leg_errors: Dict[str, str] = field(default_factory=dict)
+    skipped_leg: Optional[str] = None
+    total_seconds: float = 0.0
 
 
 class HybridRetriever:
@@ -31,6 +84,14 @@ class HybridRetriever:
     Note: domain and include_global filtering should be handled by the
     caller before passing search functions, as KnowledgePieceStore.search()
     doesn't natively support these parameters.
+
+    When ``query_embedding_fn`` is set, the query is embedded once per
+    search (or taken from the ``query_vector`` argument) and passed to
+    ``vector_search_fn`` as ``query_vector``; the vector search function
+    must then accept that keyword (e.g. ``LanceDBKnowledgePieceStore.search``).
+
+    Both search functions may be called from worker threads (see
+    ``HybridSearchConfig.parallel_legs``) and must be thread-safe.
     """
 
     def __init__(
@@ -38,10 +99,22 @@ class HybridRetriever:
         vector_search_fn: Callable[..., List[Tuple[KnowledgePiece, float]]],
         keyword_search_fn: Callable[..., List[Tuple[KnowledgePiece, float]]],
         config: Optional[HybridSearchConfig] = None,
+        query_embedding_fn: Optional[Callable[[str], List[float]]] = None,
     ):
         self.vector_search_fn = vector_search_fn
         self.keyword_search_fn = keyword_search_fn
         self.config = config or HybridSearchConfig()
+        self.query_embedding_fn = query_embedding_fn
+
+    def embed_query(self, query: str) -> Optional[List[float]]:
+        """Embed ``query`` for the vector leg, or None if not configured."""
+        if self.query_embedding_fn is None:
+            return None
+        try:
+            return self.query_embedding_fn(query)
+        except Exception as e:
+            logger.warning("Query embedding failed: %s", e)
+            return None
 
     def search(
         self,
@@ -49,33 +122,182 @@ class HybridRetriever:
         top_k: int = 10,
         entity_id: Optional[str] = None,
         tags: Optional[List[str]] = None,
+        query_vector: Optional[List[float]] = None,
     ) -> List[ScoredPiece]:
-        """Perform hybrid search with RRF fusion."""
+        """Perform hybrid search with RRF fusion.
+
+        Args:
+            query_vector: Optional precomputed embedding of ``query``, e.g.
+                from ``embed_query()`` when searching several scopes.
+        """
+        return self.search_with_stats(
+            query,
+            top_k=top_k,
+            entity_id=entity_id,
+            tags=tags,
+            query_vector=query_vector,
+        ).pieces
+
+    def search_with_stats(
+        self,
+        query: str,
+        top_k: int = 10,
+        entity_id: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        query_vector: Optional[List[float]] = None,
+    ) -> HybridSearchResult:
+        """Like ``search()``, but also report per-leg latency and errors."""
+        started = time.perf_counter()
         fetch_k = top_k * self.config.candidate_multiplier
 
-        try:
-            vector_results = self.vector_search_fn(
+        if query_vector is None:
+            query_vector = self.embed_query(query)
+        vector_kwargs = {} if query_vector is None else {"query_vector": query_vector}
+
+        legs = {
+            LEG_VECTOR: lambda: self.vector_search_fn(
                 query=query,
                 entity_id=entity_id,
                 tags=tags,
                 top_k=fetch_k,
-            )
-        except Exception as e:
-            logger.warning("Vector search failed: %s", e)
-            vector_results = []
-
-        try:
-            keyword_results = self.keyword_search_fn(
+                **vector_kwargs,
+            ),
+            LEG_KEYWORD: lambda: self.keyword_search_fn(
                 query=query,
                 entity_id=entity_id,
                 tags=tags,
                 top_k=fetch_k,
-            )
+            ),
+        }
+
+        result = HybridSearchResult()
+        if self.config.parallel_legs and not in_search_leg_worker():
+            leg_results = self._run_legs_concurrently(legs, top_k, result)
+        else:
+            leg_results = {
+                name: self._run_leg(name, fn, result.leg_latencies, result.leg_errors)
+                for name, fn in legs.items()
+            }
+
+        result.pieces = self._fuse(
+            leg_results.get(LEG_VECTOR, []),
+            leg_results.get(LEG_KEYWORD, []),
+        )[:top_k]
+        result.total_seconds = time.perf_counter() - started
+        return result
+
+    def _run_leg(
+        self,
+        name: str,
+        fn: Callable[[], List[Tuple[KnowledgePiece, float]]],
+        latencies: Dict[str, float],
+        errors: Dict[str, str],
+    ) -> List[Tuple[KnowledgePiece, float]]:
+        """Run one leg, recording its latency; failures yield no results."""
+        leg_started = time.perf_counter()
+        try:
+            return fn()
         except Exception as e:
-            logger.warning("Keyword search failed: %s", e)
-            keyword_results = []
+            logger.warning("%s search failed: %s", name.capitalize(), e)
+            errors[name] = f"{type(e).__name__}: {e}"
+            return []
+        finally:
+            latencies[name] = time.perf_counter() - leg_started
 
-        # RRF Fusion
+    def _run_legs_concurrently(
+        self,
+        legs: Dict[str, Callable[[], List[Tuple[KnowledgePiece, float]]]],
+        top_k: int,
+        result: HybridSearchResult,
+    ) -> Dict[str, List[Tuple[KnowledgePiece, float]]]:
+        """Run both legs on the leg executor; stop early when allowed.
+
+        Workers write latencies and errors to their own dicts; only legs
+        that were awaited are copied into ``result``, so an abandoned leg
+        finishing later never mutates a returned result.
+        """
+        executor = get_search_leg_executor()
+        worker_latencies: Dict[str, float] = {}
+        worker_errors: Dict[str, str] = {}
+        futures = {
+            executor.submit(self._run_leg, name, fn, worker_latencies, worker_errors): name
+            for name, fn in legs.items()
+        }
+
+        done, pending = concurrent.futures.wait(
+            futures, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        leg_results = {futures[f]: f.result() for f in done}
+
+        if pending:
+            (straggler,) = pending
+            straggler_name = futures[straggler]
+            if self.config.early_termination and self._top_k_is_final(
+                leg_results, straggler_name, top_k
+            ):
+                straggler.cancel()
+                result.skipped_leg = straggler_name
+            else:
+                try:
+                    leg_results[straggler_name] = straggler.result(
+                        timeout=self.config.straggler_timeout_seconds
+                    )
+                except concurrent.futures.TimeoutError:
+                    logger.warning(
+                        "%s search exceeded the %.3fs straggler timeout; fusing without it",
+                        straggler_name.capitalize(),
+                        self.config.straggler_timeout_seconds,
+                    )
+                    straggler.cancel()
+                    result.skipped_leg = straggler_name
+                    result.leg_errors[straggler_name] = "timeout"
+
+        for name in leg_results:
+            if name in worker_latencies:
+                result.leg_latencies[name] = worker_latencies[name]
+            if name in worker_errors:
+                result.leg_errors[name] = worker_errors[name]
+        return leg_results
+
+    def _top_k_is_final(
+        self,
+        leg_results: Dict[str, List[Tuple[KnowledgePiece, float]]],
+        missing_leg: str,
+        top_k: int,
+    ) -> bool:
+        """Whether the missing leg can no longer change the top-k order.
+
+        A leg adds at most ``weight / (rrf_k + 1)`` to any piece (its rank-0
+        contribution), so the order is final when every adjacent gap in the
+        partial top-k, and the gap to the best piece outside it, exceeds
+        that bound. Any lower piece may be the one that gets the rank-0
+        contribution, so neither per-rank contributions nor checking only
+        top-k membership tighten it; see the module docstring for when it
+        can pass.
+        """
+        weight = (
+            self.config.keyword_weight
+            if missing_leg == LEG_KEYWORD
+            else self.config.vector_weight
+        )
+        max_boost = weight / (self.config.rrf_k + 1)
+        partial = self._fuse(
+            leg_results.get(LEG_VECTOR, []),
+            leg_results.get(LEG_KEYWORD, []),
+        )
+        if len(partial) < top_k:
+            return False
+        if max_boost == 0:
+            return True
+        scores = [sp.score for sp in partial[: top_k + 1]] + [0.0]
+        return all(scores[i] - scores[i + 1] > max_boost for i in range(top_k))
+
+    def _fuse(
+        self,
+        vector_results: List[Tuple[KnowledgePiece, float]],
+        keyword_results: List[Tuple[KnowledgePiece, float]],
+    ) -> List[ScoredPiece]:
+        """RRF-fuse both legs' rankings, highest fused score first."""
         scores: Dict[str, float] = {}
         piece_map: Dict[str, KnowledgePiece] = {}
 
@@ -93,5 +315,5 @@ class HybridRetriever:
 
         return [
             ScoredPiece(piece=piece_map[pid], score=scores[pid])
-            for pid in sorted_ids[:top_k]
+            for pid in sorted_ids
         ]
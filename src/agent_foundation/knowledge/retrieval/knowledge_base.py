@@ -14,12 +14,15 @@ Requirements: 4.1, 4.2, 4.3, 4.4, 4.5, 4.6, 4.7, 4.8,
               5.1, 5.2, 5.3, 5.4, 6.1, 6.2, 6.3, 6.4, 6.5,
               8.1, 8.2, 8.3, 9.1, 9.2
 """
+import asyncio
+import concurrent.futures
 import json
 import logging
 import os
 import re
+import time
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from attr import attrs, attrib
 
@@ -30,6 +33,11 @@ from rich_python_utils.service_utils.data_operation_record import (
 from agent_foundation.knowledge.retrieval.models.kb_metadata import (
     KnowledgeBaseMetadata,
 )
+from agent_foundation.knowledge.retrieval.async_executor import (
+    get_retrieval_executor,
+    in_retrieval_worker,
+    run_blocking,
+)
 from agent_foundation.knowledge.retrieval.formatter import (
     KnowledgeFormatter,
     RetrievalResult,
@@ -47,11 +55,13 @@ from agent_foundation.knowledge.retrieval.models.results import ScoredPiece
 from agent_foundation.knowledge.retrieval.stores.graph.base import EntityGraphStore
 from agent_foundation.knowledge.retrieval.stores.metadata.base import MetadataStore
 from agent_foundation.knowledge.retrieval.stores.pieces.base import KnowledgePieceStore
+from agent_foundation.knowledge.retrieval.stores.pieces.filters import PieceFilter
 from agent_foundation.knowledge.retrieval.temporal_decay import (
     TemporalDecayConfig,
     apply_temporal_decay,
 )
 from agent_foundation.knowledge.retrieval.graph_walk import (
+    drop_already_retrieved_pieces,
     find_search_seeds,
     find_identity_seeds,
     graph_walk,
@@ -61,6 +71,95 @@ from agent_foundation.knowledge.retrieval.utils import parse_entity_type
 
 logger = logging.getLogger(__name__)
 
+# Layer names used in RetrievalResult.layer_timings / layer_errors and as
+# keys of KnowledgeBase.layer_timeouts.
+LAYER_METADATA = "metadata"
+LAYER_PIECES = "pieces"
+LAYER_SEARCH_GRAPH = "search_graph"
+LAYER_IDENTITY_GRAPH = "identity_graph"
+
+
+def _timed(timings: Dict[str, float], name: str, fn: Callable, *args) -> Any:
+    """Call ``fn(*args)`` and record its wall-clock seconds in ``timings[name]``."""
+    started = time.perf_counter()
+    try:
+        return fn(*args)
+    finally:
+        timings[name] = time.perf_counter() - started
+
+
+@attrs
+class _PieceSearchMemo:
+    """Per-request memo of piece-store searches.
+
+    Entries are keyed by every search argument except ``top_k`` and keep the
+    largest result list fetched so far. A search asking for no more than
+    that many results is served from its prefix, so the fallback tiers and
+    the progressive space over-fetch re-filter results in memory instead of
+    querying the store again with the same arguments.
+
+    Attributes:
+        store_calls: Number of searches that reached the piece store.
+        hits: Number of searches served from the memo.
+    """
+
+    store_calls: int = attrib(default=0)
+    hits: int = attrib(default=0)
+    _entries: Dict[tuple, Tuple[int, List[Tuple[KnowledgePiece, float]]]] = attrib(
+        factory=dict, repr=False
+    )
+
+    def search(
+        self,
+        piece_store: KnowledgePieceStore,
+        query: str,
+        entity_id: Optional[str],
+        tags: Optional[List[str]],
+        top_k: int,
+        spaces: Optional[List[str]] = None,
+    ) -> List[Tuple[KnowledgePiece, float]]:
+        """Return ``piece_store.search(...)[:top_k]``, reusing larger fetches."""
+        key = (
+            query,
+            entity_id,
+            tuple(tags) if tags else None,
+            tuple(spaces) if spaces else None,
+        )
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] >= top_k:
+            self.hits += 1
+            return entry[1][:top_k]
+
+        kwargs = {"spaces": spaces} if spaces else {}
+        results = piece_store.search(
+            query, entity_id=entity_id, tags=tags, top_k=top_k, **kwargs
+        )
+        self.store_calls += 1
+        self._entries[key] = (top_k, results)
+        return results[:top_k]
+
+    def search_filtered(
+        self,
+        piece_store: KnowledgePieceStore,
+        query: str,
+        entity_id: Optional[str],
+        piece_filter: PieceFilter,
+        top_k: int,
+    ) -> List[Tuple[KnowledgePiece, float]]:
+        """Return ``piece_store.search_filtered(...)[:top_k]``, reusing larger fetches."""
+        key = ("filtered", query, entity_id, piece_filter)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] >= top_k:
+            self.hits += 1
+            return entry[1][:top_k]
+
+        results = piece_store.search_filtered(
+            query, piece_filter, entity_id=entity_id, top_k=top_k
+        )
+        self.store_calls += 1
+        self._entries[key] = (top_k, results)
+        return results[:top_k]
+
 
 @attrs
 class KnowledgeBase:
@@ -81,6 +180,16 @@ class KnowledgeBase:
         graph_traversal_depth: How many hops to traverse in the graph.
         sensitive_patterns: Regex patterns for detecting sensitive content.
         formatter: Formatter for converting RetrievalResult to string.
+        concurrent_layers: Run the four retrieval layers of ``retrieve()``
+            concurrently on a shared thread pool instead of one after
+            another. Stores must tolerate concurrent reads.
+        layer_timeout_seconds: Default per-layer timeout for concurrent
+            retrieval (None = wait indefinitely). A layer that fails or
+            times out contributes an empty result and is reported in
+            ``RetrievalResult.layer_errors``.
+        layer_timeouts: Per-layer overrides of ``layer_timeout_seconds``,
+            keyed by layer name (``metadata``, ``pieces``, ``search_graph``,
+            ``identity_graph``).
     """
 
     metadata_store: MetadataStore = attrib()
@@ -112,6 +221,11 @@ class KnowledgeBase:
     # Store path for KB-level metadata persistence
     store_path: Optional[str] = attrib(default=None)
 
+    # Concurrent layer execution
+    concurrent_layers: bool = attrib(default=False)
+    layer_timeout_seconds: Optional[float] = attrib(default=None)
+    layer_timeouts: Dict[str, float] = attrib(factory=dict)
+
 
 
     def __attrs_post_init__(self):
@@ -227,6 +341,15 @@ class KnowledgeBase:
         if include_global:
             global_metadata = self.metadata_store.get_metadata("global")
 
+        return self._filter_metadata_by_spaces(metadata, global_metadata, spaces)
+
+    @staticmethod
+    def _filter_metadata_by_spaces(
+        metadata: Optional["EntityMetadata"],
+        global_metadata: Optional["EntityMetadata"],
+        spaces: Optional[List[str]],
+    ) -> Tuple[Optional["EntityMetadata"], Optional["EntityMetadata"]]:
+        """Drop metadata whose spaces do not intersect ``spaces``."""
         # Filter metadata by spaces intersection (OR semantics)
         if spaces:
             if metadata:
@@ -284,16 +407,20 @@ class KnowledgeBase:
 
         if self._hybrid_retriever is not None:
             # Enhanced retrieval path: hybrid → space filter → domain filter → temporal decay → MMR
+            # Embed once; the entity and global searches share the vector.
+            query_vector = self._hybrid_retriever.embed_query(query)
             scored = self._hybrid_retriever.search(
                 query=query,
                 top_k=top_k * 3,  # fetch more for post-processing
                 entity_id=entity_id,
                 tags=tags,
+                query_vector=query_vector,
             )
 
             # Space post-filter on hybrid results (before domain/temporal/MMR)
+            space_filter = PieceFilter(spaces=spaces)
             if spaces:
-                scored = [sp for sp in scored if set(sp.piece.spaces) & set(spaces)]
+                scored = [sp for sp in scored if space_filter.matches(sp.piece)]
 
             # Domain filter: keep pieces matching domain or secondary_domains
             if domain:
@@ -327,16 +454,20 @@ class KnowledgeBase:
                     top_k=top_k,
                     entity_id=None,
                     tags=tags,
+                    query_vector=query_vector,
                 )
                 # Apply space post-filter to global pieces before merging
                 if spaces:
-                    global_scored = [sp for sp in global_scored if set(sp.piece.spaces) & set(spaces)]
+                    global_scored = [sp for sp in global_scored if space_filter.matches(sp.piece)]
                 global_pieces = [(sp.piece, sp.score) for sp in global_scored]
                 pieces = self._merge_scored_pieces(pieces, global_pieces, top_k)
 
             return pieces
 
-        elif domain or tags:
+        # One memo per request: the fallback tiers and the global search
+        # often repeat the same store search.
+        memo = _PieceSearchMemo()
+        if domain or tags:
             # Domain-aware fallback path
             pieces = self._retrieve_pieces_with_fallback(
                 query=query,
@@ -347,25 +478,24 @@ class KnowledgeBase:
                 tags=tags,
                 min_results=min_results,
                 spaces=spaces,
+                memo=memo,
             )
-            if include_global:
-                global_pieces = self._search_with_space_strategy(
-                    query, entity_id=None, top_k=top_k, spaces=spaces
-                )
-                pieces = self._merge_scored_pieces(pieces, global_pieces, top_k)
-            return pieces
-
         else:
             # Standard retrieval path (no domain/tag filters)
             pieces = self._search_with_space_strategy(
-                query, entity_id=entity_id, top_k=top_k, spaces=spaces
+                query, entity_id=entity_id, top_k=top_k, spaces=spaces, memo=memo
             )
-            if include_global:
-                global_pieces = self._search_with_space_strategy(
-                    query, entity_id=None, top_k=top_k, spaces=spaces
-                )
-                pieces = self._merge_scored_pieces(pieces, global_pieces, top_k)
-            return pieces
+        if include_global:
+            global_pieces = self._search_with_space_strategy(
+                query, entity_id=None, top_k=top_k, spaces=spaces, memo=memo
+            )
+            pieces = self._merge_scored_pieces(pieces, global_pieces, top_k)
+        logger.debug(
+            "Piece search memo: %d store searches, %d reused",
+            memo.store_calls,
+            memo.hits,
+        )
+        return pieces
 
     def retrieve_search_graph(
         self,
@@ -481,6 +611,13 @@ class KnowledgeBase:
         4. L3b: retrieve_identity_graph() — identity-based graph traversal
         5. Merge L3a + L3b graph contexts
 
+        With ``concurrent_layers`` the four layers run in parallel (see
+        ``_retrieve_concurrently``), except when ``retrieve`` is itself
+        running on the retrieval executor (e.g. via ``acall``): the layers
+        then run sequentially so the call never waits on the pool it
+        occupies. Per-layer wall-clock time is recorded in
+        ``RetrievalResult.layer_timings`` in both modes.
+
         Args:
             query: The search query string.
             entity_id: Override for active_entity_id.
@@ -502,43 +639,323 @@ class KnowledgeBase:
         entity_id = entity_id or self.active_entity_id
         top_k = top_k if top_k is not None else self.default_top_k
 
+        if self.concurrent_layers and not in_retrieval_worker():
+            return self._retrieve_concurrently(
+                query, entity_id, top_k, include_global,
+                domain, secondary_domains, tags, min_results, spaces,
+            )
+
         result = RetrievalResult()
+        timings = result.layer_timings
+        started = time.perf_counter()
 
         # L1: Metadata
-        result.metadata, result.global_metadata = self.retrieve_metadata(
-            entity_id, include_global, spaces
+        result.metadata, result.global_metadata = _timed(
+            timings, LAYER_METADATA,
+            self.retrieve_metadata, entity_id, include_global, spaces,
         )
 
         # L2: Knowledge pieces (skip for empty/whitespace queries)
         if query and query.strip() and self.include_pieces:
-            result.pieces = self.retrieve_pieces(
+            result.pieces = _timed(
+                timings, LAYER_PIECES,
+                self.retrieve_pieces,
                 query, entity_id, top_k, include_global,
                 domain, secondary_domains, tags, min_results, spaces,
             )
 
         # Build dedup set from L2 pieces for graph walk
-        already_retrieved_piece_ids = None
-        if self.graph_retrieval_ignore_pieces_already_retrieved and result.pieces:
-            already_retrieved_piece_ids = {
-                p.piece_id: p.info_type for p, _ in result.pieces
-            }
+        already_retrieved_piece_ids = self._already_retrieved_piece_ids(result.pieces)
 
         # L3a: Query-driven graph search
-        search_ctx = self.retrieve_search_graph(
-            query, top_k, spaces, already_retrieved_piece_ids
+        search_ctx = _timed(
+            timings, LAYER_SEARCH_GRAPH,
+            self.retrieve_search_graph,
+            query, top_k, spaces, already_retrieved_piece_ids,
         )
 
         # L3b: Identity-based graph traversal
-        identity_ctx = self.retrieve_identity_graph(
-            entity_id, spaces, already_retrieved_piece_ids
+        identity_ctx = _timed(
+            timings, LAYER_IDENTITY_GRAPH,
+            self.retrieve_identity_graph,
+            entity_id, spaces, already_retrieved_piece_ids,
         )
 
         # Merge graph contexts from both paths
         if search_ctx or identity_ctx:
             result.graph_context = merge_graph_contexts(search_ctx, identity_ctx)
 
+        timings["total"] = time.perf_counter() - started
         return result
 
+    def _already_retrieved_piece_ids(
+        self, pieces: List[Tuple[KnowledgePiece, float]]
+    ) -> Optional[Dict[str, str]]:
+        """Map L2 piece IDs to info_type for graph-walk dedup, if enabled."""
+        if not self.graph_retrieval_ignore_pieces_already_retrieved or not pieces:
+            return None
+        return {p.piece_id: p.info_type for p, _ in pieces}
+
+    def _layer_calls(
+        self,
+        query: str,
+        entity_id: Optional[str],
+        top_k: int,
+        include_global: bool,
+        domain: Optional[str],
+        secondary_domains: Optional[List[str]],
+        tags: Optional[List[str]],
+        min_results: int,
+        spaces: Optional[List[str]],
+    ) -> Dict[str, Tuple[Callable[[], Any], Any]]:
+        """Build ``{layer: (zero-arg call, empty result)}`` for parallel retrieval.
+
+        The graph layers are called without the already-retrieved dedup set
+        so they need not wait for L2; ``_assemble_layer_outputs`` applies it.
+        """
+        layers: Dict[str, Tuple[Callable[[], Any], Any]] = {
+            LAYER_METADATA: (
+                lambda: self.retrieve_metadata(entity_id, include_global, spaces),
+                (None, None),
+            ),
+            LAYER_SEARCH_GRAPH: (
+                lambda: self.retrieve_search_graph(query, top_k, spaces, None),
+                [],
+            ),
+            LAYER_IDENTITY_GRAPH: (
+                lambda: self.retrieve_identity_graph(entity_id, spaces, None),
+                [],
+            ),
+        }
+        if query and query.strip() and self.include_pieces:
+            layers[LAYER_PIECES] = (
+                lambda: self.retrieve_pieces(
+                    query, entity_id, top_k, include_global,
+                    domain, secondary_domains, tags, min_results, spaces,
+                ),
+                [],
+            )
+        return layers
+
+    def _layer_timeout(self, name: str) -> Optional[float]:
+        return self.layer_timeouts.get(name, self.layer_timeout_seconds)
+
+    def _record_layer_failure(
+        self,
+        result: RetrievalResult,
+        name: str,
+        exc: BaseException,
+        timeout: Optional[float],
+    ) -> None:
+        if isinstance(exc, (concurrent.futures.TimeoutError, asyncio.TimeoutError)):
+            result.layer_errors[name] = f"timeout after {timeout:.3f}s"
+            logger.warning("Retrieval layer %r timed out after %.3fs", name, timeout)
+        else:
+            result.layer_errors[name] = f"{type(exc).__name__}: {exc}"
+            logger.warning("Retrieval layer %r failed", name, exc_info=exc)
+
+    def _assemble_layer_outputs(
+        self,
+        result: RetrievalResult,
+        outputs: Dict[str, Any],
+        started: float,
+    ) -> RetrievalResult:
+        """Fill ``result`` from per-layer outputs of a parallel retrieval."""
+        result.metadata, result.global_metadata = outputs[LAYER_METADATA]
+        result.pieces = outputs.get(LAYER_PIECES, [])
+
+        # Apply L2 dedup to the graph entries now that L2 is known
+        already_retrieved_piece_ids = self._already_retrieved_piece_ids(result.pieces)
+        search_ctx = drop_already_retrieved_pieces(
+            outputs[LAYER_SEARCH_GRAPH],
+            already_retrieved_piece_ids,
+            self.graph_retrieval_ignore_pieces_already_retrieved,
+        )
+        identity_ctx = drop_already_retrieved_pieces(
+            outputs[LAYER_IDENTITY_GRAPH],
+            already_retrieved_piece_ids,
+            self.graph_retrieval_ignore_pieces_already_retrieved,
+        )
+        if search_ctx or identity_ctx:
+            result.graph_context = merge_graph_contexts(search_ctx, identity_ctx)
+
+        result.layer_timings["total"] = time.perf_counter() - started
+        return result
+
+    def _retrieve_concurrently(
+        self,
+        query: str,
+        entity_id: Optional[str],
+        top_k: int,
+        include_global: bool,
+        domain: Optional[str],
+        secondary_domains: Optional[List[str]],
+        tags: Optional[List[str]],
+        min_results: int,
+        spaces: Optional[List[str]],
+    ) -> RetrievalResult:
+        """Run the four retrieval layers in parallel and merge their results.
+
+        The graph layers do not wait for L2: they walk without the
+        already-retrieved dedup set, which is applied to their entries once
+        L2 has finished, giving the same result as the sequential path.
+
+        Each layer is bounded by its timeout (``layer_timeouts`` or
+        ``layer_timeout_seconds``, measured from fan-out). A failed or timed
+        out layer degrades to its empty result and is recorded in
+        ``layer_errors``; a timed-out layer keeps running in the background
+        until its store call returns, but its result is discarded.
+        """
+        result = RetrievalResult()
+        started = time.perf_counter()
+        layers = self._layer_calls(
+            query, entity_id, top_k, include_global,
+            domain, secondary_domains, tags, min_results, spaces,
+        )
+
+        executor = get_retrieval_executor()
+        # Worker threads record into their own dict; only layers that finish
+        # in time are copied into the result, so an abandoned layer can never
+        # mutate a result that has already been returned.
+        worker_timings: Dict[str, float] = {}
+        futures = {
+            name: executor.submit(_timed, worker_timings, name, fn)
+            for name, (fn, _) in layers.items()
+        }
+        outputs: Dict[str, Any] = {}
+        for name, future in futures.items():
+            timeout = self._layer_timeout(name)
+            remaining = None
+            if timeout is not None:
+                remaining = max(0.0, timeout - (time.perf_counter() - started))
+            try:
+                outputs[name] = future.result(timeout=remaining)
+                result.layer_timings[name] = worker_timings[name]
+            except Exception as exc:
+                future.cancel()
+                result.layer_timings[name] = worker_timings.get(
+                    name, time.perf_counter() - started
+                )
+                self._record_layer_failure(result, name, exc, timeout)
+                outputs[name] = layers[name][1]
+
+        return self._assemble_layer_outputs(result, outputs, started)
+
+    # ── Async API ────────────────────────────────────────────────────────
+
+    async def aretrieve(
+        self,
+        query: str,
+        entity_id: str = None,
+        top_k: int = None,
+        include_global: bool = True,
+        domain: Optional[str] = None,
+        secondary_domains: Optional[List[str]] = None,
+        tags: Optional[List[str]] = None,
+        min_results: int = 1,
+        spaces: Optional[List[str]] = None,
+        **kwargs,
+    ) -> RetrievalResult:
+        """Async counterpart of ``retrieve()`` that never blocks the event loop.
+
+        The four layers always run concurrently with the same semantics as
+        ``concurrent_layers=True`` (per-layer timeouts, partial results,
+        ``layer_timings``/``layer_errors``). L1 uses the metadata store's
+        async API; the other layers run on the shared retrieval executor.
+        """
+        entity_id = entity_id or self.active_entity_id
+        top_k = top_k if top_k is not None else self.default_top_k
+
+        result = RetrievalResult()
+        started = time.perf_counter()
+        layers = self._layer_calls(
+            query, entity_id, top_k, include_global,
+            domain, secondary_domains, tags, min_results, spaces,
+        )
+        coroutines = {
+            name: run_blocking(fn)
+            for name, (fn, _) in layers.items()
+            if name != LAYER_METADATA
+        }
+        coroutines[LAYER_METADATA] = self.aretrieve_metadata(
+            entity_id, include_global, spaces
+        )
+
+        async def run_layer(name: str) -> Any:
+            timeout = self._layer_timeout(name)
+            layer_started = time.perf_counter()
+            try:
+                return await asyncio.wait_for(coroutines[name], timeout)
+            except Exception as exc:
+                self._record_layer_failure(result, name, exc, timeout)
+                return layers[name][1]
+            finally:
+                result.layer_timings[name] = time.perf_counter() - layer_started
+
+        names = list(coroutines)
+        values = await asyncio.gather(*(run_layer(name) for name in names))
+        return self._assemble_layer_outputs(result, dict(zip(names, values)), started)
+
+    async def aretrieve_metadata(
+        self,
+        entity_id: Optional[str] = None,
+        include_global: bool = True,
+        spaces: Optional[List[str]] = None,
+    ) -> Tuple[Optional["EntityMetadata"], Optional["EntityMetadata"]]:
+        """Async counterpart of ``retrieve_metadata()``.
+
+        Entity and global metadata are fetched concurrently through
+        ``MetadataStore.aget_metadata``.
+        """
+        entity_id = entity_id or self.active_entity_id
+        if not self.include_metadata or not entity_id:
+            return (None, None)
+
+        lookups = [self.metadata_store.aget_metadata(entity_id)]
+        if include_global:
+            lookups.append(self.metadata_store.aget_metadata("global"))
+        found = await asyncio.gather(*lookups)
+        metadata = found[0]
+        global_metadata = found[1] if include_global else None
+        return self._filter_metadata_by_spaces(metadata, global_metadata, spaces)
+
+    async def aretrieve_pieces(self, query: str, **kwargs) -> List[Tuple[KnowledgePiece, float]]:
+        """Async counterpart of ``retrieve_pieces()`` (same arguments)."""
+        return await run_blocking(self.retrieve_pieces, query, **kwargs)
+
+    async def acall(self, query: str, **kwargs) -> str:
+        """Async counterpart of ``__call__`` for async agents and providers."""
+        return await run_blocking(self.__call__, query, **kwargs)
+
+    async def aadd_piece(
+        self,
+        piece: KnowledgePiece,
+        operation_id: Optional[str] = None,
+    ) -> str:
+        """Async counterpart of ``add_piece()``."""
+        return await run_blocking(self.add_piece, piece, operation_id)
+
+    async def aupdate_piece(
+        self,
+        piece: KnowledgePiece,
+        operation_id: Optional[str] = None,
+    ) -> bool:
+        """Async counterpart of ``update_piece()``."""
+        return await run_blocking(self.update_piece, piece, operation_id)
+
+    async def aremove_piece(
+        self,
+        piece_id: str,
+        operation_id: Optional[str] = None,
+        hard: bool = False,
+    ) -> bool:
+        """Async counterpart of ``remove_piece()``."""
+        return await run_blocking(self.remove_piece, piece_id, operation_id, hard)
+
+    async def abulk_load(self, file_path: str) -> int:
+        """Async counterpart of ``bulk_load()``."""
+        return await run_blocking(self.bulk_load, file_path)
+
     # ── Domain-aware fallback retrieval ─────────────────────────────────
 
     def _retrieve_pieces_with_fallback(
@@ -551,6 +968,7 @@ class KnowledgeBase:
         tags: Optional[List[str]] = None,
         min_results: int = 1,
         spaces: Optional[List[str]] = None,
+        memo: Optional[_PieceSearchMemo] = None,
     ) -> List[Tuple[KnowledgePiece, float]]:
         """Retrieve pieces with a 4-tier fallback strategy.
 
@@ -560,7 +978,12 @@ class KnowledgeBase:
         Tier 4: Pure semantic search (no filters)
 
         Each tier is tried only if the previous tier returned fewer
-        results than ``min_results``.
+        results than ``min_results``. Tiers 1-3 search with the same
+        arguments, so they share one memoized store search and only
+        re-filter its results. When the store supports filter pushdown,
+        tiers 1-2 instead search with the domains in the ``PieceFilter``,
+        so they return the best ``top_k`` in-domain pieces rather than the
+        in-domain subset of the overall ``top_k``.
 
         Args:
             query: The search query string.
@@ -571,19 +994,40 @@ class KnowledgeBase:
             tags: Tag filters.
             min_results: Minimum acceptable result count before fallback.
             spaces: Optional list of space strings to filter by (OR semantics).
+            memo: Per-request search memo; a fresh one is used if None.
 
         Returns:
             A list of (KnowledgePiece, score) tuples.
         """
-        # Tier 1: Domain + tags
-        pieces = self._search_with_space_strategy(
-            query, entity_id=entity_id, tags=tags, top_k=top_k, spaces=spaces
-        )
-        if domain:
-            pieces = [
+        if memo is None:
+            memo = _PieceSearchMemo()
+
+        def search_in_domains(domains):
+            if self.piece_store.supports_filter_pushdown:
+                return memo.search_filtered(
+                    self.piece_store,
+                    query,
+                    entity_id,
+                    PieceFilter(spaces=spaces, tags=tags, domains=sorted(domains)),
+                    top_k,
+                )
+            pieces = self._search_with_space_strategy(
+                query, entity_id=entity_id, tags=tags, top_k=top_k, spaces=spaces,
+                memo=memo,
+            )
+            return [
                 (p, s) for p, s in pieces
-                if getattr(p, "domain", "general") == domain
+                if getattr(p, "domain", "general") in domains
             ]
+
+        # Tier 1: Domain + tags
+        if domain:
+            pieces = search_in_domains({domain})
+        else:
+            pieces = self._search_with_space_strategy(
+                query, entity_id=entity_id, tags=tags, top_k=top_k, spaces=spaces,
+                memo=memo,
+            )
         if len(pieces) >= min_results:
             return pieces[:top_k]
 
@@ -591,27 +1035,23 @@ class KnowledgeBase:
         if secondary_domains:
             all_domains = {domain} if domain else set()
             all_domains.update(secondary_domains)
-            pieces = self._search_with_space_strategy(
-                query, entity_id=entity_id, tags=tags, top_k=top_k, spaces=spaces
-            )
-            pieces = [
-                (p, s) for p, s in pieces
-                if getattr(p, "domain", "general") in all_domains
-            ]
+            pieces = search_in_domains(all_domains)
             if len(pieces) >= min_results:
                 return pieces[:top_k]
 
         # Tier 3: Tags only (no domain filter)
         if tags:
             pieces = self._search_with_space_strategy(
-                query, entity_id=entity_id, tags=tags, top_k=top_k, spaces=spaces
+                query, entity_id=entity_id, tags=tags, top_k=top_k, spaces=spaces,
+                memo=memo,
             )
             if len(pieces) >= min_results:
                 return pieces[:top_k]
 
         # Tier 4: Pure semantic search (no filters)
         pieces = self._search_with_space_strategy(
-            query, entity_id=entity_id, top_k=top_k, spaces=spaces
+            query, entity_id=entity_id, top_k=top_k, spaces=spaces,
+            memo=memo,
         )
         return pieces[:top_k]
 
@@ -624,16 +1064,22 @@ class KnowledgeBase:
         tags: Optional[List[str]] = None,
         top_k: int = 5,
         spaces: Optional[List[str]] = None,
+        memo: Optional[_PieceSearchMemo] = None,
     ) -> List[Tuple[KnowledgePiece, float]]:
         """Search pieces using the adaptive space filtering strategy.
 
-        If the piece store natively supports space filtering
-        (``supports_space_filter is True``), passes ``spaces`` directly
-        and trusts the pre-filtered results.
+        If the piece store compiles ``PieceFilter`` constraints
+        (``supports_filter_pushdown``) or natively supports space filtering
+        (``supports_space_filter``), the spaces go into the store query and
+        the pre-filtered results are trusted.
 
         If the store does not support native filtering, applies progressive
         over-fetch (5× initial, 20× retry if insufficient) and post-filters
-        results by spaces intersection.
+        results by spaces intersection. The retry is skipped when the 5×
+        fetch already came back short (the store has no more candidates).
+
+        Searches go through ``memo``, so repeated calls within one request
+        reuse the largest fetch made so far instead of re-querying.
 
         When ``spaces`` is None, delegates directly to the store with no
         space filtering.
@@ -644,35 +1090,44 @@ class KnowledgeBase:
             tags: Optional tag filters.
             top_k: Maximum number of results.
             spaces: Optional list of space strings to filter by.
+            memo: Per-request search memo; a fresh one is used if None.
 
         Returns:
             A list of (KnowledgePiece, score) tuples.
         """
+        if memo is None:
+            memo = _PieceSearchMemo()
+
         if not spaces:
             # No space filtering — direct pass-through
-            return self.piece_store.search(
-                query, entity_id=entity_id, tags=tags, top_k=top_k
+            return memo.search(self.piece_store, query, entity_id, tags, top_k)
+
+        if self.piece_store.supports_filter_pushdown:
+            # Store compiles the filter into its query (e.g., LanceDB)
+            return memo.search_filtered(
+                self.piece_store,
+                query,
+                entity_id,
+                PieceFilter(spaces=spaces, tags=tags),
+                top_k,
             )
 
         if self.piece_store.supports_space_filter:
-            # Store handles filtering natively (e.g., LanceDB)
-            return self.piece_store.search(
-                query, entity_id=entity_id, tags=tags, top_k=top_k, spaces=spaces
+            # Store handles space filtering natively
+            return memo.search(
+                self.piece_store, query, entity_id, tags, top_k, spaces=spaces
             )
 
         # Non-native store: over-fetch and post-filter
         initial_top_k = top_k * 5
-        pieces = self.piece_store.search(
-            query, entity_id=entity_id, tags=tags, top_k=initial_top_k
-        )
-        pieces = [(p, s) for p, s in pieces if set(p.spaces) & set(spaces)]
+        space_filter = PieceFilter(spaces=spaces)
+        fetched = memo.search(self.piece_store, query, entity_id, tags, initial_top_k)
+        pieces = [(p, s) for p, s in fetched if space_filter.matches(p)]
 
-        if len(pieces) < top_k:
+        if len(pieces) < top_k and len(fetched) >= initial_top_k:
             # Retry with larger fetch
-            pieces = self.piece_store.search(
-                query, entity_id=entity_id, tags=tags, top_k=top_k * 20
-            )
-            pieces = [(p, s) for p, s in pieces if set(p.spaces) & set(spaces)]
+            fetched = memo.search(self.piece_store, query, entity_id, tags, top_k * 20)
+            pieces = [(p, s) for p, s in fetched if space_filter.matches(p)]
 
         return pieces[:top_k]
 
@@ -865,8 +1320,11 @@ class KnowledgeBase:
         """Load KnowledgePiece items from a JSON file.
 
         Reads a JSON file containing a list of KnowledgePiece dictionaries.
-        Each item is validated and added to the store. Items that fail
-        validation are logged and skipped.
+        Each item is validated; items that fail validation (or whose
+        piece_id already exists) are logged and skipped. Valid items are
+        written with one ``add_many`` call inside a ``bulk_session`` so the
+        store embeds in batches and maintains its indexes once, and the
+        load is logged as a single KB operation.
 
         Args:
             file_path: Path to a JSON file containing a list of piece dicts.
@@ -880,16 +1338,42 @@ class KnowledgeBase:
         with open(file_path, "r", encoding="utf-8") as f:
             items = json.load(f)
 
-        count = 0
+        now = datetime.now(timezone.utc).isoformat()
+        op_id = generate_operation_id("KnowledgeBase", "bulk_load")
+        pieces: List[KnowledgePiece] = []
         for i, item_dict in enumerate(items):
             try:
                 piece = KnowledgePiece.from_dict(item_dict)
-                self.add_piece(piece)
-                count += 1
+                self._validate_content(piece.content)
             except Exception as e:
                 logger.warning("Skipping item %d: %s", i, e)
-
-        return count
+                continue
+            piece.history.append(DataOperationRecord(
+                operation="add",
+                timestamp=now,
+                operation_id=op_id,
+                source="KnowledgeBase.bulk_load",
+            ))
+            pieces.append(piece)
+
+        with self.piece_store.bulk_session():
+            added = self.piece_store.add_many(pieces, skip_duplicates=True)
+
+        if len(added) < len(pieces):
+            added_ids = set(added)
+            for piece in pieces:
+                if piece.piece_id not in added_ids:
+                    logger.warning(
+                        "Skipping piece %s: duplicate piece_id", piece.piece_id
+                    )
+        if added:
+            self._log_kb_operation(
+                op_id,
+                f"Bulk-loaded {len(added)} pieces from {os.path.basename(file_path)}",
+                "KnowledgeBase.bulk_load",
+                len(added),
+            )
+        return len(added)
 
     # ── Validation ───────────────────────────────────────────────────────
 
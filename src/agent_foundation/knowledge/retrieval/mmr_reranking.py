@@ -1,7 +1,11 @@
 """
 Maximal Marginal Relevance (MMR) for diversity re-ranking.
 
-Uses pure Python cosine_similarity from utils.py (no numpy).
+Uses numpy when it is installed: the candidate embeddings are normalized
+into one matrix up front and each greedy step is a single matrix-vector
+product. Without numpy, falls back to pure Python cosine_similarity from
+utils.py. Both engines keep each candidate's maximum similarity to the
+selected set incrementally and produce the same ranking.
 """
 
 from dataclasses import dataclass
@@ -10,13 +14,25 @@ from typing import List
 from agent_foundation.knowledge.retrieval.models.results import ScoredPiece
 from agent_foundation.knowledge.retrieval.utils import cosine_similarity
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised via monkeypatch in tests
+    np = None
+
 
 @dataclass
 class MMRConfig:
-    """Configuration for MMR re-ranking."""
+    """Configuration for MMR re-ranking.
+
+    Attributes:
+        enabled: Whether MMR re-ranking is applied at all.
+        lambda_param: Trade-off between relevance (1.0) and diversity (0.0).
+        vectorized: Use the numpy engine when numpy is available.
+    """
 
     enabled: bool = True
     lambda_param: float = 0.7
+    vectorized: bool = True
 
 
 def apply_mmr_reranking(
@@ -24,10 +40,11 @@ def apply_mmr_reranking(
     config: MMRConfig,
     top_k: int = 10,
 ) -> List[ScoredPiece]:
-    """Apply MMR diversity re-ranking using pure Python cosine similarity.
+    """Apply MMR diversity re-ranking.
 
     Greedy selection: at each step, pick the piece maximizing
     ``lambda * relevance - (1 - lambda) * max_similarity_to_selected``.
+    Ties go to the piece that comes first in ``pieces``.
 
     Pieces without embeddings are skipped during diversity calculation
     and appended after embedding-based selection.
@@ -56,35 +73,94 @@ def apply_mmr_reranking(
         for p in pieces_with_emb:
             p.normalized_score = 1.0
 
-    # MMR selection
-    selected: List[ScoredPiece] = []
-    remaining = pieces_with_emb.copy()
-
-    while len(selected) < top_k and remaining:
-        mmr_scores = []
-
-        for piece in remaining:
-            relevance = piece.normalized_score
-
-            if selected:
-                similarities = [
-                    cosine_similarity(piece.piece.embedding, s.piece.embedding)
-                    for s in selected
-                    if s.piece.embedding is not None
-                ]
-                max_sim = max(similarities) if similarities else 0
-            else:
-                max_sim = 0
-
-            mmr = config.lambda_param * relevance - (1 - config.lambda_param) * max_sim
-            mmr_scores.append((piece, mmr))
-
-        best_piece, _ = max(mmr_scores, key=lambda x: x[1])
-        selected.append(best_piece)
-        remaining.remove(best_piece)
+    order = None
+    if config.vectorized and np is not None:
+        order = _mmr_order_numpy(pieces_with_emb, config.lambda_param, top_k)
+    if order is None:
+        order = _mmr_order_python(pieces_with_emb, config.lambda_param, top_k)
+    selected = [pieces_with_emb[i] for i in order]
 
     # Append pieces without embeddings after embedding-based selection
     if len(selected) < top_k:
         selected.extend(pieces_without_emb[: top_k - len(selected)])
 
     return selected
+
+
+def _mmr_order_python(
+    pieces: List[ScoredPiece], lambda_param: float, top_k: int
+) -> List[int]:
+    """Greedy MMR selection with pure Python cosine similarity.
+
+    Returns the indices of the selected pieces in selection order.
+    """
+    relevance = [p.normalized_score for p in pieces]
+    # Max similarity to the selected set; None until something is selected.
+    max_sim = None
+    remaining = list(range(len(pieces)))
+    order: List[int] = []
+
+    while len(order) < top_k and remaining:
+        best_index = None
+        best_mmr = None
+        for i in remaining:
+            sim = max_sim[i] if max_sim is not None else 0
+            mmr = lambda_param * relevance[i] - (1 - lambda_param) * sim
+            if best_mmr is None or mmr > best_mmr:
+                best_index, best_mmr = i, mmr
+
+        order.append(best_index)
+        remaining.remove(best_index)
+
+        chosen = pieces[best_index].piece.embedding
+        if max_sim is None:
+            max_sim = [0.0] * len(pieces)
+            for i in remaining:
+                max_sim[i] = cosine_similarity(pieces[i].piece.embedding, chosen)
+        else:
+            for i in remaining:
+                sim = cosine_similarity(pieces[i].piece.embedding, chosen)
+                if sim > max_sim[i]:
+                    max_sim[i] = sim
+
+    return order
+
+
+def _mmr_order_numpy(pieces: List[ScoredPiece], lambda_param: float, top_k: int):
+    """Greedy MMR selection over a normalized embedding matrix.
+
+    Returns the indices of the selected pieces in selection order, or None
+    when the embeddings do not form a matrix (mismatched dimensions), in
+    which case the caller falls back to the pure Python engine.
+    """
+    try:
+        matrix = np.asarray([p.piece.embedding for p in pieces], dtype=np.float64)
+    except ValueError:
+        return None
+    if matrix.ndim != 2:
+        return None
+
+    norms = np.linalg.norm(matrix, axis=1)
+    # Zero vectors have similarity 0.0 to everything, as in cosine_similarity.
+    safe_norms = np.where(norms == 0.0, 1.0, norms)
+    unit = matrix / safe_norms[:, None]
+
+    weighted_relevance = lambda_param * np.asarray(
+        [p.normalized_score for p in pieces], dtype=np.float64
+    )
+    diversity_weight = 1 - lambda_param
+    max_sim = np.zeros(len(pieces))
+    available = np.ones(len(pieces), dtype=bool)
+    order: List[int] = []
+
+    for step in range(min(top_k, len(pieces))):
+        mmr = weighted_relevance - diversity_weight * max_sim
+        mmr[~available] = -np.inf
+        best_index = int(np.argmax(mmr))
+        order.append(best_index)
+        available[best_index] = False
+
+        sims = unit @ unit[best_index]
+        max_sim = sims if step == 0 else np.maximum(max_sim, sims)
+
+    return order
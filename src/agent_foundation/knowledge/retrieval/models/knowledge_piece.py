@@ -25,6 +25,7 @@ from typing import Any, Dict, List, Optional
 
 from attr import attrs, attrib
 
+from agent_foundation.knowledge.retrieval.utils import iso_to_epoch
 from rich_python_utils.service_utils.data_operation_record import DataOperationRecord
 
 
@@ -141,6 +142,11 @@ class KnowledgePiece:
     # Operation history
     history: List[DataOperationRecord] = attrib(factory=list)
 
+    # Parsed timestamps: field name -> (ISO string, epoch seconds)
+    _epoch_cache: Dict[str, tuple] = attrib(
+        factory=dict, init=False, repr=False, eq=False
+    )
+
     def __attrs_post_init__(self):
         if self.piece_id is None:
             self.piece_id = str(uuid.uuid4())
@@ -167,6 +173,41 @@ class KnowledgePiece:
             self.spaces = ["main"]
         self.space = self.spaces[0]
 
+    @property
+    def created_at_epoch(self) -> Optional[float]:
+        """``created_at`` as POSIX seconds (None if missing or unparsable)."""
+        return self._timestamp_epoch("created_at")
+
+    @property
+    def updated_at_epoch(self) -> Optional[float]:
+        """``updated_at`` as POSIX seconds (None if missing or unparsable)."""
+        return self._timestamp_epoch("updated_at")
+
+    def set_timestamp_epochs(
+        self,
+        created_at_epoch: Optional[float] = None,
+        updated_at_epoch: Optional[float] = None,
+    ) -> None:
+        """Seed the parsed timestamps with values stored alongside the piece.
+
+        Stores that persist epoch columns call this when loading a piece so
+        scoring never parses the ISO strings. The seeded values are tied to
+        the current ``created_at``/``updated_at`` strings and are dropped
+        once those change.
+        """
+        if created_at_epoch is not None:
+            self._epoch_cache["created_at"] = (self.created_at, created_at_epoch)
+        if updated_at_epoch is not None:
+            self._epoch_cache["updated_at"] = (self.updated_at, updated_at_epoch)
+
+    def _timestamp_epoch(self, field_name: str) -> Optional[float]:
+        timestamp = getattr(self, field_name)
+        cached = self._epoch_cache.get(field_name)
+        if cached is None or cached[0] != timestamp:
+            cached = (timestamp, iso_to_epoch(timestamp))
+            self._epoch_cache[field_name] = cached
+        return cached[1]
+
     def _compute_content_hash(self) -> str:
         """Compute SHA256 hash of whitespace-normalized content.
 
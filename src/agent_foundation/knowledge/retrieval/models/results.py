@@ -94,6 +94,11 @@ class ScoredPiece:
         """Delegate to wrapped piece's updated_at."""
         return self.piece.updated_at
 
+    @property
+    def updated_at_epoch(self) -> Optional[float]:
+        """Delegate to wrapped piece's updated_at_epoch."""
+        return self.piece.updated_at_epoch
+
 
 @attrs
 class MergeJobResult:
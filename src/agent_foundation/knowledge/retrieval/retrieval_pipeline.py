@@ -12,18 +12,24 @@ Provides the core building blocks for a configurable retrieval pipeline:
 Two execution paths:
 1. **Single-query** (no expander): delegates to ``kb.retrieve()`` directly.
 2. **Multi-query** (with expander): calls ``retrieve_metadata()`` and
-   ``retrieve_identity_graph()`` once, then loops ``retrieve_pieces()`` and
-   ``retrieve_search_graph()`` per sub-query.
+   ``retrieve_identity_graph()`` once, then runs ``retrieve_pieces()`` and
+   ``retrieve_search_graph()`` per sub-query — one at a time, or up to
+   ``max_concurrent_subqueries`` at once on a shared thread pool. Results
+   are assembled in sub-query order either way, so fusion is unchanged.
 
 Requirements: 7.1, 7.2, 7.3, 7.5, 14.1, 14.2, 14.3, 14.4
 """
 from __future__ import annotations
 
+import concurrent.futures
+import contextvars
 import json
 import logging
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
 
 from attr import attrib, attrs
 
@@ -144,6 +150,10 @@ class RetrievalPipeline:
         post_processor: Post-processor for output formatting.
         min_results: Minimum results before fallback (for agentic path).
         top_k: Maximum results to return.
+        max_concurrent_subqueries: How many sub-queries of the multi-query
+            path run at once. ``1`` (default) runs them sequentially on the
+            calling thread; larger values run them on the shared sub-query
+            pool, so the KnowledgeBase and its stores must be thread-safe.
     """
 
     kb: KnowledgeBase = attrib()  # type annotation for IDE support
@@ -151,6 +161,7 @@ class RetrievalPipeline:
     expander: Optional[QueryExpander] = attrib(default=None)
     min_results: int = attrib(default=1)
     top_k: int = attrib(default=10)
+    max_concurrent_subqueries: int = attrib(default=1)
 
     # ── public API ───────────────────────────────────────────────────
 
@@ -168,9 +179,10 @@ class RetrievalPipeline:
 
         Multi-query path (with expander):
             Calls ``retrieve_metadata()`` and ``retrieve_identity_graph()``
-            once, then loops ``retrieve_pieces()`` and
-            ``retrieve_search_graph()`` per sub-query.  Merges all L3a
-            search contexts with L3b identity context once after the loop.
+            once, then runs ``retrieve_pieces()`` and
+            ``retrieve_search_graph()`` per sub-query (concurrently when
+            ``max_concurrent_subqueries > 1``).  Merges all L3a search
+            contexts with L3b identity context once after all sub-queries.
 
         Args:
             query: The user query.
@@ -246,10 +258,7 @@ class RetrievalPipeline:
         # Expand query into sub-queries
         sub_queries = self.expander.expand(query)
 
-        all_pieces: List[Any] = []  # per-sub-query piece lists
-        all_search_ctx: List[Dict[str, Any]] = []
-
-        for sq in sub_queries:
+        def run_sub_query(sq: SubQuery) -> Tuple[List[Any], List[Dict[str, Any]]]:
             # L2: pieces per sub-query
             pieces = self.kb.retrieve_pieces(
                 query=sq.query,
@@ -261,7 +270,6 @@ class RetrievalPipeline:
                 min_results=1,
                 spaces=spaces,
             )
-            all_pieces.append(pieces)
 
             # Build dedup set from this sub-query's L2 pieces
             already_retrieved_piece_ids: Optional[Dict[str, str]] = None
@@ -277,6 +285,12 @@ class RetrievalPipeline:
                 spaces=spaces,
                 already_retrieved_piece_ids=already_retrieved_piece_ids,
             )
+            return pieces, search_ctx
+
+        all_pieces: List[Any] = []  # per-sub-query piece lists
+        all_search_ctx: List[Dict[str, Any]] = []
+        for pieces, search_ctx in self._run_sub_queries(run_sub_query, sub_queries):
+            all_pieces.append(pieces)
             all_search_ctx.extend(search_ctx)
 
         # Merge all L3a + L3b ONCE after all sub-queries
@@ -323,6 +337,47 @@ class RetrievalPipeline:
 
         return output
 
+    def _run_sub_queries(
+        self,
+        run_sub_query: Callable[[SubQuery], Any],
+        sub_queries: List[SubQuery],
+    ) -> List[Any]:
+        """Run ``run_sub_query`` for each sub-query, returning results in order.
+
+        With ``max_concurrent_subqueries > 1`` at most that many sub-queries
+        are in flight on the shared sub-query pool at a time. The first
+        failure (in sub-query order) is re-raised, as on the sequential path;
+        sub-queries not yet started are then skipped.
+        """
+        limit = max(1, self.max_concurrent_subqueries)
+        if limit == 1 or len(sub_queries) <= 1:
+            return [run_sub_query(sq) for sq in sub_queries]
+
+        # Deferred import: async_executor is only needed on this path
+        from agent_foundation.knowledge.retrieval.async_executor import (
+            get_subquery_executor,
+        )
+
+        executor = get_subquery_executor()
+        futures: List[concurrent.futures.Future] = []
+        in_flight = set()
+        try:
+            for sq in sub_queries:
+                if len(in_flight) >= limit:
+                    done, in_flight = concurrent.futures.wait(
+                        in_flight, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    if any(f.exception() is not None for f in done):
+                        break
+                ctx = contextvars.copy_context()
+                future = executor.submit(ctx.run, run_sub_query, sq)
+                futures.append(future)
+                in_flight.add(future)
+            return [future.result() for future in futures]
+        finally:
+            for future in futures:
+                future.cancel()
+
     def _needs_fallback(self, output: Any) -> bool:
         """Check if output needs fallback retrieval.
 
@@ -381,6 +436,7 @@ def create_domain_decomposer(
 def create_llm_decomposer(
     llm_fn: Callable[[str], str],
     domains: Optional[List[str]] = None,
+    cache_size: int = 256,
 ) -> Callable[[str], List[SubQuery]]:
     """Create an LLM-backed query decomposer.
 
@@ -388,15 +444,23 @@ def create_llm_decomposer(
     potentially targeting different domains or aspects.  On failure,
     falls back to a single undecomposed sub-query.
 
+    Successful decompositions are cached (LRU) keyed by the normalized
+    query — case-folded with whitespace collapsed — so repeated queries
+    skip the LLM call. Fallback results are not cached.
+
     Args:
         llm_fn: LLM inference function (prompt -> response string).
         domains: Optional list of available domains for the LLM to choose from.
+        cache_size: Maximum number of cached decompositions; ``0`` disables
+            the cache.
 
     Returns:
         A decomposer function: ``(query: str) -> List[SubQuery]``.
     """
+    cache: "OrderedDict[str, List[SubQuery]]" = OrderedDict()
+    cache_lock = threading.Lock()
 
-    def decomposer(query: str) -> List[SubQuery]:
+    def decompose(query: str) -> Optional[List[SubQuery]]:
         from agent_foundation.knowledge.prompt_templates import render_prompt
 
         domains_section = ""
@@ -425,6 +489,41 @@ def create_llm_decomposer(
                 "LLM decomposer failed, falling back to original query",
                 exc_info=True,
             )
+            return None
+
+    def decomposer(query: str) -> List[SubQuery]:
+        key = _normalize_query(query)
+        if cache_size > 0:
+            with cache_lock:
+                cached = cache.get(key)
+                if cached is not None:
+                    cache.move_to_end(key)
+            if cached is not None:
+                return _copy_sub_queries(cached)
+
+        sub_queries = decompose(query)
+        if sub_queries is None:
             return [SubQuery(query=query)]
 
+        if cache_size > 0:
+            with cache_lock:
+                cache[key] = _copy_sub_queries(sub_queries)
+                cache.move_to_end(key)
+                while len(cache) > cache_size:
+                    cache.popitem(last=False)
+        return sub_queries
+
     return decomposer
+
+
+def _normalize_query(query: str) -> str:
+    """Cache key for a query: case-folded, whitespace collapsed."""
+    return " ".join(query.casefold().split())
+
+
+def _copy_sub_queries(sub_queries: List[SubQuery]) -> List[SubQuery]:
+    """Copy sub-queries so callers cannot mutate cached entries."""
+    return [
+        replace(sq, tags=list(sq.tags) if sq.tags is not None else None)
+        for sq in sub_queries
+    ]
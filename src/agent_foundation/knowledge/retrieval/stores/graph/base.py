@@ -14,13 +14,15 @@ eliminating the need for domain-specific EntityNode/EntityRelation models.
 Requirements: 2.1
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from rich_python_utils.service_utils.graph_service.graph_node import (
     GraphEdge,
     GraphNode,
 )
 
+from agent_foundation.knowledge.retrieval.async_executor import run_blocking
+
 
 class EntityGraphStore(ABC):
     """Abstract base class for entity graph storage backends.
@@ -36,6 +38,17 @@ class EntityGraphStore(ABC):
     - Removing specific edges
     - Traversing neighbors up to a given depth
 
+    Batched reads (``get_neighbors_many``, ``get_relations_many``) default
+    to one per-node call each; backends that can answer several nodes in
+    one query should override them. Batched writes and lookups
+    (``add_nodes``, ``add_relations``, ``get_nodes``) likewise loop over
+    the single-item methods by default.
+
+    Async counterparts of the read and write methods (``aget_node``,
+    ``aget_neighbors``, ...) run the sync methods on the shared retrieval
+    executor by default. Backends with a native async client (e.g. the
+    Neo4j async driver) should override them.
+
     The ``close()`` method is a concrete no-op by default. Subclasses that hold
     external connections (e.g., Neo4j) should override it to release resources.
     """
@@ -163,6 +176,91 @@ class EntityGraphStore(ABC):
         """
         ...
 
+    def get_neighbors_many(
+        self,
+        node_ids: Iterable[str],
+        relation_type: str = None,
+        depth: int = 1,
+    ) -> Dict[str, List[Tuple[GraphNode, int]]]:
+        """Traverse from several source nodes.
+
+        Default calls ``get_neighbors(node_id, relation_type, depth)`` per
+        source. Override for backends with a multi-source traversal query;
+        results must match ``get_neighbors`` per source.
+
+        Args:
+            node_ids: The starting nodes.
+            relation_type: If specified, only follow edges of this type.
+            depth: Maximum traversal depth.
+
+        Returns:
+            A dict mapping each source ID to its ``(GraphNode, depth)``
+            tuples, excluding the source itself.
+        """
+        return {
+            node_id: self.get_neighbors(
+                node_id, relation_type=relation_type, depth=depth
+            )
+            for node_id in dict.fromkeys(node_ids)
+        }
+
+    def get_relations_many(
+        self,
+        node_ids: Iterable[str],
+        relation_type: str = None,
+        direction: str = "outgoing",
+    ) -> Dict[str, List[GraphEdge]]:
+        """Get edges for several nodes.
+
+        Default calls ``get_relations`` per node. Override for backends with
+        a batched edge query.
+
+        Returns:
+            A dict mapping each node ID to its edges.
+        """
+        return {
+            node_id: self.get_relations(
+                node_id, relation_type=relation_type, direction=direction
+            )
+            for node_id in dict.fromkeys(node_ids)
+        }
+
+    def get_nodes(self, node_ids: Iterable[str]) -> Dict[str, GraphNode]:
+        """Get several nodes by their IDs.
+
+        Default calls ``get_node`` per ID. Override for backends with a
+        batched lookup.
+
+        Returns:
+            A dict mapping node ID to GraphNode for the nodes that were
+            found, in first-seen input order. Missing IDs are omitted.
+        """
+        found: Dict[str, GraphNode] = {}
+        for node_id in dict.fromkeys(node_ids):
+            node = self.get_node(node_id)
+            if node is not None:
+                found[node_id] = node
+        return found
+
+    def add_nodes(self, nodes: Iterable[GraphNode], **kwargs) -> None:
+        """Add or update several nodes.
+
+        Default calls ``add_node`` per node, passing ``**kwargs`` through
+        (e.g. a shared ``operation_id``). Override for backends with a
+        batched write.
+        """
+        for node in nodes:
+            self.add_node(node, **kwargs)
+
+    def add_relations(self, relations: Iterable[GraphEdge], **kwargs) -> None:
+        """Add several edges between existing nodes.
+
+        Default calls ``add_relation`` per edge, passing ``**kwargs``
+        through. Override for backends with a batched write.
+        """
+        for relation in relations:
+            self.add_relation(relation, **kwargs)
+
     @property
     def supports_semantic_search(self) -> bool:
         """Whether this store supports semantic search over nodes."""
@@ -204,6 +302,46 @@ class EntityGraphStore(ABC):
             f"{type(self).__name__} does not implement list_nodes"
         )
 
+    async def aadd_node(self, node: GraphNode) -> None:
+        """Async counterpart of ``add_node()``."""
+        await run_blocking(self.add_node, node)
+
+    async def aget_node(self, node_id: str) -> Optional[GraphNode]:
+        """Async counterpart of ``get_node()``."""
+        return await run_blocking(self.get_node, node_id)
+
+    async def aadd_relation(self, relation: GraphEdge) -> None:
+        """Async counterpart of ``add_relation()``."""
+        await run_blocking(self.add_relation, relation)
+
+    async def aget_relations(
+        self,
+        node_id: str,
+        relation_type: str = None,
+        direction: str = "outgoing",
+    ) -> List[GraphEdge]:
+        """Async counterpart of ``get_relations()``."""
+        return await run_blocking(self.get_relations, node_id, relation_type, direction)
+
+    async def aget_neighbors(
+        self,
+        node_id: str,
+        relation_type: str = None,
+        depth: int = 1,
+    ) -> List[Tuple[GraphNode, int]]:
+        """Async counterpart of ``get_neighbors()``."""
+        return await run_blocking(self.get_neighbors, node_id, relation_type, depth)
+
+    async def asearch_nodes(
+        self,
+        query: str,
+        top_k: int = 5,
+        node_type: Optional[str] = None,
+        namespace: Optional[str] = None,
+    ) -> List[Tuple[GraphNode, float]]:
+        """Async counterpart of ``search_nodes()``."""
+        return await run_blocking(self.search_nodes, query, top_k, node_type, namespace)
+
     def close(self):
         """Close any underlying connections.
 
@@ -14,7 +14,7 @@ Requirements: 3.1, 3.2, 3.3, 4.1–4.5, 5.1–5.5, 6.1–6.3, 8.1–8.3, 9.1–9
 """
 
 import logging
-from typing import Callable, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from attr import attrib, attrs
 
@@ -152,6 +152,21 @@ class SemanticGraphStore(EntityGraphStore):
             **kwargs: Passed through to the wrapped store (e.g. ``operation_id``).
         """
         self.graph_store.add_node(node, **kwargs)
+        self._index_node(node)
+
+    def add_nodes(self, nodes, **kwargs) -> None:
+        """Add or update several nodes, syncing the sidecar index.
+
+        Delegates the batch to the wrapped store's ``add_nodes``, then
+        indexes each node in the sidecar retrieval service.
+        """
+        nodes = list(nodes)
+        self.graph_store.add_nodes(nodes, **kwargs)
+        for node in nodes:
+            self._index_node(node)
+
+    def _index_node(self, node: GraphNode) -> None:
+        """Add or update ``node``'s document in the sidecar index."""
         if self.retrieval_service is None:
             return
         try:
@@ -253,6 +268,22 @@ class SemanticGraphStore(EntityGraphStore):
         """
         return self.graph_store.get_neighbors(node_id, relation_type=relation_type, depth=depth, **kwargs)
 
+    def get_nodes(self, node_ids) -> Dict[str, GraphNode]:
+        """Get several nodes by ID (pure delegation)."""
+        return self.graph_store.get_nodes(node_ids)
+
+    def add_relations(self, relations, **kwargs) -> None:
+        """Add several edges (pure delegation, no sidecar sync)."""
+        self.graph_store.add_relations(relations, **kwargs)
+
+    def get_neighbors_many(self, node_ids, relation_type=None, depth=1) -> Dict[str, List[Tuple[GraphNode, int]]]:
+        """Traverse from several nodes at once (pure delegation)."""
+        return self.graph_store.get_neighbors_many(node_ids, relation_type=relation_type, depth=depth)
+
+    def get_relations_many(self, node_ids, relation_type=None, direction="outgoing") -> Dict[str, List[GraphEdge]]:
+        """Get edges for several nodes (pure delegation)."""
+        return self.graph_store.get_relations_many(node_ids, relation_type=relation_type, direction=direction)
+
     def list_nodes(self, node_type=None, include_inactive=False, **kwargs) -> List[GraphNode]:
         """List all nodes (pure delegation).
 
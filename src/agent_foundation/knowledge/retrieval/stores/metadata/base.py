@@ -12,6 +12,7 @@ Requirements: 2.1
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
+from agent_foundation.knowledge.retrieval.async_executor import run_blocking
 from agent_foundation.knowledge.retrieval.models.entity_metadata import EntityMetadata
 
 
@@ -27,6 +28,10 @@ class MetadataStore(ABC):
     - Deleting metadata by entity ID
     - Listing entity IDs with optional type filtering
 
+    Async counterparts (``aget_metadata``, ``asave_metadata``, ...) run the
+    sync methods on the shared retrieval executor by default. Backends with a
+    native async client should override them.
+
     The ``close()`` method is a concrete no-op by default. Subclasses that hold
     external connections (e.g., SQLite) should override it to release resources.
     """
@@ -80,6 +85,22 @@ class MetadataStore(ABC):
         """
         ...
 
+    async def aget_metadata(self, entity_id: str) -> Optional[EntityMetadata]:
+        """Async counterpart of ``get_metadata()``."""
+        return await run_blocking(self.get_metadata, entity_id)
+
+    async def asave_metadata(self, metadata: EntityMetadata) -> None:
+        """Async counterpart of ``save_metadata()``."""
+        await run_blocking(self.save_metadata, metadata)
+
+    async def adelete_metadata(self, entity_id: str) -> bool:
+        """Async counterpart of ``delete_metadata()``."""
+        return await run_blocking(self.delete_metadata, entity_id)
+
+    async def alist_entities(self, entity_type: str = None) -> List[str]:
+        """Async counterpart of ``list_entities()``."""
+        return await run_blocking(self.list_entities, entity_type)
+
     def close(self):
         """Close any underlying connections.
 
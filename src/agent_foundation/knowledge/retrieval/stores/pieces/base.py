@@ -11,12 +11,15 @@ with support for CRUD operations, search, and filtering.
 Requirements: 2.1
 """
 from abc import ABC, abstractmethod
-from typing import List, Optional, Tuple
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from agent_foundation.knowledge.retrieval.async_executor import run_blocking
 from agent_foundation.knowledge.retrieval.models.knowledge_piece import (
     KnowledgePiece,
     KnowledgeType,
 )
+from agent_foundation.knowledge.retrieval.stores.pieces.filters import PieceFilter
 
 
 class KnowledgePieceStore(ABC):
@@ -34,6 +37,29 @@ class KnowledgePieceStore(ABC):
     - Searching pieces by query with optional filters
     - Listing all pieces with optional filters
 
+    ``iter_all()`` streams pieces page by page for maintenance scans;
+    stores with a paginated or streaming backend read should override it.
+
+    ``find_by_content_hash()`` / ``find_by_content_hashes()`` default to
+    scanning with ``iter_all()``; stores should back them with an index on
+    the content hash (a backend index, or a ``ContentHashIndex``).
+
+    Batch operations (``add_many``, ``update_many``, ``remove_many``) and
+    ``bulk_session()`` have concrete defaults built on the single-piece
+    methods. Stores with per-write overhead (embedding calls, index rebuilds)
+    should override them with native batched implementations.
+
+    ``search_filtered()`` takes a ``PieceFilter`` (spaces, tags, domains,
+    created_at range, active flag, validation status). Its default passes
+    what ``search()`` supports natively and filters the rest in Python with
+    progressive over-fetch; stores returning True from
+    ``supports_filter_pushdown`` compile the filter into the backend query.
+
+    Async counterparts (``aadd``, ``aget_by_id``, ``asearch``, ...) run the
+    sync methods on the shared retrieval executor by default so callers on
+    an event loop are never blocked. Backends with a native async client
+    should override them.
+
     The ``close()`` method is a concrete no-op by default. Subclasses that hold
     external connections (e.g., SQLite, Chroma, LanceDB, Elasticsearch) should
     override it to release resources.
@@ -49,6 +75,28 @@ class KnowledgePieceStore(ABC):
         """
         return False
 
+    @property
+    def supports_filter_pushdown(self) -> bool:
+        """Whether ``search_filtered`` evaluates filters inside the backend.
+
+        Stores returning True compile a ``PieceFilter`` into their native
+        query, so ``top_k`` is met without over-fetching (constraints the
+        backend cannot express may still be checked in Python). Stores
+        returning False use the default over-fetch implementation.
+        """
+        return False
+
+    @property
+    def query_embedding_function(self) -> Optional[Callable[[str], List[float]]]:
+        """The function this store embeds search queries with, if any.
+
+        Stores returning a function accept a precomputed ``query_vector``
+        keyword in ``search()``. Callers that already embedded the query
+        with the *same* function (e.g. a shared ``EmbeddingCache``) pass it
+        to skip a second embedding. Defaults to None (not supported).
+        """
+        return None
+
     @abstractmethod
     def add(self, piece: KnowledgePiece) -> str:
         """Add a knowledge piece to the store.
@@ -158,6 +206,198 @@ class KnowledgePieceStore(ABC):
         """
         ...
 
+    def iter_all(
+        self,
+        entity_id: str = None,
+        knowledge_type: KnowledgeType = None,
+        piece_filter: Optional[PieceFilter] = None,
+        batch_size: int = 500,
+    ) -> Iterator[KnowledgePiece]:
+        """Iterate over all pieces matching the given filters.
+
+        Unlike ``list_all`` this never truncates, and stores that override
+        it read the backend ``batch_size`` rows at a time, so scans over a
+        large store use bounded memory. The default materializes
+        ``list_all`` and filters it in Python. Overrides raise backend
+        errors instead of ending the iteration early, so callers never act
+        on a partial scan.
+
+        Pieces should not be added or removed in the scanned scope while
+        iterating; collect the changes and apply them afterwards.
+
+        Args:
+            entity_id: Entity scope, as in ``list_all()``.
+            knowledge_type: If specified, filter to this knowledge type only.
+            piece_filter: Further constraints on the returned pieces.
+            batch_size: Number of pieces fetched from the backend per page.
+
+        Yields:
+            Matching KnowledgePiece objects.
+        """
+        piece_filter = piece_filter or PieceFilter()
+        kwargs = {"entity_id": entity_id}
+        if knowledge_type is not None:
+            kwargs["knowledge_type"] = knowledge_type
+        if piece_filter.spaces:
+            kwargs["spaces"] = list(piece_filter.spaces)
+        for piece in self.list_all(**kwargs):
+            if piece_filter.matches(piece):
+                yield piece
+
+    def search_filtered(
+        self,
+        query: str,
+        piece_filter: Optional[PieceFilter] = None,
+        entity_id: str = None,
+        knowledge_type: KnowledgeType = None,
+        top_k: int = 5,
+    ) -> List[Tuple[KnowledgePiece, float]]:
+        """Search pieces matching ``piece_filter``.
+
+        The default passes ``tags`` (and ``spaces`` when
+        ``supports_space_filter``) to ``search()`` and evaluates the rest of
+        the filter in Python, over-fetching 5× and then 20× if too few
+        results survive.
+
+        Args:
+            query: The search query string.
+            piece_filter: Constraints on the returned pieces. None matches
+                every piece.
+            entity_id: Entity scope, as in ``search()``.
+            knowledge_type: If specified, filter to this knowledge type only.
+            top_k: Maximum number of results to return.
+
+        Returns:
+            A list of (KnowledgePiece, relevance_score) tuples ordered by
+            descending relevance score.
+        """
+        piece_filter = piece_filter or PieceFilter()
+        native = {"tags": list(piece_filter.tags) if piece_filter.tags else None}
+        residual = piece_filter.without("tags")
+        if piece_filter.spaces and self.supports_space_filter:
+            native["spaces"] = list(piece_filter.spaces)
+            residual = residual.without("spaces")
+        return self._search_with_residual(
+            lambda k: self.search(
+                query, entity_id=entity_id, knowledge_type=knowledge_type, top_k=k, **native
+            ),
+            residual,
+            top_k,
+        )
+
+    @staticmethod
+    def _search_with_residual(
+        search_fn: Callable[[int], List[Tuple[KnowledgePiece, float]]],
+        residual: PieceFilter,
+        top_k: int,
+    ) -> List[Tuple[KnowledgePiece, float]]:
+        """Run ``search_fn(k)`` and apply the ``residual`` filter in Python.
+
+        With an empty residual this is a single ``top_k`` search. Otherwise
+        fetches 5× ``top_k``, and 20× if too few results match and the first
+        fetch came back full.
+        """
+        if residual.is_empty():
+            return search_fn(top_k)[:top_k]
+        fetch_k = top_k * 5
+        results = search_fn(fetch_k)
+        pieces = [(p, s) for p, s in results if residual.matches(p)]
+        if len(pieces) < top_k and len(results) >= fetch_k:
+            results = search_fn(top_k * 20)
+            pieces = [(p, s) for p, s in results if residual.matches(p)]
+        return pieces[:top_k]
+
+    def add_many(
+        self,
+        pieces: Iterable[KnowledgePiece],
+        skip_duplicates: bool = False,
+    ) -> List[str]:
+        """Add several knowledge pieces.
+
+        Duplicate piece_ids (already stored, or repeated within ``pieces``)
+        are detected before anything is written.
+
+        Args:
+            pieces: The KnowledgePieces to add.
+            skip_duplicates: If True, duplicates are skipped instead of
+                raising.
+
+        Returns:
+            The piece_ids that were added, in input order.
+
+        Raises:
+            ValueError: If any piece_id is a duplicate and ``skip_duplicates``
+                is False. No piece is added in that case.
+        """
+        to_add: List[KnowledgePiece] = []
+        duplicates: List[str] = []
+        seen = set()
+        for piece in pieces:
+            if piece.piece_id in seen or self.get_by_id(piece.piece_id) is not None:
+                duplicates.append(piece.piece_id)
+                continue
+            seen.add(piece.piece_id)
+            to_add.append(piece)
+        if duplicates and not skip_duplicates:
+            raise ValueError(f"Duplicate piece_id(s): {sorted(set(duplicates))}")
+        return [self.add(piece) for piece in to_add]
+
+    def update_many(self, pieces: Iterable[KnowledgePiece]) -> List[str]:
+        """Update several existing knowledge pieces.
+
+        Args:
+            pieces: The KnowledgePieces with updated fields.
+
+        Returns:
+            The piece_ids that were found and updated.
+        """
+        return [piece.piece_id for piece in pieces if self.update(piece)]
+
+    def remove_many(self, piece_ids: Iterable[str]) -> List[str]:
+        """Remove several knowledge pieces.
+
+        Args:
+            piece_ids: The identifiers of the pieces to remove.
+
+        Returns:
+            The piece_ids that existed and were removed.
+        """
+        return [piece_id for piece_id in piece_ids if self.remove(piece_id)]
+
+    @contextmanager
+    def bulk_session(self) -> Iterator["KnowledgePieceStore"]:
+        """Group many writes, deferring index maintenance until exit.
+
+        Sessions may be nested; deferred work runs when the outermost session
+        exits (also on error, since writes already made must stay searchable).
+        The default implementation is a no-op.
+
+        Yields:
+            This store.
+        """
+        yield self
+
+    def get_by_ids(self, piece_ids: Iterable[str]) -> Dict[str, KnowledgePiece]:
+        """Get several knowledge pieces by their IDs.
+
+        The default implementation calls ``get_by_id`` once per ID.
+        Subclasses should override with a single batched lookup.
+
+        Args:
+            piece_ids: The identifiers of the pieces to fetch. Repeated IDs
+                are looked up once.
+
+        Returns:
+            Dict mapping piece_id to KnowledgePiece for the IDs that were
+            found, in first-seen input order. Missing IDs are omitted.
+        """
+        found: Dict[str, KnowledgePiece] = {}
+        for piece_id in dict.fromkeys(piece_ids):
+            piece = self.get_by_id(piece_id)
+            if piece is not None:
+                found[piece_id] = piece
+        return found
+
     def find_by_content_hash(
         self,
         content_hash: str,
@@ -165,7 +405,7 @@ class KnowledgePieceStore(ABC):
     ) -> Optional[KnowledgePiece]:
         """Find a piece by its content hash.
 
-        Default implementation does a linear scan over all pieces.
+        Default implementation does a linear scan with ``iter_all``.
         Subclasses should override with indexed lookup for better performance.
 
         Args:
@@ -175,17 +415,91 @@ class KnowledgePieceStore(ABC):
         Returns:
             The matching piece if found, None otherwise.
         """
-        for piece in self.list_all(entity_id=None):
+        for piece in self.iter_all(entity_id=None):
             if getattr(piece, "content_hash", None) == content_hash:
                 return piece
 
         if entity_id:
-            for piece in self.list_all(entity_id=entity_id):
+            for piece in self.iter_all(entity_id=entity_id):
                 if getattr(piece, "content_hash", None) == content_hash:
                     return piece
 
         return None
 
+    def find_by_content_hashes(
+        self,
+        content_hashes: Iterable[str],
+        entity_id: Optional[str] = None,
+    ) -> Dict[str, KnowledgePiece]:
+        """Find pieces for several content hashes at once.
+
+        Same matching rules as ``find_by_content_hash`` (global pieces
+        first, then ``entity_id``'s), but the default implementation
+        answers all hashes in one ``iter_all`` pass per scope instead of
+        one scan per hash. Subclasses with an index should override it.
+
+        Args:
+            content_hashes: The hashes to look up. Repeats are looked up once.
+            entity_id: If provided, also check entity-scoped pieces.
+
+        Returns:
+            Dict from content hash to matching piece, in first-seen input
+            order. Hashes without a match are omitted.
+        """
+        wanted = [h for h in dict.fromkeys(content_hashes) if h]
+        found: Dict[str, KnowledgePiece] = {}
+        scopes = [None] if not entity_id else [None, entity_id]
+        for scope in scopes:
+            missing = set(wanted) - found.keys()
+            if not missing:
+                break
+            for piece in self.iter_all(entity_id=scope):
+                content_hash = getattr(piece, "content_hash", None)
+                if content_hash in missing:
+                    found[content_hash] = piece
+                    missing.discard(content_hash)
+                    if not missing:
+                        break
+        return {h: found[h] for h in wanted if h in found}
+
+    # ── Async API ────────────────────────────────────────────────────────
+
+    async def aadd(self, piece: KnowledgePiece) -> str:
+        """Async counterpart of ``add()``."""
+        return await run_blocking(self.add, piece)
+
+    async def aget_by_id(self, piece_id: str) -> Optional[KnowledgePiece]:
+        """Async counterpart of ``get_by_id()``."""
+        return await run_blocking(self.get_by_id, piece_id)
+
+    async def aget_by_ids(self, piece_ids: Iterable[str]) -> Dict[str, KnowledgePiece]:
+        """Async counterpart of ``get_by_ids()``."""
+        return await run_blocking(self.get_by_ids, list(piece_ids))
+
+    async def aupdate(self, piece: KnowledgePiece) -> bool:
+        """Async counterpart of ``update()``."""
+        return await run_blocking(self.update, piece)
+
+    async def aremove(self, piece_id: str) -> bool:
+        """Async counterpart of ``remove()``."""
+        return await run_blocking(self.remove, piece_id)
+
+    async def asearch(self, query: str, **kwargs) -> List[Tuple[KnowledgePiece, float]]:
+        """Async counterpart of ``search()`` (same keyword arguments)."""
+        return await run_blocking(self.search, query, **kwargs)
+
+    async def alist_all(self, **kwargs) -> List[KnowledgePiece]:
+        """Async counterpart of ``list_all()`` (same keyword arguments)."""
+        return await run_blocking(self.list_all, **kwargs)
+
+    async def aadd_many(
+        self,
+        pieces: Iterable[KnowledgePiece],
+        skip_duplicates: bool = False,
+    ) -> List[str]:
+        """Async counterpart of ``add_many()``."""
+        return await run_blocking(self.add_many, list(pieces), skip_duplicates)
+
     def close(self):
         """Close any underlying connections.
 
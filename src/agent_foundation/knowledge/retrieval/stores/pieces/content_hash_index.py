@@ -0,0 +1,146 @@
+"""
+ContentHashIndex — in-memory secondary index from content hash to piece ids.
+
+Tier 1 deduplication and ingestion look pieces up by ``content_hash``.
+Stores whose backend cannot filter on that field natively keep this index
+next to the backend: it is built once from a full scan (or loaded from a
+JSON file saved by an earlier run) and kept current by the store's
+``add`` / ``update`` / ``remove``.
+
+Entries are keyed by entity scope: global pieces (``entity_id=None``) and
+each entity's pieces are separate scopes, and lookups check the global
+scope before the entity's own, like ``find_by_content_hash``.
+"""
+import json
+import os
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from agent_foundation.knowledge.retrieval.models.knowledge_piece import KnowledgePiece
+
+_FORMAT_VERSION = 1
+
+_Key = Tuple[Optional[str], str]
+
+
+class ContentHashIndex:
+    """Thread-safe map from ``(entity_id, content_hash)`` to piece ids.
+
+    A piece is indexed under at most one key; re-adding a piece id moves
+    it to its new key, which is how updates that change content are
+    tracked. When several pieces share a key, lookups return the earliest
+    indexed one.
+    """
+
+    def __init__(self):
+        self._ids_by_key: Dict[_Key, Dict[str, None]] = {}
+        self._key_by_id: Dict[str, _Key] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._key_by_id)
+
+    def __contains__(self, piece_id: str) -> bool:
+        with self._lock:
+            return piece_id in self._key_by_id
+
+    @classmethod
+    def build(cls, pieces: Iterable[KnowledgePiece]) -> "ContentHashIndex":
+        """Create an index over ``pieces``."""
+        index = cls()
+        for piece in pieces:
+            index.add(piece)
+        return index
+
+    def add(self, piece: KnowledgePiece) -> None:
+        """Index ``piece``, replacing any earlier entry for its piece id."""
+        with self._lock:
+            self._put(piece.piece_id, piece.entity_id, piece.content_hash)
+
+    def discard(self, piece_id: str) -> None:
+        """Remove the entry for ``piece_id``, if any."""
+        with self._lock:
+            self._drop(piece_id)
+
+    def lookup(self, content_hash: str, entity_id: Optional[str] = None) -> Optional[str]:
+        """Return the id of a piece with this hash, or None.
+
+        Global pieces are checked first, then ``entity_id``'s pieces.
+        """
+        return self.lookup_many([content_hash], entity_id).get(content_hash)
+
+    def lookup_many(
+        self,
+        content_hashes: Iterable[str],
+        entity_id: Optional[str] = None,
+    ) -> Dict[str, str]:
+        """Map each hash that is indexed to the id of a matching piece.
+
+        Args:
+            content_hashes: The hashes to check. Repeats are checked once.
+            entity_id: If provided, also check this entity's pieces.
+
+        Returns:
+            Dict from content hash to piece id, in first-seen input order.
+            Hashes without a match are omitted.
+        """
+        scopes = [None] if not entity_id else [None, entity_id]
+        found: Dict[str, str] = {}
+        with self._lock:
+            for content_hash in dict.fromkeys(content_hashes):
+                for scope in scopes:
+                    ids = self._ids_by_key.get((scope, content_hash))
+                    if ids:
+                        found[content_hash] = next(iter(ids))
+                        break
+        return found
+
+    def save(self, path: str) -> None:
+        """Write the index to ``path`` as JSON (atomically replaced)."""
+        with self._lock:
+            entries = [
+                [piece_id, entity_id, content_hash]
+                for piece_id, (entity_id, content_hash) in self._key_by_id.items()
+            ]
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": _FORMAT_VERSION, "entries": entries}, f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> "ContentHashIndex":
+        """Read an index written by ``save``.
+
+        Raises:
+            ValueError: If the file is not a saved content-hash index.
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or data.get("version") != _FORMAT_VERSION:
+            raise ValueError(f"Unsupported content hash index file: {path}")
+        index = cls()
+        for piece_id, entity_id, content_hash in data.get("entries", []):
+            index._put(piece_id, entity_id, content_hash)
+        return index
+
+    def _put(self, piece_id: str, entity_id: Optional[str], content_hash: Optional[str]) -> None:
+        self._drop(piece_id)
+        if not content_hash:
+            return
+        key = (entity_id, content_hash)
+        self._ids_by_key.setdefault(key, {})[piece_id] = None
+        self._key_by_id[piece_id] = key
+
+    def _drop(self, piece_id: str) -> None:
+        key = self._key_by_id.pop(piece_id, None)
+        if key is None:
+            return
+        ids = self._ids_by_key.get(key)
+        if ids is not None:
+            ids.pop(piece_id, None)
+            if not ids:
+                del self._ids_by_key[key]
@@ -0,0 +1,114 @@
+"""
+PieceFilter — backend-neutral filter expression for knowledge piece search.
+
+A ``PieceFilter`` describes which pieces a search may return. Stores that
+can evaluate it inside the backend (``supports_filter_pushdown``) compile
+it to their native filter language — LanceDB ``where`` clauses, retrieval
+service metadata filters — so ``top_k`` is honoured without over-fetching.
+Everything a store cannot compile is evaluated in Python with ``matches()``.
+
+Semantics (all set conditions are ANDed; None means "no constraint"):
+    - ``spaces``: the piece belongs to at least one of these spaces.
+    - ``tags``: the piece carries all of these tags (case-insensitive).
+    - ``domains``: the piece's primary domain is one of these.
+    - ``created_since`` / ``created_before``: ``created_at`` lies in
+      ``[created_since, created_before)``. Bounds are ISO-8601 strings (or
+      datetimes, converted to UTC ISO-8601) and compare lexicographically
+      with the stored timestamps, which are UTC ISO-8601.
+    - ``is_active``: the piece's active flag equals this value.
+    - ``validation_statuses``: the piece's validation status is one of these.
+"""
+from datetime import datetime, timezone
+from typing import Optional, Sequence, Tuple, Union
+
+from attr import attrib, attrs, evolve
+
+from agent_foundation.knowledge.retrieval.models.knowledge_piece import KnowledgePiece
+
+TimestampLike = Union[str, datetime]
+
+
+def _optional_tuple(values: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+    """Convert a sequence to a de-duplicated tuple; empty or None -> None."""
+    if not values:
+        return None
+    return tuple(dict.fromkeys(values))
+
+
+def _optional_tags(values: Optional[Sequence[str]]) -> Optional[Tuple[str, ...]]:
+    """Normalize tags like ``KnowledgePiece`` does (strip, lowercase)."""
+    if not values:
+        return None
+    return _optional_tuple([t.strip().lower() for t in values if t.strip()])
+
+
+def _optional_timestamp(value: Optional[TimestampLike]) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+@attrs(frozen=True)
+class PieceFilter:
+    """Filter expression over knowledge pieces.
+
+    Instances are immutable and hashable, so they can key search caches.
+
+    Attributes:
+        spaces: Match pieces in any of these spaces.
+        tags: Match pieces carrying all of these tags.
+        domains: Match pieces whose primary domain is one of these.
+        created_since: Inclusive lower bound on ``created_at``.
+        created_before: Exclusive upper bound on ``created_at``.
+        is_active: Match pieces with this active flag.
+        validation_statuses: Match pieces in any of these validation states.
+    """
+
+    spaces: Optional[Tuple[str, ...]] = attrib(default=None, converter=_optional_tuple)
+    tags: Optional[Tuple[str, ...]] = attrib(default=None, converter=_optional_tags)
+    domains: Optional[Tuple[str, ...]] = attrib(default=None, converter=_optional_tuple)
+    created_since: Optional[str] = attrib(default=None, converter=_optional_timestamp)
+    created_before: Optional[str] = attrib(default=None, converter=_optional_timestamp)
+    is_active: Optional[bool] = attrib(default=None)
+    validation_statuses: Optional[Tuple[str, ...]] = attrib(
+        default=None, converter=_optional_tuple
+    )
+
+    def is_empty(self) -> bool:
+        """Whether the filter places no constraint at all."""
+        return self == _EMPTY
+
+    def matches(self, piece: KnowledgePiece) -> bool:
+        """Evaluate the filter against a piece in Python."""
+        if self.spaces is not None and not any(s in self.spaces for s in piece.spaces):
+            return False
+        if self.tags is not None and not all(t in piece.tags for t in self.tags):
+            return False
+        if self.domains is not None and getattr(piece, "domain", "general") not in self.domains:
+            return False
+        created_at = piece.created_at or ""
+        if self.created_since is not None and created_at < self.created_since:
+            return False
+        if self.created_before is not None and created_at >= self.created_before:
+            return False
+        if self.is_active is not None and piece.is_active != self.is_active:
+            return False
+        if (
+            self.validation_statuses is not None
+            and piece.validation_status not in self.validation_statuses
+        ):
+            return False
+        return True
+
+    def without(self, *fields: str) -> "PieceFilter":
+        """Return a copy with the given constraints removed.
+
+        Stores use it to compute the residual filter left after compiling
+        the parts their backend supports.
+        """
+        return evolve(self, **{name: None for name in fields})
+
+
+_EMPTY = PieceFilter()
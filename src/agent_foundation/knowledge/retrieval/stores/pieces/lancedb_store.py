@@ -9,32 +9,58 @@ the most capable knowledge piece store — it indexes both ``embedding_text``
 Architecture:
     - A single LanceDB table stores knowledge pieces with columns for
       piece_id, content, embedding_text, knowledge_type, tags (JSON string),
-      entity_id, source, created_at, updated_at, and vector.
+      entity_id, source, created_at, updated_at, and vector. ``created_at_epoch``
+      / ``updated_at_epoch`` hold the timestamps as POSIX seconds, written
+      once at insert and seeded into loaded pieces for temporal scoring.
     - The ``embedding_function`` parameter is required and must be a callable
       that accepts a string and returns a list of floats (the embedding vector).
       Typically ``SentenceTransformer('all-MiniLM-L6-v2').encode``.
     - Search performs separate vector ANN and BM25 FTS queries, then combines
       scores: ``score = hybrid_alpha * vector_score + (1 - hybrid_alpha) * bm25_score``
     - ``hybrid_alpha`` defaults to 0.7 (70% vector, 30% BM25).
-    - Tag filtering is done post-query since LanceDB doesn't support JSON
-      array containment.
+    - ``search_filtered`` compiles a ``PieceFilter`` (spaces, tags, domains,
+      created_at range, active flag, validation status) into the WHERE
+      clause; tags, stored as a JSON string, match via ``LIKE '%"tag"%'``.
+      ``search`` delegates to it, so top-k needs no over-fetch.
     - Both vector and BM25 scores are normalized to [0.0, 1.0] before combining.
+    - The vector and BM25 queries run concurrently (``parallel_search_legs``);
+      per-leg latency is logged at DEBUG level.
+    - ``add_many`` / ``update_many`` / ``remove_many`` embed in batches, check
+      existing ids with one ``IN`` query per chunk and write with a single
+      table operation. Inside ``bulk_session()`` the FTS index rebuild is
+      deferred to the end of the session instead of running per write.
+    - ``iter_all`` streams rows through the Lance dataset scanner in record
+      batches (offset/limit pages as a fallback), so full scans neither load
+      the table at once nor stop at ``list_all``'s row limit.
+    - ``content_hash`` has a scalar (BTREE) index, created with the table or
+      on first open. ``find_by_content_hashes`` answers many hashes with one
+      ``IN`` query per chunk; rows appended since the index was built are
+      still found (LanceDB scans unindexed fragments) until the table is
+      optimized.
 
 Requirements: 2.1, 2.2, 2.3, 2.4, 2.5, 2.6, 2.7, 4.2, 4.4, 4.6
 """
 import json
 import logging
 import os
+import time
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 from attr import attrs, attrib
 
+from agent_foundation.knowledge.retrieval.async_executor import (
+    get_search_leg_executor,
+    in_search_leg_worker,
+)
 from agent_foundation.knowledge.retrieval.models.knowledge_piece import (
     KnowledgePiece,
     KnowledgeType,
 )
 from agent_foundation.knowledge.retrieval.stores.pieces.base import KnowledgePieceStore
+from agent_foundation.knowledge.retrieval.stores.pieces.filters import PieceFilter
+from agent_foundation.knowledge.retrieval.utils import iso_to_epoch
 from rich_python_utils.service_utils.data_operation_record import DataOperationRecord
 
 logger = logging.getLogger(__name__)
@@ -42,6 +68,21 @@ logger = logging.getLogger(__name__)
 # Sentinel value for global pieces (entity_id=None) in LanceDB.
 _GLOBAL_ENTITY_SENTINEL = "__global__"
 
+# Maximum number of ids per ``piece_id IN (...)`` clause.
+_MAX_IDS_PER_QUERY = 500
+
+# Rows per record batch when a schema migration rewrites the table.
+_MIGRATION_BATCH_SIZE = 10000
+
+
+def _epoch_column(epoch):
+    return float("nan") if epoch is None else float(epoch)
+
+
+def _epoch_from_column(value):
+    if value is None or value != value:  # missing or NaN
+        return None
+    return float(value)
 
 
 def _piece_to_record(piece, vector):
@@ -56,6 +97,9 @@ def _piece_to_record(piece, vector):
         "source": piece.source or "",
         "created_at": piece.created_at or "",
         "updated_at": piece.updated_at or "",
+        # Pre-parsed timestamps (NaN when unparsable) for scoring without parsing
+        "created_at_epoch": _epoch_column(piece.created_at_epoch),
+        "updated_at_epoch": _epoch_column(piece.updated_at_epoch),
         "vector": vector,
         # New fields
         "domain": piece.domain or "general",
@@ -161,7 +205,7 @@ def _record_to_piece(record):
     history_list = _parse_json_list(history_raw) if history_raw else []
     history = [DataOperationRecord.from_dict(r) for r in history_list if isinstance(r, dict)]
 
-    return KnowledgePiece(
+    piece = KnowledgePiece(
         content=record.get("content", ""),
         piece_id=record.get("piece_id", ""),
         knowledge_type=knowledge_type,
@@ -192,6 +236,11 @@ def _record_to_piece(record):
         space_suggestion_status=space_suggestion_status,
         history=history,
     )
+    piece.set_timestamp_epochs(
+        created_at_epoch=_epoch_from_column(record.get("created_at_epoch")),
+        updated_at_epoch=_epoch_from_column(record.get("updated_at_epoch")),
+    )
+    return piece
 
 
 
@@ -212,25 +261,44 @@ class LanceDBKnowledgePieceStore(KnowledgePieceStore):
     Attributes:
         db_path: Directory for LanceDB data files.
         embedding_function: A callable that accepts a string and returns a
-            list of floats (the embedding vector).
+            list of floats (the embedding vector). Wrap it in an
+            ``EmbeddingCache`` to reuse query and piece embeddings.
         table_name: Name of the LanceDB table.
         hybrid_alpha: Balance between vector and FTS search.
             0.0 = pure FTS, 1.0 = pure vector. Defaults to 0.7.
+        batch_embedding_function: Optional callable that accepts a list of
+            strings and returns one vector per string (e.g.
+            ``SentenceTransformer.encode``). Used by the batch methods;
+            when None they call ``embedding_function`` once per text.
+        embedding_batch_size: Number of texts per batch embedding call.
+        parallel_search_legs: Run the BM25 leg of ``search`` concurrently
+            with the vector leg (query embedding + ANN). Defaults to True.
     """
 
     db_path: str = attrib()
     embedding_function: Callable = attrib()
     table_name: str = attrib(default="knowledge_pieces")
     hybrid_alpha: float = attrib(default=0.7)
+    batch_embedding_function: Optional[Callable] = attrib(default=None)
+    embedding_batch_size: int = attrib(default=64)
+    parallel_search_legs: bool = attrib(default=True)
     _db: Any = attrib(init=False, default=None)
     _table: Any = attrib(init=False, default=None)
     _fts_index_created: bool = attrib(init=False, default=False)
+    _bulk_depth: int = attrib(init=False, default=0)
+    _fts_dirty: bool = attrib(init=False, default=False)
+    _content_hash_indexed: bool = attrib(init=False, default=False)
 
     @property
     def supports_space_filter(self) -> bool:
         """LanceDB natively supports space filtering via SQL WHERE clauses."""
         return True
 
+    @property
+    def query_embedding_function(self):
+        """Queries are embedded with ``embedding_function``."""
+        return self.embedding_function
+
     def __attrs_post_init__(self):
         """Initialize LanceDB connection and open or create the table."""
         import lancedb as _lancedb
@@ -243,16 +311,24 @@ class LanceDBKnowledgePieceStore(KnowledgePieceStore):
             self._table = self._db.open_table(self.table_name)
             self._fts_index_created = True
             self._migrate_schema_if_needed()
+            self._create_content_hash_index()
         else:
             self._table = None
             self._fts_index_created = False
 
     def _migrate_schema_if_needed(self):
-        """Check for missing spaces/primary_space columns and migrate if needed.
+        """Check for missing spaces/primary_space/epoch columns and migrate if needed.
 
         Migration is idempotent — if columns already exist, no action is taken.
-        Derives ``spaces`` from the existing ``space`` column as ``[space]``
-        and sets ``primary_space`` to ``space`` for each existing record.
+        Missing epoch columns are added in place with LanceDB schema
+        evolution; existing rows get NULL epochs and their pieces parse the
+        ISO timestamps lazily until they are next written.
+
+        Missing spaces/history columns need per-row values, so the table is
+        rewritten: rows are streamed from the Lance dataset into a temporary
+        table (``spaces`` derived from ``space`` as ``[space]``,
+        ``primary_space`` set to ``space``), and the original table is only
+        replaced once that copy is complete.
         """
         if self._table is None:
             return
@@ -265,29 +341,98 @@ class LanceDBKnowledgePieceStore(KnowledgePieceStore):
             return
         needs_spaces = "spaces" not in sample[0] or "primary_space" not in sample[0]
         needs_history = "history" not in sample[0]
-        if not needs_spaces and not needs_history:
+        needs_epochs = "updated_at_epoch" not in sample[0]
+        if not needs_spaces and not needs_history and not needs_epochs:
             return  # Already fully migrated
 
+        if needs_spaces or needs_history:
+            # The rewrite computes the epoch columns along the way.
+            self._rewrite_table_for_migration(needs_spaces, needs_history, needs_epochs)
+        elif needs_epochs:
+            self._add_epoch_columns()
+
+    def _add_epoch_columns(self):
+        """Add NULL ``created_at_epoch``/``updated_at_epoch`` columns in place."""
+        logger.info("Adding epoch columns to LanceDB table '%s'...", self.table_name)
+        try:
+            self._table.add_columns({
+                "created_at_epoch": "CAST(NULL AS DOUBLE)",
+                "updated_at_epoch": "CAST(NULL AS DOUBLE)",
+            })
+        except Exception as exc:
+            logger.error("Failed to add epoch columns to LanceDB table '%s': %s", self.table_name, exc)
+
+    def _rewrite_table_for_migration(self, needs_spaces, needs_history, needs_epochs):
+        """Copy every row into a migrated table, swapping it in only on success."""
         logger.info("Migrating LanceDB table '%s' to add spaces columns...", self.table_name)
         try:
-            all_records = self._table.search().limit(100000).to_list()
-            for record in all_records:
-                if needs_spaces:
-                    space = record.get("space", "main")
-                    record["spaces"] = json.dumps([space], ensure_ascii=False)
-                    record["primary_space"] = space
-                    record["pending_space_suggestions"] = ""
-                    record["space_suggestion_reasons"] = ""
-                    record["space_suggestion_status"] = ""
-                if needs_history:
-                    record["history"] = "[]"
-            self._db.drop_table(self.table_name)
-            self._table = self._db.create_table(self.table_name, all_records)
-            self._fts_index_created = False
-            self._create_fts_index()
-            logger.info("Schema migration complete for table '%s' (%d records).", self.table_name, len(all_records))
+            dataset = self._table.to_lance()
+        except Exception as exc:
+            logger.error(
+                "LanceDB schema migration skipped for table '%s': cannot stream rows (%s)",
+                self.table_name, exc,
+            )
+            return
+
+        temp_name = f"{self.table_name}__migration"
+        if temp_name in self._db.table_names():
+            self._db.drop_table(temp_name)
+        temp_table = None
+        row_count = 0
+        try:
+            for batch in dataset.to_batches(batch_size=_MIGRATION_BATCH_SIZE):
+                records = batch.to_pylist()
+                for record in records:
+                    if needs_spaces:
+                        space = record.get("space", "main")
+                        record["spaces"] = json.dumps([space], ensure_ascii=False)
+                        record["primary_space"] = space
+                        record["pending_space_suggestions"] = ""
+                        record["space_suggestion_reasons"] = ""
+                        record["space_suggestion_status"] = ""
+                    if needs_history:
+                        record["history"] = "[]"
+                    if needs_epochs:
+                        record["created_at_epoch"] = _epoch_column(iso_to_epoch(record.get("created_at")))
+                        record["updated_at_epoch"] = _epoch_column(iso_to_epoch(record.get("updated_at")))
+                if not records:
+                    continue
+                if temp_table is None:
+                    temp_table = self._db.create_table(temp_name, records)
+                else:
+                    temp_table.add(records)
+                row_count += len(records)
         except Exception as exc:
+            # The original table is untouched; discard the partial copy.
             logger.error("LanceDB schema migration failed for table '%s': %s", self.table_name, exc)
+            if temp_table is not None:
+                self._db.drop_table(temp_name)
+            return
+        if temp_table is None:
+            return
+
+        try:
+            self._db.drop_table(self.table_name)
+            self._table = self._db.create_table(
+                self.table_name,
+                temp_table.to_lance().to_batches(batch_size=_MIGRATION_BATCH_SIZE),
+                schema=temp_table.schema,
+            )
+        except Exception as exc:
+            # The migrated rows are still in the temporary table.
+            logger.error(
+                "LanceDB schema migration failed to replace table '%s'; "
+                "all %d rows are kept in table '%s': %s",
+                self.table_name, row_count, temp_name, exc,
+            )
+            self._table = temp_table
+            return
+        self._db.drop_table(temp_name)
+        self._fts_index_created = False
+        self._create_fts_index()
+        self._content_hash_indexed = False
+        self._create_content_hash_index()
+        logger.info("Schema migration complete for table '%s' (%d records).", self.table_name, row_count)
 
     def _ensure_table(self, first_record):
         """Create the table with the first record if it doesn't exist yet."""
@@ -295,6 +440,7 @@ class LanceDBKnowledgePieceStore(KnowledgePieceStore):
             return
         self._table = self._db.create_table(self.table_name, [first_record])
         self._create_fts_index()
+        self._create_content_hash_index()
 
     def _create_fts_index(self):
         """Create the FTS index on the content column for BM25 search."""
@@ -306,6 +452,22 @@ class LanceDBKnowledgePieceStore(KnowledgePieceStore):
         except Exception as exc:
             logger.warning("Failed to create FTS index: %s", exc)
 
+    def _create_content_hash_index(self):
+        """Create the scalar index on content_hash unless the table has one."""
+        if self._content_hash_indexed or self._table is None:
+            return
+        try:
+            indexed_columns = {
+                column
+                for index in self._table.list_indices()
+                for column in (getattr(index, "columns", None) or [])
+            }
+            if "content_hash" not in indexed_columns:
+                self._table.create_scalar_index("content_hash")
+            self._content_hash_indexed = True
+        except Exception as exc:
+            logger.warning("Failed to create content_hash scalar index: %s", exc)
+
     def _embed(self, text):
         """Embed a text string using the configured embedding function."""
         result = self.embedding_function(text)
@@ -313,6 +475,33 @@ class LanceDBKnowledgePieceStore(KnowledgePieceStore):
             return result.tolist()
         return list(result)
 
+    def _embed_many(self, texts):
+        """Embed a list of texts, batching when a batch function is configured."""
+        if self.batch_embedding_function is None:
+            return [self._embed(text) for text in texts]
+        vectors = []
+        size = max(1, self.embedding_batch_size)
+        for start in range(0, len(texts), size):
+            for vector in self.batch_embedding_function(texts[start:start + size]):
+                vectors.append(vector.tolist() if hasattr(vector, "tolist") else list(vector))
+        return vectors
+
+    def _existing_piece_ids(self, piece_ids):
+        """Return the subset of ``piece_ids`` already stored (one query per chunk)."""
+        found: Set[str] = set()
+        if self._table is None or not piece_ids:
+            return found
+        for where, size in _piece_id_in_clauses(piece_ids):
+            rows = (
+                self._table.search()
+                .where(where)
+                .select(["piece_id"])
+                .limit(size)
+                .to_list()
+            )
+            found.update(row.get("piece_id") for row in rows)
+        return found
+
     def add(self, piece):
         """Add a knowledge piece to the LanceDB table.
 
@@ -342,6 +531,109 @@ class LanceDBKnowledgePieceStore(KnowledgePieceStore):
 
         return piece.piece_id
 
+    def add_many(self, pieces, skip_duplicates=False):
+        """Add pieces with one dedup query, batched embedding and one write.
+
+        Raises ValueError (before writing anything) if any piece_id already
+        exists or repeats within ``pieces``, unless ``skip_duplicates``.
+        Returns the added piece_ids in input order.
+        """
+        to_add = []
+        duplicates = []
+        seen = set()
+        for piece in pieces:
+            if piece.piece_id in seen:
+                duplicates.append(piece.piece_id)
+                continue
+            seen.add(piece.piece_id)
+            to_add.append(piece)
+
+        existing = self._existing_piece_ids([p.piece_id for p in to_add])
+        if existing:
+            duplicates.extend(p.piece_id for p in to_add if p.piece_id in existing)
+            to_add = [p for p in to_add if p.piece_id not in existing]
+        if duplicates and not skip_duplicates:
+            raise ValueError(f"Duplicate piece_id(s): {sorted(set(duplicates))}")
+        if not to_add:
+            return []
+
+        vectors = self._embed_many([_get_embedding_text(p) for p in to_add])
+        records = [_piece_to_record(p, v) for p, v in zip(to_add, vectors)]
+        if self._table is None:
+            self._table = self._db.create_table(self.table_name, records)
+            self._create_fts_index()
+            self._create_content_hash_index()
+        else:
+            self._table.add(records)
+            self._rebuild_fts_index()
+        return [p.piece_id for p in to_add]
+
+    def update_many(self, pieces):
+        """Update existing pieces with one lookup, batched embedding and one write.
+
+        Pieces whose piece_id is not stored are ignored. Returns the updated
+        piece_ids in input order.
+        """
+        if self._table is None:
+            return []
+        # Last occurrence wins if a piece_id repeats.
+        by_id = {}
+        for piece in pieces:
+            by_id[piece.piece_id] = piece
+        existing = self._existing_piece_ids(list(by_id))
+        to_update = [p for pid, p in by_id.items() if pid in existing]
+        if not to_update:
+            return []
+
+        now = datetime.now(timezone.utc).isoformat()
+        for piece in to_update:
+            piece.updated_at = now
+        vectors = self._embed_many([_get_embedding_text(p) for p in to_update])
+        records = [_piece_to_record(p, v) for p, v in zip(to_update, vectors)]
+
+        merge_insert = getattr(self._table, "merge_insert", None)
+        if merge_insert is not None:
+            merge_insert("piece_id").when_matched_update_all().execute(records)
+        else:
+            for where, _ in _piece_id_in_clauses([p.piece_id for p in to_update]):
+                self._table.delete(where)
+            self._table.add(records)
+        self._rebuild_fts_index()
+        return [p.piece_id for p in to_update]
+
+    def remove_many(self, piece_ids):
+        """Remove pieces with one lookup and one delete per id chunk.
+
+        Returns the removed piece_ids in input order.
+        """
+        if self._table is None:
+            return []
+        piece_ids = list(dict.fromkeys(piece_ids))
+        existing = self._existing_piece_ids(piece_ids)
+        removed = [pid for pid in piece_ids if pid in existing]
+        if not removed:
+            return []
+        for where, _ in _piece_id_in_clauses(removed):
+            self._table.delete(where)
+        self._rebuild_fts_index()
+        return removed
+
+    @contextmanager
+    def bulk_session(self):
+        """Defer FTS index rebuilds until the outermost session exits.
+
+        While a session is open, full-text search does not see rows written
+        in the session (vector search does). The index is rebuilt once on
+        exit, including when the session body raises.
+        """
+        self._bulk_depth += 1
+        try:
+            yield self
+        finally:
+            self._bulk_depth -= 1
+            if self._bulk_depth == 0 and self._fts_dirty:
+                self._rebuild_fts_index()
+
     def get_by_id(self, piece_id):
         """Get a knowledge piece by its ID."""
         if self._table is None:
@@ -360,6 +652,26 @@ class LanceDBKnowledgePieceStore(KnowledgePieceStore):
             return None
         return _record_to_piece(results[0])
 
+    def get_by_ids(self, piece_ids):
+        """Get several knowledge pieces with one ``IN`` query per chunk of IDs."""
+        piece_ids = list(dict.fromkeys(piece_ids))
+        if self._table is None or not piece_ids:
+            return {}
+        records = {}
+        for where, size in _piece_id_in_clauses(piece_ids):
+            try:
+                rows = self._table.search().where(where).limit(size).to_list()
+            except Exception as exc:
+                logger.warning("LanceDB get_by_ids error for %d ids: %s", size, exc)
+                continue
+            for row in rows:
+                records[row.get("piece_id")] = row
+        return {
+            pid: _record_to_piece(records[pid])
+            for pid in piece_ids
+            if pid in records
+        }
+
     def update(self, piece):
         """Update an existing knowledge piece. Returns True if found and updated."""
         if self._table is None:
@@ -405,66 +717,85 @@ class LanceDBKnowledgePieceStore(KnowledgePieceStore):
         self._rebuild_fts_index()
         return True
 
-    def search(self, query, entity_id=None, knowledge_type=None, tags=None, top_k=5, spaces=None):
+    @property
+    def supports_filter_pushdown(self) -> bool:
+        """``PieceFilter`` constraints compile to the LanceDB WHERE clause."""
+        return True
+
+    def search(
+        self, query, entity_id=None, knowledge_type=None, tags=None, top_k=5, spaces=None,
+        query_vector=None,
+    ):
         """Hybrid search combining vector similarity and BM25 full-text search.
 
         score = hybrid_alpha * vector_score + (1 - hybrid_alpha) * bm25_score
         Both vector and BM25 scores are normalized to [0.0, 1.0] before combining.
+
+        ``query_vector`` is an optional precomputed embedding of ``query``
+        (made with ``embedding_function``); when given, the query is not
+        embedded again.
+        """
+        return self.search_filtered(
+            query,
+            PieceFilter(spaces=spaces, tags=tags),
+            entity_id=entity_id,
+            knowledge_type=knowledge_type,
+            top_k=top_k,
+            query_vector=query_vector,
+        )
+
+    def search_filtered(
+        self, query, piece_filter=None, entity_id=None, knowledge_type=None, top_k=5,
+        query_vector=None,
+    ):
+        """Hybrid search restricted to pieces matching ``piece_filter``.
+
+        The whole filter (tags included) is part of the WHERE clause of both
+        the vector and the FTS query, so each leg fetches exactly ``top_k``.
+        Returned pieces are re-checked with ``PieceFilter.matches`` in case
+        a JSON-encoded tag pattern matched more than intended.
         """
         if not query or not query.strip():
             return []
         if self._table is None:
             return []
 
-        where_clause = _build_where_clause(entity_id, knowledge_type, spaces=spaces)
-        fetch_limit = top_k * 5 if tags else top_k
-
-        # Vector search
-        vector_scores = {}
-        try:
-            query_vector = self._embed(query)
-            vector_builder = self._table.search(query_vector).metric("cosine")
-            if where_clause:
-                vector_builder = vector_builder.where(where_clause)
-            vector_results = vector_builder.limit(fetch_limit).to_list()
-
-            if vector_results:
-                for row in vector_results:
-                    pid = row.get("piece_id", "")
-                    distance = row.get("_distance", 1.0)
-                    score = max(0.0, 1.0 - distance)
-                    vector_scores[pid] = score
-        except Exception as exc:
-            logger.warning("LanceDB vector search error: %s", exc)
-
-        # FTS (BM25) search
-        bm25_scores = {}
-        if self._fts_index_created:
-            try:
-                fts_builder = self._table.search(query, query_type="fts")
-                if where_clause:
-                    fts_builder = fts_builder.where(where_clause)
-                fts_results = fts_builder.limit(fetch_limit).to_list()
-
-                if fts_results:
-                    raw_scores = []
-                    for row in fts_results:
-                        pid = row.get("piece_id", "")
-                        score = row.get("_score", 0.0)
-                        if score is None:
-                            score = 0.0
-                        raw_scores.append((pid, float(score)))
-
-                    if raw_scores:
-                        max_score = max(s for _, s in raw_scores)
-                        if max_score > 0:
-                            for pid, raw in raw_scores:
-                                bm25_scores[pid] = raw / max_score
-                        else:
-                            for pid, _ in raw_scores:
-                                bm25_scores[pid] = 0.0
-            except Exception as exc:
-                logger.warning("LanceDB FTS search error: %s", exc)
+        piece_filter = piece_filter or PieceFilter()
+        where_clause = _build_where_clause(
+            entity_id, knowledge_type, piece_filter=piece_filter
+        )
+        fetch_limit = top_k
+
+        # The FTS leg runs on the search-leg executor while the vector leg
+        # (including query embedding) runs here. When this search is itself
+        # a HybridRetriever leg, both run inline.
+        timings = {}
+        fts_future = None
+        if (
+            self._fts_index_created
+            and self.parallel_search_legs
+            and not in_search_leg_worker()
+        ):
+            fts_future = get_search_leg_executor().submit(
+                self._timed_leg, timings, "fts", self._fts_scores,
+                query, where_clause, fetch_limit,
+            )
+        vector_scores = self._timed_leg(
+            timings, "vector", self._vector_scores,
+            query, query_vector, where_clause, fetch_limit,
+        )
+        if fts_future is not None:
+            bm25_scores = fts_future.result()
+        elif self._fts_index_created:
+            bm25_scores = self._timed_leg(
+                timings, "fts", self._fts_scores, query, where_clause, fetch_limit,
+            )
+        else:
+            bm25_scores = {}
+        logger.debug(
+            "LanceDB hybrid search legs: %s",
+            ", ".join(f"{leg}={secs * 1000:.1f}ms" for leg, secs in timings.items()),
+        )
 
         # Combine scores
         all_piece_ids = set(vector_scores.keys()) | set(bm25_scores.keys())
@@ -478,26 +809,80 @@ class LanceDBKnowledgePieceStore(KnowledgePieceStore):
             b_score = bm25_scores.get(pid, 0.0)
             combined[pid] = alpha * v_score + (1.0 - alpha) * b_score
 
-        # Retrieve full pieces and apply tag filtering
+        # Retrieve full pieces in one round trip
+        pieces = self.get_by_ids(list(combined))
         scored_pieces = []
         for pid, score in combined.items():
-            piece = self.get_by_id(pid)
-            if piece is None:
+            piece = pieces.get(pid)
+            if piece is None or not piece_filter.matches(piece):
                 continue
             score = max(0.0, min(1.0, score))
             scored_pieces.append((piece, score))
 
-        if tags:
-            filter_tags = {t.strip().lower() for t in tags if t.strip()}
-            scored_pieces = [
-                (piece, score)
-                for piece, score in scored_pieces
-                if filter_tags.issubset(set(piece.tags))
-            ]
-
         scored_pieces.sort(key=lambda x: (-x[1], x[0].piece_id))
         return scored_pieces[:top_k]
 
+    @staticmethod
+    def _timed_leg(timings, name, fn, *args):
+        started = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            timings[name] = time.perf_counter() - started
+
+    def _vector_scores(self, query, query_vector, where_clause, limit):
+        """Vector ANN leg of ``search``: piece_id -> cosine similarity."""
+        vector_scores = {}
+        try:
+            if query_vector is None:
+                query_vector = self._embed(query)
+            elif hasattr(query_vector, "tolist"):
+                query_vector = query_vector.tolist()
+            vector_builder = self._table.search(query_vector).metric("cosine")
+            if where_clause:
+                vector_builder = vector_builder.where(where_clause)
+            vector_results = vector_builder.limit(limit).to_list()
+
+            if vector_results:
+                for row in vector_results:
+                    pid = row.get("piece_id", "")
+                    distance = row.get("_distance", 1.0)
+                    score = max(0.0, 1.0 - distance)
+                    vector_scores[pid] = score
+        except Exception as exc:
+            logger.warning("LanceDB vector search error: %s", exc)
+        return vector_scores
+
+    def _fts_scores(self, query, where_clause, limit):
+        """BM25 FTS leg of ``search``: piece_id -> max-normalized BM25 score."""
+        bm25_scores = {}
+        try:
+            fts_builder = self._table.search(query, query_type="fts")
+            if where_clause:
+                fts_builder = fts_builder.where(where_clause)
+            fts_results = fts_builder.limit(limit).to_list()
+
+            if fts_results:
+                raw_scores = []
+                for row in fts_results:
+                    pid = row.get("piece_id", "")
+                    score = row.get("_score", 0.0)
+                    if score is None:
+                        score = 0.0
+                    raw_scores.append((pid, float(score)))
+
+                if raw_scores:
+                    max_score = max(s for _, s in raw_scores)
+                    if max_score > 0:
+                        for pid, raw in raw_scores:
+                            bm25_scores[pid] = raw / max_score
+                    else:
+                        for pid, _ in raw_scores:
+                            bm25_scores[pid] = 0.0
+        except Exception as exc:
+            logger.warning("LanceDB FTS search error: %s", exc)
+        return bm25_scores
+
     def list_all(self, entity_id=None, knowledge_type=None, spaces=None, limit=10000):
         """List all pieces matching the given filters.
 
@@ -506,8 +891,8 @@ class LanceDBKnowledgePieceStore(KnowledgePieceStore):
             knowledge_type: If specified, filter to this knowledge type only.
             spaces: If specified, filter to pieces belonging to at least one of these spaces.
             limit: Maximum number of records to return. Defaults to 10000 for
-                backward compatibility. Use a larger value for migration use cases
-                that need to iterate all pieces without truncation.
+                backward compatibility. Use ``iter_all`` for scans that must
+                not truncate.
         """
         if self._table is None:
             return []
@@ -530,11 +915,61 @@ class LanceDBKnowledgePieceStore(KnowledgePieceStore):
 
         return [_record_to_piece(row) for row in results]
 
+    def iter_all(
+        self, entity_id=None, knowledge_type=None, piece_filter=None, batch_size=500,
+    ):
+        """Stream pieces matching the filters, ``batch_size`` rows at a time.
+
+        The filters are compiled into one WHERE clause. Rows are read with
+        the Lance dataset scanner, which works on a fixed table version, so
+        updates made while iterating do not shift the scan. Tables without
+        a Lance dataset (e.g. remote tables) are paged with offset/limit.
+        Query errors are raised, never turned into a shorter scan.
+        """
+        if self._table is None:
+            return
+        piece_filter = piece_filter or PieceFilter()
+        where_clause = _build_where_clause(
+            entity_id, knowledge_type, piece_filter=piece_filter
+        )
+        for row in self._iter_rows(where_clause, batch_size):
+            piece = _record_to_piece(row)
+            # Tag LIKE patterns can over-match; re-check in Python.
+            if piece_filter.matches(piece):
+                yield piece
+
+    def _iter_rows(self, where_clause, batch_size):
+        """Yield raw rows matching ``where_clause`` in pages of ``batch_size``."""
+        try:
+            dataset = self._table.to_lance()
+        except Exception:
+            dataset = None
+        if dataset is not None:
+            for batch in dataset.to_batches(filter=where_clause, batch_size=batch_size):
+                yield from batch.to_pylist()
+            return
+
+        offset = 0
+        while True:
+            # A failed page propagates: ending early would look like a
+            # complete scan to callers.
+            rows = (
+                self._table.search()
+                .where(where_clause)
+                .offset(offset)
+                .limit(batch_size)
+                .to_list()
+            )
+            yield from rows
+            if len(rows) < batch_size:
+                return
+            offset += len(rows)
+
     def find_by_content_hash(self, content_hash, entity_id=None):
         """Find a piece by content hash using indexed SQL WHERE clause.
 
-        Overrides the default linear-scan implementation with an O(1) lookup
-        using a SQL WHERE clause on the content_hash column.
+        Overrides the default linear-scan implementation with a SQL WHERE
+        clause on the content_hash column, served by its scalar index.
 
         Args:
             content_hash: SHA256 hash prefix (16 chars).
@@ -569,16 +1004,63 @@ class LanceDBKnowledgePieceStore(KnowledgePieceStore):
 
         return None
 
+    def find_by_content_hashes(self, content_hashes, entity_id=None):
+        """Find pieces for several content hashes with indexed IN queries.
+
+        Each chunk of up to ``_MAX_IDS_PER_QUERY`` hashes is one scan
+        filtered on ``content_hash IN (...)`` over the global and (if given)
+        entity scopes. Global matches win over entity-scoped ones.
+
+        Args:
+            content_hashes: The hashes to look up. Repeats are looked up once.
+            entity_id: If provided, also check entity-scoped pieces.
+
+        Returns:
+            Dict from content hash to matching piece, in first-seen input
+            order. Hashes without a match are omitted.
+        """
+        wanted = [h for h in dict.fromkeys(content_hashes) if h]
+        if self._table is None or not wanted:
+            return {}
+
+        scopes = [_GLOBAL_ENTITY_SENTINEL] + ([entity_id] if entity_id else [])
+        global_rows: Dict[str, Dict[str, Any]] = {}
+        entity_rows: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(wanted), _MAX_IDS_PER_QUERY):
+            chunk = wanted[start:start + _MAX_IDS_PER_QUERY]
+            where = f"{_sql_in('content_hash', chunk)} AND {_sql_in('entity_id', scopes)}"
+            for row in self._iter_rows(where, _MAX_IDS_PER_QUERY):
+                if row.get("entity_id") == _GLOBAL_ENTITY_SENTINEL:
+                    global_rows.setdefault(row.get("content_hash"), row)
+                else:
+                    entity_rows.setdefault(row.get("content_hash"), row)
+
+        found = {}
+        for content_hash in wanted:
+            row = global_rows.get(content_hash) or entity_rows.get(content_hash)
+            if row is not None:
+                found[content_hash] = _record_to_piece(row)
+        return found
+
     def close(self):
         """Close LanceDB connection and release resources."""
         self._table = None
         self._db = None
         self._fts_index_created = False
+        self._content_hash_indexed = False
 
     def _rebuild_fts_index(self):
-        """Rebuild the FTS index after data modifications."""
+        """Rebuild the FTS index after data modifications.
+
+        Inside ``bulk_session()`` the rebuild is only recorded and runs once
+        when the session exits.
+        """
         if self._table is None:
             return
+        if self._bulk_depth > 0:
+            self._fts_dirty = True
+            return
+        self._fts_dirty = False
         try:
             self._table.create_fts_index("content", replace=True)
             self._fts_index_created = True
@@ -591,6 +1073,14 @@ def _escape_sql(value):
     return value.replace("'", "''")
 
 
+def _piece_id_in_clauses(piece_ids):
+    """Yield ``(where_clause, chunk_size)`` pairs of ``piece_id IN (...)`` filters."""
+    for start in range(0, len(piece_ids), _MAX_IDS_PER_QUERY):
+        chunk = piece_ids[start:start + _MAX_IDS_PER_QUERY]
+        values = ", ".join(f"'{_escape_sql(pid)}'" for pid in chunk)
+        yield f"piece_id IN ({values})", len(chunk)
+
+
 def _escape_sql_like(value):
     """Escape LIKE wildcards in addition to single quotes.
 
@@ -599,7 +1089,39 @@ def _escape_sql_like(value):
     return value.replace("'", "''").replace("%", "\\%").replace("_", "\\_")
 
 
-def _build_where_clause(entity_id, knowledge_type, spaces=None):
+def _json_like_pattern(value):
+    """LIKE pattern matching ``value`` as an element of a JSON string list."""
+    return f"%\"{_escape_sql_like(json.dumps(value, ensure_ascii=False)[1:-1])}\"%"
+
+
+def _sql_in(column, values):
+    in_values = ", ".join(f"'{_escape_sql(v)}'" for v in values)
+    return f"{column} IN ({in_values})"
+
+
+def _filter_conditions(piece_filter):
+    """Compile the non-space parts of a ``PieceFilter`` to WHERE conditions.
+
+    Tags are stored as a JSON string list, so each required tag becomes a
+    ``LIKE`` on its quoted JSON form.
+    """
+    conditions = []
+    for tag in piece_filter.tags or ():
+        conditions.append(f"tags LIKE '{_json_like_pattern(tag)}'")
+    if piece_filter.domains:
+        conditions.append(_sql_in("domain", piece_filter.domains))
+    if piece_filter.created_since is not None:
+        conditions.append(f"created_at >= '{_escape_sql(piece_filter.created_since)}'")
+    if piece_filter.created_before is not None:
+        conditions.append(f"created_at < '{_escape_sql(piece_filter.created_before)}'")
+    if piece_filter.is_active is not None:
+        conditions.append(f"is_active = {'true' if piece_filter.is_active else 'false'}")
+    if piece_filter.validation_statuses:
+        conditions.append(_sql_in("validation_status", piece_filter.validation_statuses))
+    return conditions
+
+
+def _build_where_clause(entity_id, knowledge_type, spaces=None, piece_filter=None):
     """Build a SQL WHERE clause string for LanceDB filtering.
 
     Args:
@@ -609,6 +1131,8 @@ def _build_where_clause(entity_id, knowledge_type, spaces=None):
             dual-strategy WHERE clause using ``primary_space IN (...)`` as the
             fast indexed path combined with ``spaces LIKE`` fallback for
             multi-space pieces.
+        piece_filter: Optional ``PieceFilter``; its spaces are used when
+            ``spaces`` is not given and its other constraints are ANDed in.
     """
     conditions = []
 
@@ -620,6 +1144,9 @@ def _build_where_clause(entity_id, knowledge_type, spaces=None):
             f"knowledge_type = '{_escape_sql(knowledge_type.value)}'"
         )
 
+    if not spaces and piece_filter is not None:
+        spaces = piece_filter.spaces
+
     if spaces:
         in_values = ", ".join(f"'{_escape_sql(s)}'" for s in spaces)
         like_conditions = [f"spaces LIKE '%\"{_escape_sql_like(s)}\"%'" for s in spaces]
@@ -627,6 +1154,9 @@ def _build_where_clause(entity_id, knowledge_type, spaces=None):
             f"(primary_space IN ({in_values}) OR {' OR '.join(like_conditions)})"
         )
 
+    if piece_filter is not None:
+        conditions.extend(_filter_conditions(piece_filter))
+
     if not conditions:
         return None
     return " AND ".join(conditions)
@@ -17,10 +17,19 @@ Mapping:
     - merge_suggestion_reason, suggestion_status → metadata dict (lifecycle)
     - embedding_text → embedding_text
     - created_at, updated_at → created_at, updated_at
+    - created_at_epoch, updated_at_epoch → metadata dict (pre-parsed timestamps)
+
+Content-hash lookups go through a ``ContentHashIndex`` built from one scan
+of every namespace on first use (or loaded from ``content_hash_index_path``)
+and kept current by ``add`` / ``update`` / ``remove``.
 
 Requirements: 12.1, 12.2, 12.3, 12.4
 """
-from typing import List, Optional, Tuple
+import inspect
+import logging
+import os
+import threading
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 from attr import attrs, attrib
 
@@ -33,8 +42,41 @@ from agent_foundation.knowledge.retrieval.models.knowledge_piece import (
     KnowledgeType,
 )
 from agent_foundation.knowledge.retrieval.stores.pieces.base import KnowledgePieceStore
+from agent_foundation.knowledge.retrieval.stores.pieces.content_hash_index import ContentHashIndex
+from agent_foundation.knowledge.retrieval.stores.pieces.filters import PieceFilter
 from rich_python_utils.service_utils.data_operation_record import DataOperationRecord
 
+logger = logging.getLogger(__name__)
+
+
+def _compile_service_filters(
+    piece_filter: PieceFilter,
+) -> Tuple[Dict[str, Any], PieceFilter]:
+    """Split a ``PieceFilter`` into service metadata filters and a residual.
+
+    Only single-valued constraints are pushed down: a list filter value
+    means containment for list metadata (as for ``tags``), and scalar
+    values mean equality.
+    """
+    filters: Dict[str, Any] = {}
+    pushed = []
+    if piece_filter.tags:
+        filters["tags"] = list(piece_filter.tags)
+        pushed.append("tags")
+    if piece_filter.spaces and len(piece_filter.spaces) == 1:
+        filters["spaces"] = list(piece_filter.spaces)
+        pushed.append("spaces")
+    if piece_filter.domains and len(piece_filter.domains) == 1:
+        filters["domain"] = piece_filter.domains[0]
+        pushed.append("domains")
+    if piece_filter.validation_statuses and len(piece_filter.validation_statuses) == 1:
+        filters["validation_status"] = piece_filter.validation_statuses[0]
+        pushed.append("validation_statuses")
+    if piece_filter.is_active is not None:
+        filters["is_active"] = piece_filter.is_active
+        pushed.append("is_active")
+    return filters, piece_filter.without(*pushed)
+
 
 @attrs
 class RetrievalKnowledgePieceStore(KnowledgePieceStore):
@@ -45,11 +87,33 @@ class RetrievalKnowledgePieceStore(KnowledgePieceStore):
     field maps to the retrieval service namespace, and knowledge_type/tags
     are stored as metadata for filtering.
 
+    The content-hash index only sees writes made through this adapter;
+    pieces written to the service directly are picked up when the index is
+    rebuilt (``rebuild_content_hash_index``).
+
     Attributes:
         retrieval_service: The underlying retrieval service instance.
+        content_hash_index_path: Optional JSON file for the content-hash
+            index. Loaded on construction when it exists and saved on
+            ``close()``, so restarts skip the full scan.
     """
 
     retrieval_service: RetrievalServiceBase = attrib()
+    content_hash_index_path: Optional[str] = attrib(default=None)
+    _hash_index: Optional[ContentHashIndex] = attrib(init=False, default=None)
+    _hash_index_lock: threading.Lock = attrib(init=False, factory=threading.Lock)
+
+    def __attrs_post_init__(self):
+        """Load a previously saved content-hash index, if configured."""
+        path = self.content_hash_index_path
+        if path and os.path.exists(path):
+            try:
+                self._hash_index = ContentHashIndex.load(path)
+            except (OSError, ValueError) as exc:
+                logger.warning(
+                    "Ignoring unreadable content hash index %s (%s); it will be rebuilt",
+                    path, exc,
+                )
 
     def _piece_to_doc(self, piece: KnowledgePiece) -> Document:
         """Convert KnowledgePiece to Document.
@@ -97,6 +161,9 @@ class RetrievalKnowledgePieceStore(KnowledgePieceStore):
                 "space_suggestion_status": piece.space_suggestion_status,
                 # History — full records preserved for rollback support
                 "history": [r.to_dict() for r in piece.history],
+                # Pre-parsed timestamps for temporal scoring
+                "created_at_epoch": piece.created_at_epoch,
+                "updated_at_epoch": piece.updated_at_epoch,
             },
             embedding_text=piece.embedding_text,
             created_at=piece.created_at,
@@ -116,7 +183,7 @@ class RetrievalKnowledgePieceStore(KnowledgePieceStore):
         Returns:
             A KnowledgePiece with equivalent data.
         """
-        return KnowledgePiece(
+        piece = KnowledgePiece(
             content=doc.content,
             piece_id=doc.doc_id,
             knowledge_type=KnowledgeType(doc.metadata.get("knowledge_type", "fact")),
@@ -155,6 +222,11 @@ class RetrievalKnowledgePieceStore(KnowledgePieceStore):
                 for r in doc.metadata.get("history", [])
             ],
         )
+        piece.set_timestamp_epochs(
+            created_at_epoch=doc.metadata.get("created_at_epoch"),
+            updated_at_epoch=doc.metadata.get("updated_at_epoch"),
+        )
+        return piece
 
     def _namespace(self, entity_id: Optional[str]) -> Optional[str]:
         """Map entity_id to namespace.
@@ -186,7 +258,10 @@ class RetrievalKnowledgePieceStore(KnowledgePieceStore):
             ValueError: If a piece with the same piece_id already exists.
         """
         doc = self._piece_to_doc(piece)
-        return self.retrieval_service.add(doc, namespace=self._namespace(piece.entity_id))
+        piece_id = self.retrieval_service.add(doc, namespace=self._namespace(piece.entity_id))
+        if self._hash_index is not None:
+            self._hash_index.add(piece)
+        return piece_id
 
     def get_by_id(self, piece_id: str) -> Optional[KnowledgePiece]:
         """Get a knowledge piece by its ID.
@@ -213,6 +288,41 @@ class RetrievalKnowledgePieceStore(KnowledgePieceStore):
             return self._doc_to_piece(doc)
         return None
 
+    def get_by_ids(self, piece_ids: Iterable[str]) -> Dict[str, KnowledgePiece]:
+        """Get several knowledge pieces by their IDs.
+
+        Lists the namespaces once and probes each namespace only for the IDs
+        not yet found, instead of repeating the full namespace scan per ID.
+
+        Args:
+            piece_ids: The identifiers of the pieces to fetch.
+
+        Returns:
+            Dict mapping piece_id to KnowledgePiece for the IDs that were
+            found, in first-seen input order. Missing IDs are omitted.
+        """
+        ordered = list(dict.fromkeys(piece_ids))
+        if not ordered:
+            return {}
+        remaining = ordered
+        docs = {}
+        for ns in [*self.retrieval_service.namespaces(), None]:
+            still_missing = []
+            for piece_id in remaining:
+                doc = self.retrieval_service.get_by_id(piece_id, namespace=ns)
+                if doc is not None:
+                    docs[piece_id] = doc
+                else:
+                    still_missing.append(piece_id)
+            remaining = still_missing
+            if not remaining:
+                break
+        return {
+            piece_id: self._doc_to_piece(docs[piece_id])
+            for piece_id in ordered
+            if piece_id in docs
+        }
+
     def update(self, piece: KnowledgePiece) -> bool:
         """Update an existing knowledge piece.
 
@@ -226,7 +336,10 @@ class RetrievalKnowledgePieceStore(KnowledgePieceStore):
             True if the piece was found and updated, False if not found.
         """
         doc = self._piece_to_doc(piece)
-        return self.retrieval_service.update(doc, namespace=self._namespace(piece.entity_id))
+        updated = self.retrieval_service.update(doc, namespace=self._namespace(piece.entity_id))
+        if updated and self._hash_index is not None:
+            self._hash_index.add(piece)
+        return updated
 
     def remove(self, piece_id: str) -> bool:
         """Remove a knowledge piece from the store.
@@ -239,13 +352,13 @@ class RetrievalKnowledgePieceStore(KnowledgePieceStore):
         Returns:
             True if the piece existed and was removed, False if not found.
         """
-        # Try all namespaces since we don't know which one the piece is in
-        for ns in self.retrieval_service.namespaces():
+        # Try all namespaces since we don't know which one the piece is in,
+        # then the default namespace
+        for ns in [*self.retrieval_service.namespaces(), None]:
             if self.retrieval_service.remove(piece_id, namespace=ns):
+                if self._hash_index is not None:
+                    self._hash_index.discard(piece_id)
                 return True
-        # Also try the default namespace
-        if self.retrieval_service.remove(piece_id, namespace=None):
-            return True
         return False
 
     def search(
@@ -285,6 +398,47 @@ class RetrievalKnowledgePieceStore(KnowledgePieceStore):
             filters["knowledge_type"] = knowledge_type.value
         if tags:
             filters["tags"] = tags
+        return self._search_docs(query, filters, entity_id, top_k)
+
+    @property
+    def supports_filter_pushdown(self) -> bool:
+        """Single-valued ``PieceFilter`` constraints become service filters."""
+        return True
+
+    def search_filtered(
+        self,
+        query: str,
+        piece_filter: Optional[PieceFilter] = None,
+        entity_id: str = None,
+        knowledge_type: KnowledgeType = None,
+        top_k: int = 5,
+    ) -> List[Tuple[KnowledgePiece, float]]:
+        """Search pieces matching ``piece_filter``.
+
+        Constraints the retrieval-service metadata filters can express are
+        pushed down: tags (list containment), a single space (containment
+        in the ``spaces`` list), a single domain or validation status
+        (equality) and the active flag. The rest — several alternative
+        spaces, domains or statuses, and the created_at range — is checked
+        in Python with progressive over-fetch.
+        """
+        piece_filter = piece_filter or PieceFilter()
+        filters, residual = _compile_service_filters(piece_filter)
+        if knowledge_type:
+            filters["knowledge_type"] = knowledge_type.value
+        return self._search_with_residual(
+            lambda k: self._search_docs(query, filters, entity_id, k),
+            residual,
+            top_k,
+        )
+
+    def _search_docs(
+        self,
+        query: str,
+        filters: Dict[str, Any],
+        entity_id: Optional[str],
+        top_k: int,
+    ) -> List[Tuple[KnowledgePiece, float]]:
         results = self.retrieval_service.search(
             query,
             filters=filters or None,
@@ -326,6 +480,129 @@ class RetrievalKnowledgePieceStore(KnowledgePieceStore):
         )
         return [self._doc_to_piece(doc) for doc in docs]
 
+    def iter_all(
+        self,
+        entity_id: str = None,
+        knowledge_type: KnowledgeType = None,
+        piece_filter: Optional[PieceFilter] = None,
+        batch_size: int = 500,
+    ) -> Iterator[KnowledgePiece]:
+        """Iterate over pieces matching the filters.
+
+        The constraints ``search_filtered`` can push down are sent to the
+        service as metadata filters; the rest is checked in Python. When
+        the service's ``list_all`` accepts ``offset`` and ``limit``,
+        documents are fetched ``batch_size`` at a time; otherwise they are
+        listed once and converted to pieces lazily.
+        """
+        piece_filter = piece_filter or PieceFilter()
+        filters, residual = _compile_service_filters(piece_filter)
+        if knowledge_type:
+            filters["knowledge_type"] = knowledge_type.value
+        for doc in self._iter_docs(filters or None, self._namespace(entity_id), batch_size):
+            piece = self._doc_to_piece(doc)
+            if residual.matches(piece):
+                yield piece
+
+    def _iter_docs(
+        self,
+        filters: Optional[Dict[str, Any]],
+        namespace: Optional[str],
+        batch_size: int,
+    ) -> Iterator[Document]:
+        """Yield service documents, paging when the service supports it."""
+        list_all = self.retrieval_service.list_all
+        try:
+            params = inspect.signature(list_all).parameters
+        except (TypeError, ValueError):
+            params = {}
+        if "offset" not in params or "limit" not in params:
+            yield from list_all(filters=filters, namespace=namespace)
+            return
+
+        offset = 0
+        while True:
+            docs = list_all(
+                filters=filters, namespace=namespace, offset=offset, limit=batch_size
+            )
+            yield from docs
+            if len(docs) < batch_size:
+                return
+            offset += len(docs)
+
+    def find_by_content_hash(
+        self,
+        content_hash: str,
+        entity_id: Optional[str] = None,
+    ) -> Optional[KnowledgePiece]:
+        """Find a piece by its content hash using the content-hash index."""
+        if not content_hash:
+            return None
+        return self.find_by_content_hashes([content_hash], entity_id).get(content_hash)
+
+    def find_by_content_hashes(
+        self,
+        content_hashes: Iterable[str],
+        entity_id: Optional[str] = None,
+    ) -> Dict[str, KnowledgePiece]:
+        """Find pieces for several content hashes with one index lookup.
+
+        Matching piece ids come from the content-hash index and are fetched
+        with a single ``get_by_ids``. Index entries that turn out to be
+        stale (piece removed, or its content changed outside this adapter)
+        are corrected and not returned.
+
+        Args:
+            content_hashes: The hashes to look up. Repeats are looked up once.
+            entity_id: If provided, also check entity-scoped pieces.
+
+        Returns:
+            Dict from content hash to matching piece, in first-seen input
+            order. Hashes without a match are omitted.
+        """
+        index = self._content_hash_index()
+        piece_ids = index.lookup_many([h for h in content_hashes if h], entity_id)
+        if not piece_ids:
+            return {}
+        pieces = self.get_by_ids(piece_ids.values())
+        found: Dict[str, KnowledgePiece] = {}
+        for content_hash, piece_id in piece_ids.items():
+            piece = pieces.get(piece_id)
+            if piece is None:
+                index.discard(piece_id)
+            elif piece.content_hash != content_hash:
+                index.add(piece)
+            else:
+                found[content_hash] = piece
+        return found
+
+    def rebuild_content_hash_index(self) -> ContentHashIndex:
+        """Rebuild the content-hash index from a scan of every namespace."""
+        with self._hash_index_lock:
+            self._hash_index = self._scan_content_hash_index()
+            return self._hash_index
+
+    def _content_hash_index(self) -> ContentHashIndex:
+        """Return the content-hash index, building it on first use."""
+        with self._hash_index_lock:
+            if self._hash_index is None:
+                self._hash_index = self._scan_content_hash_index()
+            return self._hash_index
+
+    def _scan_content_hash_index(self) -> ContentHashIndex:
+        namespaces = dict.fromkeys([*self.retrieval_service.namespaces(), None])
+        return ContentHashIndex.build(
+            piece for ns in namespaces for piece in self.iter_all(entity_id=ns)
+        )
+
     def close(self):
-        """Close the underlying retrieval service."""
+        """Save the content-hash index (if configured) and close the service."""
+        if self.content_hash_index_path and self._hash_index is not None:
+            try:
+                self._hash_index.save(self.content_hash_index_path)
+            except OSError as exc:
+                logger.warning(
+                    "Failed to save content hash index %s: %s",
+                    self.content_hash_index_path, exc,
+                )
         self.retrieval_service.close()
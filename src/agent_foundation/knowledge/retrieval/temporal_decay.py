@@ -4,18 +4,29 @@ Temporal decay scoring for knowledge retrieval.
 Applies exponential decay to piece scores based on age, so fresher
 knowledge is prioritised over stale content.  Evergreen info types
 (e.g. skills, instructions) are exempt from decay.
+
+Ages are computed from pre-parsed epoch timestamps (``updated_at_epoch``)
+in one batch, rather than parsing ISO strings per piece per query.
 """
 
 import logging
 import math
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import List, Set
+from typing import List, Optional, Sequence, Set
 
 from agent_foundation.knowledge.retrieval.models.results import ScoredPiece
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised via monkeypatch in tests
+    np = None
+
 logger = logging.getLogger(__name__)
 
+# Below this batch size the Python loop beats numpy's conversion overhead.
+_NUMPY_MIN_BATCH = 32
+
 
 @dataclass
 class TemporalDecayConfig:
@@ -38,7 +49,9 @@ def apply_temporal_decay(
     Formula: ``score *= max(e^(-ln(2)/half_life * age_days), min_score_multiplier)``
 
     Pieces whose ``info_type`` is in ``config.evergreen_info_types`` are
-    skipped (their scores remain unchanged).
+    skipped (their scores remain unchanged). Ages come from each piece's
+    ``updated_at_epoch``, which stores pre-parse at load time, and the
+    multipliers are computed for all pieces in one batch.
 
     When ``config.enabled`` is False the input list is returned unchanged.
 
@@ -47,42 +60,55 @@ def apply_temporal_decay(
     if not config.enabled:
         return pieces
 
-    now = datetime.now(timezone.utc)
-    decay_lambda = math.log(2) / config.half_life_days
-
-    result: List[ScoredPiece] = []
-    for sp in pieces:
-        if sp.info_type in config.evergreen_info_types:
-            result.append(sp)
-            continue
+    decayed = [sp for sp in pieces if sp.info_type not in config.evergreen_info_types]
+    epochs = [sp.updated_at_epoch for sp in decayed]
+    multipliers = compute_decay_multipliers(
+        epochs, datetime.now(timezone.utc).timestamp(), config
+    )
 
-        age_days = _compute_age_days(sp.updated_at, now)
-        if age_days is None:
+    for sp, epoch, multiplier in zip(decayed, epochs, multipliers):
+        if multiplier is None:
             # Cannot determine age – leave score untouched
-            result.append(sp)
+            if sp.updated_at:
+                logger.warning("Could not parse updated_at timestamp: %s", sp.updated_at)
             continue
-
-        multiplier = max(
-            math.exp(-decay_lambda * age_days),
-            config.min_score_multiplier,
-        )
         sp.score = sp.score * multiplier
-        result.append(sp)
 
+    result = list(pieces)
     result.sort(key=lambda p: p.score, reverse=True)
     return result
 
 
-def _compute_age_days(updated_at: str, now: datetime) -> float | None:
-    """Parse an ISO 8601 timestamp and return age in fractional days."""
-    if not updated_at:
-        return None
-    try:
-        dt = datetime.fromisoformat(updated_at)
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        delta = now - dt
-        return delta.total_seconds() / 86400
-    except (ValueError, TypeError):
-        logger.warning("Could not parse updated_at timestamp: %s", updated_at)
-        return None
+def compute_decay_multipliers(
+    epochs: Sequence[Optional[float]],
+    now_epoch: float,
+    config: TemporalDecayConfig,
+) -> List[Optional[float]]:
+    """Compute decay multipliers for a batch of ``updated_at`` epochs.
+
+    Returns one multiplier per epoch, ``None`` where the epoch is ``None``
+    (unknown age). Uses numpy for the exponentials when it is installed.
+
+    Args:
+        epochs: POSIX timestamps in seconds, or None.
+        now_epoch: The reference time in POSIX seconds.
+        config: Half-life and floor of the decay.
+    """
+    decay_lambda = math.log(2) / config.half_life_days
+    floor = config.min_score_multiplier
+
+    if np is None or len(epochs) < _NUMPY_MIN_BATCH:
+        return [
+            None if epoch is None
+            else max(math.exp(-decay_lambda * (now_epoch - epoch) / 86400), floor)
+            for epoch in epochs
+        ]
+
+    values = np.array(
+        [now_epoch if epoch is None else epoch for epoch in epochs], dtype=np.float64
+    )
+    multipliers = np.maximum(np.exp(-decay_lambda * (now_epoch - values) / 86400), floor)
+    return [
+        None if epoch is None else m
+        for epoch, m in zip(epochs, multipliers.tolist())
+    ]
@@ -2,11 +2,13 @@
 Utility functions for the knowledge module.
 
 Provides entity ID sanitization for safe filesystem usage, entity type parsing
-from the `type:name` ID convention, cosine similarity, and token counting.
+from the `type:name` ID convention, ISO timestamp to epoch conversion,
+cosine similarity, and token counting.
 """
 
 import math
-from typing import List
+from datetime import datetime, timezone
+from typing import List, Optional
 
 
 def sanitize_id(entity_id: str) -> str:
@@ -81,6 +83,31 @@ def parse_entity_type(entity_id: str) -> str:
     return entity_id.split(":")[0] if ":" in entity_id else "default"
 
 
+def iso_to_epoch(timestamp: Optional[str]) -> Optional[float]:
+    """Convert an ISO 8601 timestamp to POSIX seconds.
+
+    Naive timestamps are taken as UTC, matching how pieces record them.
+    Returns None for empty or unparsable input.
+
+    Examples:
+        >>> iso_to_epoch("1970-01-02T00:00:00+00:00")
+        86400.0
+        >>> iso_to_epoch("1970-01-02T00:00:00")
+        86400.0
+        >>> iso_to_epoch("not a date") is None
+        True
+    """
+    if not timestamp:
+        return None
+    try:
+        dt = datetime.fromisoformat(timestamp)
+    except (ValueError, TypeError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
 def cosine_similarity(vec_a: List[float], vec_b: List[float]) -> float:
     """Compute cosine similarity between two float vectors using pure Python.
 
@@ -1,5 +1,6 @@
 """Tests for DevmateCliInferencer."""
 
+import asyncio
 import os
 import tempfile
 import unittest
@@ -394,6 +395,29 @@ class DevmateCliInferencerStreamingTest(unittest.TestCase):
 
             self.assertTrue(inferencer.dump_output)
 
+    def test_async_streaming_finalizes_cache_off_the_loop(self):
+        """Test that ainfer_streaming opens and finalizes the cache off the loop."""
+        inferencer = DevmateCliInferencer(repo_path="/test/repo")
+
+        async def fake_stream(*_args, **_kwargs):
+            yield "answer\n"
+
+        async def run():
+            with tempfile.TemporaryDirectory() as tmp:
+                inferencer.cache_folder = tmp
+                with patch.object(inferencer, "_ainfer_streaming", fake_stream), \
+                        patch.object(inferencer, "_finalize_cache") as sync_finalize, \
+                        patch.object(
+                            inferencer, "_afinalize_cache", wraps=inferencer._afinalize_cache
+                        ) as async_finalize:
+                    lines = [line async for line in inferencer.ainfer_streaming("prompt")]
+            self.assertEqual(lines, ["answer\n"])
+            sync_finalize.assert_not_called()
+            async_finalize.assert_awaited_once()
+            self.assertTrue(async_finalize.await_args.args[1])
+
+        asyncio.run(run())
+
 
 class DevmateCliInferencerSessionTest(unittest.TestCase):
     """Test session management methods."""
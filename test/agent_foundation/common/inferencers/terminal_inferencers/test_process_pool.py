@@ -0,0 +1,362 @@
+"""Unit tests for the warm terminal process pool.
+
+A fake CLI script stands in for Claude Code / Devmate / Kiro:
+
+- ``oneshot`` mode reads the whole prompt from stdin, answers and exits.
+- ``session`` mode answers each stdin line and terminates every response
+  with an ``<<END>>`` marker line, serving many turns per process.
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import unittest
+from typing import Any, Dict
+
+try:
+    import resolve_path  # noqa: F401
+except (ImportError, RuntimeError):
+    pass  # PYTHONPATH already set externally
+
+from attr import attrib, attrs
+
+from agent_foundation.common.inferencers.terminal_inferencers.process_pool import (
+    TerminalProcessPool,
+    wait_for_process_exit,
+)
+from agent_foundation.common.inferencers.terminal_inferencers.terminal_session_inferencer_base import (
+    TerminalSessionInferencerBase,
+)
+
+FAKE_CLI = """
+import os, sys
+if sys.argv[1] == "oneshot":
+    prompt = sys.stdin.read().strip()
+    sys.stderr.write("note from %d\\n" % os.getpid())
+    print("pid=%d answer:%s" % (os.getpid(), prompt))
+else:
+    for line in sys.stdin:
+        print("pid=%d answer:%s" % (os.getpid(), line.strip()), flush=True)
+        print("<<END>>", flush=True)
+"""
+
+# Stands in for ``claude -p``: reads the prompt from stdin and answers in the
+# requested --output-format.
+FAKE_CLAUDE = """
+import json, os, sys
+prompt = sys.stdin.read().strip()
+answer = "pid=%d answer:%s" % (os.getpid(), prompt)
+result = {"type": "result", "result": answer, "session_id": "s-%d" % os.getpid()}
+if "stream-json" in sys.argv:
+    delta = {"type": "content_block_delta", "delta": {"type": "text_delta", "text": answer}}
+    print(json.dumps({"type": "stream_event", "event": delta}))
+    print(json.dumps(result))
+else:
+    print(json.dumps(result))
+"""
+
+
+@attrs
+class FakeCliInferencer(TerminalSessionInferencerBase):
+    """Runs the fake CLI; the prompt only ever travels over stdin."""
+
+    script_path: str = attrib(default="")
+    mode: str = attrib(default="oneshot")
+
+    supports_stdin_prompt = True
+
+    def construct_command(self, inference_input: Any, **kwargs) -> str:
+        assert kwargs.get("use_stdin"), "pooled commands must not embed the prompt"
+        return f"{sys.executable} {self.script_path} {self.mode}"
+
+    def parse_output(self, stdout: str, stderr: str, return_code: int) -> Dict[str, Any]:
+        return {"output": stdout, "stderr": stderr, "return_code": return_code}
+
+    def _build_session_args(self, session_id: str, is_resume: bool) -> str:
+        return ""
+
+
+def _pid_of(text: str) -> str:
+    return text.split()[0]
+
+
+class TerminalProcessPoolTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.script = os.path.join(self._tmp.name, "fake_cli.py")
+        with open(self.script, "w") as f:
+            f.write(FAKE_CLI)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _collect(self, inferencer, prompt):
+        async def run():
+            lines = [line async for line in inferencer._ainfer_streaming(prompt)]
+            return "".join(lines)
+
+        return run()
+
+    def test_oneshot_uses_prespawned_process(self):
+        async def run():
+            pool = TerminalProcessPool()
+            inf = FakeCliInferencer(script_path=self.script, process_pool=pool)
+            first = await self._collect(inf, "hello")
+            self.assertIn("answer:hello", first)
+            self.assertIn("note from", inf._last_streaming_stderr)
+            self.assertEqual(inf._last_streaming_return_code, 0)
+            second = await self._collect(inf, "again")
+            self.assertIn("answer:again", second)
+            self.assertNotEqual(_pid_of(first), _pid_of(second))
+            self.assertEqual(pool.stats.cold_starts, 1)
+            self.assertEqual(pool.stats.warm_hits, 1)
+            await pool.aclose()
+
+        asyncio.run(asyncio.wait_for(run(), timeout=30))
+
+    def test_pooled_stream_accepts_dict_input(self):
+        async def run():
+            pool = TerminalProcessPool(prewarm=False)
+            inf = FakeCliInferencer(script_path=self.script, process_pool=pool)
+            lines = [line async for line in inf._ainfer_streaming({"prompt": "hi"})]
+            self.assertIn("answer:hi", "".join(lines))
+            await pool.aclose()
+
+        asyncio.run(asyncio.wait_for(run(), timeout=30))
+
+    def test_resumed_session_is_not_prewarmed_or_reused(self):
+        async def run():
+            pool = TerminalProcessPool()
+            inf = FakeCliInferencer(script_path=self.script, process_pool=pool)
+            lines = inf._ainfer_streaming("hello", session_id="s1", resume=True)
+            self.assertIn("answer:hello", "".join([line async for line in lines]))
+            self.assertEqual(pool.stats.spawned, 1)
+            self.assertEqual(pool.idle_count(), 0)
+
+            session = FakeCliInferencer(
+                script_path=self.script,
+                mode="session",
+                process_pool=pool,
+                multi_turn_stdin=True,
+                turn_end_marker="<<END>>",
+            )
+            lines = session._ainfer_streaming("one", session_id="s1", resume=True)
+            self.assertIn("answer:one", "".join([line async for line in lines]))
+            self.assertEqual(session._last_streaming_return_code, 0)
+            self.assertEqual(pool.stats.spawned, 2)
+            self.assertEqual(pool.idle_count(), 0)
+            await pool.aclose()
+
+        asyncio.run(asyncio.wait_for(run(), timeout=30))
+
+    def test_multi_turn_session_is_reused(self):
+        async def run():
+            pool = TerminalProcessPool(prewarm=False)
+            inf = FakeCliInferencer(
+                script_path=self.script,
+                mode="session",
+                process_pool=pool,
+                multi_turn_stdin=True,
+                turn_end_marker="<<END>>",
+            )
+            first = await self._collect(inf, "one")
+            second = await self._collect(inf, "two")
+            self.assertIn("answer:one", first)
+            self.assertIn("answer:two", second)
+            self.assertNotIn("<<END>>", second)
+            self.assertEqual(_pid_of(first), _pid_of(second))
+            self.assertEqual(pool.stats.spawned, 1)
+            self.assertEqual(pool.stats.reused, 1)
+            await pool.aclose()
+
+        asyncio.run(asyncio.wait_for(run(), timeout=30))
+
+    def test_dead_idle_process_is_replaced(self):
+        async def run():
+            pool = TerminalProcessPool(prewarm=False)
+            spawn = self._session_spawn()
+
+            first = await pool.acquire("k", spawn)
+            pool.release(first, reusable=True)
+            first.process.kill()
+            await first.process.wait()
+            second = await pool.acquire("k", spawn)
+            self.assertNotEqual(first.pid, second.pid)
+            self.assertEqual(pool.stats.discarded, 1)
+            pool.release(second)
+            await pool.aclose()
+
+        asyncio.run(asyncio.wait_for(run(), timeout=30))
+
+    def _session_spawn(self):
+        async def spawn():
+            return await asyncio.create_subprocess_exec(
+                sys.executable,
+                self.script,
+                "session",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+
+        return spawn
+
+    def test_unfinished_turn_releases_process_once(self):
+        async def run():
+            pool = TerminalProcessPool(prewarm=False)
+            releases = []
+            original_release = pool.release
+
+            def counting_release(pooled, reusable=False):
+                releases.append(reusable)
+                original_release(pooled, reusable)
+
+            pool.release = counting_release
+            inf = FakeCliInferencer(
+                script_path=self.script,
+                mode="session",
+                process_pool=pool,
+                multi_turn_stdin=True,
+                turn_end_marker="<<END>>",
+            )
+            lines = inf._ainfer_streaming("one")
+            self.assertIn("answer:one", await lines.__anext__())
+            await lines.aclose()
+            self.assertEqual(releases, [False])
+            self.assertIsNotNone(inf._last_streaming_return_code)
+            self.assertEqual(pool.idle_count(), 0)
+            await pool.aclose()
+
+        asyncio.run(asyncio.wait_for(run(), timeout=30))
+
+    def test_reaper_terminates_expired_idle_processes(self):
+        async def run():
+            pool = TerminalProcessPool(
+                prewarm=False, idle_ttl_seconds=0.05, reap_interval_seconds=0.05
+            )
+            pooled = await pool.acquire(("session", "once"), self._session_spawn())
+            pool.release(pooled, reusable=True)
+            self.assertEqual(pool.idle_count(), 1)
+            await asyncio.wait_for(pooled.process.wait(), timeout=5)
+            self.assertEqual(pool.idle_count(), 0)
+            self.assertEqual(pool.stats.discarded, 1)
+            await pool.aclose()
+
+        asyncio.run(asyncio.wait_for(run(), timeout=30))
+
+    def test_idle_total_cap_evicts_least_recently_used(self):
+        async def run():
+            pool = TerminalProcessPool(
+                prewarm=False, max_idle_total=1, reap_interval_seconds=0
+            )
+            older = await pool.acquire("a", self._session_spawn())
+            newer = await pool.acquire("b", self._session_spawn())
+            pool.release(older, reusable=True)
+            pool.release(newer, reusable=True)
+            self.assertEqual(pool.idle_count("a"), 0)
+            self.assertEqual(pool.idle_count("b"), 1)
+            self.assertEqual(pool.stats.discarded, 1)
+            await asyncio.wait_for(older.process.wait(), timeout=5)
+            await pool.aclose()
+
+        asyncio.run(asyncio.wait_for(run(), timeout=30))
+
+    def test_exit_detection_is_prompt(self):
+        async def run():
+            proc = await asyncio.create_subprocess_shell("sleep 0.05")
+            start = time.monotonic()
+            code = await wait_for_process_exit(proc.pid, max_poll_interval=0.5)
+            elapsed = time.monotonic() - start
+            # None when asyncio's child watcher reaped the process first.
+            self.assertIn(code, [0, None])
+            self.assertLess(elapsed, 0.4)
+            self.assertEqual(await proc.wait(), 0)
+
+        asyncio.run(asyncio.wait_for(run(), timeout=10))
+
+
+class CliInferencerPoolingTest(unittest.TestCase):
+    """The concrete CLI inferencers either use ``process_pool`` or reject it."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.script = os.path.join(self._tmp.name, "fake_claude.py")
+        with open(self.script, "w") as f:
+            f.write(FAKE_CLAUDE)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _claude(self, pool):
+        from agent_foundation.common.inferencers.agentic_inferencers.external.claude_code.claude_code_cli_inferencer import (
+            ClaudeCodeCliInferencer,
+        )
+
+        return ClaudeCodeCliInferencer(
+            target_path=self._tmp.name,
+            claude_command=f"{sys.executable} {self.script}",
+            process_pool=pool,
+        )
+
+    def test_claude_stream_json_runs_on_pooled_processes(self):
+        async def run():
+            pool = TerminalProcessPool()
+            inf = self._claude(pool)
+            first = "".join([c async for c in inf._ainfer_streaming("hello")])
+            self.assertIn("answer:hello", first)
+            self.assertEqual(inf._last_streaming_output, first)
+            self.assertTrue(inf._last_stream_result["session_id"].startswith("s-"))
+            second = "".join([c async for c in inf._ainfer_streaming("again")])
+            self.assertIn("answer:again", second)
+            self.assertEqual(pool.stats.cold_starts, 1)
+            self.assertEqual(pool.stats.warm_hits, 1)
+            await pool.aclose()
+
+        asyncio.run(asyncio.wait_for(run(), timeout=30))
+
+    def test_claude_sync_infer_runs_on_pooled_processes(self):
+        from agent_foundation.common.inferencers.loop_runner import (
+            get_default_loop_runner,
+        )
+
+        pool = TerminalProcessPool()
+        inf = self._claude(pool)
+        try:
+            first = inf._infer("hello")
+            second = inf._infer("again")
+            self.assertTrue(first.success)
+            self.assertIn("answer:hello", first.output)
+            self.assertIn("answer:again", second.output)
+            self.assertTrue(second.session_id.startswith("s-"))
+            self.assertEqual(pool.stats.cold_starts, 1)
+            self.assertEqual(pool.stats.warm_hits, 1)
+        finally:
+            get_default_loop_runner().run(pool.aclose())
+
+    def test_argv_prompt_clis_reject_process_pool(self):
+        from agent_foundation.common.inferencers.agentic_inferencers.external.devmate.devmate_cli_inferencer import (
+            DevmateCliInferencer,
+        )
+        from agent_foundation.common.inferencers.agentic_inferencers.external.metamate.metamate_cli_inferencer import (
+            MetamateCliInferencer,
+        )
+        from agent_foundation.common.inferencers.agentic_inferencers.external.rovodev.rovodev_cli_inferencer import (
+            RovoDevCliInferencer,
+        )
+
+        for cls, kwargs in (
+            (DevmateCliInferencer, {"repo_path": self._tmp.name}),
+            (MetamateCliInferencer, {}),
+            (RovoDevCliInferencer, {"working_dir": self._tmp.name}),
+        ):
+            with self.subTest(cls=cls.__name__):
+                with self.assertRaisesRegex(ValueError, "process_pool"):
+                    cls(process_pool=TerminalProcessPool(), **kwargs)
+                # Without a pool the class still constructs.
+                cls(**kwargs)
+
+
+if __name__ == "__main__":
+    unittest.main()
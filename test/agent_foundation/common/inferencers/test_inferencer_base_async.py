@@ -192,5 +192,106 @@ class InferencerBaseAsyncTest(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(inferencer.call_count, 5)
 
 
+@attrs
+class VariableDelayInferencer(InferencerBase):
+    """Async inferencer whose latency is given by the (numeric) input."""
+
+    in_flight: int = attrib(default=0, init=False)
+    max_in_flight: int = attrib(default=0, init=False)
+
+    def _infer(self, inference_input, inference_config=None, **_inference_args):
+        return inference_input
+
+    async def _ainfer(self, inference_input, inference_config=None, **_inference_args):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(inference_input)
+            if inference_input < 0:
+                raise ValueError("negative delay")
+            return inference_input
+        finally:
+            self.in_flight -= 1
+
+
+class AiterParallelInferTest(unittest.IsolatedAsyncioTestCase):
+    """Test suite for InferencerBase.aiter_parallel_infer."""
+
+    async def test_yields_in_completion_order(self):
+        inferencer = VariableDelayInferencer(response_types=None)
+        results = [
+            item
+            async for item in inferencer.aiter_parallel_infer([0.05, 0.0, 0.02])
+        ]
+        self.assertEqual(results, [(1, 0.0), (2, 0.02), (0, 0.05)])
+
+    async def test_preserve_order(self):
+        inferencer = VariableDelayInferencer(response_types=None)
+        results = [
+            item
+            async for item in inferencer.aiter_parallel_infer(
+                [0.05, 0.0, 0.02], preserve_order=True
+            )
+        ]
+        self.assertEqual(results, [(0, 0.05), (1, 0.0), (2, 0.02)])
+
+    async def test_accepts_async_iterable_and_bounds_concurrency(self):
+        inferencer = VariableDelayInferencer(response_types=None)
+
+        async def inputs():
+            for _ in range(10):
+                yield 0.01
+
+        results = [
+            item
+            async for item in inferencer.aiter_parallel_infer(
+                inputs(), max_concurrency=3
+            )
+        ]
+        self.assertEqual(sorted(i for i, _ in results), list(range(10)))
+        self.assertLessEqual(inferencer.max_in_flight, 3)
+
+    async def test_return_exceptions(self):
+        inferencer = VariableDelayInferencer(response_types=None, max_retry=1)
+        results = dict(
+            [
+                item
+                async for item in inferencer.aiter_parallel_infer(
+                    [0.0, -0.001], return_exceptions=True
+                )
+            ]
+        )
+        self.assertEqual(results[0], 0.0)
+        self.assertIsInstance(results[1], ValueError)
+
+    async def test_rejects_non_positive_reorder_buffer(self):
+        inferencer = VariableDelayInferencer(response_types=None)
+        for preserve_order in (False, True):
+            with self.assertRaises(ValueError):
+                async for _ in inferencer.aiter_parallel_infer(
+                    [0.0], preserve_order=preserve_order, max_reorder_buffer=0
+                ):
+                    pass
+
+    async def test_reorder_buffer_ignored_without_preserve_order(self):
+        inferencer = VariableDelayInferencer(response_types=None)
+        results = [
+            item
+            async for item in inferencer.aiter_parallel_infer(
+                [0.02, 0.0, 0.01], max_concurrency=3, max_reorder_buffer=1
+            )
+        ]
+        self.assertEqual(results, [(1, 0.0), (2, 0.01), (0, 0.02)])
+        self.assertEqual(inferencer.max_in_flight, 3)
+
+    async def test_early_close_cancels_in_flight(self):
+        inferencer = VariableDelayInferencer(response_types=None)
+        agen = inferencer.aiter_parallel_infer([0.0, 10.0, 10.0])
+        first = await agen.__anext__()
+        await agen.aclose()
+        self.assertEqual(first, (0, 0.0))
+        self.assertEqual(inferencer.in_flight, 0)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,97 @@
+"""Tests for BackgroundLoopRunner (shared sync-to-async bridge)."""
+
+import asyncio
+import contextvars
+import threading
+import unittest
+
+from agent_foundation.common.inferencers.loop_runner import (
+    BackgroundLoopRunner,
+    get_default_loop_runner,
+)
+
+_request_id: contextvars.ContextVar = contextvars.ContextVar("_request_id", default=None)
+
+
+class BackgroundLoopRunnerTest(unittest.TestCase):
+    def setUp(self):
+        self.runner = BackgroundLoopRunner(name="test-loop-runner")
+
+    def tearDown(self):
+        self.runner.stop()
+
+    def test_run_reuses_one_loop(self):
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = self.runner.run(current_loop())
+        second = self.runner.run(current_loop())
+        self.assertIs(first, second)
+        self.assertFalse(first.is_closed())
+
+    def test_run_propagates_exceptions_and_contextvars(self):
+        async def boom():
+            raise ValueError(_request_id.get())
+
+        token = _request_id.set("req-1")
+        try:
+            with self.assertRaisesRegex(ValueError, "req-1"):
+                self.runner.run(boom())
+        finally:
+            _request_id.reset(token)
+
+    def test_iterate_yields_in_order(self):
+        async def gen():
+            for i in range(5):
+                await asyncio.sleep(0)
+                yield i
+
+        self.assertEqual(list(self.runner.iterate(gen, max_buffer=2)), [0, 1, 2, 3, 4])
+
+    def test_iterate_raises_producer_error(self):
+        async def gen():
+            yield "a"
+            raise RuntimeError("stream broke")
+
+        it = self.runner.iterate(gen)
+        self.assertEqual(next(it), "a")
+        with self.assertRaisesRegex(RuntimeError, "stream broke"):
+            next(it)
+
+    def test_early_close_cancels_producer(self):
+        cleaned_up = threading.Event()
+
+        async def gen():
+            try:
+                i = 0
+                while True:
+                    yield i
+                    i += 1
+                    await asyncio.sleep(0.001)
+            finally:
+                cleaned_up.set()
+
+        it = self.runner.iterate(gen)
+        self.assertEqual(next(it), 0)
+        it.close()
+        self.assertTrue(cleaned_up.wait(2.0))
+
+    def test_submit_from_runner_thread_raises(self):
+        async def nested():
+            return self.runner.submit(asyncio.sleep(0))
+
+        with self.assertRaises(RuntimeError):
+            self.runner.run(nested())
+
+    def test_restarts_after_stop(self):
+        self.assertEqual(self.runner.run(asyncio.sleep(0, result=1)), 1)
+        self.runner.stop()
+        self.assertFalse(self.runner.is_running)
+        self.assertEqual(self.runner.run(asyncio.sleep(0, result=2)), 2)
+
+    def test_default_runner_is_shared(self):
+        self.assertIs(get_default_loop_runner(), get_default_loop_runner())
+
+
+if __name__ == "__main__":
+    unittest.main()
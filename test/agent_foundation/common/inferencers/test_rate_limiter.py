@@ -0,0 +1,131 @@
+"""Tests for token-bucket rate limiting and adaptive concurrency."""
+
+import asyncio
+import time
+import unittest
+
+from attr import attrib, attrs
+
+from agent_foundation.common.inferencers.inferencer_base import InferencerBase
+from agent_foundation.common.inferencers.rate_limiter import (
+    AdaptiveConcurrencyLimiter,
+    RateLimiter,
+    TokenBucket,
+    get_shared_rate_limiter,
+    is_throttling_error,
+)
+
+
+class ThrottledError(Exception):
+    status_code = 429
+
+
+@attrs
+class ThrottleOnceInferencer(InferencerBase):
+    """Fake backend that throttles the first attempt and then succeeds."""
+
+    call_count: int = attrib(default=0, init=False)
+
+    def _infer(self, inference_input, inference_config=None, **_inference_args):
+        self.call_count += 1
+        if self.call_count == 1:
+            raise ThrottledError("Too Many Requests")
+        return inference_input
+
+    async def _ainfer(self, inference_input, inference_config=None, **_inference_args):
+        return self._infer(inference_input, inference_config, **_inference_args)
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_burst_then_wait(self):
+        bucket = TokenBucket(rate=10, capacity=2)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, delta=0.02)
+
+    def test_rejects_non_positive_rate(self):
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+
+
+class AdaptiveConcurrencyLimiterTest(unittest.TestCase):
+    def test_aimd(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, min_limit=1)
+        limiter.acquire()
+        limiter.release(throttled=True)
+        self.assertEqual(limiter.limit, 4)
+        for _ in range(20):
+            limiter.acquire()
+            limiter.release()
+        self.assertEqual(limiter.limit, 8)
+
+    def test_non_adaptive_limit_is_fixed(self):
+        limiter = AdaptiveConcurrencyLimiter(max_limit=8, initial_limit=3, adaptive=False)
+        limiter.acquire()
+        limiter.release(throttled=True)
+        self.assertEqual(limiter.limit, 3)
+
+
+class RateLimiterTest(unittest.IsolatedAsyncioTestCase):
+    async def test_alimit_bounds_concurrency(self):
+        limiter = RateLimiter(max_concurrency=2)
+        active, peak = 0, 0
+
+        async def job():
+            nonlocal active, peak
+            async with limiter.alimit("p"):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*[job() for _ in range(8)])
+        self.assertEqual(peak, 2)
+        self.assertEqual(limiter.in_flight, 0)
+
+    def test_requests_per_second(self):
+        limiter = RateLimiter(requests_per_second=50)
+        start = time.monotonic()
+        for _ in range(60):
+            with limiter.limit():
+                pass
+        self.assertGreaterEqual(time.monotonic() - start, 0.15)
+
+    def test_throttling_backs_off(self):
+        limiter = RateLimiter(max_concurrency=8, throttle_cooldown_seconds=0)
+        with self.assertRaises(ThrottledError):
+            with limiter.limit("p"):
+                raise ThrottledError("slow down")
+        self.assertEqual(limiter.concurrency_limit, 4)
+        self.assertEqual(limiter.stats.throttled, 1)
+
+    def test_is_throttling_error(self):
+        self.assertTrue(is_throttling_error(ThrottledError()))
+        self.assertTrue(is_throttling_error(RuntimeError("Rate limit exceeded")))
+        self.assertFalse(is_throttling_error(ValueError("bad input")))
+
+    def test_shared_registry(self):
+        a = get_shared_rate_limiter("test-backend", max_concurrency=3)
+        b = get_shared_rate_limiter("test-backend", max_concurrency=99)
+        self.assertIs(a, b)
+        self.assertEqual(b.max_concurrency, 3)
+
+
+class InferencerRateLimitTest(unittest.IsolatedAsyncioTestCase):
+    def test_retry_after_throttle_shrinks_limit(self):
+        limiter = RateLimiter(max_concurrency=8, throttle_cooldown_seconds=0)
+        inferencer = ThrottleOnceInferencer(rate_limiter=limiter, max_retry=2)
+        self.assertEqual(inferencer("hi"), "hi")
+        self.assertEqual(limiter.stats.attempts, 2)
+        self.assertEqual(limiter.stats.throttled, 1)
+        self.assertLess(limiter.concurrency_limit, 8)
+
+    async def test_async_path_is_limited(self):
+        limiter = RateLimiter(max_concurrency=8, throttle_cooldown_seconds=0)
+        inferencer = ThrottleOnceInferencer(rate_limiter=limiter, max_retry=2)
+        self.assertEqual(await inferencer.ainfer("hi"), "hi")
+        self.assertEqual(limiter.stats.throttled, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+"""Tests for single-flight request coalescing in InferencerBase."""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from attr import attrib, attrs
+
+from agent_foundation.common.inferencers.inferencer_base import InferencerBase
+from agent_foundation.common.inferencers.request_coalescing import RequestCoalescer
+
+
+@attrs
+class SlowInferencer(InferencerBase):
+    """Fake backend that sleeps so that concurrent calls overlap."""
+
+    delay_seconds: float = attrib(default=0.05)
+    fail: bool = attrib(default=False)
+    call_count: int = attrib(default=0, init=False)
+    _count_lock: threading.Lock = attrib(init=False, factory=threading.Lock)
+
+    def _infer(self, inference_input, inference_config=None, **_inference_args):
+        with self._count_lock:
+            self.call_count += 1
+        time.sleep(self.delay_seconds)
+        if self.fail:
+            raise RuntimeError("boom")
+        return f"echo:{inference_input}"
+
+    async def _ainfer(self, inference_input, inference_config=None, **_inference_args):
+        self.call_count += 1
+        await asyncio.sleep(self.delay_seconds)
+        if self.fail:
+            raise RuntimeError("boom")
+        return f"echo:{inference_input}"
+
+
+class RequestCoalescerTest(unittest.IsolatedAsyncioTestCase):
+    async def test_arun_shares_one_execution(self):
+        coalescer = RequestCoalescer()
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.02)
+            return "v"
+
+        results = await asyncio.gather(*[coalescer.arun("k", work) for _ in range(5)])
+        self.assertEqual(results, ["v"] * 5)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual((coalescer.leaders, coalescer.followers), (1, 4))
+        self.assertEqual(coalescer.in_flight, 0)
+
+    async def test_cancelling_leader_does_not_cancel_followers(self):
+        coalescer = RequestCoalescer()
+
+        async def work():
+            await asyncio.sleep(0.05)
+            return "v"
+
+        leader = asyncio.ensure_future(coalescer.arun("k", work))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(coalescer.arun("k", work))
+        await asyncio.sleep(0)
+        leader.cancel()
+        self.assertEqual(await follower, "v")
+
+
+class InferencerCoalescingTest(unittest.IsolatedAsyncioTestCase):
+    async def test_aparallel_infer_identical_inputs_coalesce(self):
+        inferencer = SlowInferencer(request_coalescer=RequestCoalescer())
+        results = await inferencer.aparallel_infer(["q"] * 8 + ["other"])
+        self.assertEqual(results, ["echo:q"] * 8 + ["echo:other"])
+        self.assertEqual(inferencer.call_count, 2)
+
+    async def test_exception_fans_out_to_followers(self):
+        inferencer = SlowInferencer(
+            request_coalescer=RequestCoalescer(), fail=True, max_retry=1
+        )
+        results = await asyncio.gather(
+            *[inferencer.ainfer("q") for _ in range(3)], return_exceptions=True
+        )
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+    async def test_opt_out_per_call(self):
+        inferencer = SlowInferencer(request_coalescer=RequestCoalescer())
+        await asyncio.gather(
+            inferencer.ainfer("q", coalesce_request=False),
+            inferencer.ainfer("q", coalesce_request=False),
+        )
+        self.assertEqual(inferencer.call_count, 2)
+
+    def test_sync_threads_coalesce(self):
+        inferencer = SlowInferencer(request_coalescer=RequestCoalescer())
+        results = inferencer.parallel_infer(["q"] * 6)
+        self.assertEqual(results, ["echo:q"] * 6)
+        self.assertEqual(inferencer.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+"""Tests for the InferencerBase response cache."""
+
+import asyncio
+import functools
+import os
+import tempfile
+import unittest
+
+from attr import attrib, attrs
+
+from agent_foundation.common.inferencers.inferencer_base import InferencerBase
+from agent_foundation.common.inferencers.response_cache import (
+    CACHE_MISS,
+    InMemoryLRUResponseCache,
+    SqliteResponseCache,
+    build_response_cache_key,
+)
+
+
+@attrs
+class CountingInferencer(InferencerBase):
+    """Echo inferencer that counts backend calls."""
+
+    call_count: int = attrib(default=0, init=False)
+    fail_times: int = attrib(default=0)
+
+    def _infer(self, inference_input, inference_config=None, **_inference_args):
+        self.call_count += 1
+        if self.call_count <= self.fail_times:
+            raise RuntimeError("transient")
+        return f"echo:{inference_input}"
+
+
+class BuildResponseCacheKeyTest(unittest.TestCase):
+    def test_key_is_deterministic_and_order_insensitive(self):
+        k1 = build_response_cache_key("ns", "p", {"a": 1}, None, {"x": 1, "y": 2})
+        k2 = build_response_cache_key("ns", "p", {"a": 1}, None, {"y": 2, "x": 1})
+        self.assertEqual(k1, k2)
+
+    def test_key_changes_with_each_component(self):
+        base = build_response_cache_key("ns", "p", {"a": 1}, None, {"x": 1})
+        self.assertNotEqual(base, build_response_cache_key("ns2", "p", {"a": 1}, None, {"x": 1}))
+        self.assertNotEqual(base, build_response_cache_key("ns", "q", {"a": 1}, None, {"x": 1}))
+        self.assertNotEqual(base, build_response_cache_key("ns", "p", {"a": 2}, None, {"x": 1}))
+        self.assertNotEqual(base, build_response_cache_key("ns", "p", {"a": 1}, "cfg", {"x": 1}))
+        self.assertNotEqual(base, build_response_cache_key("ns", "p", {"a": 1}, None, {"x": 2}))
+
+    def test_module_level_callables_are_keyed_by_name(self):
+        def key(fn):
+            return build_response_cache_key("ns", "p", None, None, {"fn": fn})
+
+        self.assertEqual(key(os.path.join), key(os.path.join))
+        self.assertNotEqual(key(os.path.join), key(os.path.split))
+        self.assertNotEqual(key(str), key(bytes))
+
+    def test_unnamed_callables_are_unfingerprintable(self):
+        def local(text):
+            return text
+
+        for fn in (local, lambda t: t, "a".upper, functools.partial(local, "x")):
+            with self.assertRaises(TypeError):
+                build_response_cache_key("ns", "p", None, None, {"fn": fn})
+
+class InMemoryLRUResponseCacheTest(unittest.TestCase):
+    def test_get_set_and_eviction(self):
+        cache = InMemoryLRUResponseCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        self.assertEqual(cache.get("a"), 1)  # "a" becomes most recent
+        cache.set("c", 3)
+        self.assertIs(cache.get("b"), CACHE_MISS)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(len(cache), 2)
+
+    def test_ttl_expiry(self):
+        cache = InMemoryLRUResponseCache(ttl_seconds=0.01)
+        cache.set("a", 1)
+        import time
+
+        time.sleep(0.02)
+        self.assertIs(cache.get("a"), CACHE_MISS)
+
+
+class SqliteResponseCacheTest(unittest.TestCase):
+    def test_persists_across_instances(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "sub", "cache.db")
+            cache = SqliteResponseCache(path=path)
+            cache.set("k", {"text": "hello"})
+            cache.close()
+
+            reopened = SqliteResponseCache(path=path)
+            self.assertEqual(reopened.get("k"), {"text": "hello"})
+            self.assertIs(reopened.get("missing"), CACHE_MISS)
+            reopened.delete("k")
+            self.assertEqual(len(reopened), 0)
+            reopened.close()
+
+    def test_max_entries_evicts_least_recently_accessed(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache = SqliteResponseCache(path=os.path.join(tmp, "c.db"), max_entries=2)
+            cache.set("a", 1)
+            cache.set("b", 2)
+            cache.get("a")
+            cache.set("c", 3)
+            self.assertEqual(len(cache), 2)
+            self.assertIs(cache.get("b"), CACHE_MISS)
+            cache.close()
+
+
+class InferencerResponseCacheTest(unittest.TestCase):
+    def test_hit_skips_backend_and_records_stats(self):
+        inferencer = CountingInferencer(response_cache=InMemoryLRUResponseCache())
+        self.assertEqual(inferencer("hi"), "echo:hi")
+        self.assertEqual(inferencer("hi"), "echo:hi")
+        self.assertEqual(inferencer.call_count, 1)
+        stats = inferencer.response_cache_stats
+        self.assertEqual((stats.hits, stats.misses, stats.writes), (1, 1, 1))
+
+    def test_inference_args_are_part_of_key(self):
+        inferencer = CountingInferencer(response_cache=InMemoryLRUResponseCache())
+        inferencer("hi", temperature=0.1)
+        inferencer("hi", temperature=0.9)
+        self.assertEqual(inferencer.call_count, 2)
+
+    def test_callable_args_bypass_cache(self):
+        inferencer = CountingInferencer(response_cache=InMemoryLRUResponseCache())
+        inferencer("hi", on_chunk=lambda chunk: None)
+        inferencer("hi", on_chunk=lambda chunk: print(chunk))
+        self.assertEqual(inferencer.call_count, 2)
+        self.assertEqual(inferencer.response_cache_stats.writes, 0)
+
+    def test_bypass_per_call(self):
+        inferencer = CountingInferencer(response_cache=InMemoryLRUResponseCache())
+        inferencer("hi")
+        inferencer("hi", use_response_cache=False)
+        self.assertEqual(inferencer.call_count, 2)
+
+    def test_post_processor_runs_on_hit(self):
+        inferencer = CountingInferencer(
+            response_cache=InMemoryLRUResponseCache(),
+            response_post_processor=str.upper,
+        )
+        self.assertEqual(inferencer("hi"), "ECHO:HI")
+        self.assertEqual(inferencer("hi"), "ECHO:HI")
+        self.assertEqual(inferencer.call_count, 1)
+
+    def test_shared_cache_is_namespaced_by_model(self):
+        cache = InMemoryLRUResponseCache()
+        a = CountingInferencer(model_id="a", response_cache=cache)
+        b = CountingInferencer(model_id="b", response_cache=cache)
+        a("hi")
+        b("hi")
+        self.assertEqual((a.call_count, b.call_count), (1, 1))
+
+    def test_successful_retry_result_is_cached(self):
+        inferencer = CountingInferencer(
+            response_cache=InMemoryLRUResponseCache(), fail_times=1, max_retry=2
+        )
+        self.assertEqual(inferencer("hi"), "echo:hi")
+        self.assertEqual(inferencer("hi"), "echo:hi")
+        self.assertEqual(inferencer.call_count, 2)
+
+    def test_fallback_inferencer_response_is_not_cached(self):
+        primary = CountingInferencer(
+            model_id="primary",
+            response_cache=InMemoryLRUResponseCache(),
+            fail_times=10,
+            max_retry=1,
+            fallback_inferencer=CountingInferencer(model_id="fallback"),
+        )
+        self.assertEqual(primary("hi"), "echo:hi")
+        self.assertEqual(primary.fallback_inferencer.call_count, 1)
+        self.assertEqual(primary.response_cache_stats.writes, 0)
+
+        primary.fail_times = 0
+        primary("hi")
+        self.assertEqual(primary.fallback_inferencer.call_count, 1)
+        self.assertEqual(primary.response_cache_stats.writes, 1)
+
+    def test_async_fallback_inferencer_response_is_not_cached(self):
+        primary = CountingInferencer(
+            response_cache=InMemoryLRUResponseCache(),
+            fail_times=10,
+            max_retry=1,
+            fallback_inferencer=CountingInferencer(),
+        )
+        self.assertEqual(asyncio.run(primary.ainfer("hi")), "echo:hi")
+        self.assertEqual(primary.fallback_inferencer.call_count, 1)
+        self.assertEqual(primary.response_cache_stats.writes, 0)
+
+    def test_async_path_shares_cache(self):
+        inferencer = CountingInferencer(response_cache=InMemoryLRUResponseCache())
+        inferencer("hi")
+        result = asyncio.run(inferencer.ainfer("hi"))
+        self.assertEqual(result, "echo:hi")
+        self.assertEqual(inferencer.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""Tests for the StreamingInferencerBase cache manifest (StreamCacheIndex)."""
+
+import hashlib
+import os
+import tempfile
+import time
+import unittest
+import uuid
+
+from agent_foundation.common.inferencers.stream_cache_index import (
+    STATUS_COMPLETED,
+    STATUS_FAILED,
+    STATUS_OPEN,
+    StreamCacheIndex,
+)
+
+
+def _write_stream(cache_folder, class_name, prompt, content):
+    prompt_hash = hashlib.sha256(prompt.encode()).hexdigest()[:8]
+    session_dir = os.path.join(cache_folder, class_name, f"id_{uuid.uuid4().hex[:6]}")
+    os.makedirs(session_dir, exist_ok=True)
+    path = os.path.join(session_dir, f"stream_{uuid.uuid4().hex[:8]}_{prompt_hash}.txt")
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+    return path, prompt_hash
+
+
+class StreamCacheIndexTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.folder = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_first_lookup_rebuilds_from_disk(self):
+        path, h = _write_stream(
+            self.folder, "Cls", "p", "text\n--- STREAM COMPLETED SUCCESSFULLY ---\n"
+        )
+        index = StreamCacheIndex(cache_folder=self.folder)
+        entry = index.latest("Cls", h)
+        self.assertEqual(entry.path, os.path.abspath(path))
+        self.assertEqual(entry.status, STATUS_COMPLETED)
+        index.close()
+
+    def test_open_finalize_and_latest(self):
+        index = StreamCacheIndex(cache_folder=self.folder)
+        old, h = _write_stream(self.folder, "Cls", "p", "a")
+        index.rebuild("Cls")
+        new, _ = _write_stream(self.folder, "Cls", "p", "")
+        index.record_open(new, "Cls", h)
+        self.assertEqual(index.latest("Cls", h).status, STATUS_OPEN)
+        index.record_finalized(new, completed=False)
+        entry = index.latest("Cls", h)
+        self.assertEqual(entry.path, os.path.abspath(new))
+        self.assertEqual(entry.status, STATUS_FAILED)
+        index.close()
+
+    def test_missing_file_is_dropped(self):
+        path, h = _write_stream(self.folder, "Cls", "p", "x")
+        index = StreamCacheIndex(cache_folder=self.folder)
+        index.rebuild()
+        os.remove(path)
+        self.assertIsNone(index.latest("Cls", h))
+        self.assertEqual(index.entries("Cls"), [])
+        index.close()
+
+    def test_evict_by_age_and_size(self):
+        index = StreamCacheIndex(cache_folder=self.folder)
+        paths = []
+        for i in range(3):
+            path, h = _write_stream(
+                self.folder, "Cls", f"p{i}", "x" * 100 + "\n--- STREAM COMPLETED SUCCESSFULLY ---\n"
+            )
+            index.record_open(path, "Cls", h)
+            index.record_finalized(path, completed=True)
+            paths.append(path)
+            time.sleep(0.01)
+        removed = index.evict(max_total_bytes=300)
+        self.assertEqual(removed, 1)
+        self.assertFalse(os.path.exists(paths[0]))
+        removed = index.evict(max_age_seconds=0)
+        self.assertEqual(removed, 2)
+        self.assertEqual(index.entries(), [])
+        index.close()
+
+    def test_evict_skips_open_streams(self):
+        index = StreamCacheIndex(cache_folder=self.folder)
+        path, h = _write_stream(self.folder, "Cls", "p", "partial")
+        index.record_open(path, "Cls", h)
+        self.assertEqual(index.evict(max_age_seconds=0), 0)
+        self.assertTrue(os.path.exists(path))
+        self.assertEqual(index.evict(max_age_seconds=0, include_open=True), 1)
+        index.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+"""Tests for BufferedCacheWriter (background streaming cache writes)."""
+
+import asyncio
+import os
+import tempfile
+import time
+import unittest
+
+from agent_foundation.common.inferencers.stream_cache_writer import BufferedCacheWriter
+
+
+class BufferedCacheWriterTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self._tmp.name, "stream_x_deadbeef.txt")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _read(self):
+        with open(self.path, encoding="utf-8") as f:
+            return f.read()
+
+    def test_write_is_buffered_until_close(self):
+        writer = BufferedCacheWriter(
+            open(self.path, "w", encoding="utf-8"),
+            flush_bytes=1024,
+            flush_interval_seconds=60,
+        )
+        writer.write("a")
+        writer.write("b")
+        self.assertEqual(self._read(), "")
+        writer.write("\n--- STREAM COMPLETED SUCCESSFULLY ---\n")
+        writer.close()
+        self.assertTrue(writer.closed)
+        self.assertEqual(self._read(), "ab\n--- STREAM COMPLETED SUCCESSFULLY ---\n")
+
+    def test_size_triggered_flush_preserves_order(self):
+        writer = BufferedCacheWriter(
+            open(self.path, "w", encoding="utf-8"),
+            flush_bytes=4,
+            flush_interval_seconds=60,
+        )
+        for i in range(100):
+            writer.write(f"{i:03d},")
+        writer.flush(wait=True)
+        self.assertEqual(self._read(), "".join(f"{i:03d}," for i in range(100)))
+        writer.close()
+
+    def test_time_triggered_flush_while_idle(self):
+        writer = BufferedCacheWriter(
+            open(self.path, "w", encoding="utf-8"),
+            flush_bytes=1024,
+            flush_interval_seconds=0.05,
+        )
+        writer.write("partial")
+        deadline = time.monotonic() + 2.0
+        while self._read() != "partial" and time.monotonic() < deadline:
+            time.sleep(0.02)
+        self.assertEqual(self._read(), "partial")
+        writer.close()
+
+    def test_write_after_close_raises(self):
+        writer = BufferedCacheWriter(open(self.path, "w", encoding="utf-8"))
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write("x")
+
+    def test_aclose_does_not_block_event_loop(self):
+        writer = BufferedCacheWriter(open(self.path, "w", encoding="utf-8"))
+        writer.write("done")
+        # Another stream's slow write is queued ahead of this close.
+        writer._service.submit(lambda: time.sleep(0.3))
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            task = asyncio.create_task(ticker())
+            await writer.aclose()
+            task.cancel()
+            return ticks
+
+        self.assertGreaterEqual(asyncio.run(run()), 5)
+        self.assertTrue(writer.closed)
+        self.assertEqual(self._read(), "done")
+
+    def test_fsync_on_close_is_opt_in(self):
+        writer = BufferedCacheWriter(open(self.path, "w", encoding="utf-8"))
+        self.assertFalse(writer.fsync_on_close)
+        writer.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,6 +11,7 @@ Tests:
 """
 
 import asyncio
+import threading
 import unittest
 from typing import Any, AsyncIterator, Optional
 from unittest.mock import patch
@@ -221,5 +222,43 @@ class TestDualTimerBehavior(unittest.TestCase):
         self.assertEqual(result, [])
 
 
+class TestInferStreamingSyncBridge(unittest.TestCase):
+    """Tests for the sync infer_streaming() bridge."""
+
+    def test_background_loop_is_reused_across_calls(self):
+        loops = []
+
+        @attrs
+        class _LoopRecordingInferencer(_FakeStreamingInferencer):
+            async def _ainfer_streaming(self, prompt, **kwargs):
+                loops.append(asyncio.get_running_loop())
+                async for chunk in super()._ainfer_streaming(prompt, **kwargs):
+                    yield chunk
+
+        inferencer = _LoopRecordingInferencer(
+            chunks=[("a", 0), ("b", 0)], use_background_loop=True
+        )
+        self.assertEqual(list(inferencer.infer_streaming("p")), ["a", "b"])
+        self.assertEqual(list(inferencer.infer_streaming("p")), ["a", "b"])
+        self.assertIs(loops[0], loops[1])
+        self.assertFalse(loops[0].is_closed())
+
+    def test_per_call_thread_by_default(self):
+        threads = []
+
+        @attrs
+        class _ThreadRecordingInferencer(_FakeStreamingInferencer):
+            async def _ainfer_streaming(self, prompt, **kwargs):
+                threads.append(threading.current_thread())
+                async for chunk in super()._ainfer_streaming(prompt, **kwargs):
+                    yield chunk
+
+        inferencer = _ThreadRecordingInferencer(chunks=[("x", 0), ("y", 0)])
+        self.assertFalse(inferencer.use_background_loop)
+        self.assertEqual(list(inferencer.infer_streaming("p")), ["x", "y"])
+        self.assertEqual(list(inferencer.infer_streaming("p")), ["x", "y"])
+        self.assertIsNot(threads[0], threads[1])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,92 @@
+"""Tests for the in-memory ContentHashIndex."""
+import json
+import sys
+from pathlib import Path
+
+_src_dir = Path(__file__).resolve().parents[3] / "src"
+if str(_src_dir) not in sys.path:
+    sys.path.insert(0, str(_src_dir))
+
+import pytest
+
+from agent_foundation.knowledge.retrieval.models.knowledge_piece import KnowledgePiece
+from agent_foundation.knowledge.retrieval.stores.pieces.content_hash_index import (
+    ContentHashIndex,
+)
+
+
+def _piece(content, piece_id, entity_id=None):
+    return KnowledgePiece(content=content, piece_id=piece_id, entity_id=entity_id)
+
+
+class TestLookup:
+    def test_lookup_by_scope(self):
+        g = _piece("shared", "g")
+        e = _piece("mine", "e", entity_id="user-1")
+        index = ContentHashIndex.build([g, e])
+
+        assert index.lookup(g.content_hash) == "g"
+        assert index.lookup(e.content_hash) is None
+        assert index.lookup(e.content_hash, entity_id="user-1") == "e"
+        assert index.lookup(e.content_hash, entity_id="user-2") is None
+
+    def test_global_piece_wins_over_entity_piece(self):
+        e = _piece("shared", "e", entity_id="user-1")
+        g = _piece("shared", "g")
+        index = ContentHashIndex.build([e, g])
+
+        assert index.lookup(g.content_hash, entity_id="user-1") == "g"
+
+    def test_lookup_many_keeps_input_order_and_omits_misses(self):
+        a, b = _piece("a", "a"), _piece("b", "b")
+        index = ContentHashIndex.build([a, b])
+
+        found = index.lookup_many([b.content_hash, "missing", a.content_hash, b.content_hash])
+
+        assert list(found.items()) == [(b.content_hash, "b"), (a.content_hash, "a")]
+
+
+class TestMaintenance:
+    def test_readding_moves_piece_to_new_hash(self):
+        piece = _piece("before", "p")
+        index = ContentHashIndex.build([piece])
+        old_hash = piece.content_hash
+
+        index.add(_piece("after", "p"))
+
+        assert index.lookup(old_hash) is None
+        assert index.lookup(_piece("after", "x").content_hash) == "p"
+        assert len(index) == 1
+
+    def test_discard(self):
+        first, second = _piece("same", "first"), _piece("same", "second")
+        index = ContentHashIndex.build([first, second])
+
+        index.discard("first")
+        index.discard("unknown")
+
+        assert index.lookup(first.content_hash) == "second"
+        assert "first" not in index
+        index.discard("second")
+        assert index.lookup(first.content_hash) is None
+        assert len(index) == 0
+
+
+class TestPersistence:
+    def test_save_and_load_round_trip(self, tmp_path):
+        pieces = [_piece("a", "a"), _piece("b", "b", entity_id="user-1")]
+        path = str(tmp_path / "nested" / "hashes.json")
+        ContentHashIndex.build(pieces).save(path)
+
+        loaded = ContentHashIndex.load(path)
+
+        assert len(loaded) == 2
+        assert loaded.lookup(pieces[0].content_hash) == "a"
+        assert loaded.lookup(pieces[1].content_hash, entity_id="user-1") == "b"
+
+    def test_load_rejects_unknown_format(self, tmp_path):
+        path = tmp_path / "hashes.json"
+        path.write_text(json.dumps({"version": 99, "entries": []}))
+
+        with pytest.raises(ValueError):
+            ContentHashIndex.load(str(path))
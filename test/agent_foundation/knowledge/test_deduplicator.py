@@ -439,3 +439,205 @@ class TestTierInteraction:
         result = dedup.deduplicate(new_piece)
 
         assert result.action == DedupAction.ADD
+
+
+class TestQueryVectorReuse:
+    """Tier 2 reuses its embedding for the store search when models match."""
+
+    class _VectorAwareStore(InMemoryPieceStore):
+        def __init__(self, embedding_fn, pieces=None):
+            super().__init__(pieces)
+            self._embedding_fn = embedding_fn
+            self.search_kwargs = []
+
+        @property
+        def query_embedding_function(self):
+            return self._embedding_fn
+
+        def search(self, query, entity_id=None, knowledge_type=None, tags=None, top_k=5, **kwargs):
+            self.search_kwargs.append(kwargs)
+            return super().search(query, entity_id=entity_id, top_k=top_k)
+
+    def test_shared_embedding_fn_passes_query_vector(self):
+        embedding_fn = MagicMock(return_value=[0.1, 0.2, 0.3])
+        store = self._VectorAwareStore(embedding_fn)
+        dedup = ThreeTierDeduplicator(store, embedding_fn)
+
+        dedup.deduplicate(KnowledgePiece(content="New content", entity_id="e1"))
+
+        embedding_fn.assert_called_once_with("New content")
+        assert store.search_kwargs == [{"query_vector": [0.1, 0.2, 0.3]}]
+
+    def test_different_embedding_fn_does_not_pass_vector(self):
+        store = self._VectorAwareStore(MagicMock(return_value=[9.0]))
+        dedup = ThreeTierDeduplicator(store, _dummy_embedding_fn)
+
+        dedup.deduplicate(KnowledgePiece(content="New content", entity_id="e1"))
+
+        assert store.search_kwargs == [{}]
+
+
+class TestDeduplicateMany:
+    """Batch deduplication: one embedding call plus in-batch matching."""
+
+    _VECTORS = {
+        "alpha": [1.0, 0.0, 0.0],
+        "alpha again": [0.999, 0.01, 0.0],
+        "beta": [0.0, 1.0, 0.0],
+        "gamma": [0.0, 0.0, 1.0],
+    }
+
+    class _CountingStore(InMemoryPieceStore):
+        def __init__(self, pieces=None):
+            super().__init__(pieces)
+            self.queries = []
+
+        def search(self, query, entity_id=None, knowledge_type=None, tags=None, top_k=5, **kwargs):
+            self.queries.append(query)
+            return super().search(query, entity_id=entity_id, top_k=top_k)
+
+    def _dedup(self, store=None, **config):
+        batch_fn = MagicMock(side_effect=lambda texts: [self._VECTORS[t] for t in texts])
+        dedup = ThreeTierDeduplicator(
+            store or self._CountingStore(),
+            MagicMock(side_effect=lambda text: self._VECTORS[text]),
+            config=DedupConfig(enable_tier3=False, **config),
+            batch_embedding_fn=batch_fn,
+        )
+        return dedup, batch_fn
+
+    def test_embeds_candidates_in_one_batch(self):
+        dedup, batch_fn = self._dedup()
+        pieces = [KnowledgePiece(content=t) for t in ("alpha", "beta", "gamma")]
+
+        results = dedup.deduplicate_many(pieces)
+
+        batch_fn.assert_called_once_with(["alpha", "beta", "gamma"])
+        dedup.embedding_fn.assert_not_called()
+        assert [r.action for r in results] == [DedupAction.ADD] * 3
+        assert pieces[1].embedding == [0.0, 1.0, 0.0]
+
+    def test_exact_repeat_within_batch_is_no_op(self):
+        dedup, batch_fn = self._dedup()
+        pieces = [
+            KnowledgePiece(content="alpha", piece_id="a1"),
+            KnowledgePiece(content="alpha", piece_id="a2"),
+        ]
+
+        results = dedup.deduplicate_many(pieces)
+
+        assert results[0].action == DedupAction.ADD
+        assert results[1].action == DedupAction.NO_OP
+        assert results[1].existing_piece_id == "a1"
+        batch_fn.assert_called_once_with(["alpha"])
+        assert dedup.piece_store.queries == ["alpha"]
+
+    def test_near_duplicate_within_batch_skips_store_search(self):
+        dedup, _ = self._dedup()
+        pieces = [
+            KnowledgePiece(content="alpha", piece_id="a1"),
+            KnowledgePiece(content="alpha again", piece_id="a2"),
+            KnowledgePiece(content="beta", piece_id="b1"),
+        ]
+
+        results = dedup.deduplicate_many(pieces)
+
+        assert [r.action for r in results] == [
+            DedupAction.ADD, DedupAction.NO_OP, DedupAction.ADD,
+        ]
+        assert results[1].existing_piece_id == "a1"
+        assert results[1].similarity_score > 0.98
+        assert dedup.piece_store.queries == ["alpha", "beta"]
+
+    def test_batch_matching_respects_entity_scope(self):
+        dedup, _ = self._dedup()
+        pieces = [
+            KnowledgePiece(content="alpha", entity_id="e1"),
+            KnowledgePiece(content="alpha again", entity_id="e2"),
+        ]
+
+        results = dedup.deduplicate_many(pieces)
+
+        assert [r.action for r in results] == [DedupAction.ADD, DedupAction.ADD]
+
+    def test_repeat_of_store_duplicate_points_at_stored_piece(self):
+        existing = KnowledgePiece(content="alpha", piece_id="stored")
+        dedup, _ = self._dedup(store=self._CountingStore([existing]))
+        pieces = [KnowledgePiece(content="alpha"), KnowledgePiece(content="alpha")]
+
+        results = dedup.deduplicate_many(pieces)
+
+        assert [r.action for r in results] == [DedupAction.NO_OP, DedupAction.NO_OP]
+        assert [r.existing_piece_id for r in results] == ["stored", "stored"]
+
+    def test_hash_lookup_is_one_batched_call_per_entity(self):
+        existing = KnowledgePiece(content="beta", piece_id="stored")
+        store = self._CountingStore([existing])
+        store.find_by_content_hash = MagicMock()
+        hash_calls = []
+        find_many = store.find_by_content_hashes
+
+        def counting_find_many(hashes, entity_id=None):
+            hashes = list(hashes)
+            hash_calls.append((entity_id, len(hashes)))
+            return find_many(hashes, entity_id)
+
+        store.find_by_content_hashes = counting_find_many
+        dedup, _ = self._dedup(store=store)
+        pieces = [
+            KnowledgePiece(content="alpha"),
+            KnowledgePiece(content="beta"),
+            KnowledgePiece(content="gamma", entity_id="e1"),
+        ]
+
+        results = dedup.deduplicate_many(pieces)
+
+        assert hash_calls == [(None, 2), ("e1", 1)]
+        store.find_by_content_hash.assert_not_called()
+        assert results[1].action == DedupAction.NO_OP
+        assert results[1].existing_piece_id == "stored"
+
+    def test_matches_single_piece_dedup_without_batch_duplicates(self):
+        existing = KnowledgePiece(content="existing", piece_id="e")
+        store = self._CountingStore([existing])
+        store._score = 0.5
+        contents = ["alpha", "beta", "gamma"]
+
+        dedup, _ = self._dedup(store=store)
+        batch = dedup.deduplicate_many([KnowledgePiece(content=t) for t in contents])
+        single = [dedup.deduplicate(KnowledgePiece(content=t)) for t in contents]
+
+        assert batch == single
+
+    def test_pure_python_fallback_matches_numpy(self, monkeypatch):
+        from agent_foundation.knowledge.ingestion import deduplicator as module
+
+        contents = ["alpha", "beta", "alpha again", "gamma"]
+        dedup, _ = self._dedup()
+        with_numpy = dedup.deduplicate_many(
+            [KnowledgePiece(content=t, piece_id=t) for t in contents]
+        )
+
+        monkeypatch.setattr(module, "np", None)
+        dedup, _ = self._dedup()
+        without_numpy = dedup.deduplicate_many(
+            [KnowledgePiece(content=t, piece_id=t) for t in contents]
+        )
+
+        assert with_numpy == without_numpy
+        assert with_numpy[2].action == DedupAction.NO_OP
+
+    def test_precomputed_vectors_passed_to_store_search(self):
+        embedding_fn = MagicMock(side_effect=lambda text: self._VECTORS[text])
+        store = TestQueryVectorReuse._VectorAwareStore(embedding_fn)
+        dedup = ThreeTierDeduplicator(
+            store, embedding_fn, batch_embedding_fn=lambda texts: [self._VECTORS[t] for t in texts]
+        )
+
+        dedup.deduplicate_many([KnowledgePiece(content="alpha"), KnowledgePiece(content="beta")])
+
+        embedding_fn.assert_not_called()
+        assert store.search_kwargs == [
+            {"query_vector": [1.0, 0.0, 0.0]},
+            {"query_vector": [0.0, 1.0, 0.0]},
+        ]
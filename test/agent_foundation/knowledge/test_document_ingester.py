@@ -1,11 +1,14 @@
 """Unit tests for the DocumentIngester module."""
 
 import json
+import threading
+import time
 from typing import Any, Dict, List, Optional, Tuple
 from unittest.mock import MagicMock
 
 import pytest
 
+from agent_foundation.knowledge.ingestion import document_ingester as document_ingester_module
 from agent_foundation.knowledge.ingestion.document_ingester import (
     DocumentIngester,
     IngesterConfig,
@@ -14,7 +17,7 @@ from agent_foundation.knowledge.ingestion.document_ingester import (
     ingest_markdown_files,
     ingest_directory,
 )
-from agent_foundation.knowledge.ingestion.chunker import ChunkerConfig
+from agent_foundation.knowledge.ingestion.chunker import ChunkerConfig, DocumentChunk
 from agent_foundation.knowledge.ingestion.deduplicator import (
     DedupConfig,
     ThreeTierDeduplicator,
@@ -374,11 +377,12 @@ class TestApplyEnhancements:
 
     def test_dedup_noop_removes_piece(self):
         mock_dedup = MagicMock(spec=ThreeTierDeduplicator)
-        mock_dedup.deduplicate.return_value = DedupResult(
+        dedup_result = DedupResult(
             action=DedupAction.NO_OP,
             reason="Exact match",
             existing_piece_id="existing-1",
         )
+        mock_dedup.deduplicate_many.side_effect = lambda pieces: [dedup_result] * len(pieces)
 
         ingester = DocumentIngester(
             inferencer=lambda p: "",
@@ -392,11 +396,12 @@ class TestApplyEnhancements:
 
     def test_dedup_update_sets_supersedes(self):
         mock_dedup = MagicMock(spec=ThreeTierDeduplicator)
-        mock_dedup.deduplicate.return_value = DedupResult(
+        dedup_result = DedupResult(
             action=DedupAction.UPDATE,
             reason="Updated version",
             existing_piece_id="old-piece-1",
         )
+        mock_dedup.deduplicate_many.side_effect = lambda pieces: [dedup_result] * len(pieces)
 
         ingester = DocumentIngester(
             inferencer=lambda p: "",
@@ -413,10 +418,11 @@ class TestApplyEnhancements:
 
     def test_dedup_add_keeps_piece(self):
         mock_dedup = MagicMock(spec=ThreeTierDeduplicator)
-        mock_dedup.deduplicate.return_value = DedupResult(
+        dedup_result = DedupResult(
             action=DedupAction.ADD,
             reason="No duplicates",
         )
+        mock_dedup.deduplicate_many.side_effect = lambda pieces: [dedup_result] * len(pieces)
 
         ingester = DocumentIngester(
             inferencer=lambda p: "",
@@ -616,6 +622,162 @@ class TestIngestDirectory:
         assert results == {}
 
 
+# ── Concurrent Chunk Processing Tests ────────────────────────────────────────
+
+
+def _chunks(n: int, source_file: Optional[str] = None) -> List[DocumentChunk]:
+    return [
+        DocumentChunk(
+            content=f"chunk-{i}",
+            header_context="",
+            chunk_index=i,
+            total_chunks=n,
+            source_file=source_file,
+        )
+        for i in range(n)
+    ]
+
+
+def _chunk_inferencer(delay_for=None, fail_once=(), barrier=None):
+    """Inferencer answering ``chunk-i`` prompts with piece ``p{i}``."""
+    attempts: Dict[str, int] = {}
+
+    def inferencer(prompt: str) -> str:
+        i = int(prompt.rsplit("-", 1)[1])
+        attempts[prompt] = attempts.get(prompt, 0) + 1
+        if barrier is not None:
+            barrier.wait(timeout=5)
+        if delay_for:
+            time.sleep(delay_for(i))
+        if i in fail_once and attempts[prompt] == 1:
+            raise RuntimeError("transient")
+        return _make_llm_response([_simple_piece_dict(f"p{i}", f"content {i}")])
+
+    return inferencer
+
+
+@pytest.fixture
+def plain_prompts(monkeypatch):
+    monkeypatch.setattr(
+        document_ingester_module,
+        "get_structuring_prompt",
+        lambda user_input, context="", full_schema=True: user_input,
+    )
+
+
+def _ingester(inferencer, n_chunks, **config_kwargs):
+    ingester = DocumentIngester(inferencer, config=IngesterConfig(**config_kwargs))
+    ingester.chunker.chunk_document = lambda text, source_file=None: _chunks(
+        n_chunks, source_file
+    )
+    ingester._load_into_kb = MagicMock(
+        side_effect=lambda data, kb, pieces_to_deactivate=None: {
+            "pieces": len(data["pieces"]),
+            "graph_nodes": len(data["graph"]["nodes"]),
+        }
+    )
+    return ingester
+
+
+def _loaded_piece_ids(ingester) -> List[str]:
+    return [
+        piece["piece_id"]
+        for call in ingester._load_into_kb.call_args_list
+        for piece in call.args[0]["pieces"]
+    ]
+
+
+@pytest.mark.usefixtures("plain_prompts")
+class TestConcurrentChunkProcessing:
+    def test_chunks_run_in_parallel(self):
+        ingester = _ingester(
+            _chunk_inferencer(barrier=threading.Barrier(4)), 4, max_concurrent_chunks=4
+        )
+        result = ingester.ingest_text("doc", _make_mock_kb())
+
+        assert result.success is True
+        assert result.chunks_processed == 4
+
+    def test_output_order_is_deterministic(self):
+        ingester = _ingester(
+            _chunk_inferencer(delay_for=lambda i: 0.01 * (6 - i)), 6, max_concurrent_chunks=3
+        )
+        result = ingester.ingest_text("doc", _make_mock_kb())
+
+        assert _loaded_piece_ids(ingester) == [f"p{i}" for i in range(6)]
+        assert result.pieces_created == 6
+
+    def test_retries_are_per_chunk(self):
+        ingester = _ingester(
+            _chunk_inferencer(fail_once={1, 3}), 4, max_concurrent_chunks=2, max_retries=2
+        )
+        result = ingester.ingest_text("doc", _make_mock_kb())
+
+        assert result.errors == []
+        assert result.stats.llm_calls == 6
+        assert _loaded_piece_ids(ingester) == ["p0", "p1", "p2", "p3"]
+
+    def test_failed_chunk_recorded_in_stats(self):
+        ingester = _ingester(
+            _chunk_inferencer(fail_once={2}), 3, max_concurrent_chunks=3, max_retries=1
+        )
+        result = ingester.ingest_text("doc", _make_mock_kb())
+
+        assert result.chunks_processed == 2
+        assert result.errors == ["Chunk 2: Failed after 1 attempts: transient"]
+        assert result.stats.chunks_total == 3
+        assert result.stats.chunks_completed == 3
+        assert result.stats.chunks_failed == 1
+        assert result.stats.elapsed_seconds > 0
+
+    def test_load_in_batches(self):
+        ingester = _ingester(_chunk_inferencer(), 5, max_concurrent_chunks=2, load_batch_size=2)
+        result = ingester.ingest_text("doc", _make_mock_kb())
+
+        assert ingester._load_into_kb.call_count == 3
+        assert result.stats.batches_loaded == 3
+        assert result.pieces_created == 5
+        assert _loaded_piece_ids(ingester) == [f"p{i}" for i in range(5)]
+
+    def test_batched_edges_wait_for_their_nodes(self):
+        responses = [
+            {"metadata": {}, "pieces": [], "graph": {
+                "nodes": [{"node_id": "a"}],
+                "edges": [{"source_id": "a", "target_id": "b", "edge_type": "R"}],
+            }},
+            {"metadata": {}, "pieces": [], "graph": {"nodes": [{"node_id": "b"}], "edges": []}},
+        ]
+        ingester = _ingester(
+            lambda prompt: json.dumps(responses[int(prompt.rsplit("-", 1)[1])]),
+            2,
+            load_batch_size=1,
+        )
+        ingester.ingest_text("doc", _make_mock_kb())
+
+        loads = [call.args[0]["graph"] for call in ingester._load_into_kb.call_args_list]
+        assert [n["node_id"] for n in loads[0]["nodes"]] == ["a"]
+        assert loads[0]["edges"] == []
+        assert [e["target_id"] for e in loads[1]["edges"]] == ["b"]
+
+    def test_ingest_files_shares_pool_across_files(self, tmp_path):
+        paths = []
+        for i in range(2):
+            path = tmp_path / f"doc{i}.md"
+            path.write_text("x")
+            paths.append(str(path))
+        missing = str(tmp_path / "missing.md")
+
+        ingester = _ingester(
+            _chunk_inferencer(barrier=threading.Barrier(4)), 2, max_concurrent_chunks=4
+        )
+        results = ingester.ingest_files([paths[0], missing, paths[1]], _make_mock_kb())
+
+        assert list(results) == [paths[0], missing, paths[1]]
+        assert results[paths[0]].success and results[paths[1]].success
+        assert results[missing].success is False
+        assert results[paths[1]].chunks_processed == 2
+
+
 # ── Space Classifier Integration Tests ───────────────────────────────────────
 
 from agent_foundation.knowledge.ingestion.space_classifier import (
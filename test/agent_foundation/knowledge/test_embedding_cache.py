@@ -0,0 +1,119 @@
+"""Unit tests for EmbeddingCache (LRU + optional SQLite tier)."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from agent_foundation.knowledge.retrieval.embedding_cache import EmbeddingCache
+
+
+def _counting_fn():
+    return MagicMock(side_effect=lambda text: [float(len(text)), 1.0])
+
+
+class TestMemoryTier:
+    def test_repeated_text_embedded_once(self):
+        fn = _counting_fn()
+        cache = EmbeddingCache(fn, model_name="m")
+
+        assert cache("hello") == [5.0, 1.0]
+        assert cache("hello") == [5.0, 1.0]
+
+        fn.assert_called_once_with("hello")
+        assert cache.stats.memory_hits == 1
+        assert cache.stats.misses == 1
+
+    def test_lru_evicts_least_recently_used(self):
+        fn = _counting_fn()
+        cache = EmbeddingCache(fn, model_name="m", max_entries=2)
+
+        cache("a")
+        cache("b")
+        cache("a")  # refresh "a"
+        cache("c")  # evicts "b"
+
+        assert len(cache) == 2
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+
+    def test_numpy_like_vectors_become_lists(self):
+        vector = MagicMock()
+        vector.tolist.return_value = [0.5]
+        cache = EmbeddingCache(lambda text: vector, model_name="m")
+        assert cache("x") == [0.5]
+
+    def test_default_model_name_from_function(self):
+        fn = _counting_fn()
+        fn.model_name = "mini-lm"
+        assert EmbeddingCache(fn).model_name == "mini-lm"
+
+
+class TestEmbedMany:
+    def test_batches_only_misses_and_preserves_order(self):
+        fn = _counting_fn()
+        batch_fn = MagicMock(side_effect=lambda texts: [[float(len(t)), 2.0] for t in texts])
+        cache = EmbeddingCache(fn, model_name="m", batch_embedding_fn=batch_fn)
+        cache("aa")
+
+        vectors = cache.embed_many(["bbb", "aa", "bbb", "c"])
+
+        assert vectors == [[3.0, 2.0], [2.0, 1.0], [3.0, 2.0], [1.0, 2.0]]
+        batch_fn.assert_called_once_with(["bbb", "c"])
+
+    def test_falls_back_to_single_calls(self):
+        fn = _counting_fn()
+        cache = EmbeddingCache(fn, model_name="m")
+        assert cache.embed_many(["a", "bb"]) == [[1.0, 1.0], [2.0, 1.0]]
+        assert fn.call_count == 2
+
+
+class TestDiskTier:
+    def test_vectors_survive_new_instance(self, tmp_path):
+        path = str(tmp_path / "emb.sqlite")
+        first = EmbeddingCache(_counting_fn(), model_name="m", persist_path=path)
+        first("persisted")
+        first.close()
+
+        fn = _counting_fn()
+        second = EmbeddingCache(fn, model_name="m", persist_path=path)
+
+        assert second("persisted") == [9.0, 1.0]
+        fn.assert_not_called()
+        assert second.stats.disk_hits == 1
+
+    def test_model_name_isolates_entries(self, tmp_path):
+        path = str(tmp_path / "emb.sqlite")
+        EmbeddingCache(_counting_fn(), model_name="m1", persist_path=path)("text")
+
+        fn = _counting_fn()
+        EmbeddingCache(fn, model_name="m2", persist_path=path)("text")
+
+        fn.assert_called_once_with("text")
+
+    def test_persist_path_requires_model_name(self, tmp_path):
+        class Encoder:
+            def encode(self, text):
+                return [1.0]
+
+        with pytest.raises(ValueError, match="model_name"):
+            EmbeddingCache(Encoder().encode, persist_path=str(tmp_path / "emb.sqlite"))
+
+    def test_persist_path_accepts_declared_model_name(self, tmp_path):
+        def encode(text):
+            return [1.0]
+
+        encode.model_name = "mini-lm"
+        cache = EmbeddingCache(encode, persist_path=str(tmp_path / "emb.sqlite"))
+
+        assert cache.model_name == "mini-lm"
+
+    def test_clear_disk_drops_model_entries(self, tmp_path):
+        path = str(tmp_path / "emb.sqlite")
+        fn = _counting_fn()
+        cache = EmbeddingCache(fn, model_name="m", persist_path=path)
+        cache("text")
+        cache.clear(include_disk=True)
+
+        assert cache.get("text") is None
+        cache("text")
+        assert fn.call_count == 2
@@ -24,6 +24,7 @@ from agent_foundation.knowledge.retrieval.models.knowledge_piece import (
 from agent_foundation.knowledge.retrieval.stores.pieces.base import (
     KnowledgePieceStore,
 )
+from agent_foundation.knowledge.retrieval.stores.pieces.filters import PieceFilter
 
 
 class InMemoryPieceStore(KnowledgePieceStore):
@@ -137,3 +138,67 @@ class TestFindByContentHash:
         object.__setattr__(piece, "content_hash", None)
         store.add(piece)
         assert store.find_by_content_hash("some_hash") is None
+
+
+class TestDefaultIterAll:
+    """Unit tests for the default list_all-backed iter_all."""
+
+    def test_yields_scope_and_applies_piece_filter(self):
+        store = InMemoryPieceStore()
+        store.add(KnowledgePiece(content="a", piece_id="a", tags=["x"]))
+        store.add(KnowledgePiece(content="b", piece_id="b"))
+        store.add(KnowledgePiece(content="c", piece_id="c", tags=["x"], entity_id="user-1"))
+
+        assert [p.piece_id for p in store.iter_all()] == ["a", "b"]
+        assert [p.piece_id for p in store.iter_all(piece_filter=PieceFilter(tags=["x"]))] == ["a"]
+        assert [p.piece_id for p in store.iter_all(entity_id="user-1")] == ["c"]
+
+
+class TestFindByContentHashes:
+    """Unit tests for the default batched find_by_content_hashes."""
+
+    def test_matches_single_lookups(self):
+        store = InMemoryPieceStore()
+        global_piece = KnowledgePiece(content="shared", entity_id=None)
+        store.add(global_piece)
+        store.add(KnowledgePiece(content="shared", entity_id="user-1"))
+        entity_piece = KnowledgePiece(content="mine", entity_id="user-1")
+        store.add(entity_piece)
+        hashes = [entity_piece.content_hash, global_piece.content_hash, "missing"]
+
+        found = store.find_by_content_hashes(hashes, entity_id="user-1")
+
+        assert list(found) == hashes[:2]
+        for content_hash, piece in found.items():
+            expected = store.find_by_content_hash(content_hash, entity_id="user-1")
+            assert piece.piece_id == expected.piece_id
+        assert found[global_piece.content_hash].piece_id == global_piece.piece_id
+
+    def test_one_scan_per_scope(self):
+        store = InMemoryPieceStore()
+        pieces = [KnowledgePiece(content=f"piece {i}") for i in range(5)]
+        for piece in pieces:
+            store.add(piece)
+        scans = []
+        iter_all = store.iter_all
+        store.iter_all = lambda **kwargs: scans.append(kwargs) or iter_all(**kwargs)
+
+        found = store.find_by_content_hashes(
+            [p.content_hash for p in pieces] + ["missing"], entity_id="user-1"
+        )
+
+        assert len(found) == 5
+        assert scans == [{"entity_id": None}, {"entity_id": "user-1"}]
+
+    def test_skips_entity_scan_when_all_found_globally(self):
+        store = InMemoryPieceStore()
+        piece = KnowledgePiece(content="global")
+        store.add(piece)
+        scans = []
+        iter_all = store.iter_all
+        store.iter_all = lambda **kwargs: scans.append(kwargs) or iter_all(**kwargs)
+
+        found = store.find_by_content_hashes([piece.content_hash] * 2, entity_id="user-1")
+
+        assert list(found) == [piece.content_hash]
+        assert scans == [{"entity_id": None}]
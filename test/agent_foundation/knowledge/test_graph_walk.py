@@ -374,6 +374,187 @@ class TestPieceStoreException:
         assert depth_1[0]["relation_type"] == "MANAGES"
 
 
+class TestBatchedPieceHydration:
+    """Edge-linked pieces are fetched with one get_by_ids call per walk."""
+
+    def _build(self):
+        store = InMemoryEntityGraphStore()
+        seed_node = _make_node("seed_b", spaces=["main"])
+        store.add_node(seed_node)
+        for i in range(3):
+            store.add_node(_make_node(f"n{i}", spaces=["main"]))
+            store.add_relation(GraphEdge(
+                source_id="seed_b", target_id=f"n{i}", edge_type="LINKS",
+                properties={"piece_id": f"p{i}"},
+            ))
+        return store, _make_seed(seed_node, score=1.0, source="identity")
+
+    def test_single_batched_lookup(self):
+        store, seed = self._build()
+        piece_store = InMemoryPieceStore()
+        for i in range(3):
+            piece_store.add(KnowledgePiece(content=f"piece {i}", piece_id=f"p{i}"))
+
+        with patch.object(piece_store, "get_by_ids", wraps=piece_store.get_by_ids) as get_by_ids:
+            result = graph_walk(store, piece_store, [seed, seed], traversal_depth=1)
+
+        get_by_ids.assert_called_once()
+        depth_1 = [e for e in result if e["depth"] == 1]
+        assert len(depth_1) == 6
+        assert all(e["piece"].piece_id == f"p{e['target_node_id'][1:]}" for e in depth_1)
+
+    def test_batch_failure_falls_back_per_piece(self):
+        store, seed = self._build()
+        piece_store = InMemoryPieceStore()
+        piece_store.add(KnowledgePiece(content="piece 1", piece_id="p1"))
+
+        with patch.object(piece_store, "get_by_ids", side_effect=RuntimeError("batch down")):
+            result = graph_walk(store, piece_store, [seed], traversal_depth=1)
+
+        pieces = {e["target_node_id"]: e["piece"] for e in result if e["depth"] == 1}
+        assert pieces["n0"] is None
+        assert pieces["n1"].piece_id == "p1"
+        assert pieces["n2"] is None
+
+
+class CountingGraphStore(InMemoryEntityGraphStore):
+    """Records the node batches passed to the batched read methods."""
+
+    def __init__(self):
+        super().__init__()
+        self.neighbor_batches: List[List[str]] = []
+        self.relation_batches: List[List[str]] = []
+
+    def get_neighbors_many(self, node_ids, relation_type=None, depth=1):
+        node_ids = list(node_ids)
+        self.neighbor_batches.append(node_ids)
+        return super().get_neighbors_many(node_ids, relation_type, depth)
+
+    def get_relations_many(self, node_ids, relation_type=None, direction="outgoing"):
+        node_ids = list(node_ids)
+        self.relation_batches.append(node_ids)
+        return super().get_relations_many(node_ids, relation_type, direction)
+
+
+class TestBatchedReads:
+    """All seeds are walked together, with one batched read per store method."""
+
+    def _build(self, store):
+        # a -> shared, b -> shared, shared -> leaf, a -> b
+        for node_id in ("a", "b", "shared", "leaf"):
+            store.add_node(_make_node(node_id, spaces=["main"]))
+        for source, target in (("a", "shared"), ("b", "shared"), ("shared", "leaf"), ("a", "b")):
+            store.add_relation(GraphEdge(source_id=source, target_id=target, edge_type="LINKS"))
+        return [_make_seed(store.get_node("a")), _make_seed(store.get_node("b"))]
+
+    def test_one_neighbors_call_and_one_relations_call(self):
+        store = CountingGraphStore()
+        seeds = self._build(store)
+
+        graph_walk(store, None, seeds, traversal_depth=2)
+
+        assert store.neighbor_batches == [["a", "b"]]
+        assert store.relation_batches == [["a", "b"]]
+
+    def test_results_match_per_seed_walk(self):
+        store = CountingGraphStore()
+        seeds = self._build(store)
+
+        result = graph_walk(store, None, seeds, traversal_depth=2)
+
+        per_seed = {
+            (e["target_node_id"], e["depth"]) for e in result if e["depth"] > 0
+        }
+        expected = {
+            (node.node_id, depth)
+            for seed in seeds
+            for node, depth in store.get_neighbors(seed.node.node_id, depth=2)
+        }
+        assert per_seed == expected
+
+    @pytest.mark.parametrize("depth", [1, 2, 3])
+    def test_get_neighbors_many_matches_get_neighbors(self, depth):
+        store = InMemoryEntityGraphStore()
+        self._build(store)
+        sources = ["a", "b", "shared", "missing"]
+
+        batched = store.get_neighbors_many(sources, depth=depth)
+
+        for source in sources:
+            expected = {(n.node_id, d) for n, d in store.get_neighbors(source, depth=depth)}
+            assert {(n.node_id, d) for n, d in batched[source]} == expected
+
+
+def _per_seed_walk(graph_store, seeds, traversal_depth):
+    """Reference walk: one ``get_neighbors(depth=N)`` and ``get_relations`` per seed."""
+    entries = []
+    for seed in seeds:
+        entries.append({
+            "relation_type": "SEARCH_HIT" if seed.source == "search" else "IDENTITY",
+            "target_node_id": seed.node.node_id,
+            "target_label": seed.node.label,
+            "piece": None,
+            "depth": 0,
+            "score": seed.score,
+        })
+        relations = graph_store.get_relations(seed.node.node_id, direction="outgoing")
+        for neighbor, depth in graph_store.get_neighbors(seed.node.node_id, depth=traversal_depth):
+            matching = [r for r in relations if r.target_id == neighbor.node_id] if depth == 1 else []
+            for rel in matching or [None]:
+                entries.append({
+                    "relation_type": rel.edge_type if rel else "RELATED",
+                    "target_node_id": neighbor.node_id,
+                    "target_label": neighbor.label,
+                    "piece": None,
+                    "depth": depth,
+                    "score": seed.score * (1.0 / (depth + 1)),
+                })
+    return entries
+
+
+class TestUnbatchedStoreParity:
+    """Stores without a batched traversal keep per-seed traversal semantics."""
+
+    def _build(self):
+        from rich_python_utils.service_utils.graph_service.memory_graph_service import (
+            MemoryGraphService,
+        )
+        from agent_foundation.knowledge.retrieval.stores.graph.graph_adapter import (
+            GraphServiceEntityGraphStore,
+        )
+
+        service = MemoryGraphService()
+        # a -> hidden (inactive) -> behind; a -> z -> w; b -> z
+        for node_id in ("a", "b", "hidden", "behind", "z", "w"):
+            node = _make_node(node_id, spaces=["main"])
+            node.is_active = node_id != "hidden"
+            service.add_node(node)
+        for source, target in (("a", "hidden"), ("hidden", "behind"), ("a", "z"), ("z", "w"), ("b", "z")):
+            service.add_edge(GraphEdge(source_id=source, target_id=target, edge_type="LINKS"))
+        store = GraphServiceEntityGraphStore(graph_service=service)
+        seeds = [_make_seed(store.get_node("a")), _make_seed(store.get_node("b"))]
+        return service, store, seeds
+
+    def test_depth_2_matches_per_seed_walk(self):
+        _, store, seeds = self._build()
+
+        result = graph_walk(store, None, seeds, traversal_depth=2)
+
+        assert result == _per_seed_walk(store, seeds, traversal_depth=2)
+        # Reachable only through the inactive node, as with get_neighbors
+        assert ("behind", 2) in {(e["target_node_id"], e["depth"]) for e in result}
+        assert "hidden" not in {e["target_node_id"] for e in result}
+
+    def test_one_traversal_per_seed(self):
+        service, store, seeds = self._build()
+
+        with patch.object(service, "get_neighbors", wraps=service.get_neighbors) as get_neighbors:
+            graph_walk(store, None, seeds, traversal_depth=2)
+
+        assert [c.args[0] for c in get_neighbors.call_args_list] == ["a", "b"]
+        assert all(c.kwargs["depth"] == 2 for c in get_neighbors.call_args_list)
+
+
 # ── 9. Space filtering: matching spaces kept, non-matching filtered ──────────
 
 
@@ -8,6 +8,7 @@ Tests cover:
 - Default config values
 """
 import sys
+import threading
 from pathlib import Path
 
 # Path resolution for imports
@@ -199,3 +200,153 @@ class TestHybridRetriever:
         retriever = HybridRetriever(lambda **kw: [], lambda **kw: [])
         results = retriever.search("test", top_k=10)
         assert results == []
+
+
+class TestQueryVectorReuse:
+    def test_query_embedded_once_and_passed_to_vector_leg(self):
+        embed_calls = []
+        vector_kwargs = []
+        keyword_kwargs = []
+
+        def embed(text):
+            embed_calls.append(text)
+            return [1.0, 0.0]
+
+        retriever = HybridRetriever(
+            lambda **kw: vector_kwargs.append(kw) or [],
+            lambda **kw: keyword_kwargs.append(kw) or [],
+            query_embedding_fn=embed,
+        )
+        retriever.search("test", top_k=2)
+
+        assert embed_calls == ["test"]
+        assert vector_kwargs[0]["query_vector"] == [1.0, 0.0]
+        assert "query_vector" not in keyword_kwargs[0]
+
+    def test_precomputed_vector_skips_embedding(self):
+        embed_calls = []
+        vector_kwargs = []
+        retriever = HybridRetriever(
+            lambda **kw: vector_kwargs.append(kw) or [],
+            lambda **kw: [],
+            query_embedding_fn=lambda text: embed_calls.append(text) or [0.5],
+        )
+        retriever.search("test", top_k=2, query_vector=[0.25])
+
+        assert embed_calls == []
+        assert vector_kwargs[0]["query_vector"] == [0.25]
+
+    def test_no_embedding_fn_keeps_legacy_call(self):
+        vector_kwargs = []
+        retriever = HybridRetriever(lambda **kw: vector_kwargs.append(kw) or [], lambda **kw: [])
+        retriever.search("test", top_k=2)
+        assert "query_vector" not in vector_kwargs[0]
+
+
+class TestParallelLegs:
+    def _legs(self):
+        vector = [(_make_piece(f"v{i}"), 1.0 - i * 0.1) for i in range(4)]
+        keyword = [(_make_piece(f"v{i}"), 1.0) for i in (3, 1)] + [(_make_piece("k0"), 0.5)]
+        return (lambda **kw: list(vector)), (lambda **kw: list(keyword))
+
+    def test_parallel_matches_sequential(self):
+        vector_fn, keyword_fn = self._legs()
+        parallel = HybridRetriever(vector_fn, keyword_fn).search("q", top_k=4)
+        sequential = HybridRetriever(
+            vector_fn, keyword_fn, HybridSearchConfig(parallel_legs=False)
+        ).search("q", top_k=4)
+
+        assert [(r.piece_id, r.score) for r in parallel] == [
+            (r.piece_id, r.score) for r in sequential
+        ]
+
+    def test_legs_overlap_and_report_latency(self):
+        # Each leg waits for the other; sequential execution would break the barrier.
+        barrier = threading.Barrier(2, timeout=5)
+        p1 = _make_piece("p1")
+
+        def vector_fn(**kwargs):
+            barrier.wait()
+            return [(p1, 0.9)]
+
+        def keyword_fn(**kwargs):
+            barrier.wait()
+            return [(p1, 0.8)]
+
+        result = HybridRetriever(vector_fn, keyword_fn).search_with_stats("q", top_k=1)
+
+        assert [r.piece_id for r in result.pieces] == ["p1"]
+        assert set(result.leg_latencies) == {"vector", "keyword"}
+        assert result.leg_errors == {}
+        assert result.skipped_leg is None
+
+    def test_leg_failure_is_reported(self):
+        p1 = _make_piece("p1")
+
+        def keyword_fn(**kwargs):
+            raise RuntimeError("index offline")
+
+        result = HybridRetriever(lambda **kw: [(p1, 0.9)], keyword_fn).search_with_stats("q")
+
+        assert [r.piece_id for r in result.pieces] == ["p1"]
+        assert "index offline" in result.leg_errors["keyword"]
+
+    def test_straggler_timeout_fuses_without_slow_leg(self):
+        release = threading.Event()
+        p1 = _make_piece("p1")
+
+        def keyword_fn(**kwargs):
+            release.wait(5)
+            return [(_make_piece("late"), 1.0)]
+
+        config = HybridSearchConfig(straggler_timeout_seconds=0.05)
+        try:
+            result = HybridRetriever(
+                lambda **kw: [(p1, 0.9)], keyword_fn, config
+            ).search_with_stats("q")
+        finally:
+            release.set()
+
+        assert [r.piece_id for r in result.pieces] == ["p1"]
+        assert result.skipped_leg == "keyword"
+        assert result.leg_errors == {"keyword": "timeout"}
+
+    def test_early_termination_when_other_leg_cannot_change_top_k(self):
+        release = threading.Event()
+        vector_fn, _ = self._legs()
+
+        def keyword_fn(**kwargs):
+            release.wait(5)
+            return [(_make_piece("v3"), 1.0)]
+
+        config = HybridSearchConfig(
+            vector_weight=1.0, keyword_weight=0.0, early_termination=True
+        )
+        try:
+            result = HybridRetriever(vector_fn, keyword_fn, config).search_with_stats(
+                "q", top_k=2
+            )
+        finally:
+            release.set()
+
+        assert [r.piece_id for r in result.pieces] == ["v0", "v1"]
+        assert result.skipped_leg == "keyword"
+        assert "keyword" not in result.leg_latencies
+
+    def test_top_k_final_only_with_very_unequal_weights(self):
+        # Default rrf_k=60, top_k=10: the threshold is 0.7 * 61 / (70 * 71) ~ 0.0086
+        vector_results = [(_make_piece(f"v{i}"), 1.0) for i in range(30)]
+        for keyword_weight, final in [(0.3, False), (0.01, False), (0.008, True)]:
+            config = HybridSearchConfig(vector_weight=0.7, keyword_weight=keyword_weight)
+            retriever = HybridRetriever(lambda **kw: [], lambda **kw: [], config)
+
+            assert retriever._top_k_is_final({"vector": vector_results}, "keyword", 10) is final
+
+    def test_no_early_termination_when_top_k_may_change(self):
+        vector_fn, keyword_fn = self._legs()
+        config = HybridSearchConfig(early_termination=True)
+
+        result = HybridRetriever(vector_fn, keyword_fn, config).search_with_stats("q", top_k=4)
+
+        assert result.skipped_leg is None
+        assert {"k0", "v3"} & {r.piece_id for r in result.pieces}
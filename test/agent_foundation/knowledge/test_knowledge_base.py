@@ -39,6 +39,7 @@ from agent_foundation.knowledge.retrieval.stores.metadata.keyvalue_adapter impor
 from agent_foundation.knowledge.retrieval.stores.pieces.retrieval_adapter import (
     RetrievalKnowledgePieceStore,
 )
+from agent_foundation.knowledge.retrieval.stores.pieces.filters import PieceFilter
 from agent_foundation.knowledge.retrieval.stores.graph.graph_adapter import (
     GraphServiceEntityGraphStore,
 )
@@ -383,6 +384,136 @@ class TestRetrievePiecesWithFallback:
         assert len(result) <= 1
 
 
+class TestPieceSearchMemo:
+    """The fallback tiers and space over-fetch share store searches per request."""
+
+    def _count_searches(self, kb, monkeypatch):
+        calls = []
+        original = kb.piece_store.search
+
+        def counting_search(query, **kwargs):
+            calls.append(kwargs)
+            return original(query, **kwargs)
+
+        monkeypatch.setattr(kb.piece_store, "search", counting_search)
+        return calls
+
+    def _disable_pushdown(self, kb, monkeypatch):
+        # Exercise the Python-side space over-fetch.
+        monkeypatch.setattr(
+            type(kb.piece_store), "supports_filter_pushdown", False
+        )
+
+    def test_tiers_reuse_one_search(self, populated_kb, monkeypatch):
+        calls = self._count_searches(populated_kb, monkeypatch)
+
+        result = populated_kb._retrieve_pieces_with_fallback(
+            query="eggs",
+            entity_id="user:xinli",
+            top_k=5,
+            domain="nonexistent_domain",
+            secondary_domains=["other_domain"],
+            tags=["eggs"],
+            min_results=1,
+        )
+
+        # Tiers 1 and 2 filter out everything; tier 3 succeeds. All three
+        # re-filter the same tagged search.
+        assert [c["tags"] for c in calls] == [["eggs"]]
+        assert [p.piece_id for p, _ in result] == ["piece-1"]
+
+    def test_global_search_shared_with_fallback(self, populated_kb, monkeypatch):
+        calls = self._count_searches(populated_kb, monkeypatch)
+
+        populated_kb.retrieve_pieces(
+            "eggs", entity_id=None, domain="nonexistent_domain", include_global=True
+        )
+
+        # Tier 4 and the global merge run the same unfiltered global search.
+        assert len(calls) == 2
+
+    def test_space_over_fetch_reuses_larger_fetch(self, populated_kb, monkeypatch):
+        for i in range(10):
+            populated_kb.piece_store.add(KnowledgePiece(
+                content=f"eggs note {i}",
+                piece_id=f"note-{i}",
+                entity_id="user:xinli",
+            ))
+        self._disable_pushdown(populated_kb, monkeypatch)
+        calls = self._count_searches(populated_kb, monkeypatch)
+
+        populated_kb._retrieve_pieces_with_fallback(
+            query="eggs",
+            entity_id="user:xinli",
+            top_k=2,
+            domain="nonexistent_domain",
+            tags=None,
+            min_results=1,
+            spaces=["personal"],
+        )
+
+        # 5x fetch came back full, so one 20x retry; tier 4 reuses both.
+        assert [c["top_k"] for c in calls] == [10, 40]
+
+    def test_short_over_fetch_skips_retry(self, populated_kb, monkeypatch):
+        self._disable_pushdown(populated_kb, monkeypatch)
+        calls = self._count_searches(populated_kb, monkeypatch)
+
+        result = populated_kb._search_with_space_strategy(
+            "eggs", entity_id="user:xinli", top_k=2, spaces=["personal"]
+        )
+
+        assert result == []
+        assert [c["top_k"] for c in calls] == [10]
+
+
+class TestFilterPushdown:
+    """Stores with filter pushdown get spaces/tags/domains in the query."""
+
+    def test_domain_tier_returns_best_in_domain_pieces(self, kb):
+        for i in range(6):
+            kb.piece_store.add(KnowledgePiece(
+                content=f"eggs recipe {i}",
+                piece_id=f"cooking-{i}",
+                entity_id="user:xinli",
+                domain="cooking",
+            ))
+        kb.piece_store.add(KnowledgePiece(
+            content="eggs protein",
+            piece_id="health-1",
+            entity_id="user:xinli",
+            domain="health",
+        ))
+
+        result = kb._retrieve_pieces_with_fallback(
+            query="eggs",
+            entity_id="user:xinli",
+            top_k=2,
+            domain="health",
+            tags=None,
+            min_results=1,
+        )
+
+        # Post-filtering the overall top 2 would drop the health piece.
+        assert [p.piece_id for p, _ in result] == ["health-1"]
+
+    def test_space_strategy_uses_search_filtered(self, populated_kb, monkeypatch):
+        calls = []
+        original = populated_kb.piece_store.search_filtered
+
+        def recording(query, piece_filter=None, **kwargs):
+            calls.append(piece_filter)
+            return original(query, piece_filter=piece_filter, **kwargs)
+
+        monkeypatch.setattr(populated_kb.piece_store, "search_filtered", recording)
+
+        populated_kb._search_with_space_strategy(
+            "eggs", entity_id="user:xinli", top_k=2, tags=["eggs"], spaces=["personal"]
+        )
+
+        assert calls == [PieceFilter(spaces=["personal"], tags=["eggs"])]
+
+
 # ── Enhanced retrieval path tests ────────────────────────────────────────────
 
 
@@ -506,3 +637,202 @@ class TestPreservation:
     def test_graph_retrieval_ignore_attribute_exists(self, kb):
         """graph_retrieval_ignore_pieces_already_retrieved attribute is preserved."""
         assert hasattr(kb, "graph_retrieval_ignore_pieces_already_retrieved")
+
+
+# ── Concurrent layer execution ───────────────────────────────────────────────
+
+
+class TestConcurrentLayers:
+    """Tests for retrieve() with concurrent_layers enabled."""
+
+    def _link_piece_in_graph(self, stores):
+        _, _, graph_store = stores
+        graph_store.add_node(GraphNode(node_id="item:eggs", node_type="item", label="Eggs"))
+        graph_store.add_relation(GraphEdge(
+            source_id="user:xinli",
+            target_id="item:eggs",
+            edge_type="PREFERS",
+            properties={"piece_id": "piece-1"},
+        ))
+
+    @pytest.mark.parametrize("ignore_retrieved", [False, True])
+    def test_matches_sequential_result(self, populated_kb, stores, ignore_retrieved):
+        self._link_piece_in_graph(stores)
+        populated_kb.graph_retrieval_ignore_pieces_already_retrieved = ignore_retrieved
+
+        sequential = populated_kb.retrieve("organic eggs")
+        populated_kb.concurrent_layers = True
+        concurrent = populated_kb.retrieve("organic eggs")
+
+        assert concurrent == sequential
+        assert concurrent.layer_errors == {}
+        prefers = [e for e in concurrent.graph_context if e["relation_type"] == "PREFERS"]
+        assert (prefers[0]["piece"] is None) == ignore_retrieved
+
+    def test_layer_timings_recorded(self, populated_kb):
+        populated_kb.concurrent_layers = True
+        result = populated_kb.retrieve("eggs")
+
+        assert set(result.layer_timings) == {
+            "metadata", "pieces", "search_graph", "identity_graph", "total",
+        }
+        assert all(t >= 0 for t in result.layer_timings.values())
+
+    def test_sequential_path_also_records_timings(self, populated_kb):
+        result = populated_kb.retrieve("eggs")
+        assert {"metadata", "pieces", "total"} <= set(result.layer_timings)
+
+    def test_failed_layer_degrades_to_partial_result(self, populated_kb, monkeypatch):
+        def boom(*args, **kwargs):
+            raise RuntimeError("graph down")
+
+        monkeypatch.setattr(populated_kb, "retrieve_identity_graph", boom)
+        populated_kb.concurrent_layers = True
+
+        result = populated_kb.retrieve("eggs")
+
+        assert "graph down" in result.layer_errors["identity_graph"]
+        assert result.pieces
+        assert result.metadata is not None
+
+    def test_slow_layer_times_out(self, populated_kb, monkeypatch):
+        import time
+
+        def slow(*args, **kwargs):
+            time.sleep(1.0)
+            return [{"target_node_id": "late"}]
+
+        monkeypatch.setattr(populated_kb, "retrieve_search_graph", slow)
+        populated_kb.concurrent_layers = True
+        populated_kb.layer_timeouts = {"search_graph": 0.05}
+
+        started = time.perf_counter()
+        result = populated_kb.retrieve("eggs")
+
+        assert time.perf_counter() - started < 0.8
+        assert "timeout" in result.layer_errors["search_graph"]
+        assert all(e["target_node_id"] != "late" for e in result.graph_context)
+        assert result.pieces
+
+    def test_layers_overlap(self, populated_kb, monkeypatch):
+        import time
+
+        def slow(value):
+            def layer(*args, **kwargs):
+                time.sleep(0.2)
+                return value
+            return layer
+
+        monkeypatch.setattr(populated_kb, "retrieve_metadata", slow((None, None)))
+        monkeypatch.setattr(populated_kb, "retrieve_pieces", slow([]))
+        monkeypatch.setattr(populated_kb, "retrieve_search_graph", slow([]))
+        monkeypatch.setattr(populated_kb, "retrieve_identity_graph", slow([]))
+        populated_kb.concurrent_layers = True
+
+        result = populated_kb.retrieve("eggs")
+
+        assert result.layer_timings["total"] < 0.6
+
+
+# ── Async API ────────────────────────────────────────────────────────────────
+
+
+class TestAsyncAPI:
+    """Tests for aretrieve / aadd_piece / abulk_load and async store defaults."""
+
+    def test_aretrieve_matches_retrieve(self, populated_kb):
+        import asyncio
+
+        sync_result = populated_kb.retrieve("organic eggs")
+        async_result = asyncio.run(populated_kb.aretrieve("organic eggs"))
+
+        assert async_result == sync_result
+        assert "total" in async_result.layer_timings
+
+    def test_aretrieve_does_not_block_loop(self, populated_kb, monkeypatch):
+        import asyncio
+        import time
+
+        def slow_pieces(*args, **kwargs):
+            time.sleep(0.2)
+            return []
+
+        monkeypatch.setattr(populated_kb, "retrieve_pieces", slow_pieces)
+
+        async def run():
+            ticks = 0
+
+            async def ticker():
+                nonlocal ticks
+                while True:
+                    await asyncio.sleep(0.01)
+                    ticks += 1
+
+            task = asyncio.create_task(ticker())
+            await populated_kb.aretrieve("eggs")
+            task.cancel()
+            return ticks
+
+        assert asyncio.run(run()) >= 5
+
+    def test_aretrieve_timeout_degrades(self, populated_kb, monkeypatch):
+        import asyncio
+        import time
+
+        monkeypatch.setattr(
+            populated_kb, "retrieve_search_graph", lambda *a, **k: time.sleep(1.0) or []
+        )
+        populated_kb.layer_timeouts = {"search_graph": 0.05}
+
+        result = asyncio.run(populated_kb.aretrieve("eggs"))
+
+        assert "timeout" in result.layer_errors["search_graph"]
+        assert result.pieces
+
+    def test_concurrent_acall_does_not_deadlock_saturated_pool(self, populated_kb, monkeypatch):
+        import asyncio
+        import concurrent.futures
+
+        from agent_foundation.knowledge.retrieval import async_executor
+
+        pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=2, initializer=async_executor._mark_retrieval_thread
+        )
+        monkeypatch.setattr(async_executor, "_executor", pool)
+        populated_kb.concurrent_layers = True
+        expected = populated_kb("organic eggs")
+
+        async def run():
+            calls = [populated_kb.acall("organic eggs") for _ in range(4)]
+            return await asyncio.wait_for(asyncio.gather(*calls), timeout=5)
+
+        try:
+            assert asyncio.run(run()) == [expected] * 4
+        finally:
+            pool.shutdown(wait=False)
+
+    def test_aadd_piece_and_async_store_reads(self, kb):
+        import asyncio
+
+        async def run():
+            piece = KnowledgePiece(content="Async added", piece_id="async-1")
+            assert await kb.aadd_piece(piece) == "async-1"
+            fetched = await kb.piece_store.aget_by_id("async-1")
+            batch = await kb.piece_store.aget_by_ids(["async-1", "missing"])
+            return fetched, batch
+
+        fetched, batch = asyncio.run(run())
+        assert fetched.content == "Async added"
+        assert list(batch) == ["async-1"]
+
+    def test_abulk_load(self, kb, tmp_path):
+        import asyncio
+
+        path = tmp_path / "pieces.json"
+        path.write_text(json.dumps([
+            {"content": "Bulk one", "piece_id": "bulk-1"},
+            {"content": "Bulk two", "piece_id": "bulk-2"},
+        ]))
+
+        assert asyncio.run(kb.abulk_load(str(path))) == 2
+        assert kb.piece_store.get_by_id("bulk-2") is not None
@@ -71,6 +71,16 @@ from conftest import InMemoryEntityGraphStore, InMemoryRetrievalService
 # ── Helper: build a KnowledgeBase with mock stores ───────────────────────────
 
 
+def _mock_piece_store(piece: Optional[KnowledgePiece] = None) -> MagicMock:
+    """Mock piece store whose get_by_id/get_by_ids both return ``piece``."""
+    piece_store = MagicMock(spec=KnowledgePieceStore)
+    piece_store.get_by_id.return_value = piece
+    piece_store.get_by_ids.side_effect = lambda ids: (
+        {pid: piece for pid in ids} if piece is not None else {}
+    )
+    return piece_store
+
+
 def _make_knowledge_base(
     graph_store: EntityGraphStore,
     piece_store: Optional[KnowledgePieceStore] = None,
@@ -81,8 +91,7 @@ def _make_knowledge_base(
 ) -> KnowledgeBase:
     """Create a KnowledgeBase with the given graph store and mock piece/metadata stores."""
     if piece_store is None:
-        piece_store = MagicMock(spec=KnowledgePieceStore)
-        piece_store.get_by_id.return_value = None
+        piece_store = _mock_piece_store()
         piece_store.search.return_value = []
         piece_store.list_all.return_value = []
     if metadata_store is None:
@@ -163,12 +172,11 @@ class TestSemanticGraphSearchEnabled:
         # Re-add the other nodes so they exist in inner_store (already there)
 
         # Mock piece_store to return a piece for piece-eggs
-        piece_store = MagicMock(spec=KnowledgePieceStore)
         eggs_piece = KnowledgePiece(
             content="Organic eggs at Safeway cost $5.99",
             piece_id="piece-eggs",
         )
-        piece_store.get_by_id.return_value = eggs_piece
+        piece_store = _mock_piece_store(eggs_piece)
         piece_store.search.return_value = []
         piece_store.list_all.return_value = []
 
@@ -212,9 +220,8 @@ class TestNonSemanticGraphStoreFallback:
         graph_store = InMemoryEntityGraphStore()
         nodes = _build_safeway_graph(graph_store)
 
-        piece_store = MagicMock(spec=KnowledgePieceStore)
         eggs_piece = KnowledgePiece(content="Eggs info", piece_id="piece-eggs")
-        piece_store.get_by_id.return_value = eggs_piece
+        piece_store = _mock_piece_store(eggs_piece)
         piece_store.search.return_value = []
         piece_store.list_all.return_value = []
 
@@ -361,8 +368,7 @@ class TestMergeDedupLayer2AndLayer3a:
         eggs_piece = KnowledgePiece(
             content="Organic eggs info", piece_id="piece-eggs", info_type="context",
         )
-        piece_store = MagicMock(spec=KnowledgePieceStore)
-        piece_store.get_by_id.return_value = eggs_piece
+        piece_store = _mock_piece_store(eggs_piece)
         # Layer 2 also returns this piece
         piece_store.search.return_value = [(eggs_piece, 0.9)]
         piece_store.list_all.return_value = []
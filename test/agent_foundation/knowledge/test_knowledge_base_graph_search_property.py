@@ -107,6 +107,16 @@ from conftest import InMemoryEntityGraphStore
 # ── Helper: build a KnowledgeBase with mock stores ───────────────────────────
 
 
+def _mock_piece_store(piece: Optional[KnowledgePiece] = None) -> MagicMock:
+    """Mock piece store whose get_by_id/get_by_ids both return ``piece``."""
+    piece_store = MagicMock(spec=KnowledgePieceStore)
+    piece_store.get_by_id.return_value = piece
+    piece_store.get_by_ids.side_effect = lambda ids: (
+        {pid: piece for pid in ids} if piece is not None else {}
+    )
+    return piece_store
+
+
 def _make_knowledge_base(
     graph_store: EntityGraphStore,
     piece_store: Optional[KnowledgePieceStore] = None,
@@ -116,8 +126,7 @@ def _make_knowledge_base(
 ) -> KnowledgeBase:
     """Create a KnowledgeBase with the given graph store and mock piece/metadata stores."""
     if piece_store is None:
-        piece_store = MagicMock(spec=KnowledgePieceStore)
-        piece_store.get_by_id.return_value = None
+        piece_store = _mock_piece_store()
         piece_store.search.return_value = []
         piece_store.list_all.return_value = []
     if metadata_store is None:
@@ -278,8 +287,7 @@ class TestGraphSearchPieceDedupViaSkip:
 
         # Mock piece_store that would return a piece for this piece_id
         mock_piece = KnowledgePiece(content="test content", piece_id=piece_id, info_type=info_type)
-        piece_store = MagicMock(spec=KnowledgePieceStore)
-        piece_store.get_by_id.return_value = mock_piece
+        piece_store = _mock_piece_store(mock_piece)
         piece_store.search.return_value = []
         piece_store.list_all.return_value = []
 
@@ -335,8 +343,7 @@ class TestGraphSearchPieceDedupViaSkip:
 
         # Mock piece_store returns a piece
         mock_piece = KnowledgePiece(content="test content", piece_id=piece_id)
-        piece_store = MagicMock(spec=KnowledgePieceStore)
-        piece_store.get_by_id.return_value = mock_piece
+        piece_store = _mock_piece_store(mock_piece)
         piece_store.search.return_value = []
         piece_store.list_all.return_value = []
 
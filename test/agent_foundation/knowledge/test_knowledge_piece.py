@@ -9,6 +9,7 @@ Tests cover:
 - Content validation in from_dict
 - Serialization round-trip (to_dict / from_dict)
 - embedding_text optional field
+- Pre-parsed timestamp epochs
 
 Requirements: 1.1, 1.2, 1.4, 1.5, 1.6
 """
@@ -533,3 +534,33 @@ class TestSpacesRoundTrip:
         assert "pending_space_suggestions" not in d
         restored = KnowledgePiece.from_dict(d)
         assert restored.pending_space_suggestions is None
+
+
+class TestTimestampEpochs:
+    """Tests for created_at_epoch / updated_at_epoch."""
+
+    def test_epochs_parsed_from_iso(self):
+        piece = KnowledgePiece(
+            content="Test",
+            created_at="1970-01-02T00:00:00+00:00",
+            updated_at="1970-01-03T00:00:00",
+        )
+        assert piece.created_at_epoch == 86400.0
+        assert piece.updated_at_epoch == 2 * 86400.0
+
+    def test_unparsable_timestamp_gives_none(self):
+        assert KnowledgePiece(content="Test", updated_at="yesterday").updated_at_epoch is None
+
+    def test_seeded_epoch_used_until_timestamp_changes(self):
+        piece = KnowledgePiece(content="Test", updated_at="1970-01-02T00:00:00+00:00")
+        piece.set_timestamp_epochs(updated_at_epoch=123.0)
+        assert piece.updated_at_epoch == 123.0
+
+        piece.updated_at = "1970-01-03T00:00:00+00:00"
+        assert piece.updated_at_epoch == 2 * 86400.0
+
+    def test_epoch_cache_excluded_from_equality(self):
+        a = KnowledgePiece(content="Test", piece_id="p", created_at="t", updated_at="t")
+        b = KnowledgePiece(content="Test", piece_id="p", created_at="t", updated_at="t")
+        b.set_timestamp_epochs(created_at_epoch=1.0)
+        assert a == b
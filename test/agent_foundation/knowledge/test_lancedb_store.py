@@ -23,6 +23,7 @@ from agent_foundation.knowledge.retrieval.stores.pieces.lancedb_store import (
     _escape_sql_like,
     _build_where_clause,
 )
+from agent_foundation.knowledge.retrieval.stores.pieces.filters import PieceFilter
 
 
 class TestPieceToRecord:
@@ -248,6 +249,39 @@ class TestRoundTrip:
         assert restored.supersedes == piece.supersedes
 
 
+class TestTimestampEpochColumns:
+    """Tests for the pre-parsed created_at/updated_at epoch columns."""
+
+    def test_record_stores_epochs(self):
+        piece = KnowledgePiece(
+            content="epoch test",
+            created_at="1970-01-02T00:00:00+00:00",
+            updated_at="1970-01-03T00:00:00+00:00",
+        )
+        record = _piece_to_record(piece, [0.0])
+        assert record["created_at_epoch"] == 86400.0
+        assert record["updated_at_epoch"] == 2 * 86400.0
+
+    def test_unparsable_timestamp_stored_as_nan(self):
+        record = _piece_to_record(KnowledgePiece(content="x", updated_at="bad"), [0.0])
+        assert record["updated_at_epoch"] != record["updated_at_epoch"]
+        assert _record_to_piece(record).updated_at_epoch is None
+
+    def test_loaded_piece_uses_stored_epoch(self):
+        record = _piece_to_record(
+            KnowledgePiece(content="x", updated_at="1970-01-03T00:00:00+00:00"), [0.0]
+        )
+        record["updated_at_epoch"] = 5.0  # proves the column is used, not the string
+        assert _record_to_piece(record).updated_at_epoch == 5.0
+
+    def test_record_without_epoch_columns_parses_lazily(self):
+        record = _piece_to_record(
+            KnowledgePiece(content="x", updated_at="1970-01-03T00:00:00+00:00"), [0.0]
+        )
+        del record["created_at_epoch"], record["updated_at_epoch"]
+        assert _record_to_piece(record).updated_at_epoch == 2 * 86400.0
+
+
 class TestFindByContentHash:
     """Tests for LanceDBKnowledgePieceStore.find_by_content_hash override."""
 
@@ -533,6 +567,46 @@ class TestBuildWhereClauseSpaces:
         assert "primary_space" not in clause
 
 
+class TestBuildWhereClauseFilter:
+    """Tests for compiling a PieceFilter into the WHERE clause."""
+
+    def test_tags_become_json_like_conditions(self):
+        clause = _build_where_clause(
+            "user:1", None, piece_filter=PieceFilter(tags=["eggs", "diet"])
+        )
+        assert "tags LIKE '%\"eggs\"%'" in clause
+        assert "tags LIKE '%\"diet\"%'" in clause
+
+    def test_scalar_constraints(self):
+        clause = _build_where_clause(
+            "user:1",
+            None,
+            piece_filter=PieceFilter(
+                domains=["cooking", "health"],
+                created_since="2024-01-01",
+                created_before="2025-01-01",
+                is_active=True,
+                validation_statuses=["passed"],
+            ),
+        )
+        assert "domain IN ('cooking', 'health')" in clause
+        assert "created_at >= '2024-01-01'" in clause
+        assert "created_at < '2025-01-01'" in clause
+        assert "is_active = true" in clause
+        assert "validation_status IN ('passed')" in clause
+
+    def test_filter_spaces_used_when_spaces_not_given(self):
+        clause = _build_where_clause(
+            "user:1", None, piece_filter=PieceFilter(spaces=["personal"])
+        )
+        assert "primary_space IN ('personal')" in clause
+
+    def test_empty_filter_adds_nothing(self):
+        assert _build_where_clause("user:1", None, piece_filter=PieceFilter()) == (
+            _build_where_clause("user:1", None)
+        )
+
+
 class TestRoundTripSpaces:
     """Tests for _piece_to_record → _record_to_piece round trip with spaces."""
 
@@ -569,3 +643,493 @@ class TestRoundTripSpaces:
         assert restored.pending_space_suggestions is None
         assert restored.space_suggestion_reasons is None
         assert restored.space_suggestion_status is None
+
+
+def _make_mock_lancedb_store(tmp_path, existing_ids=(), batch_calls=None):
+    """Build a LanceDBKnowledgePieceStore over a MagicMock lancedb table."""
+    import sys
+
+    from agent_foundation.knowledge.retrieval.stores.pieces.lancedb_store import LanceDBKnowledgePieceStore
+
+    fake_lancedb = MagicMock()
+    db = fake_lancedb.connect.return_value
+    db.table_names.return_value = ["knowledge_pieces"]
+    table = db.open_table.return_value
+    # Schema migration check sees an empty table.
+    table.search.return_value.limit.return_value.to_list.return_value = []
+    table.search.return_value.where.return_value.limit.return_value.to_list.return_value = []
+    table.search.return_value.where.return_value.select.return_value.limit.return_value.to_list.return_value = [
+        {"piece_id": pid} for pid in existing_ids
+    ]
+
+    def batch_embed(texts):
+        if batch_calls is not None:
+            batch_calls.append(list(texts))
+        return [[float(len(t))] for t in texts]
+
+    with patch.dict(sys.modules, {"lancedb": fake_lancedb}):
+        store = LanceDBKnowledgePieceStore(
+            db_path=str(tmp_path),
+            embedding_function=lambda text: [float(len(text))],
+            batch_embedding_function=batch_embed,
+            embedding_batch_size=2,
+        )
+    return store, table
+
+
+class TestBatchOperations:
+    """Tests for add_many / update_many / remove_many and bulk_session."""
+
+    def test_add_many_embeds_in_batches_and_writes_once(self, tmp_path):
+        calls = []
+        store, table = _make_mock_lancedb_store(tmp_path, batch_calls=calls)
+        pieces = [KnowledgePiece(content=f"piece {i}", piece_id=f"p{i}") for i in range(3)]
+
+        added = store.add_many(pieces)
+
+        assert added == ["p0", "p1", "p2"]
+        assert calls == [["piece 0", "piece 1"], ["piece 2"]]
+        table.add.assert_called_once()
+        assert [r["piece_id"] for r in table.add.call_args[0][0]] == added
+        table.create_fts_index.assert_called_once_with("content", replace=True)
+
+    def test_add_many_rejects_duplicates_before_writing(self, tmp_path):
+        store, table = _make_mock_lancedb_store(tmp_path, existing_ids=["p1"])
+        pieces = [KnowledgePiece(content=f"piece {i}", piece_id=f"p{i}") for i in range(3)]
+
+        with pytest.raises(ValueError, match="p1"):
+            store.add_many(pieces)
+        table.add.assert_not_called()
+
+        added = store.add_many(pieces, skip_duplicates=True)
+        assert added == ["p0", "p2"]
+
+    def test_add_many_rejects_in_batch_duplicates(self, tmp_path):
+        store, table = _make_mock_lancedb_store(tmp_path)
+        pieces = [KnowledgePiece(content="a", piece_id="dup"), KnowledgePiece(content="b", piece_id="dup")]
+
+        with pytest.raises(ValueError, match="dup"):
+            store.add_many(pieces)
+        table.add.assert_not_called()
+
+    def test_bulk_session_rebuilds_fts_once(self, tmp_path):
+        store, table = _make_mock_lancedb_store(tmp_path)
+
+        with store.bulk_session():
+            store.add_many([KnowledgePiece(content="a", piece_id="a")])
+            with store.bulk_session():
+                store.add(KnowledgePiece(content="b", piece_id="b"))
+            table.create_fts_index.assert_not_called()
+
+        table.create_fts_index.assert_called_once_with("content", replace=True)
+
+    def test_remove_many_deletes_with_one_in_clause(self, tmp_path):
+        store, table = _make_mock_lancedb_store(tmp_path, existing_ids=["p1", "p2"])
+
+        removed = store.remove_many(["p1", "p2", "missing"])
+
+        assert removed == ["p1", "p2"]
+        table.delete.assert_called_once_with("piece_id IN ('p1', 'p2')")
+        table.create_fts_index.assert_called_once()
+
+    def test_update_many_merges_existing_only(self, tmp_path):
+        store, table = _make_mock_lancedb_store(tmp_path, existing_ids=["p1"])
+        pieces = [KnowledgePiece(content="new", piece_id="p1"), KnowledgePiece(content="x", piece_id="p9")]
+
+        updated = store.update_many(pieces)
+
+        assert updated == ["p1"]
+        merge = table.merge_insert.return_value.when_matched_update_all.return_value
+        records = merge.execute.call_args[0][0]
+        assert [r["piece_id"] for r in records] == ["p1"]
+        table.merge_insert.assert_called_once_with("piece_id")
+
+
+class TestGetByIds:
+    """Tests for batched get_by_ids and its use in search hydration."""
+
+    def test_fetches_all_ids_with_one_query(self, tmp_path):
+        store, table = _make_mock_lancedb_store(tmp_path)
+        records = [
+            _piece_to_record(KnowledgePiece(content=f"piece {pid}", piece_id=pid), [0.0])
+            for pid in ("p2", "p1")
+        ]
+        table.search.reset_mock()
+        table.search.return_value.where.return_value.limit.return_value.to_list.return_value = records
+
+        pieces = store.get_by_ids(["p1", "missing", "p2", "p1"])
+
+        assert list(pieces) == ["p1", "p2"]
+        assert pieces["p1"].content == "piece p1"
+        table.search.return_value.where.assert_called_once_with(
+            "piece_id IN ('p1', 'missing', 'p2')"
+        )
+
+    def test_empty_ids_skip_query(self, tmp_path):
+        store, table = _make_mock_lancedb_store(tmp_path)
+        table.search.reset_mock()
+
+        assert store.get_by_ids([]) == {}
+        table.search.assert_not_called()
+
+    def test_search_hydrates_hits_in_one_round_trip(self, tmp_path):
+        store, table = _make_mock_lancedb_store(tmp_path)
+        hits = [{"piece_id": "a", "_distance": 0.1}, {"piece_id": "b", "_distance": 0.4}]
+        vector_query = table.search.return_value.metric.return_value
+        vector_query.where.return_value.limit.return_value.to_list.return_value = hits
+        pieces = {
+            pid: KnowledgePiece(content=pid, piece_id=pid) for pid in ("a", "b")
+        }
+
+        with patch.object(store, "get_by_ids", return_value=pieces) as get_by_ids, \
+                patch.object(store, "get_by_id") as get_by_id:
+            results = store.search("query", top_k=2)
+
+        assert [p.piece_id for p, _ in results] == ["a", "b"]
+        get_by_ids.assert_called_once()
+        assert sorted(get_by_ids.call_args[0][0]) == ["a", "b"]
+        get_by_id.assert_not_called()
+
+
+class TestParallelSearchLegs:
+    """Tests for running the vector and FTS legs of search concurrently."""
+
+    def _wire_legs(self, store, table, vector_hits, fts_hits, barrier=None):
+        vector_query = MagicMock()
+        fts_query = MagicMock()
+
+        def vector_rows():
+            if barrier is not None:
+                barrier.wait()
+            return vector_hits
+
+        def fts_rows():
+            if barrier is not None:
+                barrier.wait()
+            return fts_hits
+
+        vector_query.metric.return_value.where.return_value.limit.return_value.to_list.side_effect = vector_rows
+        fts_query.where.return_value.limit.return_value.to_list.side_effect = fts_rows
+
+        def search(query=None, query_type=None):
+            return fts_query if query_type == "fts" else vector_query
+
+        table.search.side_effect = search
+        store._fts_index_created = True
+        pieces = {
+            pid: KnowledgePiece(content=pid, piece_id=pid) for pid in ("a", "b", "c")
+        }
+        return patch.object(
+            store, "get_by_ids", side_effect=lambda ids: {i: pieces[i] for i in ids}
+        )
+
+    def test_legs_overlap(self, tmp_path):
+        import threading
+
+        store, table = _make_mock_lancedb_store(tmp_path)
+        # Each leg waits for the other; sequential execution would break the barrier.
+        barrier = threading.Barrier(2, timeout=5)
+        with self._wire_legs(
+            store, table,
+            [{"piece_id": "a", "_distance": 0.1}],
+            [{"piece_id": "b", "_score": 2.0}],
+            barrier=barrier,
+        ):
+            results = store.search("query", top_k=2)
+
+        assert [p.piece_id for p, _ in results] == ["a", "b"]
+
+    def test_parallel_matches_sequential(self, tmp_path):
+        vector_hits = [{"piece_id": "a", "_distance": 0.2}, {"piece_id": "b", "_distance": 0.5}]
+        fts_hits = [{"piece_id": "c", "_score": 4.0}, {"piece_id": "b", "_score": 2.0}]
+        ranked = []
+        for parallel in (True, False):
+            store, table = _make_mock_lancedb_store(tmp_path)
+            store.parallel_search_legs = parallel
+            with self._wire_legs(store, table, vector_hits, fts_hits):
+                ranked.append([(p.piece_id, s) for p, s in store.search("query", top_k=3)])
+
+        assert ranked[0] == ranked[1]
+        assert [pid for pid, _ in ranked[0]] == ["a", "b", "c"]
+
+    def test_tag_filter_pushed_into_both_legs(self, tmp_path):
+        store, table = _make_mock_lancedb_store(tmp_path)
+        vector_query = MagicMock()
+        fts_query = MagicMock()
+        vector_query.metric.return_value.where.return_value.limit.return_value.to_list.return_value = []
+        fts_query.where.return_value.limit.return_value.to_list.return_value = []
+        table.search.side_effect = lambda query=None, query_type=None: (
+            fts_query if query_type == "fts" else vector_query
+        )
+        store._fts_index_created = True
+
+        store.search("query", tags=["eggs"], top_k=3)
+
+        vector_where = vector_query.metric.return_value.where
+        fts_where = fts_query.where
+        assert "tags LIKE" in vector_where.call_args[0][0]
+        assert "tags LIKE" in fts_where.call_args[0][0]
+        # No over-fetch: the filter is applied before the limit.
+        vector_where.return_value.limit.assert_called_once_with(3)
+        fts_where.return_value.limit.assert_called_once_with(3)
+
+
+class TestIterAll:
+    """Tests for streaming iteration over the LanceDB table."""
+
+    @staticmethod
+    def _rows(*ids):
+        return [_piece_to_record(KnowledgePiece(content=i, piece_id=i), [0.0]) for i in ids]
+
+    def test_streams_dataset_batches_with_where_clause(self, tmp_path):
+        store, table = _make_mock_lancedb_store(tmp_path)
+        batches = [MagicMock(), MagicMock()]
+        batches[0].to_pylist.return_value = self._rows("a", "b")
+        batches[1].to_pylist.return_value = self._rows("c")
+        dataset = table.to_lance.return_value
+        dataset.to_batches.return_value = iter(batches)
+
+        ids = [p.piece_id for p in store.iter_all(
+            knowledge_type=KnowledgeType.Fact,
+            piece_filter=PieceFilter(is_active=True),
+            batch_size=2,
+        )]
+
+        assert ids == ["a", "b", "c"]
+        kwargs = dataset.to_batches.call_args.kwargs
+        assert kwargs["batch_size"] == 2
+        assert "knowledge_type = 'fact'" in kwargs["filter"]
+        assert "is_active = true" in kwargs["filter"]
+
+    def test_rechecks_tag_filter_in_python(self, tmp_path):
+        store, table = _make_mock_lancedb_store(tmp_path)
+        batch = MagicMock()
+        tagged = _piece_to_record(KnowledgePiece(content="t", piece_id="t", tags=["gpu"]), [0.0])
+        batch.to_pylist.return_value = [tagged] + self._rows("u")
+        table.to_lance.return_value.to_batches.return_value = iter([batch])
+
+        ids = [p.piece_id for p in store.iter_all(piece_filter=PieceFilter(tags=["gpu"]))]
+
+        assert ids == ["t"]
+
+    def test_falls_back_to_offset_pages(self, tmp_path):
+        store, table = _make_mock_lancedb_store(tmp_path)
+        table.to_lance.side_effect = NotImplementedError("remote table")
+        pages = {0: self._rows("a", "b"), 2: self._rows("c")}
+        offsets = []
+
+        def page(offset):
+            offsets.append(offset)
+            query = MagicMock()
+            query.limit.return_value.to_list.return_value = pages[offset]
+            return query
+
+        table.search.return_value.where.return_value.offset.side_effect = page
+
+        ids = [p.piece_id for p in store.iter_all(batch_size=2)]
+
+        assert ids == ["a", "b", "c"]
+        assert offsets == [0, 2]
+
+    def test_offset_page_error_is_raised(self, tmp_path):
+        store, table = _make_mock_lancedb_store(tmp_path)
+        table.to_lance.side_effect = NotImplementedError("remote table")
+
+        def page(offset):
+            query = MagicMock()
+            if offset:
+                query.limit.return_value.to_list.side_effect = RuntimeError("query failed")
+            else:
+                query.limit.return_value.to_list.return_value = self._rows("a", "b")
+            return query
+
+        table.search.return_value.where.return_value.offset.side_effect = page
+
+        scanned = []
+        with pytest.raises(RuntimeError, match="query failed"):
+            for piece in store.iter_all(batch_size=2):
+                scanned.append(piece.piece_id)
+        assert scanned == ["a", "b"]
+
+
+class TestContentHashIndex:
+    """Tests for the content_hash scalar index and batched hash lookups."""
+
+    def test_scalar_index_created_on_open(self, tmp_path):
+        _, table = _make_mock_lancedb_store(tmp_path)
+
+        table.create_scalar_index.assert_called_once_with("content_hash")
+
+    def test_existing_scalar_index_is_reused(self, tmp_path):
+        import sys
+
+        from agent_foundation.knowledge.retrieval.stores.pieces.lancedb_store import LanceDBKnowledgePieceStore
+
+        fake_lancedb = MagicMock()
+        db = fake_lancedb.connect.return_value
+        db.table_names.return_value = ["knowledge_pieces"]
+        table = db.open_table.return_value
+        table.search.return_value.limit.return_value.to_list.return_value = []
+        table.list_indices.return_value = [MagicMock(columns=["content_hash"])]
+
+        with patch.dict(sys.modules, {"lancedb": fake_lancedb}):
+            LanceDBKnowledgePieceStore(db_path=str(tmp_path), embedding_function=lambda t: [0.0])
+
+        table.create_scalar_index.assert_not_called()
+
+    def test_scalar_index_created_when_add_many_creates_table(self, tmp_path):
+        import sys
+
+        from agent_foundation.knowledge.retrieval.stores.pieces.lancedb_store import LanceDBKnowledgePieceStore
+
+        fake_lancedb = MagicMock()
+        db = fake_lancedb.connect.return_value
+        db.table_names.return_value = []
+        with patch.dict(sys.modules, {"lancedb": fake_lancedb}):
+            store = LanceDBKnowledgePieceStore(db_path=str(tmp_path), embedding_function=lambda t: [0.0])
+        created = db.create_table.return_value
+        created.list_indices.return_value = []
+
+        store.add_many([KnowledgePiece(content="first", piece_id="p1")])
+
+        db.create_table.assert_called_once()
+        created.create_scalar_index.assert_called_once_with("content_hash")
+
+    def test_find_by_content_hashes_uses_one_in_query(self, tmp_path):
+        store, table = _make_mock_lancedb_store(tmp_path)
+        shared = KnowledgePiece(content="shared", piece_id="entity-copy", entity_id="user-1")
+        shared_global = KnowledgePiece(content="shared", piece_id="global-copy")
+        mine = KnowledgePiece(content="mine", piece_id="mine", entity_id="user-1")
+        batch = MagicMock()
+        batch.to_pylist.return_value = [
+            _piece_to_record(p, [0.0]) for p in (shared, mine, shared_global)
+        ]
+        dataset = table.to_lance.return_value
+        dataset.to_batches.return_value = iter([batch])
+
+        found = store.find_by_content_hashes(
+            [mine.content_hash, shared.content_hash, "missing", mine.content_hash],
+            entity_id="user-1",
+        )
+
+        assert {h: p.piece_id for h, p in found.items()} == {
+            mine.content_hash: "mine",
+            shared.content_hash: "global-copy",
+        }
+        assert list(found) == [mine.content_hash, shared.content_hash]
+        where = dataset.to_batches.call_args.kwargs["filter"]
+        assert where.startswith("content_hash IN (")
+        assert "'missing'" in where
+        assert f"entity_id IN ('{_GLOBAL_ENTITY_SENTINEL}', 'user-1')" in where
+        dataset.to_batches.assert_called_once()
+
+    def test_find_by_content_hashes_without_table(self, tmp_path):
+        store, _ = _make_mock_lancedb_store(tmp_path)
+        store._table = None
+
+        assert store.find_by_content_hashes(["abc"]) == {}
+
+
+class TestSchemaMigration:
+    """Tests for migrating tables opened with an older schema."""
+
+    @staticmethod
+    def _open(tmp_path, sample, batches=()):
+        import sys
+
+        from agent_foundation.knowledge.retrieval.stores.pieces.lancedb_store import LanceDBKnowledgePieceStore
+
+        fake_lancedb = MagicMock()
+        db = fake_lancedb.connect.return_value
+        db.table_names.return_value = ["knowledge_pieces"]
+        table = db.open_table.return_value
+        table.search.return_value.limit.return_value.to_list.return_value = [sample]
+        table.to_lance.return_value.to_batches.return_value = iter(batches)
+
+        with patch.dict(sys.modules, {"lancedb": fake_lancedb}):
+            store = LanceDBKnowledgePieceStore(db_path=str(tmp_path), embedding_function=lambda t: [0.0])
+        return store, db, table
+
+    @staticmethod
+    def _old_record(piece_id, *drop):
+        record = _piece_to_record(KnowledgePiece(content=piece_id, piece_id=piece_id), [0.0])
+        for column in ("created_at_epoch", "updated_at_epoch") + drop:
+            record.pop(column)
+        return record
+
+    def test_missing_epoch_columns_are_added_in_place(self, tmp_path):
+        store, db, table = self._open(tmp_path, self._old_record("p0"))
+
+        table.add_columns.assert_called_once_with({
+            "created_at_epoch": "CAST(NULL AS DOUBLE)",
+            "updated_at_epoch": "CAST(NULL AS DOUBLE)",
+        })
+        db.drop_table.assert_not_called()
+        db.create_table.assert_not_called()
+        assert store._table is table
+
+    def test_null_epoch_columns_fall_back_to_iso_parsing(self):
+        record = _piece_to_record(
+            KnowledgePiece(content="x", created_at="2024-01-01T00:00:00+00:00"), [0.0]
+        )
+        record["created_at_epoch"] = None
+
+        assert _record_to_piece(record).created_at_epoch == 1704067200.0
+
+    def test_rewrite_streams_every_row_before_replacing_table(self, tmp_path):
+        rows = [self._old_record(f"p{i}", "spaces", "primary_space") for i in range(5)]
+        batches = [MagicMock(), MagicMock()]
+        batches[0].to_pylist.return_value = rows[:3]
+        batches[1].to_pylist.return_value = rows[3:]
+        copied = []
+
+        import sys
+
+        from agent_foundation.knowledge.retrieval.stores.pieces.lancedb_store import LanceDBKnowledgePieceStore
+
+        fake_lancedb = MagicMock()
+        db = fake_lancedb.connect.return_value
+        db.table_names.return_value = ["knowledge_pieces"]
+        table = db.open_table.return_value
+        table.search.return_value.limit.return_value.to_list.return_value = [rows[0]]
+        table.to_lance.return_value.to_batches.return_value = iter(batches)
+        temp_table = MagicMock()
+        temp_table.add.side_effect = copied.extend
+        final_table = MagicMock()
+        final_table.list_indices.return_value = []
+        events = []
+
+        def create_table(name, data, **kwargs):
+            events.append(("create", name))
+            if name == "knowledge_pieces__migration":
+                copied.extend(data)
+                return temp_table
+            return final_table
+
+        db.create_table.side_effect = create_table
+        db.drop_table.side_effect = lambda name: events.append(("drop", name))
+
+        with patch.dict(sys.modules, {"lancedb": fake_lancedb}):
+            store = LanceDBKnowledgePieceStore(db_path=str(tmp_path), embedding_function=lambda t: [0.0])
+
+        assert len(copied) == len(rows)
+        assert all(json.loads(r["spaces"]) == ["main"] for r in copied)
+        assert all(r["updated_at_epoch"] == r["updated_at_epoch"] for r in copied)  # not NaN
+        table.to_lance.return_value.to_batches.assert_called_once()
+        assert events == [
+            ("create", "knowledge_pieces__migration"),
+            ("drop", "knowledge_pieces"),
+            ("create", "knowledge_pieces"),
+            ("drop", "knowledge_pieces__migration"),
+        ]
+        assert store._table is final_table
+
+    def test_failed_copy_keeps_original_table(self, tmp_path):
+        batch = MagicMock()
+        batch.to_pylist.side_effect = RuntimeError("read failed")
+        store, db, table = self._open(
+            tmp_path, self._old_record("p0", "history"), batches=[batch]
+        )
+
+        db.drop_table.assert_not_called()
+        assert store._table is table
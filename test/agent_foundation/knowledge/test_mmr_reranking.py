@@ -7,7 +7,9 @@ Tests cover:
 - Handling of pieces without embeddings
 - Passthrough when disabled or input <= top_k
 - Score normalization
+- Parity of the numpy and pure Python engines with the reference greedy loop
 """
+import random
 import sys
 from pathlib import Path
 
@@ -20,6 +22,9 @@ _src_dir = _current_path.parent / "src"
 if _src_dir.exists() and str(_src_dir) not in sys.path:
     sys.path.insert(0, str(_src_dir))
 
+import pytest
+
+from agent_foundation.knowledge.retrieval import mmr_reranking
 from agent_foundation.knowledge.retrieval.mmr_reranking import (
     MMRConfig,
     apply_mmr_reranking,
@@ -176,3 +181,84 @@ class TestApplyMMRReranking:
         # All normalized scores should be 1.0 since all input scores are equal
         for r in result:
             assert r.normalized_score == 1.0
+
+
+def _reference_mmr_ids(pieces, lambda_param, top_k):
+    """The original quadratic greedy loop, kept as the parity reference."""
+    from agent_foundation.knowledge.retrieval.utils import cosine_similarity
+
+    selected = []
+    remaining = list(pieces)
+    while len(selected) < top_k and remaining:
+        mmr_scores = []
+        for piece in remaining:
+            if selected:
+                max_sim = max(
+                    cosine_similarity(piece.piece.embedding, s.piece.embedding)
+                    for s in selected
+                )
+            else:
+                max_sim = 0
+            mmr_scores.append(
+                (piece, lambda_param * piece.normalized_score - (1 - lambda_param) * max_sim)
+            )
+        best, _ = max(mmr_scores, key=lambda x: x[1])
+        selected.append(best)
+        remaining.remove(best)
+    return [p.piece_id for p in selected]
+
+
+def _random_pieces(rng, n, dim):
+    return [
+        _make_scored_piece(
+            f"p{i}", rng.uniform(0.0, 10.0), embedding=[rng.gauss(0.0, 1.0) for _ in range(dim)]
+        )
+        for i in range(n)
+    ]
+
+
+class TestVectorizedParity:
+    @pytest.mark.parametrize("seed", range(20))
+    @pytest.mark.parametrize("vectorized", [True, False])
+    def test_matches_reference_ranking(self, seed, vectorized):
+        rng = random.Random(seed)
+        pieces = _random_pieces(rng, n=rng.randint(12, 60), dim=rng.randint(2, 16))
+        lambda_param = rng.choice([0.0, 0.3, 0.7, 1.0])
+        top_k = rng.randint(1, 10)
+
+        result = apply_mmr_reranking(
+            pieces, MMRConfig(lambda_param=lambda_param, vectorized=vectorized), top_k=top_k
+        )
+
+        assert [r.piece_id for r in result] == _reference_mmr_ids(pieces, lambda_param, top_k)
+
+    def test_ties_and_zero_vectors(self):
+        pieces = [
+            _make_scored_piece("p0", 1.0, embedding=[1.0, 0.0]),
+            _make_scored_piece("p1", 1.0, embedding=[1.0, 0.0]),
+            _make_scored_piece("p2", 0.5, embedding=[0.0, 0.0]),
+            _make_scored_piece("p3", 0.5, embedding=[0.0, 1.0]),
+            _make_scored_piece("p4", 0.0, embedding=[0.0, 1.0]),
+        ]
+        rankings = [
+            [r.piece_id for r in apply_mmr_reranking(pieces, MMRConfig(vectorized=v), top_k=4)]
+            for v in (True, False)
+        ]
+        assert rankings[0] == rankings[1] == _reference_mmr_ids(pieces, 0.7, 4)
+
+    def test_falls_back_without_numpy(self, monkeypatch):
+        monkeypatch.setattr(mmr_reranking, "np", None)
+        pieces = _random_pieces(random.Random(7), n=20, dim=4)
+
+        result = apply_mmr_reranking(pieces, MMRConfig(), top_k=5)
+
+        assert [r.piece_id for r in result] == _reference_mmr_ids(pieces, 0.7, 5)
+
+    def test_mismatched_dimensions_use_python_engine(self):
+        pieces = [
+            _make_scored_piece("p0", 1.0, embedding=[1.0, 0.0]),
+            _make_scored_piece("p1", 0.5, embedding=[1.0, 0.0, 0.0]),
+            _make_scored_piece("p2", 0.1, embedding=[0.0, 1.0]),
+        ]
+        with pytest.raises(ValueError, match="dimensions"):
+            apply_mmr_reranking(pieces, MMRConfig(), top_k=2)
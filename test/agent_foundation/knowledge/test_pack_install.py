@@ -0,0 +1,255 @@
+"""Unit tests for the bulk install pipeline of KnowledgePackManager."""
+
+from contextlib import contextmanager
+from typing import List, Optional
+from unittest.mock import MagicMock
+
+import pytest
+
+from rich_python_utils.service_utils.graph_service.graph_node import GraphNode
+
+from agent_foundation.knowledge.packs.models import KnowledgePack, PackManagerConfig
+from agent_foundation.knowledge.packs.pack_manager import (
+    CONTAINS_RELATION,
+    KnowledgePackManager,
+)
+from agent_foundation.knowledge.retrieval.models.knowledge_piece import KnowledgePiece
+from agent_foundation.knowledge.retrieval.stores.graph.base import EntityGraphStore
+from agent_foundation.knowledge.retrieval.stores.pieces.base import KnowledgePieceStore
+
+
+class BulkPieceStore(KnowledgePieceStore):
+    """In-memory piece store recording batched writes and bulk sessions."""
+
+    def __init__(self):
+        self._pieces: dict[str, KnowledgePiece] = {}
+        self.add_many_sizes: List[int] = []
+        self.session_depth = 0
+        self.sessions = 0
+        self.writes_outside_session = 0
+
+    def add(self, piece: KnowledgePiece) -> str:
+        if self.session_depth == 0:
+            self.writes_outside_session += 1
+        self._pieces[piece.piece_id] = piece
+        return piece.piece_id
+
+    def add_many(self, pieces, skip_duplicates=False):
+        pieces = list(pieces)
+        self.add_many_sizes.append(len(pieces))
+        return super().add_many(pieces, skip_duplicates)
+
+    def get_by_id(self, piece_id: str) -> Optional[KnowledgePiece]:
+        return self._pieces.get(piece_id)
+
+    def update(self, piece: KnowledgePiece) -> bool:
+        if piece.piece_id in self._pieces:
+            self._pieces[piece.piece_id] = piece
+            return True
+        return False
+
+    def remove(self, piece_id: str) -> bool:
+        if self.session_depth == 0:
+            self.writes_outside_session += 1
+        return self._pieces.pop(piece_id, None) is not None
+
+    def search(self, query, entity_id=None, knowledge_type=None, tags=None, top_k=5, spaces=None):
+        return [(p, 0.9) for p in list(self._pieces.values())[:top_k]]
+
+    def list_all(self, entity_id=None, knowledge_type=None, spaces=None) -> List[KnowledgePiece]:
+        return [p for p in self._pieces.values() if p.entity_id == entity_id]
+
+    @contextmanager
+    def bulk_session(self):
+        self.session_depth += 1
+        self.sessions += 1
+        try:
+            yield self
+        finally:
+            self.session_depth -= 1
+
+
+class InMemoryGraphStore(EntityGraphStore):
+    """In-memory graph store relying on the batched-write defaults."""
+
+    def __init__(self):
+        self._nodes = {}
+        self._edges = []
+
+    def add_node(self, node, **kwargs):
+        self._nodes[node.node_id] = node
+
+    def get_node(self, node_id, **kwargs):
+        return self._nodes.get(node_id)
+
+    def remove_node(self, node_id, **kwargs):
+        self._edges = [e for e in self._edges if node_id not in (e.source_id, e.target_id)]
+        return self._nodes.pop(node_id, None) is not None
+
+    def add_relation(self, relation, **kwargs):
+        self._edges.append(relation)
+
+    def get_relations(self, node_id, relation_type=None, direction="outgoing", **kwargs):
+        return [
+            e for e in self._edges
+            if (e.source_id if direction == "outgoing" else e.target_id) == node_id
+            and (relation_type is None or e.edge_type == relation_type)
+        ]
+
+    def remove_relation(self, source_id, target_id, relation_type, **kwargs):
+        return False
+
+    def get_neighbors(self, node_id, relation_type=None, depth=1, **kwargs):
+        return []
+
+
+class InMemoryMetadataStore:
+    def __init__(self):
+        self._store = {}
+
+    def save_metadata(self, metadata):
+        self._store[metadata.entity_id] = metadata
+
+    def get_metadata(self, entity_id):
+        return self._store.get(entity_id)
+
+    def delete_metadata(self, entity_id):
+        self._store.pop(entity_id, None)
+
+
+def _make_manager(**config):
+    kb = MagicMock()
+    kb.piece_store = BulkPieceStore()
+    kb.graph_store = InMemoryGraphStore()
+    kb.metadata_store = InMemoryMetadataStore()
+    manager = KnowledgePackManager(kb=kb, config=PackManagerConfig(**config))
+    return manager, kb.piece_store, kb.graph_store, kb.metadata_store
+
+
+def _pieces(n, prefix="piece"):
+    return [KnowledgePiece(content=f"{prefix} {i}", piece_id=f"{prefix}-{i}") for i in range(n)]
+
+
+class TestBulkInstall:
+    def test_writes_in_batches_inside_one_session(self):
+        manager, pieces_store, graph, metadata = _make_manager(install_batch_size=2)
+        pack = KnowledgePack(pack_id="pack:bulk", name="bulk")
+
+        result = manager.install(pack, _pieces(5))
+
+        assert result.success
+        assert result.pieces_installed == 5
+        assert pieces_store.add_many_sizes == [2, 2, 1]
+        assert pieces_store.sessions == 1
+        assert pieces_store.writes_outside_session == 0
+        assert result.details["batches"] == 3
+        assert result.details["pieces_skipped"] == 0
+        assert result.details["pieces_per_second"] > 0
+        assert result.details["elapsed_seconds"] >= 0
+        assert manager.is_installed("pack:bulk")
+        assert sorted(manager._get_piece_ids_from_graph("pack:bulk")) == pack.piece_ids
+        assert all(graph.get_node(pid) is not None for pid in pack.piece_ids)
+
+    def test_repeated_content_within_pack_is_skipped(self):
+        manager, _, _, _ = _make_manager()
+        pieces = _pieces(2) + [KnowledgePiece(content="piece 0", piece_id="copy")]
+        pack = KnowledgePack(pack_id="pack:dupes", name="dupes")
+
+        result = manager.install(pack, pieces)
+
+        assert result.success
+        assert pack.piece_ids == ["piece-0", "piece-1"]
+        assert result.details["pieces_skipped"] == 1
+
+    def test_existing_active_content_skipped_when_configured(self):
+        manager, store, _, _ = _make_manager(skip_existing_content=True)
+        store.add(KnowledgePiece(content="piece 0", piece_id="stored-active"))
+        inactive = KnowledgePiece(content="piece 1", piece_id="stored-inactive")
+        inactive.is_active = False
+        store.add(inactive)
+        pack = KnowledgePack(pack_id="pack:existing", name="existing")
+
+        result = manager.install(pack, _pieces(3))
+
+        assert result.success
+        assert pack.piece_ids == ["piece-1", "piece-2"]
+        assert result.details["pieces_skipped"] == 1
+
+    def test_existing_content_installed_by_default(self):
+        manager, store, _, _ = _make_manager()
+        store.add(KnowledgePiece(content="piece 0", piece_id="stored"))
+        pack = KnowledgePack(pack_id="pack:default", name="default")
+
+        result = manager.install(pack, _pieces(1))
+
+        assert result.success
+        assert pack.piece_ids == ["piece-0"]
+
+
+class TestInstallValidation:
+    @pytest.mark.parametrize("stored_ids, pieces", [
+        ([], _pieces(2) + [KnowledgePiece(content="other", piece_id="piece-0")]),
+        (["piece-1"], _pieces(3)),
+    ])
+    def test_invalid_pack_writes_nothing(self, stored_ids, pieces):
+        manager, store, graph, metadata = _make_manager(install_batch_size=1)
+        for pid in stored_ids:
+            store.add(KnowledgePiece(content=f"stored {pid}", piece_id=pid))
+
+        result = manager.install(KnowledgePack(pack_id="pack:bad", name="bad"), pieces)
+
+        assert not result.success
+        assert result.error.startswith("Invalid pack:")
+        assert store.add_many_sizes == []
+        assert graph.get_node("pack:bad") is None
+        assert metadata.get_metadata("pack:bad") is None
+
+    def test_store_error_during_planning_returns_failed_result(self):
+        manager, store, graph, metadata = _make_manager()
+        store.get_by_ids = MagicMock(side_effect=OSError("store unavailable"))
+
+        result = manager.install(KnowledgePack(pack_id="pack:io", name="io"), _pieces(2))
+
+        assert not result.success
+        assert result.error == "Install failed: store unavailable"
+        assert store.add_many_sizes == []
+        assert metadata.get_metadata("pack:io") is None
+
+
+class TestInstallRollback:
+    @staticmethod
+    def _fail_on_call(obj, name, call_number=1):
+        original = getattr(obj, name)
+        calls = []
+
+        def wrapper(*args, **kwargs):
+            calls.append(args)
+            if len(calls) == call_number:
+                raise RuntimeError("backend down")
+            return original(*args, **kwargs)
+
+        setattr(obj, name, wrapper)
+
+    @pytest.mark.parametrize("store_name, method, call_number", [
+        ("piece", "add_many", 2),
+        ("graph", "add_relations", 1),
+        ("metadata", "save_metadata", 1),
+    ])
+    def test_failure_undoes_all_writes_inside_session(self, store_name, method, call_number):
+        manager, store, graph, metadata = _make_manager(install_batch_size=2)
+        stores = {"piece": store, "graph": graph, "metadata": metadata}
+        self._fail_on_call(stores[store_name], method, call_number)
+        graph.add_node(GraphNode(node_id="piece-0", node_type="knowledge_piece", label="shared"))
+
+        result = manager.install(KnowledgePack(pack_id="pack:fail", name="fail"), _pieces(3))
+
+        assert not result.success
+        assert "backend down" in result.error
+        assert store._pieces == {}
+        assert store.writes_outside_session == 0
+        assert graph.get_node("pack:fail") is None
+        assert graph.get_relations("pack:fail", relation_type=CONTAINS_RELATION) == []
+        assert graph.get_node("piece-1") is None
+        # Piece nodes that existed before the install are kept
+        assert graph.get_node("piece-0") is not None
+        assert metadata.get_metadata("pack:fail") is None
@@ -99,6 +99,16 @@ class InMemoryGraphStore:
     def add_relation(self, edge):
         self._edges.append(edge)
 
+    def get_nodes(self, node_ids):
+        return {nid: self._nodes[nid] for nid in node_ids if nid in self._nodes}
+
+    def add_nodes(self, nodes):
+        for node in nodes:
+            self.add_node(node)
+
+    def add_relations(self, edges):
+        self._edges.extend(edges)
+
     def remove_node(self, node_id: str):
         self._nodes.pop(node_id, None)
         self._edges = [e for e in self._edges if e.source_id != node_id and e.target_id != node_id]
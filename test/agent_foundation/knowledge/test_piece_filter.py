@@ -0,0 +1,63 @@
+"""Unit tests for PieceFilter matching and normalization."""
+from datetime import datetime, timezone
+
+from agent_foundation.knowledge.retrieval.models.knowledge_piece import KnowledgePiece
+from agent_foundation.knowledge.retrieval.stores.pieces.filters import PieceFilter
+
+
+def _piece(**kwargs):
+    kwargs.setdefault("content", "content")
+    return KnowledgePiece(**kwargs)
+
+
+class TestNormalization:
+    def test_empty_values_mean_no_constraint(self):
+        assert PieceFilter(spaces=[], tags=None, domains=()).is_empty()
+        assert not PieceFilter(is_active=False).is_empty()
+
+    def test_tags_lowercased_and_deduplicated(self):
+        assert PieceFilter(tags=["Eggs", "eggs ", "Diet"]).tags == ("eggs", "diet")
+
+    def test_hashable_and_comparable(self):
+        assert PieceFilter(spaces=["a"]) == PieceFilter(spaces=("a",))
+        assert len({PieceFilter(spaces=["a"]), PieceFilter(spaces=("a",))}) == 1
+
+    def test_datetime_bounds_become_utc_iso(self):
+        since = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert PieceFilter(created_since=since).created_since == since.isoformat()
+
+
+class TestMatches:
+    def test_spaces_use_or_semantics(self):
+        piece = _piece(spaces=["personal", "developmental"])
+        assert PieceFilter(spaces=["main", "personal"]).matches(piece)
+        assert not PieceFilter(spaces=["main"]).matches(piece)
+
+    def test_tags_use_and_semantics(self):
+        piece = _piece(tags=["eggs", "diet"])
+        assert PieceFilter(tags=["EGGS"]).matches(piece)
+        assert not PieceFilter(tags=["eggs", "keto"]).matches(piece)
+
+    def test_domains_match_primary_domain(self):
+        piece = _piece(domain="cooking", secondary_domains=["health"])
+        assert PieceFilter(domains=["cooking", "travel"]).matches(piece)
+        assert not PieceFilter(domains=["health"]).matches(piece)
+
+    def test_created_range_is_half_open(self):
+        piece = _piece(created_at="2024-06-01T00:00:00+00:00")
+        assert PieceFilter(created_since="2024-06-01T00:00:00+00:00").matches(piece)
+        assert not PieceFilter(created_before="2024-06-01T00:00:00+00:00").matches(piece)
+
+    def test_active_and_validation_status(self):
+        piece = _piece(is_active=False, validation_status="passed")
+        assert PieceFilter(is_active=False, validation_statuses=["passed"]).matches(piece)
+        assert not PieceFilter(is_active=True).matches(piece)
+        assert not PieceFilter(validation_statuses=["failed"]).matches(piece)
+
+
+class TestWithout:
+    def test_removes_only_named_constraints(self):
+        piece_filter = PieceFilter(spaces=["a"], tags=["t"], domains=["d"])
+        residual = piece_filter.without("tags", "spaces")
+        assert residual == PieceFilter(domains=["d"])
+        assert residual.without("domains").is_empty()
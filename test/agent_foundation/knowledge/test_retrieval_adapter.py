@@ -8,8 +8,10 @@ close delegation.
 
 Requirements: 12.1, 12.2, 12.3, 12.4
 """
+import inspect
 import sys
 from pathlib import Path
+from unittest.mock import patch
 
 # Path resolution for imports
 _current_file = Path(__file__).resolve()
@@ -35,6 +37,7 @@ from agent_foundation.knowledge.retrieval.stores.pieces.base import KnowledgePie
 from agent_foundation.knowledge.retrieval.stores.pieces.retrieval_adapter import (
     RetrievalKnowledgePieceStore,
 )
+from agent_foundation.knowledge.retrieval.stores.pieces.filters import PieceFilter
 from rich_python_utils.service_utils.retrieval_service.memory_retrieval_service import (
     MemoryRetrievalService,
 )
@@ -137,6 +140,26 @@ class TestAddAndGetById:
         result = store.get_by_id("nonexistent-id")
         assert result is None
 
+    def test_get_by_ids_across_namespaces(self, store, retrieval_service):
+        """get_by_ids should find pieces in any namespace, listing them once."""
+        store.add(KnowledgePiece(content="Global", piece_id="g-1"))
+        store.add(KnowledgePiece(content="Alice", piece_id="a-1", entity_id="user:alice"))
+        store.add(KnowledgePiece(content="Bob", piece_id="b-1", entity_id="user:bob"))
+
+        with patch.object(
+            retrieval_service, "namespaces", wraps=retrieval_service.namespaces
+        ) as namespaces:
+            result = store.get_by_ids(["b-1", "missing", "g-1", "a-1", "b-1"])
+
+        assert list(result) == ["b-1", "g-1", "a-1"]
+        assert result["a-1"].entity_id == "user:alice"
+        assert result["g-1"].content == "Global"
+        namespaces.assert_called_once()
+
+    def test_get_by_ids_empty_returns_empty_dict(self, store):
+        """get_by_ids with no IDs should return an empty dict."""
+        assert store.get_by_ids([]) == {}
+
     def test_duplicate_add_raises_value_error(self, store):
         """Adding a piece with a duplicate piece_id should raise ValueError."""
         piece = KnowledgePiece(
@@ -279,6 +302,69 @@ class TestSearch:
         assert len(results) <= 3
 
 
+class TestTimestampEpochs:
+    """Pre-parsed timestamp epochs round-trip through document metadata."""
+
+    def test_epochs_stored_and_seeded(self, store, retrieval_service):
+        store.add(KnowledgePiece(
+            content="epoch test", piece_id="e1",
+            updated_at="1970-01-03T00:00:00+00:00",
+        ))
+        doc = retrieval_service.get_by_id("e1", namespace=None)
+        assert doc.metadata["updated_at_epoch"] == 2 * 86400.0
+
+        doc.metadata["updated_at_epoch"] = 5.0
+        assert store._doc_to_piece(doc).updated_at_epoch == 5.0
+
+
+class TestSearchFiltered:
+    """search_filtered pushes single-valued constraints to the service."""
+
+    def _add_pieces(self, store):
+        store.add(KnowledgePiece(
+            content="python cooking tips", piece_id="c1", domain="cooking",
+            spaces=["personal"],
+        ))
+        store.add(KnowledgePiece(
+            content="python health tips", piece_id="h1", domain="health",
+            spaces=["main"],
+        ))
+        store.add(KnowledgePiece(
+            content="python travel tips", piece_id="t1", domain="travel",
+            spaces=["developmental"],
+        ))
+
+    def test_single_values_pushed_down(self, store, retrieval_service):
+        self._add_pieces(store)
+        with patch.object(
+            retrieval_service, "search", wraps=retrieval_service.search
+        ) as search:
+            results = store.search_filtered(
+                "python",
+                PieceFilter(spaces=["personal"], domains=["cooking"]),
+                top_k=2,
+            )
+
+        assert [p.piece_id for p, _ in results] == ["c1"]
+        search.assert_called_once()
+        assert search.call_args.kwargs["filters"] == {
+            "spaces": ["personal"], "domain": "cooking",
+        }
+        assert search.call_args.kwargs["top_k"] == 2
+
+    def test_multiple_alternatives_filtered_in_python(self, store, retrieval_service):
+        self._add_pieces(store)
+        with patch.object(
+            retrieval_service, "search", wraps=retrieval_service.search
+        ) as search:
+            results = store.search_filtered(
+                "python", PieceFilter(domains=["cooking", "health"]), top_k=2
+            )
+
+        assert sorted(p.piece_id for p, _ in results) == ["c1", "h1"]
+        assert search.call_args.kwargs["top_k"] == 10
+
+
 class TestUpdate:
     """Requirement 12.4: update preserves fields through round-trip."""
 
@@ -412,6 +498,38 @@ class TestListAll:
         assert store.list_all() == []
 
 
+class TestIterAll:
+    """iter_all pushes filters to the service and pages when it can."""
+
+    def test_matches_list_all_with_residual_filter(self, store):
+        store.add(KnowledgePiece(content="A", piece_id="it-a", tags=["x"], domain="ml"))
+        store.add(KnowledgePiece(content="B", piece_id="it-b", tags=["x"]))
+        store.add(KnowledgePiece(content="C", piece_id="it-c"))
+
+        assert {p.piece_id for p in store.iter_all()} == {"it-a", "it-b", "it-c"}
+        tagged = store.iter_all(piece_filter=PieceFilter(tags=["x"], domains=["ml", "nlp"]))
+        assert [p.piece_id for p in tagged] == ["it-a"]
+
+    def test_pages_with_offset_and_limit(self, store, retrieval_service):
+        for i in range(5):
+            store.add(KnowledgePiece(content=f"P{i}", piece_id=f"pg-{i}"))
+        pages = []
+
+        def list_all(filters=None, namespace=None, offset=0, limit=None):
+            pages.append((offset, limit))
+            docs = retrieval_service.__class__.list_all(
+                retrieval_service, filters=filters, namespace=namespace
+            )
+            return docs[offset:offset + limit]
+
+        with patch.object(retrieval_service, "list_all", side_effect=list_all) as mocked:
+            mocked.__signature__ = inspect.signature(list_all)
+            ids = [p.piece_id for p in store.iter_all(batch_size=2)]
+
+        assert sorted(ids) == [f"pg-{i}" for i in range(5)]
+        assert pages == [(0, 2), (2, 2), (4, 2)]
+
+
 class TestClose:
     """Adapter close should delegate to the underlying retrieval service."""
 
@@ -425,3 +543,70 @@ class TestClose:
         """Calling close() multiple times should not raise."""
         store.close()
         store.close()  # Should not raise
+
+
+class TestContentHashLookup:
+    """Content-hash lookups through the adapter's ContentHashIndex."""
+
+    def test_index_built_from_existing_documents(self, retrieval_service):
+        writer = RetrievalKnowledgePieceStore(retrieval_service=retrieval_service)
+        g = KnowledgePiece(content="global fact", piece_id="g")
+        e = KnowledgePiece(content="entity fact", piece_id="e", entity_id="user-1")
+        writer.add(g)
+        writer.add(e)
+
+        store = RetrievalKnowledgePieceStore(retrieval_service=retrieval_service)
+        found = store.find_by_content_hashes(
+            [g.content_hash, e.content_hash], entity_id="user-1"
+        )
+
+        assert {h: p.piece_id for h, p in found.items()} == {
+            g.content_hash: "g",
+            e.content_hash: "e",
+        }
+        assert store.find_by_content_hash(e.content_hash) is None
+
+    def test_index_follows_add_update_remove(self, store):
+        store.find_by_content_hash("warm-up")
+        piece = KnowledgePiece(content="before", piece_id="p1")
+        store.add(piece)
+        assert store.find_by_content_hash(piece.content_hash).piece_id == "p1"
+
+        old_hash = piece.content_hash
+        updated = KnowledgePiece(content="after", piece_id="p1")
+        store.update(updated)
+        assert store.find_by_content_hash(old_hash) is None
+        assert store.find_by_content_hash(updated.content_hash).piece_id == "p1"
+
+        store.remove("p1")
+        assert store.find_by_content_hash(updated.content_hash) is None
+
+    def test_stale_entry_is_dropped(self, store, retrieval_service):
+        piece = KnowledgePiece(content="gone soon", piece_id="p1")
+        store.add(piece)
+        store.find_by_content_hash(piece.content_hash)
+
+        retrieval_service.remove("p1", namespace=None)
+
+        assert store.find_by_content_hash(piece.content_hash) is None
+        assert "p1" not in store._content_hash_index()
+
+    def test_index_persisted_across_instances(self, retrieval_service, tmp_path):
+        path = str(tmp_path / "hashes.json")
+        store = RetrievalKnowledgePieceStore(
+            retrieval_service=retrieval_service, content_hash_index_path=path
+        )
+        piece = KnowledgePiece(content="persisted", piece_id="p1")
+        store.add(piece)
+        store.find_by_content_hash(piece.content_hash)
+        store.close()
+
+        reopened = RetrievalKnowledgePieceStore(
+            retrieval_service=MemoryRetrievalService(), content_hash_index_path=path
+        )
+        with patch.object(reopened, "iter_all") as iter_all:
+            reopened.get_by_ids = lambda ids: {"p1": piece}
+            found = reopened.find_by_content_hash(piece.content_hash)
+
+        iter_all.assert_not_called()
+        assert found.piece_id == "p1"
@@ -4,11 +4,14 @@ Unit tests for the RetrievalPipeline.
 Tests single-query path (no expander), multi-query path (with expander),
 fallback logic, error handling (expander failure, post-processor errors),
 and that multi-query path calls retrieve_metadata/retrieve_identity_graph
-once and retrieve_pieces/retrieve_search_graph N times.
+once and retrieve_pieces/retrieve_search_graph N times. Also covers
+concurrent sub-query execution and the LLM decomposer cache.
 
 Requirements: 7.1, 7.2, 7.3, 7.4, 7.5, 14.1, 14.2, 14.3
 """
+import json
 import sys
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from unittest.mock import MagicMock
@@ -30,7 +33,7 @@ from agent_foundation.knowledge.retrieval.models.knowledge_piece import Knowledg
 from agent_foundation.knowledge.retrieval.models.entity_metadata import EntityMetadata
 from agent_foundation.knowledge.retrieval.retrieval_pipeline import (
     AgenticRetrievalResult, PostProcessor, QueryExpander,
-    RetrievalPipeline, SubQuery,
+    RetrievalPipeline, SubQuery, create_llm_decomposer,
 )
 
 
@@ -406,3 +409,147 @@ class TestCallCountVerification:
         kb.retrieve_identity_graph.assert_called_once_with(
             entity_id="user:1", spaces=["main"],
         )
+
+
+# ---- Concurrent Sub-Queries ----
+
+
+def _query_keyed_kb(on_call=None):
+    """KB mock whose L2/L3a results depend only on the sub-query."""
+    kb = _mock_kb()
+
+    def pieces(query, **kwargs):
+        if on_call is not None:
+            on_call(query)
+        return [(_make_piece(f"{query}-{i}"), 1.0 / (i + 1)) for i in range(2)]
+
+    def search_graph(query, **kwargs):
+        return [{"target_node_id": f"{query}-node", "relation_type": "SEARCH_HIT",
+                 "depth": 0, "score": 0.5, "target_label": ""}]
+
+    kb.retrieve_pieces.side_effect = pieces
+    kb.retrieve_search_graph.side_effect = search_graph
+    return kb
+
+
+class TestConcurrentSubQueries:
+    def test_parallel_matches_sequential(self):
+        sqs = [SubQuery(query=f"sq{i}") for i in range(6)]
+        outputs = []
+        for limit in (1, 4):
+            pp = RecordingPP(AgenticRetrievalResult())
+            pipe = RetrievalPipeline(
+                kb=_query_keyed_kb(), expander=FixedExpander(sqs), post_processor=pp,
+                max_concurrent_subqueries=limit,
+            )
+            pipe.execute("q")
+            outputs.append([
+                ([p.piece_id for p, _ in r.pieces], [c["target_node_id"] for c in r.graph_context])
+                for r in pp.calls[0]["results"]
+            ])
+        assert outputs[0] == outputs[1]
+
+    def test_sub_queries_overlap(self):
+        # Each sub-query waits for the other; sequential execution would time out.
+        barrier = threading.Barrier(2, timeout=5)
+        kb = _query_keyed_kb(on_call=lambda query: barrier.wait())
+        pipe = RetrievalPipeline(
+            kb=kb, expander=FixedExpander([SubQuery(query="a"), SubQuery(query="b")]),
+            post_processor=RecordingPP(AgenticRetrievalResult()),
+            max_concurrent_subqueries=2,
+        )
+        pipe.execute("q")
+        assert kb.retrieve_pieces.call_count == 2
+
+    def test_parallelism_is_bounded(self):
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+        release = threading.Event()
+
+        def on_call(query):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+                if state["active"] == 2:
+                    release.set()
+            release.wait(timeout=1)
+            with lock:
+                state["active"] -= 1
+
+        pipe = RetrievalPipeline(
+            kb=_query_keyed_kb(on_call=on_call),
+            expander=FixedExpander([SubQuery(query=f"sq{i}") for i in range(6)]),
+            post_processor=RecordingPP(AgenticRetrievalResult()),
+            max_concurrent_subqueries=2,
+        )
+        pipe.execute("q")
+        assert state["peak"] == 2
+
+    def test_first_failure_is_raised(self):
+        def on_call(query):
+            if query == "bad":
+                raise RuntimeError("boom")
+
+        pipe = RetrievalPipeline(
+            kb=_query_keyed_kb(on_call=on_call),
+            expander=FixedExpander([SubQuery(query="ok"), SubQuery(query="bad")]),
+            post_processor=RecordingPP(AgenticRetrievalResult()),
+            max_concurrent_subqueries=2,
+        )
+        with pytest.raises(RuntimeError, match="boom"):
+            pipe.execute("q")
+
+
+# ---- LLM Decomposer Cache ----
+
+
+class TestLlmDecomposerCache:
+    @pytest.fixture(autouse=True)
+    def _plain_prompt(self, monkeypatch):
+        monkeypatch.setattr(
+            "agent_foundation.knowledge.prompt_templates.render_prompt",
+            lambda key, **kwargs: kwargs["query"],
+        )
+
+    def _llm(self, response=None):
+        llm = MagicMock(return_value=response or json.dumps(
+            [{"query": "eggs price", "domain": "grocery", "tags": ["eggs"]}]
+        ))
+        return llm
+
+    def test_normalized_query_hits_cache(self):
+        llm = self._llm()
+        decompose = create_llm_decomposer(llm)
+
+        first = decompose("Eggs  price")
+        second = decompose("eggs price ")
+
+        assert llm.call_count == 1
+        assert first == second == [SubQuery(query="eggs price", domain="grocery", tags=["eggs"])]
+
+    def test_cached_results_are_copies(self):
+        decompose = create_llm_decomposer(self._llm())
+        decompose("q")[0].tags.append("mutated")
+        assert decompose("q")[0].tags == ["eggs"]
+
+    def test_failures_not_cached(self):
+        llm = self._llm(response="not json")
+        decompose = create_llm_decomposer(llm)
+
+        assert decompose("q") == [SubQuery(query="q")]
+        decompose("q")
+        assert llm.call_count == 2
+
+    def test_lru_eviction_and_disable(self):
+        llm = self._llm()
+        decompose = create_llm_decomposer(llm, cache_size=1)
+        decompose("a")
+        decompose("b")
+        decompose("a")
+        assert llm.call_count == 3
+
+        llm = self._llm()
+        decompose = create_llm_decomposer(llm, cache_size=0)
+        decompose("a")
+        decompose("a")
+        assert llm.call_count == 2
@@ -0,0 +1,92 @@
+"""Unit tests for batch temporal decay scoring on pre-parsed timestamps."""
+import math
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from agent_foundation.knowledge.retrieval import temporal_decay
+from agent_foundation.knowledge.retrieval.models.knowledge_piece import KnowledgePiece
+from agent_foundation.knowledge.retrieval.models.results import ScoredPiece
+from agent_foundation.knowledge.retrieval.temporal_decay import (
+    TemporalDecayConfig,
+    apply_temporal_decay,
+    compute_decay_multipliers,
+)
+
+_DAY = 86400.0
+
+
+def _scored(piece_id, score, updated_at, info_type="context"):
+    piece = KnowledgePiece(
+        content=piece_id, piece_id=piece_id, updated_at=updated_at, info_type=info_type
+    )
+    return ScoredPiece(piece=piece, score=score)
+
+
+class TestComputeDecayMultipliers:
+    def test_half_life_and_floor(self):
+        config = TemporalDecayConfig(half_life_days=10.0, min_score_multiplier=0.2)
+        now = 1000 * _DAY
+        multipliers = compute_decay_multipliers([now, now - 10 * _DAY, 0.0, None], now, config)
+
+        assert multipliers[0] == pytest.approx(1.0)
+        assert multipliers[1] == pytest.approx(0.5)
+        assert multipliers[2] == pytest.approx(0.2)
+        assert multipliers[3] is None
+
+    @pytest.mark.parametrize("size", [5, 100])
+    def test_numpy_matches_python(self, size, monkeypatch):
+        config = TemporalDecayConfig(half_life_days=7.0)
+        now = 500 * _DAY
+        epochs = [None if i % 7 == 0 else now - i * 0.37 * _DAY for i in range(size)]
+
+        vectorized = compute_decay_multipliers(epochs, now, config)
+        monkeypatch.setattr(temporal_decay, "np", None)
+        pure = compute_decay_multipliers(epochs, now, config)
+
+        assert [m is None for m in vectorized] == [m is None for m in pure]
+        assert [m for m in vectorized if m is not None] == pytest.approx(
+            [m for m in pure if m is not None]
+        )
+
+
+class TestApplyTemporalDecay:
+    def test_uses_preparsed_epochs(self):
+        now = datetime.now(timezone.utc)
+        fresh = _scored("fresh", 1.0, now.isoformat())
+        stale = _scored("stale", 2.0, now.isoformat())
+        # The seeded epoch (as loaded from a store column) wins over the string.
+        stale.piece.set_timestamp_epochs(
+            updated_at_epoch=(now - timedelta(days=60)).timestamp()
+        )
+
+        result = apply_temporal_decay([stale, fresh], TemporalDecayConfig(half_life_days=30.0))
+
+        assert [sp.piece_id for sp in result] == ["fresh", "stale"]
+        assert stale.score == pytest.approx(2.0 * 0.25, rel=1e-3)
+
+    def test_evergreen_and_unparsable_untouched(self, caplog):
+        now = datetime.now(timezone.utc)
+        skill = _scored("skill", 1.0, (now - timedelta(days=90)).isoformat(), "skills")
+        broken = _scored("broken", 0.5, "not a date")
+
+        with caplog.at_level("WARNING"):
+            apply_temporal_decay([skill, broken], TemporalDecayConfig())
+
+        assert skill.score == 1.0
+        assert broken.score == 0.5
+        assert "not a date" in caplog.text
+
+    def test_matches_per_piece_formula(self):
+        now = datetime.now(timezone.utc)
+        config = TemporalDecayConfig(half_life_days=14.0, min_score_multiplier=0.05)
+        pieces = [
+            _scored(f"p{i}", 1.0, (now - timedelta(days=i * 1.5)).isoformat())
+            for i in range(50)
+        ]
+
+        apply_temporal_decay(pieces, config)
+
+        for i, sp in enumerate(pieces):
+            expected = max(math.exp(-math.log(2) / 14.0 * i * 1.5), 0.05)
+            assert sp.score == pytest.approx(expected, rel=1e-4)